@@ -5,7 +5,7 @@
  */
 
 import { createClient } from '@supabase/supabase-js';
-import { readFileSync } from 'fs';
+import { existsSync, readFileSync } from 'fs';
 import { fileURLToPath } from 'url';
 import { dirname, join } from 'path';
 
@@ -14,7 +14,7 @@ const __dirname = dirname(__filename);
 
 // Read .env.local
 const envPath = join(__dirname, '..', '.env.local');
-const envContent = readFileSync(envPath, 'utf-8');
+const envContent = existsSync(envPath) ? readFileSync(envPath, 'utf-8') : '';
 const env = {};
 envContent.split('\n').forEach(line => {
   const [key, ...valueParts] = line.split('=');
@@ -23,7 +23,7 @@ envContent.split('\n').forEach(line => {
   }
 });
 
-const supabase = createClient(env.VITE_SUPABASE_URL, env.VITE_SUPABASE_KEY);
+const supabase = createClient(process.env.VITE_SUPABASE_URL || env.VITE_SUPABASE_URL, process.env.VITE_SUPABASE_KEY || env.VITE_SUPABASE_KEY);
 
 async function checkDependencies() {
   console.log('🔍 COMPREHENSIVE DEPENDENCY CHECK\n');
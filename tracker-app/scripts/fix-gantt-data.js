@@ -6,7 +6,7 @@
  */
 
 import { createClient } from '@supabase/supabase-js';
-import { readFileSync } from 'fs';
+import { existsSync, readFileSync } from 'fs';
 import { fileURLToPath } from 'url';
 import { dirname, join } from 'path';
 
@@ -15,7 +15,7 @@ const __dirname = dirname(__filename);
 
 // Read .env.local
 const envPath = join(__dirname, '..', '.env.local');
-const envContent = readFileSync(envPath, 'utf-8');
+const envContent = existsSync(envPath) ? readFileSync(envPath, 'utf-8') : '';
 const env = {};
 envContent.split('\n').forEach(line => {
   const [key, ...valueParts] = line.split('=');
@@ -25,8 +25,8 @@ envContent.split('\n').forEach(line => {
 });
 
 const supabase = createClient(
-  env.VITE_SUPABASE_URL,
-  env.VITE_SUPABASE_KEY
+  process.env.VITE_SUPABASE_URL || env.VITE_SUPABASE_URL,
+  process.env.VITE_SUPABASE_KEY || env.VITE_SUPABASE_KEY
 );
 
 async function fixData() {
@@ -0,0 +1,224 @@
+/**
+ * BULK UPDATE TEST
+ * Runs src/lib/bulkUpdate.js in Node against a stubbed Supabase client:
+ * chunking, the per-row fallback when the RPC is missing, and rollback of
+ * failed rows
+ *
+ * Usage: node scripts/test-bulk-update.js
+ */
+
+import assert from 'node:assert/strict';
+import { register } from 'node:module';
+
+// ==================== MODULE STUBS ====================
+
+// The app imports without extensions (Vite); supabase.js is swapped for a stub
+// whose rpc() / from().update().eq().select() answer from globalThis.__supabaseStub
+const SUPABASE_STUB = `
+  const stub = globalThis.__supabaseStub;
+  const updateQuery = (table, patch) => {
+    const filters = {};
+    const query = {
+      eq: (column, value) => { filters[column] = value; return query; },
+      select: () => query,
+      then: (resolve, reject) => Promise.resolve(stub.update(table, patch, filters)).then(resolve, reject)
+    };
+    return query;
+  };
+  export const SUPABASE_URL = 'http://stub.local';
+  export const supabase = {
+    rpc: (name, args) => Promise.resolve(stub.rpc(name, args)),
+    from: (table) => ({ update: (patch) => updateQuery(table, patch) })
+  };
+`;
+
+const HOOKS = `
+  export async function resolve(specifier, context, next) {
+    let resolved;
+    try {
+      resolved = await next(specifier, context);
+    } catch (error) {
+      if (!specifier.startsWith('.') || /\\.[cm]?js$/.test(specifier)) throw error;
+      resolved = await next(specifier + '.js', context);
+    }
+    if (resolved.url.endsWith('/src/lib/supabase.js')) {
+      return { url: 'data:text/javascript,' + encodeURIComponent(${JSON.stringify(SUPABASE_STUB)}), shortCircuit: true };
+    }
+    return resolved;
+  }
+`;
+
+globalThis.__supabaseStub = {};
+register('data:text/javascript,' + encodeURIComponent(HOOKS), import.meta.url);
+
+const stub = globalThis.__supabaseStub;
+const { BULK_CHUNK_SIZE, bulkUpdateTasks, optimisticBulkUpdate } = await import('../src/lib/bulkUpdate.js');
+
+// ==================== HELPERS ====================
+
+// In-memory tasks table; a row whose id is in `rejected` fails with a check violation
+const table = (count, rejected = new Set()) => {
+  const rows = new Map();
+  for (let id = 1; id <= count; id++) {
+    rows.set(id, { id, name: `Task ${id}`, sprint_id: null, status: 'PENDING' });
+  }
+  const apply = (id, patch) => {
+    if (rejected.has(id)) return { error: { code: '23514', message: `Task ${id} rejected` } };
+    if (!rows.has(id)) return { error: { code: 'P0002', message: `Task ${id} not found` } };
+    rows.set(id, { ...rows.get(id), ...patch, updated_at: 'now' });
+    return { row: rows.get(id) };
+  };
+  return { rows, apply };
+};
+
+// bulk_update_tasks as migration 005 answers it: one result per input row
+const bulkRpc = (db, calls) => (name, args) => {
+  calls.push(args.updates.length);
+  return {
+    data: args.updates.map(({ id, ...patch }) => {
+      const { row, error } = db.apply(id, patch);
+      return error
+        ? { id, ok: false, error_code: error.code, error_message: error.message, task: null }
+        : { id, ok: true, error_code: null, error_message: null, task: row };
+    }),
+    error: null
+  };
+};
+
+// PostgREST update: a missing row comes back as an empty result, not an error
+const restUpdate = (db, calls) => (tableName, patch, filters) => {
+  calls.push(filters.id);
+  const { row, error } = db.apply(filters.id, patch);
+  if (error?.code === 'P0002') return { data: [], error: null };
+  return error ? { data: null, error } : { data: [row], error: null };
+};
+
+const updatesFor = (ids, patch) => ids.map(id => ({ id, ...patch }));
+const range = (from, to) => Array.from({ length: to - from + 1 }, (_, i) => from + i);
+
+const quietly = async (fn) => {
+  const { warn, error } = console;
+  const messages = [];
+  console.warn = (...args) => messages.push(args.join(' '));
+  console.error = () => {};
+  try {
+    return { result: await fn(), messages };
+  } finally {
+    Object.assign(console, { warn, error });
+  }
+};
+
+const results = { passed: [], failed: [] };
+const check = async (name, fn) => {
+  try {
+    await fn();
+    results.passed.push(name);
+    console.log(`✅ ${name}`);
+  } catch (error) {
+    results.failed.push(name);
+    console.log(`❌ ${name}\n   ${error.message}`);
+  }
+};
+
+// ==================== TESTS ====================
+
+console.log('🚀 Bulk task updates\n');
+
+await check('updates are sent in chunks of 500 rows', async () => {
+  const db = table(1203);
+  const rpcCalls = [];
+  stub.rpc = bulkRpc(db, rpcCalls);
+  stub.update = () => assert.fail('per-row update used while the RPC exists');
+
+  const { updated, failed } = await bulkUpdateTasks(updatesFor(range(1, 1203), { sprint_id: 7 }));
+  assert.equal(BULK_CHUNK_SIZE, 500);
+  assert.deepEqual(rpcCalls, [500, 500, 203]);
+  assert.equal(updated.length, 1203);
+  assert.deepEqual(failed, []);
+  assert.ok([...db.rows.values()].every(row => row.sprint_id === 7));
+});
+
+await check('chunkSize option overrides the default', async () => {
+  const rpcCalls = [];
+  stub.rpc = bulkRpc(table(10), rpcCalls);
+  await bulkUpdateTasks(updatesFor(range(1, 10), { status: 'DONE' }), { chunkSize: 4 });
+  assert.deepEqual(rpcCalls, [4, 4, 2]);
+});
+
+await check('missing RPC (PGRST202) falls back to per-row updates once', async () => {
+  const db = table(25, new Set([12]));
+  let rpcCalls = 0;
+  const rowCalls = [];
+  stub.rpc = () => {
+    rpcCalls += 1;
+    return { data: null, error: { code: 'PGRST202', message: 'Could not find the function public.bulk_update_tasks' } };
+  };
+  stub.update = restUpdate(db, rowCalls);
+
+  const { result, messages } = await quietly(() => bulkUpdateTasks(
+    updatesFor([...range(1, 25), 99], { sprint_id: 3 }),
+    { chunkSize: 10 }
+  ));
+  // The RPC is asked once; later chunks go straight to per-row updates
+  assert.equal(rpcCalls, 1);
+  assert.equal(rowCalls.length, 26);
+  assert.ok(messages.some(message => message.includes('apply migration 005')));
+  assert.equal(result.updated.length, 24);
+  assert.deepEqual(result.failed, [
+    { id: 12, code: '23514', message: 'Task 12 rejected' },
+    { id: 99, code: 'P0002', message: 'Task 99 not found' }
+  ]);
+  assert.equal(db.rows.get(12).sprint_id, null);
+});
+
+await check('a lost chunk fails its rows without stopping the others', async () => {
+  const db = table(9);
+  let call = 0;
+  stub.rpc = (name, args) => {
+    call += 1;
+    if (call === 2) throw new Error('Failed to fetch');
+    return bulkRpc(db, [])(name, args);
+  };
+
+  const { result } = await quietly(() => bulkUpdateTasks(updatesFor(range(1, 9), { status: 'DONE' }), { chunkSize: 3 }));
+  assert.deepEqual(result.updated.map(row => row.id), [1, 2, 3, 7, 8, 9]);
+  assert.deepEqual(result.failed.map(failure => [failure.id, failure.code]), [[4, 'NETWORK'], [5, 'NETWORK'], [6, 'NETWORK']]);
+});
+
+await check('partial failure rolls back only the touched columns of failed rows', async () => {
+  const db = table(4, new Set([2]));
+  let state = [...db.rows.values()].map(row => ({ ...row }));
+  const setTasks = (updater) => { state = updater(state); };
+  const before = state;
+
+  stub.rpc = (name, args) => {
+    // While the request is in flight, another change lands on the failing row
+    state = state.map(task => task.id === 2 ? { ...task, name: 'Renamed elsewhere' } : task);
+    return bulkRpc(db, [])(name, args);
+  };
+
+  const updates = [
+    { id: 1, sprint_id: 5, status: 'IN_PROGRESS' },
+    { id: 2, sprint_id: 5, status: 'IN_PROGRESS' },
+    { id: 3, sprint_id: 5 }
+  ];
+  const pending = optimisticBulkUpdate({ tasks: before, setTasks, updates });
+  // Optimistic values are visible before the server answers
+  assert.equal(state.find(task => task.id === 2).sprint_id, 5);
+  const { updated, failed } = await pending;
+
+  assert.deepEqual(updated.map(row => row.id), [1, 3]);
+  assert.deepEqual(failed.map(failure => failure.id), [2]);
+  const byId = new Map(state.map(task => [task.id, task]));
+  // Failed row: touched columns restored, the concurrent rename kept
+  assert.deepEqual(byId.get(2), { id: 2, name: 'Renamed elsewhere', sprint_id: null, status: 'PENDING' });
+  // Written rows carry the server row
+  assert.equal(byId.get(1).status, 'IN_PROGRESS');
+  assert.equal(byId.get(1).updated_at, 'now');
+  assert.equal(byId.get(3).sprint_id, 5);
+  // Rows outside the update are untouched
+  assert.equal(byId.get(4), before.find(task => task.id === 4));
+});
+
+console.log(`\n📊 ${results.passed.length} passed, ${results.failed.length} failed`);
+process.exit(results.failed.length > 0 ? 1 : 0);
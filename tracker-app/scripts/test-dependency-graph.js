@@ -0,0 +1,140 @@
+/**
+ * DEPENDENCY INDEX DELTA TEST
+ * Runs src/lib/dependencyGraph.js in Node: every incremental update must
+ * leave the index equal to one built from scratch, and report what changed
+ *
+ * Usage: node scripts/test-dependency-graph.js
+ */
+
+import assert from 'node:assert/strict';
+import { buildDependencyIndex, getChildren, getSuccessors, updateDependencyIndex } from '../src/lib/dependencyGraph.js';
+
+// ==================== HELPERS ====================
+
+const task = (id, fields = {}) => ({ id, name: `Task ${id}`, depends_on: null, parent_id: null, ...fields });
+
+const byKey = ([a], [b]) => (a > b ? 1 : a < b ? -1 : 0);
+
+// Maps of Sets/arrays -> sorted plain entries, so two indexes compare by content
+const snapshot = (index) => ({
+  byId: Array.from(index.byId.entries()).sort(byKey),
+  predecessorIds: Array.from(index.predecessorIds.entries()).sort(byKey),
+  successorIds: Array.from(index.successorIds.entries(), ([id, set]) => [id, [...set].sort()]).sort(byKey),
+  childIds: Array.from(index.childIds.entries(), ([id, set]) => [id, [...set].sort()]).sort(byKey)
+});
+
+const assertMatchesRebuild = (index, tasks) => {
+  assert.deepEqual(snapshot(index), snapshot(buildDependencyIndex(tasks)));
+};
+
+const results = { passed: [], failed: [] };
+const check = (name, fn) => {
+  try {
+    fn();
+    results.passed.push(name);
+    console.log(`✅ ${name}`);
+  } catch (error) {
+    results.failed.push(name);
+    console.log(`❌ ${name}\n   ${error.message}`);
+  }
+};
+
+// ==================== TESTS ====================
+
+console.log('🚀 Dependency index deltas\n');
+
+const BASE = [
+  task(1, { name: 'Epic' }),
+  task(2, { parent_id: 1 }),
+  task(3, { parent_id: 1, depends_on: [2] }),
+  task(4, { depends_on: [2, 3] }),
+  task(5, { depends_on: 3 })          // Single ID, not an array
+];
+
+check('full build reports no delta', () => {
+  const index = buildDependencyIndex(BASE);
+  assert.equal(index.version, 0);
+  assert.equal(index.changedIds, null);
+  assert.equal(index.edgesChanged, true);
+  assert.deepEqual(getSuccessors(index, 3).map(t => t.id).sort(), [4, 5]);
+  assert.deepEqual(getChildren(index, 1).map(t => t.id).sort(), [2, 3]);
+});
+
+check('same task objects return the same index', () => {
+  const index = buildDependencyIndex(BASE);
+  assert.equal(updateDependencyIndex(index, [...BASE]), index);
+});
+
+// Each step: [description, edit, expected changedIds, expected edgesChanged]
+const STEPS = [
+  ['replace a task without touching its links',
+    list => list.map(t => t.id === 4 ? { ...t, name: 'Renamed' } : t), [4], false],
+  ['add a dependency',
+    list => list.map(t => t.id === 5 ? { ...t, depends_on: [3, 1] } : t), [5], true],
+  ['remove a dependency',
+    list => list.map(t => t.id === 4 ? { ...t, depends_on: [3] } : t), [4], true],
+  ['reorder depends_on',
+    list => list.map(t => t.id === 5 ? { ...t, depends_on: [1, 3] } : t), [5], true],
+  ['move a task to another parent',
+    list => list.map(t => t.id === 3 ? { ...t, parent_id: 4 } : t), [3], false],
+  ['add tasks',
+    list => [...list, task(6, { depends_on: [4], parent_id: 1 }), task(7)], [6, 7], true],
+  ['remove a task others depend on',
+    list => list.filter(t => t.id !== 3), [3], true],
+  ['replace and remove in one update',
+    list => list.filter(t => t.id !== 7).map(t => t.id === 2 ? { ...t, depends_on: [6] } : t), [2, 7], true],
+  ['depend on a task that does not exist',
+    list => list.map(t => t.id === 6 ? { ...t, depends_on: [4, 99] } : t), [6], true]
+];
+
+let tasks = BASE;
+let index = buildDependencyIndex(tasks);
+STEPS.forEach(([description, edit, changedIds, edgesChanged]) => {
+  check(`${description}: index matches a fresh build`, () => {
+    const version = index.version;
+    tasks = edit(tasks);
+    const next = updateDependencyIndex(index, tasks);
+    assert.notEqual(next, index);
+    assert.equal(next.version, version + 1);
+    assert.deepEqual([...next.changedIds].sort(), changedIds);
+    assert.equal(next.edgesChanged, edgesChanged);
+    assertMatchesRebuild(next, tasks);
+    index = next;
+  });
+});
+
+check('successors and children follow the deltas', () => {
+  assert.deepEqual(getSuccessors(index, 4).map(t => t.id), [6]);
+  assert.deepEqual(getSuccessors(index, 6).map(t => t.id), [2]);
+  // 3 is gone but 4 and 5 still list it, as a fresh build would
+  assert.deepEqual(getSuccessors(index, 3).map(t => t.id).sort(), [4, 5]);
+  assert.deepEqual(getChildren(index, 1).map(t => t.id).sort(), [2, 6]);
+  assert.deepEqual(getChildren(index, 4), []);
+});
+
+check('many random deltas still match a fresh build', () => {
+  let state = 7;
+  const random = (n) => {
+    state = (state * 1103515245 + 12345) % 2147483648;
+    return Math.floor((state / 2147483648) * n);
+  };
+  let list = Array.from({ length: 50 }, (_, i) => task(i + 1));
+  let current = buildDependencyIndex(list);
+  for (let round = 0; round < 200; round++) {
+    const id = 1 + random(60);
+    const existing = list.find(t => t.id === id);
+    const deps = Array.from({ length: random(3) }, () => 1 + random(60));
+    if (!existing) {
+      list = [...list, task(id, { depends_on: deps, parent_id: random(2) ? 1 + random(60) : null })];
+    } else if (random(4) === 0) {
+      list = list.filter(t => t.id !== id);
+    } else {
+      list = list.map(t => t.id === id ? { ...t, depends_on: deps, parent_id: random(2) ? 1 + random(60) : null } : t);
+    }
+    current = updateDependencyIndex(current, list);
+    assertMatchesRebuild(current, list);
+  }
+});
+
+console.log(`\n📊 ${results.passed.length} passed, ${results.failed.length} failed`);
+process.exit(results.failed.length > 0 ? 1 : 0);
@@ -0,0 +1,158 @@
+/**
+ * GANTT DRAG PREVIEW TEST
+ * Runs src/lib/ganttDrag.js in Node: snapped dates while moving and
+ * resizing a bar, clamping to a minimum duration and the predecessor rule
+ *
+ * Usage: node scripts/test-gantt-drag.js
+ */
+
+import assert from 'node:assert/strict';
+import { register } from 'node:module';
+
+// ==================== MODULE HOOKS ====================
+
+// The app imports without extensions (Vite)
+const HOOKS = `
+  export async function resolve(specifier, context, next) {
+    try {
+      return await next(specifier, context);
+    } catch (error) {
+      if (!specifier.startsWith('.') || /\\.[cm]?js$/.test(specifier)) throw error;
+      return next(specifier + '.js', context);
+    }
+  }
+`;
+
+register('data:text/javascript,' + encodeURIComponent(HOOKS), import.meta.url);
+
+const { createDragSession, getDragPreview, getSnapStep, isUnchanged, toDatesPatch } = await import('../src/lib/ganttDrag.js');
+const { buildDependencyIndex } = await import('../src/lib/dependencyGraph.js');
+
+// ==================== HELPERS ====================
+
+const HOUR_MS = 60 * 60 * 1000;
+const DAY_MS = 24 * HOUR_MS;
+const DAY_WIDTH = 40;                   // px per day -> 1 px = 36 minutes
+const GRID_START = new Date(Date.UTC(2025, 0, 1));
+const at = (day, hour = 0) => Date.UTC(2025, 0, day, hour);
+
+// Task 2 runs Jan 5 -> Jan 8 and depends on task 1, which is due Jan 3
+const PREDECESSOR = { id: 1, name: 'Design', due_date: '2025-01-03', depends_on: null };
+const TASK = { id: 2, name: 'Build', depends_on: [1] };
+const INDEX = buildDependencyIndex([PREDECESSOR, TASK]);
+
+const session = ({ edge = null, start = at(5), end = at(8), viewMode = 'day', zoomLevel = 1, dayWidth = DAY_WIDTH, task = TASK } = {}) =>
+  createDragSession({
+    task,
+    edge,
+    clientX: 500,
+    position: { startDate: new Date(start), endDate: new Date(end) },
+    gridStart: GRID_START,
+    dayWidth,
+    viewMode,
+    zoomLevel,
+    dependencyIndex: INDEX
+  });
+
+// Preview after moving the pointer by `dx` px, as [start, end, valid]
+const preview = (drag, dx) => {
+  const { startMs, endMs, valid } = getDragPreview(drag, 500 + dx);
+  return [new Date(startMs).toISOString(), new Date(endMs).toISOString(), valid];
+};
+const iso = (ms) => new Date(ms).toISOString();
+
+const results = { passed: [], failed: [] };
+const check = (name, fn) => {
+  try {
+    fn();
+    results.passed.push(name);
+    console.log(`✅ ${name}`);
+  } catch (error) {
+    results.failed.push(name);
+    console.log(`❌ ${name}\n   ${error.message}`);
+  }
+};
+
+// ==================== TESTS ====================
+
+console.log('🚀 Gantt drag preview\n');
+
+check('snap step follows the view mode and zoom', () => {
+  assert.equal(getSnapStep('day', 1), DAY_MS);
+  assert.equal(getSnapStep('month', 3), DAY_MS);
+  assert.equal(getSnapStep('hour', 1), HOUR_MS);
+  assert.equal(getSnapStep('hour', 2.5), 15 * 60 * 1000);
+});
+
+check('session captures the predecessor bound and minimum duration', () => {
+  const drag = session();
+  assert.equal(drag.earliestStart, at(3));
+  assert.equal(drag.minDuration, DAY_MS);
+  assert.equal(drag.msPerPixel, DAY_MS / DAY_WIDTH);
+  assert.equal(session({ task: { id: 3, depends_on: null } }).earliestStart, -Infinity);
+});
+
+check('move keeps the duration and snaps to whole days', () => {
+  const drag = session();
+  assert.deepEqual(preview(drag, 85), [iso(at(7)), iso(at(10)), true]);     // +2.1 days
+  assert.deepEqual(preview(drag, 100), [iso(at(8)), iso(at(11)), true]);    // +2.5 days rounds up
+  assert.deepEqual(preview(drag, -90), [iso(at(3)), iso(at(6)), true]);     // onto the predecessor's due date
+});
+
+check('move before the predecessor finishes is flagged invalid', () => {
+  assert.deepEqual(preview(session(), -130), [iso(at(2)), iso(at(5)), false]);
+});
+
+check('small moves snap back to the original dates', () => {
+  const drag = session();
+  assert.equal(isUnchanged(drag, getDragPreview(drag, 510)), true);
+  assert.equal(isUnchanged(drag, getDragPreview(drag, 540)), false);
+});
+
+check('resize from the left moves only the start', () => {
+  const drag = session({ edge: 'left' });
+  assert.deepEqual(preview(drag, -40), [iso(at(4)), iso(at(8)), true]);
+  assert.deepEqual(preview(drag, 45), [iso(at(6)), iso(at(8)), true]);
+  assert.deepEqual(preview(drag, -110), [iso(at(2)), iso(at(8)), false]);
+});
+
+check('resize from the left is clamped one step before the end', () => {
+  assert.deepEqual(preview(session({ edge: 'left' }), 400), [iso(at(7)), iso(at(8)), true]);
+});
+
+check('resize from the right moves only the end', () => {
+  const drag = session({ edge: 'right' });
+  assert.deepEqual(preview(drag, 45), [iso(at(5)), iso(at(9)), true]);
+  assert.deepEqual(preview(drag, -40), [iso(at(5)), iso(at(7)), true]);
+});
+
+check('resize from the right is clamped one step after the start', () => {
+  assert.deepEqual(preview(session({ edge: 'right' }), -400), [iso(at(5)), iso(at(6)), true]);
+});
+
+check('hour view at high zoom snaps to 15 minutes', () => {
+  // 960 px per day -> 1 px = 90 s
+  const drag = session({ viewMode: 'hour', zoomLevel: 3, dayWidth: 960, start: at(5, 9), end: at(5, 12) });
+  assert.deepEqual(preview(drag, 7), [iso(at(5, 9) + 15 * 60 * 1000), iso(at(5, 12) + 15 * 60 * 1000), true]);
+  assert.deepEqual(preview(drag, 4), [iso(at(5, 9)), iso(at(5, 12)), true]);
+});
+
+check('a task shorter than one step cannot be resized below its own length', () => {
+  const drag = session({ edge: 'right', start: at(5, 9), end: at(5, 13) });
+  assert.equal(drag.minDuration, 4 * HOUR_MS);
+  assert.deepEqual(preview(drag, -200), [iso(at(5, 9)), iso(at(5, 13)), true]);
+});
+
+check('dates patch writes local calendar days next to the timestamps', () => {
+  const start = new Date(2025, 0, 5, 23, 30);
+  const end = new Date(2025, 0, 8, 0, 15);
+  assert.deepEqual(toDatesPatch(start, end), {
+    start_datetime: start.toISOString(),
+    due_datetime: end.toISOString(),
+    start_date: '2025-01-05',
+    due_date: '2025-01-08'
+  });
+});
+
+console.log(`\n📊 ${results.passed.length} passed, ${results.failed.length} failed`);
+process.exit(results.failed.length > 0 ? 1 : 0);
@@ -0,0 +1,126 @@
+/**
+ * GANTT WINDOWING TEST
+ * Runs src/lib/ganttWindow.js in Node: row model offsets with collapsed
+ * phases, row lookup by offset, and the visible row / day ranges
+ *
+ * Usage: node scripts/test-gantt-window.js
+ */
+
+import assert from 'node:assert/strict';
+import {
+  PHASE_HEADER_HEIGHT,
+  buildRowModel,
+  findRowAt,
+  getVisibleDayRange,
+  getVisibleRowRange
+} from '../src/lib/ganttWindow.js';
+
+// ==================== HELPERS ====================
+
+const ROW_HEIGHT = 32;
+
+const phase = (id) => ({ id, name: `Phase ${id}` });
+const task = (id, phaseId) => ({ id, phase_id: phaseId, name: `Task ${id}` });
+
+const PHASES = [phase(1), phase(2), phase(3)];
+const TASKS = [
+  task(10, 1), task(11, 1),
+  task(20, 2),
+  task(30, 3), task(31, 3), task(32, 3),
+  task(90, 9)                           // Phase not shown
+];
+
+const layout = (rows) => rows.map(row => [row.key, row.top, row.height]);
+
+const results = { passed: [], failed: [] };
+const check = (name, fn) => {
+  try {
+    fn();
+    results.passed.push(name);
+    console.log(`✅ ${name}`);
+  } catch (error) {
+    results.failed.push(name);
+    console.log(`❌ ${name}\n   ${error.message}`);
+  }
+};
+
+// ==================== TESTS ====================
+
+console.log('🚀 Gantt windowing\n');
+
+check('row model stacks phase headers and task rows', () => {
+  const { rows, totalHeight, rowIndexByTaskId } = buildRowModel(PHASES, TASKS, new Set(), ROW_HEIGHT);
+  assert.equal(PHASE_HEADER_HEIGHT, 40);
+  assert.deepEqual(layout(rows), [
+    ['phase-1', 0, 40], ['task-10', 40, 32], ['task-11', 72, 32],
+    ['phase-2', 104, 40], ['task-20', 144, 32],
+    ['phase-3', 176, 40], ['task-30', 216, 32], ['task-31', 248, 32], ['task-32', 280, 32]
+  ]);
+  assert.equal(totalHeight, 312);
+  assert.equal(rowIndexByTaskId.get(30), 6);
+  assert.equal(rowIndexByTaskId.has(90), false);
+});
+
+check('collapsed phases keep their header and task count but no task rows', () => {
+  const { rows, totalHeight, rowIndexByTaskId } = buildRowModel(PHASES, TASKS, new Set([2]), ROW_HEIGHT);
+  assert.deepEqual(layout(rows), [
+    ['phase-1', 0, 40], ['task-10', 40, 32], ['task-11', 72, 32],
+    ['phase-2', 104, 40],
+    ['phase-3', 144, 40], ['task-30', 184, 32], ['task-31', 216, 32], ['task-32', 248, 32]
+  ]);
+  assert.equal(rows[3].taskCount, 1);
+  assert.equal(totalHeight, 280);
+  assert.equal(rowIndexByTaskId.has(20), false);
+  assert.equal(rowIndexByTaskId.get(31), 6);
+});
+
+check('all phases collapsed leaves only headers', () => {
+  const { rows, totalHeight } = buildRowModel(PHASES, TASKS, new Set([1, 2, 3]), ROW_HEIGHT);
+  assert.deepEqual(rows.map(row => row.type), ['phase', 'phase', 'phase']);
+  assert.equal(totalHeight, 3 * PHASE_HEADER_HEIGHT);
+});
+
+check('findRowAt maps offsets to rows at their boundaries', () => {
+  const { rows } = buildRowModel(PHASES, TASKS, new Set([2]), ROW_HEIGHT);
+  assert.equal(findRowAt(rows, -5), 0);
+  assert.equal(findRowAt(rows, 0), 0);
+  assert.equal(findRowAt(rows, 39), 0);
+  assert.equal(findRowAt(rows, 40), 1);
+  assert.equal(findRowAt(rows, 143), 3);
+  assert.equal(findRowAt(rows, 144), 4);
+  assert.equal(findRowAt(rows, 10000), rows.length - 1);
+});
+
+check('visible row range covers the viewport plus overscan', () => {
+  const { rows } = buildRowModel(PHASES, TASKS, new Set([2]), ROW_HEIGHT);
+  // 100..150 spans task-11 (72..104), phase-2 (104..144) and phase-3 (144..184)
+  assert.deepEqual(getVisibleRowRange(rows, 100, 50, 0), { start: 2, end: 5 });
+  assert.deepEqual(getVisibleRowRange(rows, 100, 50, 1), { start: 1, end: 6 });
+  assert.deepEqual(getVisibleRowRange(rows, 100, 50, 50), { start: 0, end: rows.length });
+  assert.deepEqual(getVisibleRowRange(rows, 0, 10000, 0), { start: 0, end: rows.length });
+  assert.deepEqual(getVisibleRowRange([], 0, 500), { start: 0, end: 0 });
+});
+
+check('collapsing a phase shifts the visible range', () => {
+  const expanded = buildRowModel(PHASES, TASKS, new Set(), ROW_HEIGHT).rows;
+  const collapsed = buildRowModel(PHASES, TASKS, new Set([1]), ROW_HEIGHT).rows;
+  // Same 216..248 viewport: task-30 starts at 216 expanded, at 152 with phase 1
+  // collapsed (the row starting exactly at the bottom edge is included)
+  const visible = (rows) => {
+    const { start, end } = getVisibleRowRange(rows, 216, 32, 0);
+    return rows.slice(start, end).map(row => row.key);
+  };
+  assert.deepEqual(visible(expanded), ['task-30', 'task-31']);
+  assert.deepEqual(visible(collapsed), ['task-32']);
+});
+
+check('visible day range covers the viewport plus overscan, clamped to the project', () => {
+  assert.deepEqual(getVisibleDayRange(250, 300, 50, 100, 2), { startDay: 3, endDay: 13, left: 150, right: 700 });
+  assert.deepEqual(getVisibleDayRange(0, 300, 50, 100, 2), { startDay: 0, endDay: 8, left: 0, right: 450 });
+  assert.deepEqual(getVisibleDayRange(4900, 300, 50, 100, 2), { startDay: 96, endDay: 100, left: 4800, right: 5050 });
+  const { startDay, endDay } = getVisibleDayRange(700, 300, 50, 100);
+  assert.deepEqual([startDay, endDay], [7, 27]);
+});
+
+console.log(`\n📊 ${results.passed.length} passed, ${results.failed.length} failed`);
+process.exit(results.failed.length > 0 ? 1 : 0);
@@ -0,0 +1,197 @@
+/**
+ * CPM SCHEDULING TEST
+ * Runs src/lib/scheduling.js in Node on fixed dependency graphs: known
+ * ES/EF/LS/LF/float, cycle detection, and incremental updates that must
+ * match a full recompute
+ *
+ * Usage: node scripts/test-scheduling.js
+ */
+
+import assert from 'node:assert/strict';
+import { computeSchedule, describeCycle, topologicalOrder, updateSchedule } from '../src/lib/scheduling.js';
+import { buildDependencyIndex, updateDependencyIndex } from '../src/lib/dependencyGraph.js';
+
+// ==================== HELPERS ====================
+
+const task = (id, days, dependsOn = null) => ({ id, name: `Task ${id}`, days, depends_on: dependsOn });
+
+// Durations come from the fixture, not from dates
+const OPTIONS = { duration: t => t.days };
+
+const EPSILON = 1e-9;
+
+const pick = (schedule, id) => ({
+  es: schedule.es.get(id),
+  ef: schedule.ef.get(id),
+  ls: schedule.ls.get(id),
+  lf: schedule.lf.get(id),
+  float: schedule.float.get(id)
+});
+
+const assertSameSchedule = (actual, expected) => {
+  assert.deepEqual(actual.order.slice().sort((a, b) => a - b), expected.order.slice().sort((a, b) => a - b));
+  assert.ok(Math.abs(actual.projectEnd - expected.projectEnd) < EPSILON,
+    `projectEnd ${actual.projectEnd} !== ${expected.projectEnd}`);
+  expected.order.forEach(id => {
+    ['es', 'ef', 'ls', 'lf', 'float'].forEach(field => {
+      const a = actual[field].get(id);
+      const e = expected[field].get(id);
+      assert.ok(Math.abs(a - e) < EPSILON, `task ${id} ${field}: ${a} !== ${e}`);
+    });
+  });
+  assert.deepEqual([...actual.critical].sort((a, b) => a - b), [...expected.critical].sort((a, b) => a - b));
+};
+
+// Deterministic pseudo-random layered DAG (LCG, fixed seed)
+const randomGraph = (size, seed = 42) => {
+  let state = seed;
+  const random = () => {
+    state = (state * 1103515245 + 12345) % 2147483648;
+    return state / 2147483648;
+  };
+  const tasks = [];
+  for (let id = 1; id <= size; id++) {
+    const deps = [];
+    const count = id === 1 ? 0 : Math.floor(random() * 3);
+    for (let i = 0; i < count; i++) {
+      const dep = 1 + Math.floor(random() * (id - 1));
+      if (!deps.includes(dep)) deps.push(dep);
+    }
+    tasks.push(task(id, 1 + Math.floor(random() * 5), deps.length ? deps : null));
+  }
+  return tasks;
+};
+
+const results = { passed: [], failed: [] };
+const check = (name, fn) => {
+  try {
+    fn();
+    results.passed.push(name);
+    console.log(`✅ ${name}`);
+  } catch (error) {
+    results.failed.push(name);
+    console.log(`❌ ${name}\n   ${error.message}`);
+  }
+};
+
+// ==================== TESTS ====================
+
+console.log('🚀 CPM scheduling\n');
+
+//   1 (3) ──┬── 2 (2) ──┐
+//           └── 3 (4) ──┴── 4 (1)        5 (2) on its own
+const DAG = [task(1, 3), task(2, 2, [1]), task(3, 4, [1]), task(4, 1, [2, 3]), task(5, 2)];
+
+check('forward/backward pass on a fixed DAG', () => {
+  const schedule = computeSchedule(buildDependencyIndex(DAG), OPTIONS);
+  assert.equal(schedule.cycle, null);
+  assert.equal(schedule.projectEnd, 8);
+  assert.deepEqual(pick(schedule, 1), { es: 0, ef: 3, ls: 0, lf: 3, float: 0 });
+  assert.deepEqual(pick(schedule, 2), { es: 3, ef: 5, ls: 5, lf: 7, float: 2 });
+  assert.deepEqual(pick(schedule, 3), { es: 3, ef: 7, ls: 3, lf: 7, float: 0 });
+  assert.deepEqual(pick(schedule, 4), { es: 7, ef: 8, ls: 7, lf: 8, float: 0 });
+  assert.deepEqual(pick(schedule, 5), { es: 0, ef: 2, ls: 6, lf: 8, float: 6 });
+  assert.deepEqual([...schedule.critical].sort(), [1, 3, 4]);
+});
+
+check('lag is added between a predecessor\'s finish and its successor\'s start', () => {
+  const schedule = computeSchedule(buildDependencyIndex(DAG), { ...OPTIONS, lag: 1 });
+  assert.equal(schedule.projectEnd, 10);
+  assert.deepEqual(pick(schedule, 2), { es: 4, ef: 6, ls: 6, lf: 8, float: 2 });
+  assert.deepEqual(pick(schedule, 4), { es: 9, ef: 10, ls: 9, lf: 10, float: 0 });
+  assert.deepEqual(pick(schedule, 5), { es: 0, ef: 2, ls: 8, lf: 10, float: 8 });
+  assert.deepEqual([...schedule.critical].sort(), [1, 3, 4]);
+});
+
+check('topological order puts every task after its predecessors', () => {
+  const { order, cycle } = topologicalOrder(buildDependencyIndex(randomGraph(300)));
+  assert.equal(cycle, null);
+  assert.equal(order.length, 300);
+  const position = new Map(order.map((id, i) => [id, i]));
+  randomGraph(300).forEach(t => (t.depends_on || []).forEach(dep => {
+    assert.ok(position.get(dep) < position.get(t.id), `${dep} after ${t.id}`);
+  }));
+});
+
+// 1 → 2 → 3 → 1 is a cycle; 4 only hangs off it, 5 is free
+const CYCLIC = [task(1, 1, [3]), task(2, 1, [1]), task(3, 1, [2]), task(4, 1, [3]), task(5, 1)];
+
+check('cycle detection returns the cycle path in dependency order', () => {
+  const index = buildDependencyIndex(CYCLIC);
+  const { order, cycle, blocked } = topologicalOrder(index);
+  assert.deepEqual(order, [5]);
+  assert.deepEqual([...blocked].sort(), [1, 2, 3, 4]);
+  assert.deepEqual([...cycle].sort(), [1, 2, 3]);
+  // Each task in the path depends on the one before it (wrapping around)
+  cycle.forEach((id, i) => {
+    const next = cycle[(i + 1) % cycle.length];
+    assert.ok(index.byId.get(next).depends_on.includes(id), `${next} does not depend on ${id}`);
+  });
+  const names = cycle.map(id => `Task ${id}`);
+  assert.equal(describeCycle(index, cycle), [...names, names[0]].join(' → '));
+});
+
+check('computeSchedule reports the cycle and schedules only the free tasks', () => {
+  const schedule = computeSchedule(buildDependencyIndex(CYCLIC), OPTIONS);
+  assert.equal(schedule.cycle.length, 3);
+  assert.deepEqual(schedule.order, [5]);
+  assert.equal(schedule.es.has(1), false);
+});
+
+check('updateSchedule after a duration change equals a full recompute', () => {
+  let tasks = randomGraph(300);
+  let index = buildDependencyIndex(tasks);
+  let schedule = computeSchedule(index, OPTIONS);
+  // Lengthen, shorten, then a batch of several tasks at once
+  [[50], [50], [7, 120, 299], [1]].forEach((ids, round) => {
+    tasks = tasks.map(t => ids.includes(t.id) ? { ...t, days: round % 2 === 0 ? t.days + 4 : 1 } : t);
+    index = updateDependencyIndex(index, tasks);
+    assert.equal(index.edgesChanged, false);
+    schedule = updateSchedule(schedule, index, index.changedIds);
+    assertSameSchedule(schedule, computeSchedule(buildDependencyIndex(tasks), OPTIONS));
+  });
+});
+
+check('updateSchedule moving the project end re-derives every late date', () => {
+  let tasks = DAG;
+  let index = buildDependencyIndex(tasks);
+  const schedule = computeSchedule(index, OPTIONS);
+  tasks = tasks.map(t => t.id === 2 ? { ...t, days: 10 } : t);
+  index = updateDependencyIndex(index, tasks);
+  const updated = updateSchedule(schedule, index, index.changedIds);
+  assert.equal(updated.projectEnd, 14);
+  assert.deepEqual([...updated.critical].sort(), [1, 2, 4]);
+  assertSameSchedule(updated, computeSchedule(buildDependencyIndex(tasks), OPTIONS));
+});
+
+check('updateSchedule after an edge change equals a full recompute', () => {
+  let tasks = randomGraph(300);
+  let index = buildDependencyIndex(tasks);
+  let schedule = computeSchedule(index, OPTIONS);
+  // Add an edge, drop one, add a task, delete a task
+  const edits = [
+    list => list.map(t => t.id === 200 ? { ...t, depends_on: [...(t.depends_on || []), 150] } : t),
+    list => list.map(t => t.id === 200 ? { ...t, depends_on: null } : t),
+    list => [...list, task(301, 6, [299, 10])],
+    list => list.filter(t => t.id !== 10)
+  ];
+  edits.forEach(edit => {
+    tasks = edit(tasks);
+    index = updateDependencyIndex(index, tasks);
+    assert.equal(index.edgesChanged, true);
+    schedule = updateSchedule(schedule, index, index.changedIds);
+    assertSameSchedule(schedule, computeSchedule(buildDependencyIndex(tasks), OPTIONS));
+  });
+});
+
+check('updateSchedule without a duration change keeps the schedule', () => {
+  let tasks = DAG;
+  let index = buildDependencyIndex(tasks);
+  const schedule = computeSchedule(index, OPTIONS);
+  tasks = tasks.map(t => t.id === 3 ? { ...t, name: 'Renamed' } : t);
+  index = updateDependencyIndex(index, tasks);
+  assert.equal(updateSchedule(schedule, index, index.changedIds), schedule);
+});
+
+console.log(`\n📊 ${results.passed.length} passed, ${results.failed.length} failed`);
+process.exit(results.failed.length > 0 ? 1 : 0);
@@ -0,0 +1,138 @@
+/**
+ * TASK STORE DERIVED-FIELD TEST
+ * Runs src/lib/taskStore.js in Node against an in-memory Supabase stub and
+ * checks that deltas re-derive every affected row (no follow-up fetch)
+ *
+ * Usage: node scripts/test-task-store.js
+ */
+
+import assert from 'node:assert/strict';
+import { register } from 'node:module';
+
+// ==================== MODULE STUBS ====================
+
+// The app imports without extensions (Vite); supabase.js is swapped for a stub
+const SUPABASE_STUB = `
+  const stub = globalThis.__supabaseStub;
+  const query = (table) => new Proxy({}, {
+    get: (target, prop) => prop === 'then'
+      ? (resolve) => resolve({ data: (stub.tables[table] || []).map(row => ({ ...row })), error: null })
+      : () => query(table)
+  });
+  export const SUPABASE_URL = 'http://stub.local';
+  export const supabase = {
+    from: (table) => query(table),
+    channel: () => {
+      const channel = {
+        on: (type, filter, handler) => { stub.handlers.push(handler); return channel; },
+        subscribe: (callback) => { if (callback) callback('SUBSCRIBED'); return channel; }
+      };
+      return channel;
+    },
+    removeChannel: () => {}
+  };
+`;
+
+const HOOKS = `
+  export async function resolve(specifier, context, next) {
+    let resolved;
+    try {
+      resolved = await next(specifier, context);
+    } catch (error) {
+      if (!specifier.startsWith('.') || /\\.[cm]?js$/.test(specifier)) throw error;
+      resolved = await next(specifier + '.js', context);
+    }
+    if (resolved.url.endsWith('/src/lib/supabase.js')) {
+      return { url: 'data:text/javascript,' + encodeURIComponent(${JSON.stringify(SUPABASE_STUB)}), shortCircuit: true };
+    }
+    return resolved;
+  }
+`;
+
+globalThis.__supabaseStub = { tables: {}, handlers: [] };
+globalThis.requestAnimationFrame = (callback) => setTimeout(callback, 0);
+register('data:text/javascript,' + encodeURIComponent(HOOKS), import.meta.url);
+
+const stub = globalThis.__supabaseStub;
+const store = await import('../src/lib/taskStore.js');
+
+// ==================== HELPERS ====================
+
+const task = (id, fields = {}) => ({
+  id,
+  name: `Task ${id}`,
+  status: 'PENDING',
+  task_type: 'TASK',
+  phase_id: 1,
+  order_index: id,
+  parent_id: null,
+  depends_on: null,
+  progress_percentage: 0,
+  updated_at: '2025-11-13T10:00:00Z',
+  ...fields
+});
+
+const tick = () => new Promise(resolve => setTimeout(resolve, 5));
+const get = (id) => store.getTaskStoreState().byId.get(id);
+const realtime = (payload) => stub.handlers.forEach(handler => handler(payload));
+
+const results = { passed: [], failed: [] };
+const check = (name, fn) => {
+  try {
+    fn();
+    results.passed.push(name);
+    console.log(`✅ ${name}`);
+  } catch (error) {
+    results.failed.push(name);
+    console.log(`❌ ${name}\n   ${error.message}`);
+  }
+};
+
+// ==================== TESTS ====================
+
+console.log('🚀 Task store derived fields\n');
+
+stub.tables.tasks = [
+  task(1, { name: 'P', task_type: 'EPIC' }),
+  task(2, { parent_id: 1 }),
+  task(3, { parent_id: 1, status: 'DONE' })
+];
+const unsubscribe = store.subscribeTaskStore(() => {});
+await tick();
+
+check('initial load derives parent fields', () => {
+  assert.equal(store.getTaskStoreStatus(), 'ready');
+  assert.equal(get(2).parent_name, 'P');
+  assert.equal(get(2).parent_type, 'EPIC');
+  assert.equal(get(1).child_count, 2);
+});
+
+store.patchTasks([{ id: 1, name: 'Renamed', task_type: 'STORY' }]);
+check('renaming a parent re-derives its children', () => {
+  assert.equal(get(2).parent_name, 'Renamed');
+  assert.equal(get(2).parent_type, 'STORY');
+  assert.equal(get(3).parent_name, 'Renamed');
+});
+
+// Child delivered before its parent: the parent's INSERT must update it
+realtime({ eventType: 'INSERT', new: task(5, { parent_id: 4 }), old: {} });
+realtime({ eventType: 'INSERT', new: task(4, { name: 'Late parent', task_type: 'EPIC' }), old: {} });
+await tick();
+check('inserting a parent re-derives children that arrived first', () => {
+  assert.equal(get(5).parent_name, 'Late parent');
+  assert.equal(get(5).parent_type, 'EPIC');
+  assert.equal(get(4).child_count, 1);
+});
+
+store.removeTasks([1]);
+check('deleting a parent clears its children\'s parent fields', () => {
+  assert.equal(get(1), undefined);
+  assert.equal(get(2).parent_name, null);
+  assert.equal(get(2).parent_type, null);
+  assert.equal(get(3).parent_name, null);
+});
+
+unsubscribe();
+
+console.log(`\n📊 ${results.passed.length} passed, ${results.failed.length} failed`);
+process.exit(results.failed.length > 0 ? 1 : 0);
@@ -0,0 +1,175 @@
+-- ============================================================================
+-- CODIA TRACKER - TASK VIEW BENCHMARK
+-- Full reads of tasks_with_dependencies / tracker_app_data at 10k and 100k
+-- tasks: migration 002 views (correlated subqueries, "before") vs migration
+-- 006 views (task_dependency_stats join, "after")
+--
+-- Run on a scratch copy of the database (after migration 006):
+--   psql "$DATABASE_URL" -f sql/benchmark-task-views.sql
+-- Everything happens in one transaction that is rolled back at the end.
+-- Compare the "Time:" lines psql prints after each SELECT.
+-- ============================================================================
+
+-- Legacy views could take hours at 100k; a timeout counts as "did not finish"
+-- and the script carries on (each statement gets its own savepoint)
+\set ON_ERROR_STOP off
+\set ON_ERROR_ROLLBACK on
+\timing off
+
+BEGIN;
+SET LOCAL statement_timeout = '10min';
+
+-- ----------------------------------------------------------------------------
+-- "Before": migration 002 definitions as temp views
+-- (same aggregate columns; phase/sprint joins are identical in both versions)
+-- ----------------------------------------------------------------------------
+CREATE TEMP VIEW legacy_tasks_with_dependencies AS
+SELECT
+  t.*,
+  p.name as phase_name,
+  parent.name as parent_name,
+  (SELECT COUNT(*) FROM tasks WHERE parent_id = t.id) as child_count,
+  CASE
+    WHEN t.depends_on IS NOT NULL THEN
+      (SELECT array_agg(name ORDER BY name) FROM tasks WHERE id = ANY(t.depends_on))
+    ELSE NULL
+  END as depends_on_names,
+  CASE
+    WHEN EXISTS (SELECT 1 FROM tasks WHERE t.id = ANY(depends_on)) THEN
+      (SELECT array_agg(id ORDER BY id) FROM tasks WHERE t.id = ANY(depends_on))
+    ELSE ARRAY[]::INTEGER[]
+  END as blocking_dependencies,
+  (SELECT COUNT(*) FROM tasks WHERE t.id = ANY(depends_on)) as blocking_count,
+  CASE
+    WHEN t.status = 'DONE' THEN 'DONE'
+    WHEN t.depends_on IS NULL OR array_length(t.depends_on, 1) IS NULL THEN 'READY'
+    WHEN EXISTS (
+      SELECT 1 FROM tasks dep WHERE dep.id = ANY(t.depends_on) AND dep.status != 'DONE'
+    ) THEN 'BLOCKED'
+    ELSE 'READY'
+  END as execution_status,
+  CASE
+    WHEN (SELECT COUNT(*) FROM tasks WHERE parent_id = t.id) > 0 THEN
+      (SELECT ROUND((COUNT(*) FILTER (WHERE status = 'DONE')::DECIMAL / COUNT(*)) * 100)
+       FROM tasks WHERE parent_id = t.id)
+    ELSE t.progress_percentage
+  END as calculated_progress
+FROM tasks t
+LEFT JOIN phases p ON t.phase_id = p.id
+LEFT JOIN tasks parent ON t.parent_id = parent.id;
+
+CREATE TEMP VIEW legacy_tracker_app_data AS
+SELECT
+  l.*,
+  (SELECT COUNT(*) FROM tasks WHERE parent_id = l.id AND status = 'DONE') as completed_child_count,
+  (SELECT agent_name FROM ai_execution_logs WHERE task_id = l.id ORDER BY timestamp DESC LIMIT 1) as last_agent,
+  (SELECT status FROM ai_execution_logs WHERE task_id = l.id ORDER BY timestamp DESC LIMIT 1) as last_agent_status,
+  (SELECT timestamp FROM ai_execution_logs WHERE task_id = l.id ORDER BY timestamp DESC LIMIT 1) as last_agent_activity
+FROM legacy_tasks_with_dependencies l;
+
+-- ----------------------------------------------------------------------------
+-- Seed: chains of 50 tasks (each depends on the previous one, every 7th also
+-- on the one 5 back), 10 subtasks per parent, a third DONE
+-- ----------------------------------------------------------------------------
+INSERT INTO phases (name) VALUES ('Benchmark phase');
+
+CREATE FUNCTION pg_temp.seed_benchmark_tasks(target_count INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+  bench_phase INTEGER := (SELECT MAX(id) FROM phases WHERE name = 'Benchmark phase');
+  existing INTEGER := (SELECT COUNT(*) FROM tasks WHERE phase_id = bench_phase);
+BEGIN
+  IF target_count <= existing THEN
+    RETURN existing;
+  END IF;
+
+  -- Rows first, then wire depends_on/parent_id by position in one UPDATE
+  -- (IDs from one INSERT are consecutive, so neighbours are id - k)
+  INSERT INTO tasks (phase_id, name, status, order_index, progress_percentage)
+  SELECT
+    bench_phase,
+    'Benchmark task ' || n,
+    CASE WHEN n % 3 = 0 THEN 'DONE' ELSE 'PENDING' END,
+    n,
+    (n * 7) % 100
+  FROM generate_series(existing + 1, target_count) AS n
+  ORDER BY n;
+
+  UPDATE tasks t
+  SET
+    depends_on = CASE
+      WHEN t.order_index % 50 = 1 THEN NULL
+      WHEN t.order_index % 7 = 0 AND t.order_index % 50 > 5 THEN ARRAY[t.id - 1, t.id - 5]
+      ELSE ARRAY[t.id - 1]
+    END,
+    parent_id = CASE
+      WHEN t.order_index % 10 = 1 THEN NULL
+      ELSE t.id - ((t.order_index - 1) % 10)
+    END
+  WHERE t.phase_id = bench_phase
+    AND t.order_index > existing;
+
+  RETURN target_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- 10k tasks
+-- ============================================================================
+SELECT pg_temp.seed_benchmark_tasks(10000);
+ANALYZE tasks;
+ANALYZE task_dependency_stats;
+
+\timing on
+\echo '--- 10k: tasks_with_dependencies BEFORE'
+SELECT COUNT(*), SUM(length(v::TEXT)) FROM legacy_tasks_with_dependencies v;
+\echo '--- 10k: tasks_with_dependencies AFTER'
+SELECT COUNT(*), SUM(length(v::TEXT)) FROM tasks_with_dependencies v;
+\echo '--- 10k: tracker_app_data BEFORE'
+SELECT COUNT(*), SUM(length(v::TEXT)) FROM legacy_tracker_app_data v;
+\echo '--- 10k: tracker_app_data AFTER'
+SELECT COUNT(*), SUM(length(v::TEXT)) FROM tracker_app_data v;
+\timing off
+
+-- ============================================================================
+-- 100k tasks (seeding also shows the trigger cost of a 90k-row insert)
+-- ============================================================================
+\timing on
+\echo '--- seed 90k more tasks (triggers on)'
+SELECT pg_temp.seed_benchmark_tasks(100000);
+\timing off
+ANALYZE tasks;
+ANALYZE task_dependency_stats;
+
+\timing on
+\echo '--- 100k: tasks_with_dependencies BEFORE'
+SELECT COUNT(*), SUM(length(v::TEXT)) FROM legacy_tasks_with_dependencies v;
+\echo '--- 100k: tasks_with_dependencies AFTER'
+SELECT COUNT(*), SUM(length(v::TEXT)) FROM tasks_with_dependencies v;
+\echo '--- 100k: tracker_app_data BEFORE'
+SELECT COUNT(*), SUM(length(v::TEXT)) FROM legacy_tracker_app_data v;
+\echo '--- 100k: tracker_app_data AFTER'
+SELECT COUNT(*), SUM(length(v::TEXT)) FROM tracker_app_data v;
+
+-- Incremental maintenance: one status change, one drag (no refresh)
+\echo '--- 100k: mark one task DONE (refreshes task, parent, successors)'
+UPDATE tasks SET status = 'DONE'
+WHERE id = (SELECT MAX(id) - 500 FROM tasks WHERE name LIKE 'Benchmark task %');
+\echo '--- 100k: move one task (no stats refresh)'
+UPDATE tasks SET start_date = CURRENT_DATE, due_date = CURRENT_DATE + 3
+WHERE id = (SELECT MAX(id) - 500 FROM tasks WHERE name LIKE 'Benchmark task %');
+\timing off
+
+-- Consistency check on a 1% sample (the legacy view is filtered per row)
+\echo '--- sampled rows where stored aggregates differ from the legacy view (expect 0)'
+SELECT COUNT(*)
+FROM tasks_with_dependencies a
+JOIN legacy_tasks_with_dependencies b ON b.id = a.id
+WHERE a.id % 100 = 0
+  AND (a.child_count, a.depends_on_names, a.blocking_dependencies, a.blocking_count,
+       a.execution_status, a.calculated_progress)
+  IS DISTINCT FROM
+      (b.child_count, b.depends_on_names, b.blocking_dependencies, b.blocking_count,
+       b.execution_status, b.calculated_progress));
+
+ROLLBACK;
@@ -1,45 +1,27 @@
-import React, { useState, useEffect } from 'react';
-import { supabase } from '../lib/supabase';
+import React, { useEffect, useRef } from 'react';
+import { useLogStream } from '../hooks/useLogStream';
 import { Activity, CheckCircle, Clock, AlertCircle, Zap, Play } from 'lucide-react';
 
 export const AIActivityStream = () => {
-  const [logs, setLogs] = useState([]);
-  const [loading, setLoading] = useState(true);
+  // Keyset pages + realtime deltas (no refetch per inserted row)
+  const { rows: logs, loading, loadingMore, hasMore, loadMore } = useLogStream('ai_execution_logs');
+  const listRef = useRef(null);
+  const sentinelRef = useRef(null);
 
+  // Infinite scroll: fetch the next older page as the end of the list comes into view
   useEffect(() => {
-    loadLogs();
-    
-    // Real-time subscription
-    const subscription = supabase
-      .channel('ai_activity')
-      .on('postgres_changes',
-        { event: 'INSERT', schema: 'public', table: 'ai_execution_logs' },
-        () => loadLogs()
-      )
-      .subscribe();
-
-    return () => subscription.unsubscribe();
-  }, []);
+    const sentinel = sentinelRef.current;
+    if (!sentinel || !hasMore || typeof IntersectionObserver === 'undefined') return;
 
-  const loadLogs = async () => {
-    try {
-      const { data, error } = await supabase
-        .from('ai_execution_logs')
-        .select(`
-          *,
-          tasks(name, phase_id)
-        `)
-        .order('timestamp', { ascending: false })
-        .limit(20);
-
-      if (error) throw error;
-      setLogs(data || []);
-      setLoading(false);
-    } catch (error) {
-      console.error('Error loading AI logs:', error);
-      setLoading(false);
-    }
-  };
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries.some(entry => entry.isIntersecting)) loadMore();
+      },
+      { root: listRef.current, rootMargin: '200px' }
+    );
+    observer.observe(sentinel);
+    return () => observer.disconnect();
+  }, [hasMore, loadMore, logs.length]);
 
   const getStatusIcon = (status) => {
     const icons = {
@@ -81,7 +63,7 @@ export const AIActivityStream = () => {
           <p>No activity yet. Cascade will log here when working.</p>
         </div>
       ) : (
-        <div className="space-y-3">
+        <div ref={listRef} className="space-y-3 max-h-[640px] overflow-y-auto pr-1">
           {logs.map(log => (
             <div 
               key={log.id} 
@@ -146,6 +128,11 @@ export const AIActivityStream = () => {
               </div>
             </div>
           ))}
+          <div ref={sentinelRef} className="text-center py-2 text-xs text-gray-400">
+            {loadingMore ? 'Loading older activity...' : hasMore ? (
+              <button onClick={loadMore} className="hover:text-gray-600">Load older activity</button>
+            ) : 'No older activity'}
+          </div>
         </div>
       )}
     </div>
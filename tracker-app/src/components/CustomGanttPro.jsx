@@ -1,9 +1,26 @@
-import React, { useState, useEffect, useRef, useMemo } from 'react';
-import { supabase } from '../lib/supabase';
+import React, { useState, useEffect, useRef, useMemo, useCallback } from 'react';
+import { supabase, cascadeTaskDates } from '../lib/supabase';
 import { format, addDays, differenceInDays, startOfWeek, endOfWeek, eachDayOfInterval, eachWeekOfInterval, startOfMonth, endOfMonth, eachMonthOfInterval, isToday, startOfDay } from 'date-fns';
 import { Calendar, ChevronLeft, ChevronRight, ChevronDown, ChevronUp, ZoomIn, ZoomOut } from 'lucide-react';
 import toast, { Toaster } from 'react-hot-toast';
 import { TaskDetailModal } from './TaskDetailModal';
+import { buildRowModel, getVisibleRowRange, getVisibleDayRange } from '../lib/ganttWindow';
+import { useScrollViewport } from '../hooks/useScrollViewport';
+import { useDependencyIndex } from '../hooks/useDependencyIndex';
+import { useSchedule } from '../hooks/useSchedule';
+import { getPredecessors, getSuccessors, getSuccessorCount } from '../lib/dependencyGraph';
+import { computeSchedule, describeCycle, getTaskDurationDays } from '../lib/scheduling';
+import { optimisticBulkUpdate } from '../lib/bulkUpdate';
+import { setStoreTasks, reloadTasks, removeTasks, stripDerivedFields } from '../lib/taskStore';
+import { syncTable } from '../lib/localSnapshot';
+import { renderGanttImage } from '../lib/ganttCanvas';
+import { createDragSession, getDragPreview, isUnchanged, toDatesPatch } from '../lib/ganttDrag';
+import { measure } from '../lib/perf';
+import { GanttCanvas } from './GanttCanvas';
+import { useTaskStore } from '../hooks/useTaskStore';
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+const EMPTY_SET = new Set();
 
 /**
  * CustomGanttPro - Professional Gantt Chart Component
@@ -26,12 +43,17 @@ import { TaskDetailModal } from './TaskDetailModal';
  * - Grid lines (vertical guides)
  * - Tooltips (hover for full task info)
  * - Smooth scrolling and sync
+ * - Windowed rendering (only visible rows + date columns, with overscan)
  */
 export const CustomGanttPro = () => {
   // ==================== STATE ====================
-  const [tasks, setTasks] = useState([]);
+  // Tasks live in the shared store (one realtime channel for every view);
+  // local edits go through setStoreTasks with the same updater signature
+  const { tasks, loading: tasksLoading, error: tasksError } = useTaskStore();
+  const setTasks = setStoreTasks;
   const [phases, setPhases] = useState([]);
-  const [loading, setLoading] = useState(true);
+  const [phasesLoading, setPhasesLoading] = useState(true);
+  const loading = tasksLoading || phasesLoading;
   const [viewMode, setViewMode] = useState(() => localStorage.getItem('gantt_viewMode') || 'day');
   const [selectedTask, setSelectedTask] = useState(null);
   const [hoveredTask, setHoveredTask] = useState(null);
@@ -41,24 +63,26 @@ export const CustomGanttPro = () => {
   const [showBaseline, setShowBaseline] = useState(() => localStorage.getItem('gantt_showBaseline') === 'true');
   const [collapsedPhases, setCollapsedPhases] = useState(new Set());
   const [collapsedTasks, setCollapsedTasks] = useState(new Set());
-  const [draggedTask, setDraggedTask] = useState(null);
-  const [resizingTask, setResizingTask] = useState(null);
-  const [resizeEdge, setResizeEdge] = useState(null); // 'left' or 'right'
-  const [dragStartX, setDragStartX] = useState(0);
   const [tooltip, setTooltip] = useState({ visible: false, task: null, x: 0, y: 0 });
   const [contextMenu, setContextMenu] = useState({ visible: false, task: null, x: 0, y: 0 });
   const [filterStatus, setFilterStatus] = useState('ALL');
-  const [hasDragged, setHasDragged] = useState(false);
   const [taskColumnCollapsed, setTaskColumnCollapsed] = useState(() => localStorage.getItem('gantt_taskColumnCollapsed') === 'true');
+  const [renderer, setRenderer] = useState(() => localStorage.getItem('gantt_renderer') || 'dom'); // 'dom' | 'canvas'
   const [filterPriority, setFilterPriority] = useState('ALL');
   const [searchQuery, setSearchQuery] = useState('');
   const [zoomLevel, setZoomLevel] = useState(() => parseFloat(localStorage.getItem('gantt_zoomLevel')) || 1);
   
+  // Drag/resize lives in refs, not state: moving a bar re-renders nothing (see lib/ganttDrag)
+  const dragRef = useRef(null); // Active drag session
+  const dragFrameRef = useRef(null); // Pending requestAnimationFrame id
+  const hasDraggedRef = useRef(false); // Suppresses the click that ends a drag
+  const ganttCanvasRef = useRef(null);
+
   // Smart zoom: Auto-switch view mode based on zoom level
   // DISABLED during drag to prevent dayWidth changes!
   useEffect(() => {
     // Don't auto-switch while dragging - it messes up calculations!
-    if (draggedTask || resizingTask) return;
+    if (dragRef.current) return;
     
     // Determine target view mode based on zoom level
     let targetMode = viewMode;
@@ -80,16 +104,12 @@ export const CustomGanttPro = () => {
     if (targetMode !== viewMode) {
       setViewMode(targetMode);
     }
-  }, [zoomLevel, draggedTask, resizingTask, viewMode]); // Include viewMode to detect changes
+  }, [zoomLevel, viewMode]); // Include viewMode to detect changes
   const [highlightedTask, setHighlightedTask] = useState(null); // For visual highlight before modal
-  const [originalDraggedTask, setOriginalDraggedTask] = useState(null); // Store original task state for revert
-  const originalStartDateRef = useRef(null); // Store original start date for smooth drag calculation
-  const originalEndDateRef = useRef(null); // Store original end date for smooth resize calculation
   
   const timelineRef = useRef(null);
   const leftPanelRef = useRef(null);
   const modalTimerRef = useRef(null);
-  const lastDragUpdateRef = useRef(0); // Throttle drag updates
 
   // ==================== STATE PERSISTENCE ====================
   // Debug: Log initial state on mount (ONCE only)
@@ -167,6 +187,10 @@ export const CustomGanttPro = () => {
     localStorage.setItem('gantt_taskColumnCollapsed', taskColumnCollapsed.toString());
   }, [taskColumnCollapsed]);
 
+  useEffect(() => {
+    localStorage.setItem('gantt_renderer', renderer);
+  }, [renderer]);
+
   // Restore scroll position after data loads
   useEffect(() => {
     if (!loading && timelineRef.current) {
@@ -193,7 +217,7 @@ export const CustomGanttPro = () => {
 
   // ==================== DATA FETCHING ====================
   useEffect(() => {
-    loadData();
+    loadPhases();
     
     // Cleanup timer on unmount
     return () => {
@@ -238,10 +262,16 @@ export const CustomGanttPro = () => {
     const timeline = timelineRef.current;
     
     if (!leftPanel || !timeline) return;
-    
+    leftPanel.scrollTop = timeline.scrollTop; // Re-opened panel starts where the timeline is
+
+    // Instant and only on a real difference: under the global smooth
+    // scroll-behavior each assignment animates, and the two panels would keep
+    // chasing each other (the windowed rows never settle)
     const syncScroll = (source, target) => {
       return () => {
-        target.scrollTop = source.scrollTop;
+        if (target.scrollTop !== source.scrollTop) {
+          target.scrollTo({ top: source.scrollTop, behavior: 'instant' });
+        }
       };
     };
     
@@ -255,7 +285,7 @@ export const CustomGanttPro = () => {
       leftPanel.removeEventListener('scroll', leftToTimeline);
       timeline.removeEventListener('scroll', timelineToLeft);
     };
-  }, []);
+  }, [loading, taskColumnCollapsed]); // Panels only exist once loaded (left one can be hidden)
 
   // Mouse wheel zoom (Ctrl/Cmd + Wheel)
   useEffect(() => {
@@ -266,6 +296,7 @@ export const CustomGanttPro = () => {
       // Only zoom if Ctrl or Cmd is pressed
       if (e.ctrlKey || e.metaKey) {
         e.preventDefault();
+        if (dragRef.current) return; // The drag session holds the current dayWidth
         const delta = e.deltaY > 0 ? -0.1 : 0.1;
         setZoomLevel(prev => Math.max(0.5, Math.min(2, prev + delta)));
       }
@@ -275,28 +306,37 @@ export const CustomGanttPro = () => {
     return () => timeline.removeEventListener('wheel', handleWheel);
   }, []);
 
-  const loadData = async () => {
-    try {
-      setLoading(true);
-      
-      const [tasksRes, phasesRes] = await Promise.all([
-        supabase.from('tasks').select('*').order('order_index'),
-        supabase.from('phases').select('*').order('order_index')
-      ]);
+  // A drag cut short by unmounting must not paint into a stale tree
+  useEffect(() => () => {
+    if (dragFrameRef.current) cancelAnimationFrame(dragFrameRef.current);
+  }, []);
 
-      if (tasksRes.error) throw tasksRes.error;
-      if (phasesRes.error) throw phasesRes.error;
+  useEffect(() => {
+    if (tasksError) toast.error('Failed to load Gantt data');
+  }, [tasksError]);
 
-      setTasks(tasksRes.data || []);
-      setPhases(phasesRes.data || []);
+  const loadPhases = async () => {
+    try {
+      // Cached phases draw first; only changed rows come over the network
+      const data = await syncTable('phases', {
+        order: 'order_index',
+        onSnapshot: (cached) => {
+          setPhases(cached);
+          setPhasesLoading(false);
+        }
+      });
+      setPhases(data);
     } catch (error) {
       console.error('Error loading data:', error);
       toast.error('Failed to load Gantt data');
     } finally {
-      setLoading(false);
+      setPhasesLoading(false);
     }
   };
 
+  // Explicit refresh (e.g. after editing in the detail modal)
+  const loadData = () => Promise.all([reloadTasks(), loadPhases()]);
+
   // ==================== HELPER FUNCTIONS ====================
   
   // Build task hierarchy (parent-child relationships)
@@ -352,7 +392,7 @@ export const CustomGanttPro = () => {
   // ==================== CALCULATIONS ====================
   
   // Calculate project date range - use actual dates, not month boundaries
-  const projectDates = useMemo(() => {
+  const projectDates = useMemo(() => measure('gantt:projectDates', () => {
     if (!tasks.length) {
       const today = startOfDay(new Date());
       return {
@@ -381,7 +421,7 @@ export const CustomGanttPro = () => {
       start: startOfDay(addDays(minDate, -7)),
       end: startOfDay(addDays(maxDate, 30))
     };
-  }, [tasks]);
+  }), [tasks]);
 
   // Calculate day width based on view mode and zoom
   const dayWidth = useMemo(() => {
@@ -408,7 +448,7 @@ export const CustomGanttPro = () => {
   }, [viewMode]);
 
   // Sort and flatten tasks with hierarchy
-  const sortedTasks = useMemo(() => {
+  const sortedTasks = useMemo(() => measure('gantt:sortedTasks', () => {
     // Apply filters first
     let filtered = [...tasks];
     
@@ -464,10 +504,11 @@ export const CustomGanttPro = () => {
     
     // Flatten with indentation
     return flattenHierarchy(roots);
-  }, [tasks, sortBy, collapsedTasks, filterStatus, filterPriority, searchQuery]);
+  }), [tasks, sortBy, collapsedTasks, filterStatus, filterPriority, searchQuery]);
 
   // Get task position (with TIMESTAMP support for hour precision)
-  const getTaskPosition = (task) => {
+  // Stable between layout changes so the canvas renderer can memoize arrow geometry
+  const getTaskPosition = useCallback((task) => {
     // Use new TIMESTAMP columns first, fallback to DATE columns
     const startDate = task.start_datetime ? new Date(task.start_datetime) :
                      task.start_date ? new Date(task.start_date) : 
@@ -485,7 +526,7 @@ export const CustomGanttPro = () => {
     const width = Math.max(endDiff * dayWidth, dayWidth / 24); // Min 1 hour width
     
     return { left, width, startDate, endDate };
-  };
+  }, [projectDates.start, dayWidth]);
 
   // Calculate today position
   const todayPosition = useMemo(() => {
@@ -494,6 +535,49 @@ export const CustomGanttPro = () => {
     return daysFromStart * dayWidth;
   }, [projectDates.start, dayWidth]);
 
+  // Dependency index: ID -> task / predecessors / successors / children
+  const dependencyIndex = useDependencyIndex(tasks);
+
+  // ==================== WINDOWING ====================
+
+  // Flat row model shared by the task list, bars and dependency arrows
+  const rowModel = useMemo(
+    () => measure('gantt:rowModel', () => buildRowModel(phases, sortedTasks, collapsedPhases, rowHeight)),
+    [phases, sortedTasks, collapsedPhases, rowHeight]
+  );
+
+  // Timeline viewport (the left panel is scroll-synced to it)
+  const viewport = useScrollViewport(timelineRef, [loading]);
+
+  const visibleRows = useMemo(
+    () => getVisibleRowRange(rowModel.rows, viewport.scrollTop, viewport.height),
+    [rowModel, viewport.scrollTop, viewport.height]
+  );
+
+  const visibleDays = useMemo(
+    () => getVisibleDayRange(
+      viewport.scrollLeft,
+      viewport.width,
+      dayWidth,
+      differenceInDays(projectDates.end, projectDates.start)
+    ),
+    [viewport.scrollLeft, viewport.width, dayWidth, projectDates]
+  );
+
+  // Days/weeks/months overlapping the visible column range
+  const visibleDates = useMemo(() => measure('gantt:headerColumns', () => {
+    const start = addDays(projectDates.start, visibleDays.startDay);
+    const end = addDays(projectDates.start, visibleDays.endDay);
+    return {
+      days: eachDayOfInterval({ start, end }),
+      weeks: eachWeekOfInterval({ start, end }, { weekStartsOn: 1 }),
+      months: eachMonthOfInterval({ start, end })
+    };
+  }), [projectDates.start, visibleDays.startDay, visibleDays.endDay]);
+
+  // Pixel offset of a date from the project start
+  const dateLeft = (date) => differenceInDays(date, projectDates.start) * dayWidth;
+
   // ==================== EVENT HANDLERS ====================
   
   const handleTaskClick = (task) => {
@@ -505,12 +589,12 @@ export const CustomGanttPro = () => {
     // Immediately highlight the task
     setHighlightedTask(task);
     
-    // Scroll to task
-    const taskElement = leftPanelRef.current?.querySelector(`[data-task-id="${task.id}"]`);
+    // Scroll to task (row offset comes from the row model - the row may not be rendered yet)
+    const rowIndex = rowModel.rowIndexByTaskId.get(task.id);
     const timelineEl = timelineRef.current;
     const leftPanelEl = leftPanelRef.current;
     
-    if (timelineEl && leftPanelEl && taskElement) {
+    if (timelineEl && leftPanelEl && rowIndex !== undefined) {
       const { left, width } = getTaskPosition(task);
       const timelineWidth = timelineEl.offsetWidth;
       
@@ -520,15 +604,14 @@ export const CustomGanttPro = () => {
       const targetScrollLeft = Math.max(0, barCenter - viewportCenter);
       
       // Vertical scroll
-      const taskRect = taskElement.getBoundingClientRect();
-      const panelRect = leftPanelEl.getBoundingClientRect();
-      const currentScrollTop = leftPanelEl.scrollTop;
+      const row = rowModel.rows[rowIndex];
       const targetScrollTop = Math.max(0, 
-        currentScrollTop + (taskRect.top - panelRect.top) - (panelRect.height / 2) + (taskRect.height / 2)
+        row.top - (leftPanelEl.clientHeight / 2) + (row.height / 2)
       );
       
+      // The left panel follows through the scroll sync (animating it too would
+      // cut the timeline's horizontal scroll short)
       timelineEl.scrollTo({ left: targetScrollLeft, top: targetScrollTop, behavior: 'smooth' });
-      leftPanelEl.scrollTo({ top: targetScrollTop, behavior: 'smooth' });
     }
     
     // DO NOT open modal for task list clicks - only highlight and scroll
@@ -538,11 +621,11 @@ export const CustomGanttPro = () => {
     if (e) e.stopPropagation();
     
     // Only open modal if NOT dragged
-    if (!hasDragged) {
+    if (!hasDraggedRef.current) {
       setHighlightedTask(task);
       setSelectedTask(task);
     }
-    setHasDragged(false); // Reset for next interaction
+    hasDraggedRef.current = false; // Reset for next interaction
   };
 
   const handleBarRightClick = (task, e) => {
@@ -566,6 +649,38 @@ export const CustomGanttPro = () => {
   };
 
   const exportToPNG = async () => {
+    // Canvas renderer: draw the whole chart straight into an image (no DOM capture)
+    if (renderer === 'canvas') {
+      try {
+        const canvas = renderGanttImage({
+          rows: rowModel.rows,
+          rowIndexByTaskId: rowModel.rowIndexByTaskId,
+          rowHeight,
+          dayWidth,
+          viewMode,
+          zoomLevel,
+          projectStart: projectDates.start,
+          todayX: todayPosition,
+          getPosition: getTaskPosition,
+          criticalIds: calculateCriticalPath,
+          dependencyIndex,
+          showDependencies,
+          showBaseline,
+          activeTask: null
+        }, projectDates.end);
+
+        const link = document.createElement('a');
+        link.download = `gantt-chart-${format(new Date(), 'yyyy-MM-dd')}.png`;
+        link.href = canvas.toDataURL();
+        link.click();
+        toast.success('Exported to PNG!');
+      } catch (error) {
+        console.error('Export error:', error);
+        toast.error('Failed to export');
+      }
+      return;
+    }
+
     try {
       const { default: html2canvas } = await import('html2canvas');
       const ganttElement = document.querySelector('.gantt-export-area');
@@ -598,10 +713,14 @@ export const CustomGanttPro = () => {
   };
 
   // Drag & Drop handlers
+  // mousemove only records the pointer; one requestAnimationFrame callback per
+  // frame moves the bar (and its arrows) outside React, and state is written
+  // once on mouseup. Snapping and the predecessor check use the session
+  // precomputed on mousedown.
   const handleBarMouseDown = (e, task, edge = null) => {
     e.preventDefault();
     e.stopPropagation();
-    setHasDragged(false); // Reset drag flag
+    hasDraggedRef.current = false; // Reset drag flag
     setTooltip({ visible: false, task: null, x: 0, y: 0 }); // Hide tooltip during drag
     setHoveredTask(null); // Clear hover state
     
@@ -621,186 +740,110 @@ export const CustomGanttPro = () => {
       }
     }
     
-    // Store original task state for potential revert
-    setOriginalDraggedTask({ ...task });
-    
-    // Store original start/end dates for smooth drag calculation (use TIMESTAMP if available)
-    originalStartDateRef.current = task.start_datetime ? new Date(task.start_datetime) :
-                                   new Date(task.start_date || task.started_at);
-    originalEndDateRef.current = task.due_datetime ? new Date(task.due_datetime) :
-                                 new Date(task.due_date || task.completed_at);
-    
-    if (edge) {
-      setResizingTask(task);
-      setResizeEdge(edge);
-      document.body.style.cursor = 'col-resize'; // Global cursor
-    } else {
-      setDraggedTask(task);
-      document.body.style.cursor = 'grabbing'; // Global cursor
-    }
-    setDragStartX(e.clientX);
+    dragRef.current = createDragSession({
+      task,
+      edge,
+      clientX: e.clientX,
+      position: getTaskPosition(task),
+      gridStart: projectDates.start,
+      dayWidth,
+      viewMode,
+      zoomLevel,
+      dependencyIndex
+    });
+    document.body.style.cursor = edge ? 'col-resize' : 'grabbing'; // Global cursor
     
     // Attach global listeners for drag/resize
     document.addEventListener('mousemove', handleMouseMove);
     document.addEventListener('mouseup', handleMouseUp);
   };
 
+  // DOM renderer: inline styles/attributes React does not manage (or restores
+  // below), so renders during the drag leave the preview alone
+  const paintDomDragPreview = (session, position, valid) => {
+    const timeline = timelineRef.current;
+    if (!timeline) return;
+    const taskId = session.task.id;
+
+    const bar = timeline.querySelector(`[data-testid="gantt-bar"][data-task-id="${taskId}"]`);
+    if (bar) {
+      bar.style.transform = `translateX(${position.left - session.position.left}px)`;
+      bar.style.width = `${position.width}px`;
+      bar.style.transition = 'none';
+      bar.style.opacity = '0.7';
+      bar.style.boxShadow = `0 0 0 4px ${valid ? '#facc15' : '#dc2626'}`; // yellow-400 / red-600
+    }
+    timeline.querySelectorAll(`line[data-from="${taskId}"]`).forEach(line => {
+      line.setAttribute('x1', position.left + position.width);
+    });
+    timeline.querySelectorAll(`line[data-to="${taskId}"]`).forEach(line => {
+      line.setAttribute('x2', position.left);
+    });
+  };
+
+  const clearDomDragPreview = (session) => {
+    const timeline = timelineRef.current;
+    if (!timeline) return;
+    const taskId = session.task.id;
+    const { left, width } = session.position;
+
+    const bar = timeline.querySelector(`[data-testid="gantt-bar"][data-task-id="${taskId}"]`);
+    if (bar) {
+      bar.style.transform = '';
+      bar.style.width = `${width}px`;
+      bar.style.transition = '';
+      bar.style.opacity = '';
+      bar.style.boxShadow = '';
+    }
+    timeline.querySelectorAll(`line[data-from="${taskId}"]`).forEach(line => {
+      line.setAttribute('x1', left + width);
+    });
+    timeline.querySelectorAll(`line[data-to="${taskId}"]`).forEach(line => {
+      line.setAttribute('x2', left);
+    });
+  };
+
+  const paintDragFrame = () => {
+    dragFrameRef.current = null;
+    const session = dragRef.current;
+    if (!session) return;
+
+    const preview = getDragPreview(session, session.clientX);
+    const last = session.preview;
+    if (last && last.startMs === preview.startMs && last.endMs === preview.endMs) return; // Same grid cell
+    session.preview = preview;
+
+    const previewTask = {
+      ...session.task,
+      ...toDatesPatch(new Date(preview.startMs), new Date(preview.endMs))
+    };
+    if (renderer === 'canvas') {
+      ganttCanvasRef.current?.previewTask(previewTask, { invalid: !preview.valid });
+    } else {
+      paintDomDragPreview(session, getTaskPosition(previewTask), preview.valid);
+    }
+  };
+
   const handleMouseMove = (e) => {
-    if (!draggedTask && !resizingTask) return;
+    const session = dragRef.current;
+    if (!session) return;
     
     e.preventDefault();
+    session.clientX = e.clientX;
     
-    // NO THROTTLE for ultra-smooth drag!
-    // Update on EVERY mousemove for maximum responsiveness
+    // Mark as dragged on any movement (1px threshold)
+    if (Math.abs(e.clientX - session.startX) > 1) {
+      session.moved = true;
+      hasDraggedRef.current = true;
+    }
     
-    if (draggedTask) {
-      const deltaX = e.clientX - dragStartX;
-      
-      // ULTRA RESPONSIVE: Trigger on ANY movement (1px threshold)
-      // Mark as dragged immediately on any movement
-      if (Math.abs(deltaX) > 1) {
-        setHasDragged(true);
-        
-        // Calculate delta in FRACTIONAL hours/minutes for ultra-smooth movement
-        let deltaHours = 0;
-        if (viewMode === 'hour') {
-          // In hour view: Support MINUTE precision at high zoom!
-          const hourWidth = dayWidth / 24;
-          const minuteWidth = hourWidth / 60; // 1 minute width
-          
-          // At high zoom (>= 2.5), use MINUTE precision
-          if (zoomLevel >= 2.5) {
-            const deltaMinutes = deltaX / minuteWidth;
-            deltaHours = deltaMinutes / 60; // Convert minutes to hours
-          } else {
-            deltaHours = deltaX / hourWidth; // Hour precision
-          }
-        } else if (viewMode === 'day') {
-          // In day view: 1 day = dayWidth, convert to hours (1 day = 24 hours)
-          const deltaDays = deltaX / dayWidth;
-          deltaHours = deltaDays * 24; // Keep as float
-        } else {
-          // Week/Month view: use days
-          const deltaDays = deltaX / dayWidth;
-          deltaHours = deltaDays * 24;
-        }
-        
-        // ULTRA SMOOTH: Update visual on every movement!
-        // Calculate new position based on ORIGINAL start date + total delta
-        const originalStartDate = originalStartDateRef.current || 
-                                 (draggedTask.start_datetime ? new Date(draggedTask.start_datetime) : new Date(draggedTask.start_date || draggedTask.started_at));
-        const originalEndDate = originalEndDateRef.current ||
-                               (draggedTask.due_datetime ? new Date(draggedTask.due_datetime) : new Date(draggedTask.due_date || draggedTask.completed_at));
-        
-        // Calculate ACTUAL duration from current dates (preserves resize changes!)
-        const actualDuration = originalEndDate.getTime() - originalStartDate.getTime();
-        
-        // Add EXACT hours from original position (no rounding)
-        const newStartDate = new Date(originalStartDate.getTime() + deltaHours * 60 * 60 * 1000);
-        const newEndDate = new Date(newStartDate.getTime() + actualDuration);
-        
-        // Update with FULL TIMESTAMP (not just date!)
-        setTasks(prev => prev.map(t => 
-          t.id === draggedTask.id 
-            ? { 
-                ...t, 
-                start_datetime: newStartDate.toISOString(),
-                due_datetime: newEndDate.toISOString(),
-                // Keep old columns for compatibility
-                start_date: format(newStartDate, 'yyyy-MM-dd'), 
-                due_date: format(newEndDate, 'yyyy-MM-dd')
-              }
-            : t
-        ));
-        setDraggedTask({ 
-          ...draggedTask, 
-          start_datetime: newStartDate.toISOString(),
-          due_datetime: newEndDate.toISOString(),
-          start_date: format(newStartDate, 'yyyy-MM-dd'), 
-          due_date: format(newEndDate, 'yyyy-MM-dd')
-        });
-        // DON'T reset dragStartX - keep original reference point!
-      }
-    } else if (resizingTask && resizeEdge) {
-      const deltaX = e.clientX - dragStartX;
-      
-      // ULTRA RESPONSIVE: Mark as dragged on any movement
-      if (Math.abs(deltaX) > 1) {
-        setHasDragged(true);
-        
-        // Calculate delta in FRACTIONAL hours/minutes for ultra-smooth movement
-        let deltaHours = 0;
-        if (viewMode === 'hour') {
-          // In hour view: Support MINUTE precision at high zoom!
-          const hourWidth = dayWidth / 24;
-          const minuteWidth = hourWidth / 60; // 1 minute width
-          
-          // At high zoom (>= 2.5), use MINUTE precision
-          if (zoomLevel >= 2.5) {
-            const deltaMinutes = deltaX / minuteWidth;
-            deltaHours = deltaMinutes / 60; // Convert minutes to hours
-          } else {
-            deltaHours = deltaX / hourWidth; // Hour precision
-          }
-        } else if (viewMode === 'day') {
-          const deltaDays = deltaX / dayWidth;
-          deltaHours = deltaDays * 24; // Keep as float
-        } else {
-          const deltaDays = deltaX / dayWidth;
-          deltaHours = deltaDays * 24;
-        }
-        
-        // ULTRA SMOOTH: Update visual on every movement!
-        // Use ORIGINAL dates, not updated ones!
-        const originalStartDate = originalStartDateRef.current || 
-                                 (resizingTask.start_datetime ? new Date(resizingTask.start_datetime) : new Date(resizingTask.start_date || resizingTask.started_at));
-        const originalEndDate = originalEndDateRef.current ||
-                               (resizingTask.due_datetime ? new Date(resizingTask.due_datetime) : new Date(resizingTask.due_date || resizingTask.completed_at));
-        
-        let newStartDate = originalStartDate;
-        let newEndDate = originalEndDate;
-        
-        if (resizeEdge === 'left') {
-          // Add EXACT hours from ORIGINAL start date
-          newStartDate = new Date(originalStartDate.getTime() + deltaHours * 60 * 60 * 1000);
-          if (newStartDate >= originalEndDate) {
-            newStartDate = new Date(originalEndDate.getTime() - 60 * 60 * 1000); // 1 hour before end
-          }
-        } else {
-          // Add EXACT hours from ORIGINAL end date
-          newEndDate = new Date(originalEndDate.getTime() + deltaHours * 60 * 60 * 1000);
-          if (newEndDate <= originalStartDate) {
-            newEndDate = new Date(originalStartDate.getTime() + 60 * 60 * 1000); // 1 hour after start
-          }
-        }
-        
-        // Update with FULL TIMESTAMP
-        setTasks(prev => prev.map(t => 
-          t.id === resizingTask.id 
-            ? { 
-                ...t, 
-                start_datetime: newStartDate.toISOString(),
-                due_datetime: newEndDate.toISOString(),
-                start_date: format(newStartDate, 'yyyy-MM-dd'), 
-                due_date: format(newEndDate, 'yyyy-MM-dd')
-              }
-            : t
-        ));
-        setResizingTask({ 
-          ...resizingTask, 
-          start_datetime: newStartDate.toISOString(),
-          due_datetime: newEndDate.toISOString(),
-          start_date: format(newStartDate, 'yyyy-MM-dd'), 
-          due_date: format(newEndDate, 'yyyy-MM-dd')
-        });
-        // DON'T reset dragStartX - keep original reference point!
-      }
+    // Coalesce: at most one repaint per frame, whatever the mousemove rate
+    if (session.moved && !dragFrameRef.current) {
+      dragFrameRef.current = requestAnimationFrame(paintDragFrame);
     }
   };
 
   const handleMouseUp = async () => {
-    console.log('🖱️ MouseUp - hasDragged:', hasDragged);
-    
     // Remove global listeners
     document.removeEventListener('mousemove', handleMouseMove);
     document.removeEventListener('mouseup', handleMouseUp);
@@ -808,38 +851,48 @@ export const CustomGanttPro = () => {
     // Reset cursor
     document.body.style.cursor = '';
     
-    // Only save if actually dragged (not just clicked)
-    if (hasDragged) {
-      if (draggedTask) {
-        console.log('💾 Saving drag:', draggedTask.name);
-        // Use start_datetime/due_datetime for timestamp precision!
-        const startDate = new Date(draggedTask.start_datetime || draggedTask.start_date);
-        const endDate = new Date(draggedTask.due_datetime || draggedTask.due_date);
-        const success = await updateTaskDates(draggedTask.id, startDate, endDate);
-        // If validation failed, revert will happen in updateTaskDates
-      }
-      if (resizingTask) {
-        console.log('💾 Saving resize:', resizingTask.name);
-        // Use start_datetime/due_datetime for timestamp precision!
-        const startDate = new Date(resizingTask.start_datetime || resizingTask.start_date);
-        const endDate = new Date(resizingTask.due_datetime || resizingTask.due_date);
-        const success = await updateTaskDates(resizingTask.id, startDate, endDate);
-        // If validation failed, revert will happen in updateTaskDates
-      }
+    const session = dragRef.current;
+    dragRef.current = null;
+    if (dragFrameRef.current) {
+      cancelAnimationFrame(dragFrameRef.current);
+      dragFrameRef.current = null;
+    }
+    if (!session) return;
+    
+    // Back to what React rendered; the state update below moves the bar for real
+    if (renderer === 'canvas') {
+      ganttCanvasRef.current?.previewTask(null);
+    } else {
+      clearDomDragPreview(session);
+    }
+    
+    // Only save if actually dragged (not just clicked) onto other dates
+    if (!session.moved) return;
+    const preview = getDragPreview(session, session.clientX);
+    if (isUnchanged(session, preview)) return;
+    
+    if (!preview.valid) {
+      toast.error(`⚠️ Cannot start before dependencies finish!\nEarliest start: ${format(new Date(session.earliestStart), 'MMM d, yyyy')}`, {
+        duration: 4000
+      });
+      return;
     }
     
-    setDraggedTask(null);
-    setResizingTask(null);
-    setResizeEdge(null);
-    setOriginalDraggedTask(null);
-    originalStartDateRef.current = null; // Clear original date references
-    originalEndDateRef.current = null;
-    console.log('✅ MouseUp complete');
+    const startDate = new Date(preview.startMs);
+    const endDate = new Date(preview.endMs);
+    console.log('💾 Saving', session.edge ? 'resize:' : 'drag:', session.task.name);
+    
+    // Optimistic: the bar stays where it was dropped while saving
+    setTasks(prev => prev.map(t => 
+      t.id === session.task.id ? { ...t, ...toDatesPatch(startDate, endDate) } : t
+    ));
+    await updateTaskDates(session.task.id, startDate, endDate, session.task);
+    // If saving failed, updateTaskDates puts the original task back
   };
 
-  const updateTaskDates = async (taskId, startDate, endDate) => {
+  const updateTaskDates = async (taskId, startDate, endDate, originalTask = null) => {
     try {
-      const task = tasks.find(t => t.id === taskId);
+      const task = dependencyIndex.byId.get(taskId);
       if (!task) return;
 
       // VALIDATION: Check if task has dependencies (predecessors)
@@ -857,108 +910,46 @@ export const CustomGanttPro = () => {
           });
           
           // LOCAL REVERT: No reload, just revert to original state
-          if (originalDraggedTask) {
+          if (originalTask) {
             setTasks(prev => prev.map(t => 
-              t.id === originalDraggedTask.id ? originalDraggedTask : t
+              t.id === originalTask.id ? originalTask : t
             ));
           }
           return false; // Indicate failure
         }
       }
 
-      // Update this task with TIMESTAMP
-      const { error } = await supabase
-        .from('tasks')
-        .update({ 
-          start_datetime: startDate.toISOString(),
-          due_datetime: endDate.toISOString(),
-          // Keep old columns for compatibility
-          start_date: format(startDate, 'yyyy-MM-dd'),
-          due_date: format(endDate, 'yyyy-MM-dd')
-        })
-        .eq('id', taskId);
-      
-      if (error) throw error;
-
-      // AUTO-CASCADE: Find tasks that depend on this one (successors)
-      const successors = tasks.filter(t => {
-        const taskDeps = t.depends_on; // ONLY use depends_on (actual DB field)
-        if (!taskDeps) return false;
-        const depArray = Array.isArray(taskDeps) ? taskDeps : [taskDeps];
-        return depArray.includes(taskId);
-      });
+      const datesPatch = toDatesPatch(startDate, endDate);
 
-      // If moving this task forward, push successors forward too
-      if (successors.length > 0) {
-        const shouldCascade = window.confirm(
-          `This task has ${successors.length} dependent task(s).\n\nAuto-adjust their dates too?`
-        );
-
-        if (shouldCascade) {
-          for (const successor of successors) {
-            const successorStart = new Date(successor.start_date || successor.started_at);
-            const successorEnd = new Date(successor.due_date || successor.completed_at);
-            const duration = differenceInDays(successorEnd, successorStart);
-
-            // New start = this task's end date + 1 day
-            const newStart = addDays(endDate, 1);
-            const newEnd = addDays(newStart, duration);
-
-            await supabase
-              .from('tasks')
-              .update({
-                start_datetime: newStart.toISOString(),
-                due_datetime: newEnd.toISOString(),
-                start_date: format(newStart, 'yyyy-MM-dd'),
-                due_date: format(newEnd, 'yyyy-MM-dd')
-              })
-              .eq('id', successor.id);
-          }
+      // Tasks that depend on this one (successors)
+      const successors = getSuccessors(dependencyIndex, taskId);
+      const shouldCascade = successors.length > 0 && window.confirm(
+        `This task has ${successors.length} dependent task(s).\n\nAuto-adjust their dates too?`
+      );
 
-          toast.success(`✅ Updated task + ${successors.length} dependent task(s)`, {
-            duration: 3000,
-            position: 'bottom-right'
-          });
-          
-          // Reload to show cascaded changes - but preserve current task's updated dates!
-          const currentTaskUpdated = {
-            ...task,
-            start_datetime: startDate.toISOString(),
-            due_datetime: endDate.toISOString(),
-            start_date: format(startDate, 'yyyy-MM-dd'),
-            due_date: format(endDate, 'yyyy-MM-dd')
-          };
-          await loadData();
-          // Re-apply the current task's dates after reload
-          setTasks(prev => prev.map(t => 
-            t.id === taskId ? { ...t, ...currentTaskUpdated } : t
-          ));
-        } else {
-          // No successors - just update local state to reflect DB changes
-          setTasks(prev => prev.map(t => 
-            t.id === taskId ? {
-              ...t,
-              start_datetime: startDate.toISOString(),
-              due_datetime: endDate.toISOString(),
-              start_date: format(startDate, 'yyyy-MM-dd'),
-              due_date: format(endDate, 'yyyy-MM-dd')
-            } : t
-          ));
-          toast.success('✅ Task dates updated', {
-            duration: 2000,
-            position: 'bottom-right'
-          });
-        }
+      if (shouldCascade) {
+        // AUTO-CASCADE: one RPC moves this task and its whole downstream chain atomically,
+        // returning only the changed rows - merge them locally instead of reloading
+        const changedRows = await cascadeTaskDates(taskId, startDate, endDate);
+        const changedById = new Map(changedRows.map(row => [row.id, row]));
+        setTasks(prev => prev.map(t => 
+          changedById.has(t.id) ? { ...t, ...changedById.get(t.id) } : t
+        ));
+        toast.success(`✅ Updated task + ${Math.max(0, changedRows.length - 1)} dependent task(s)`, {
+          duration: 3000,
+          position: 'bottom-right'
+        });
       } else {
-        // No successors at all - update local state
+        // Just this task
+        const { error } = await supabase
+          .from('tasks')
+          .update(datesPatch)
+          .eq('id', taskId);
+        
+        if (error) throw error;
+
         setTasks(prev => prev.map(t => 
-          t.id === taskId ? {
-            ...t,
-            start_datetime: startDate.toISOString(),
-            due_datetime: endDate.toISOString(),
-            start_date: format(startDate, 'yyyy-MM-dd'),
-            due_date: format(endDate, 'yyyy-MM-dd')
-          } : t
+          t.id === taskId ? { ...t, ...datesPatch } : t
         ));
         toast.success('✅ Task dates updated', {
           duration: 2000,
@@ -970,9 +961,9 @@ export const CustomGanttPro = () => {
       toast.error('Failed to update task dates');
       
       // LOCAL REVERT: No reload, just revert to original state
-      if (originalDraggedTask) {
+      if (originalTask) {
         setTasks(prev => prev.map(t => 
-          t.id === originalDraggedTask.id ? originalDraggedTask : t
+          t.id === originalTask.id ? originalTask : t
         ));
       }
       return false; // Indicate failure
@@ -983,12 +974,7 @@ export const CustomGanttPro = () => {
   const deleteTask = async (taskId) => {
     try {
       // Check if other tasks depend on this one
-      const dependents = tasks.filter(t => {
-        const taskDeps = t.depends_on; // ONLY use depends_on (actual DB field)
-        if (!taskDeps) return false;
-        const depArray = Array.isArray(taskDeps) ? taskDeps : [taskDeps];
-        return depArray.includes(taskId);
-      });
+      const dependents = getSuccessors(dependencyIndex, taskId);
 
       if (dependents.length > 0) {
         const dependentNames = dependents.map(t => t.name).join('\n- ');
@@ -1004,7 +990,7 @@ export const CustomGanttPro = () => {
         .eq('id', taskId);
       
       if (error) throw error;
-      await loadData();
+      removeTasks([taskId]);
       setSelectedTask(null);
       toast.success('Task deleted');
     } catch (error) {
@@ -1015,17 +1001,20 @@ export const CustomGanttPro = () => {
 
   const duplicateTask = async (task) => {
     try {
-      const { id, created_at, updated_at, ...taskData } = task;
-      const { error } = await supabase
+      const { id, created_at, updated_at, ...taskData } = stripDerivedFields(task);
+      const { data, error } = await supabase
         .from('tasks')
         .insert({ 
           ...taskData,
           name: `${task.name} (Copy)`,
           status: 'PENDING'
-        });
+        })
+        .select()
+        .single();
       
       if (error) throw error;
-      await loadData();
+      // The realtime INSERT may already have added it
+      setTasks(prev => [...prev.filter(t => t.id !== data.id), data]);
       toast.success('Task duplicated');
     } catch (error) {
       console.error('Error duplicating task:', error);
@@ -1033,149 +1022,76 @@ export const CustomGanttPro = () => {
     }
   };
 
-  // Calculate critical path - longest chain of dependent tasks
-  const calculateCriticalPath = useMemo(() => {
-    if (!showCriticalPath || tasks.length === 0) return new Set();
-    
-    const taskMap = new Map(tasks.map(t => [t.id, t]));
-    const durations = new Map();
-    const criticalTasks = new Set();
-    
-    // Calculate duration for each task
-    const getDuration = (task) => {
-      if (durations.has(task.id)) return durations.get(task.id);
-      
-      const taskDuration = task.estimated_hours ? Math.ceil(task.estimated_hours / 8) : 3;
-      
-      // Use ONLY depends_on (actual DB field)
-      const deps = task.depends_on;
-      
-      // If no dependencies, duration is just task duration
-      if (!deps || deps.length === 0) {
-        durations.set(task.id, taskDuration);
-        return taskDuration;
-      }
-      
-      // Find max duration path through dependencies
-      let maxDepDuration = 0;
-      deps.forEach(depId => {
-        const depTask = taskMap.get(depId);
-        if (depTask) {
-          const depDuration = getDuration(depTask);
-          if (depDuration > maxDepDuration) maxDepDuration = depDuration;
-        }
+  // Critical path - zero-float tasks from the CPM schedule (recomputed incrementally on date changes)
+  const schedule = useSchedule(dependencyIndex, showCriticalPath);
+  const calculateCriticalPath = schedule ? schedule.critical : EMPTY_SET;
+
+  // Report dependency cycles once per distinct cycle
+  const cycleDescription = schedule?.cycle ? describeCycle(dependencyIndex, schedule.cycle) : '';
+  useEffect(() => {
+    if (cycleDescription) {
+      toast.error(`⚠️ Dependency cycle - critical path skips ${schedule.blocked.size} task(s):\n${cycleDescription}`, {
+        id: 'dependency-cycle',
+        duration: 6000
       });
-      
-      const totalDuration = maxDepDuration + taskDuration;
-      durations.set(task.id, totalDuration);
-      return totalDuration;
-    };
-    
-    // Calculate all durations
-    tasks.forEach(task => getDuration(task));
-    
-    // Find tasks with max duration (critical path)
-    const maxDuration = Math.max(...Array.from(durations.values()));
-    
-    // Trace back critical path
-    const traceCriticalPath = (task) => {
-      if (criticalTasks.has(task.id)) return;
-      
-      const taskDuration = durations.get(task.id);
-      if (taskDuration === maxDuration || criticalTasks.size > 0) {
-        criticalTasks.add(task.id);
-        
-        // Use ONLY depends_on (actual DB field)
-        const deps = task.depends_on;
-        if (deps) {
-          deps.forEach(depId => {
-            const depTask = taskMap.get(depId);
-            if (depTask && durations.get(depId) === taskDuration - (task.estimated_hours ? Math.ceil(task.estimated_hours / 8) : 3)) {
-              traceCriticalPath(depTask);
-            }
-          });
-        }
-      }
-    };
-    
-    // Start from tasks with max duration
-    tasks.forEach(task => {
-      if (durations.get(task.id) === maxDuration) {
-        traceCriticalPath(task);
-      }
-    });
-    
-    return criticalTasks;
-  }, [tasks, showCriticalPath]);
+    }
+  // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [cycleDescription]);
 
-  // Auto-schedule: Calculate optimal dates based on dependencies
+  // Auto-schedule: Calculate optimal dates based on dependencies (CPM forward pass)
+  // Tasks without predecessors keep their current start; every other task starts
+  // 1 day after its latest predecessor finishes. Durations are preserved.
   const autoSchedule = async () => {
     try {
       toast.loading('Auto-scheduling tasks...');
       
-      const updates = [];
-      const taskMap = new Map(tasks.map(t => [t.id, t]));
-      const scheduled = new Map();
-      
-      // Helper: Get earliest start date for a task
-      const getEarliestStart = (task) => {
-        if (scheduled.has(task.id)) return scheduled.get(task.id);
-        
-        // Use ONLY depends_on (actual DB field)
-        const deps = task.depends_on;
-        
-        // If no dependencies, start today
-        if (!deps || deps.length === 0) {
-          const startDate = new Date();
-          scheduled.set(task.id, startDate);
-          return startDate;
-        }
-        
-        // Find latest end date of all dependencies
-        let latestEnd = new Date();
-        deps.forEach(depId => {
-          const depTask = taskMap.get(depId);
-          if (depTask) {
-            const depStart = getEarliestStart(depTask);
-            const depDuration = depTask.estimated_hours ? Math.ceil(depTask.estimated_hours / 8) : 3;
-            const depEnd = addDays(depStart, depDuration);
-            if (depEnd > latestEnd) latestEnd = depEnd;
-          }
-        });
-        
-        // Start 1 day after latest dependency ends
-        const startDate = addDays(latestEnd, 1);
-        scheduled.set(task.id, startDate);
-        return startDate;
+      const today = startOfDay(new Date());
+      const getStart = (task) => {
+        const start = task.start_datetime || task.start_date || task.started_at;
+        return start ? new Date(start) : today;
       };
+      const hasPredecessors = (task) =>
+        (dependencyIndex.predecessorIds.get(task.id) || []).some(id => dependencyIndex.byId.has(id));
+      
+      const plan = computeSchedule(dependencyIndex, {
+        duration: getTaskDurationDays,
+        earliestStart: (task) => hasPredecessors(task) ? -Infinity : (getStart(task).getTime() - today.getTime()) / DAY_MS,
+        lag: 1
+      });
+      
+      if (plan.cycle) {
+        toast.dismiss();
+        toast.error(`⚠️ Cannot auto-schedule: dependency cycle\n${describeCycle(dependencyIndex, plan.cycle)}`, { duration: 6000 });
+        return;
+      }
       
-      // Schedule all tasks
-      tasks.forEach(task => {
-        const startDate = getEarliestStart(task);
-        const duration = task.estimated_hours ? Math.ceil(task.estimated_hours / 8) : 3;
-        const endDate = addDays(startDate, duration);
+      // Only tasks whose dates actually move are written
+      const updates = [];
+      plan.order.forEach(id => {
+        const task = dependencyIndex.byId.get(id);
+        const startDate = new Date(today.getTime() + plan.es.get(id) * DAY_MS);
+        const endDate = new Date(today.getTime() + plan.ef.get(id) * DAY_MS);
+        if (task.start_datetime && new Date(task.start_datetime).getTime() === startDate.getTime()) return;
         
         updates.push({
-          id: task.id,
+          id,
+          start_datetime: startDate.toISOString(),
+          due_datetime: endDate.toISOString(),
           start_date: format(startDate, 'yyyy-MM-dd'),
           due_date: format(endDate, 'yyyy-MM-dd')
         });
       });
       
-      // Batch update
-      for (const update of updates) {
-        await supabase
-          .from('tasks')
-          .update({ 
-            start_date: update.start_date,
-            due_date: update.due_date
-          })
-          .eq('id', update.id);
-      }
+      // Batch update: shown immediately, written in bulk, failed rows rolled back
+      const { failed } = await optimisticBulkUpdate({ tasks, setTasks, updates });
       
-      await loadData();
       toast.dismiss();
-      toast.success(`Auto-scheduled ${updates.length} tasks!`);
+      if (failed.length > 0) {
+        console.error('Auto-schedule failed rows:', failed);
+        toast.error(`⚠️ Auto-scheduled ${updates.length - failed.length} tasks, ${failed.length} failed (reverted)`, { duration: 5000 });
+      } else {
+        toast.success(`Auto-scheduled ${updates.length} tasks!`);
+      }
     } catch (error) {
       console.error('Auto-schedule error:', error);
       toast.dismiss();
@@ -1184,21 +1100,8 @@ export const CustomGanttPro = () => {
   };
 
   // Get task dependencies
-  // DB field: depends_on (array of task IDs)
-  const getTaskDependencies = (task) => {
-    if (!task) return [];
-    
-    const deps = task.depends_on;
-    
-    if (!deps || (Array.isArray(deps) && deps.length === 0)) return [];
-    
-    // Handle both array and single ID
-    const depArray = Array.isArray(deps) ? deps : [deps];
-    
-    return depArray
-      .map(depId => tasks.find(t => t.id === depId))
-      .filter(Boolean);
-  };
+  // DB field: depends_on (array of task IDs), resolved through the dependency index
+  const getTaskDependencies = (task) => getPredecessors(dependencyIndex, task);
 
   // Render dependency arrows (with proper Y positioning accounting for phases)
   const renderDependencyArrows = () => {
@@ -1214,48 +1117,41 @@ export const CustomGanttPro = () => {
     const totalDays = differenceInDays(projectDates.end, projectDates.start);
     const scaledGanttWidth = totalDays * dayWidth;
     
-    // Build a map of task ID to Y position (accounting for bar vertical centering)
-    const taskYPositions = new Map();
-    let currentY = 40; // Start after first phase header
-    let totalHeight = 40;
+    // Y position of a task's bar center, from the row model (same centering as in render)
+    const barHeight = Math.max(rowHeight - 10, 20);
+    const barTop = (rowHeight - barHeight) / 2;
+    const getTaskY = (taskId) => {
+      const rowIndex = rowModel.rowIndexByTaskId.get(taskId);
+      return rowIndex === undefined ? null : rowModel.rows[rowIndex].top + barTop + barHeight / 2;
+    };
+    const totalHeight = rowModel.totalHeight;
     
-    phases.forEach(phase => {
-      const phaseTasks = sortedTasks.filter(t => t.phase_id === phase.id);
-      
-      if (!collapsedPhases.has(phase.id)) {
-        phaseTasks.forEach((task, idx) => {
-          // Calculate bar height and top offset (same as in render)
-          const barHeight = Math.max(rowHeight - 10, 20);
-          const barTop = (rowHeight - barHeight) / 2;
-          // Center of the actual bar (not row)
-          const taskCenterY = currentY + idx * rowHeight + barTop + barHeight / 2;
-          taskYPositions.set(task.id, taskCenterY);
-        });
-        currentY += phaseTasks.length * rowHeight;
-        totalHeight = currentY;
-      }
-      currentY += 40; // Phase header height
-      totalHeight += 40;
-    });
+    // Only arrows crossing the rendered window are drawn
+    const windowTop = visibleRows.start < rowModel.rows.length ? rowModel.rows[visibleRows.start].top : 0;
+    const windowBottom = visibleRows.end > 0 ? rowModel.rows[visibleRows.end - 1].top + rowModel.rows[visibleRows.end - 1].height : 0;
     
-    // Now render arrows using the position map
+    // Now render arrows using the row positions
     sortedTasks.forEach(task => {
       const deps = getTaskDependencies(task);
       if (deps.length === 0) return;
       
-      const toY = taskYPositions.get(task.id);
-      if (!toY) return; // Task is collapsed or filtered out
+      const toY = getTaskY(task.id);
+      if (toY === null) return; // Task is collapsed or filtered out
       
       const toPos = getTaskPosition(task);
       if (!toPos) return; // Position calculation failed
       
       deps.forEach(depTask => {
-        const fromY = taskYPositions.get(depTask.id);
-        if (!fromY) return; // Dependency task is collapsed or filtered out
+        const fromY = getTaskY(depTask.id);
+        if (fromY === null) return; // Dependency task is collapsed or filtered out
+        if (Math.max(fromY, toY) < windowTop || Math.min(fromY, toY) > windowBottom) return; // Off-screen vertically
         
         const fromPos = getTaskPosition(depTask);
         if (!fromPos) return; // Position calculation failed
         
+        const fromX = fromPos.left + fromPos.width;
+        if (Math.max(fromX, toPos.left) < visibleDays.left || Math.min(fromX, toPos.left) > visibleDays.right) return; // Off-screen horizontally
+        
         // Determine if this is a critical dependency
         const isCritical = task.priority === 'HIGH' || depTask.priority === 'HIGH';
         
@@ -1269,7 +1165,9 @@ export const CustomGanttPro = () => {
         arrows.push(
           <g key={`arrow-${depTask.id}-${task.id}`}>
             <line 
-              x1={fromPos.left + fromPos.width} 
+              data-from={depTask.id}
+              data-to={task.id}
+              x1={fromX} 
               y1={fromY} 
               x2={toPos.left} 
               y2={toY}
@@ -1336,23 +1234,40 @@ export const CustomGanttPro = () => {
   const renderTimelineHeaders = () => {
     const totalDays = differenceInDays(projectDates.end, projectDates.start);
     const ganttWidth = totalDays * dayWidth;
+    // Only cells overlapping the visible columns are rendered, absolutely positioned by date
+    const { days, weeks, months } = visibleDates;
+
+    // Month cells (shared by Month/Week/Day views)
+    const renderMonthCells = (className) => months.map(month => {
+      const daysInMonth = differenceInDays(endOfMonth(month), month) + 1;
+      const width = daysInMonth * dayWidth;
+      
+      return (
+        <div 
+          key={month.getTime()}
+          style={{ left: `${dateLeft(month)}px`, width: `${width}px` }}
+          className={`absolute top-0 bottom-0 border-r border-border-default text-center font-semibold ${className}`}
+        >
+          {format(month, 'MMM yyyy')}
+        </div>
+      );
+    });
 
     if (viewMode === 'hour') {
       // Hour view: Day + Hours (24 hours per day)
       // At high zoom (>= 2.0), show MINUTES!
-      const days = eachDayOfInterval({ start: projectDates.start, end: projectDates.end });
       const hourWidth = dayWidth / 24;
       const showMinutes = zoomLevel >= 2.0;
       
       return (
         <div style={{ width: ganttWidth, position: 'relative', height: showMinutes ? 90 : 60 }}>
           {/* Day header */}
-          <div className="flex border-b border-border-default bg-background-secondary h-8">
-            {days.map((day, idx) => (
+          <div className="relative border-b border-border-default bg-background-secondary h-8">
+            {days.map(day => (
               <div 
-                key={idx}
-                style={{ width: `${dayWidth}px`, minWidth: `${dayWidth}px` }}
-                className={`border-r border-border-default px-2 text-center font-semibold text-xs flex items-center justify-center ${
+                key={day.getTime()}
+                style={{ left: `${dateLeft(day)}px`, width: `${dayWidth}px` }}
+                className={`absolute top-0 bottom-0 border-r border-border-default px-2 text-center font-semibold text-xs flex items-center justify-center ${
                   isToday(day) ? 'bg-red-100 text-red-600' : ''
                 }`}
               >
@@ -1362,9 +1277,9 @@ export const CustomGanttPro = () => {
           </div>
           
           {/* Hour header */}
-          <div className="flex border-b border-border-default bg-background-tertiary h-8">
-            {days.map((day, dayIdx) => (
-              <div key={dayIdx} className="flex" style={{ width: `${dayWidth}px` }}>
+          <div className="relative border-b border-border-default bg-background-tertiary h-8">
+            {days.map(day => (
+              <div key={day.getTime()} className="absolute top-0 bottom-0 flex" style={{ left: `${dateLeft(day)}px`, width: `${dayWidth}px` }}>
                 {showMinutes ? (
                   // High zoom with minutes: Show every 2 hours (0h, 2h, 4h, 6h, 8h, 10h, 12h, 14h, 16h, 18h, 20h, 22h)
                   Array.from({ length: 12 }, (_, idx) => {
@@ -1408,9 +1323,9 @@ export const CustomGanttPro = () => {
           
           {/* Minute header (only at high zoom >= 2.5) */}
           {showMinutes && (
-            <div className="flex border-b border-border-default bg-background-tertiary/50 h-8">
-              {days.map((day, dayIdx) => (
-                <div key={dayIdx} className="flex" style={{ width: `${dayWidth}px` }}>
+            <div className="relative border-b border-border-default bg-background-tertiary/50 h-8">
+              {days.map(day => (
+                <div key={day.getTime()} className="absolute top-0 bottom-0 flex" style={{ left: `${dateLeft(day)}px`, width: `${dayWidth}px` }}>
                   {Array.from({ length: 24 }, (_, hourIdx) => {
                     const minuteWidth = hourWidth / 60;
                     // Show every 10 minutes for better readability
@@ -1437,28 +1352,11 @@ export const CustomGanttPro = () => {
 
     if (viewMode === 'month') {
       // Month view: Show months only
-      const months = eachMonthOfInterval({ start: projectDates.start, end: projectDates.end });
-      
       return (
         <div style={{ width: ganttWidth, position: 'relative', height: 60 }}>
           {/* Month header */}
-          <div className="flex border-b border-border-default bg-background-secondary">
-            {months.map((month, idx) => {
-              const monthStart = month;
-              const monthEnd = endOfMonth(month);
-              const daysInMonth = differenceInDays(monthEnd, monthStart) + 1;
-              const width = daysInMonth * dayWidth;
-              
-              return (
-                <div 
-                  key={idx}
-                  style={{ width: `${width}px`, minWidth: `${width}px` }}
-                  className="border-r border-border-default p-2 text-center font-semibold text-sm"
-                >
-                  {format(month, 'MMM yyyy')}
-                </div>
-              );
-            })}
+          <div className="relative border-b border-border-default bg-background-secondary h-9">
+            {renderMonthCells('p-2 text-sm')}
           </div>
         </div>
       );
@@ -1466,44 +1364,25 @@ export const CustomGanttPro = () => {
 
     if (viewMode === 'week') {
       // Week view: Month + Week
-      const months = eachMonthOfInterval({ start: projectDates.start, end: projectDates.end });
-      const weeks = eachWeekOfInterval({ start: projectDates.start, end: projectDates.end }, { weekStartsOn: 1 });
-      
       return (
         <div style={{ width: ganttWidth, position: 'relative', height: 60 }}>
           {/* Month header */}
-          <div className="flex border-b border-border-default bg-background-secondary h-8">
-            {months.map((month, idx) => {
-              const monthStart = month;
-              const monthEnd = endOfMonth(month);
-              const daysInMonth = differenceInDays(monthEnd, monthStart) + 1;
-              const width = daysInMonth * dayWidth;
-              
-              return (
-                <div 
-                  key={idx}
-                  style={{ width: `${width}px`, minWidth: `${width}px` }}
-                  className="border-r border-border-default px-2 text-center font-semibold text-xs flex items-center justify-center"
-                >
-                  {format(month, 'MMM yyyy')}
-                </div>
-              );
-            })}
+          <div className="relative border-b border-border-default bg-background-secondary h-8">
+            {renderMonthCells('px-2 text-xs flex items-center justify-center')}
           </div>
           
           {/* Week header */}
-          <div className="flex border-b border-border-default bg-background-tertiary h-8">
-            {weeks.map((week, idx) => {
-              const weekStart = week;
+          <div className="relative border-b border-border-default bg-background-tertiary h-8">
+            {weeks.map(week => {
               const weekEnd = endOfWeek(week, { weekStartsOn: 1 });
-              const daysInWeek = differenceInDays(weekEnd, weekStart) + 1;
+              const daysInWeek = differenceInDays(weekEnd, week) + 1;
               const width = daysInWeek * dayWidth;
               
               return (
                 <div 
-                  key={idx}
-                  style={{ width: `${width}px`, minWidth: `${width}px` }}
-                  className="border-r border-border-default px-1 text-center text-xs flex items-center justify-center"
+                  key={week.getTime()}
+                  style={{ left: `${dateLeft(week)}px`, width: `${width}px` }}
+                  className="absolute top-0 bottom-0 border-r border-border-default px-1 text-center text-xs flex items-center justify-center"
                 >
                   W{format(week, 'w')}
                 </div>
@@ -1515,38 +1394,20 @@ export const CustomGanttPro = () => {
     }
 
     // Day view: Month + Day
-    const months = eachMonthOfInterval({ start: projectDates.start, end: projectDates.end });
-    const days = eachDayOfInterval({ start: projectDates.start, end: projectDates.end });
-    
     return (
       <div style={{ width: ganttWidth, position: 'relative', height: 60 }}>
         {/* Month header */}
-        <div className="flex border-b border-border-default bg-background-secondary h-8">
-          {months.map((month, idx) => {
-            const monthStart = month;
-            const monthEnd = endOfMonth(month);
-            const daysInMonth = differenceInDays(monthEnd, monthStart) + 1;
-            const width = daysInMonth * dayWidth;
-            
-            return (
-              <div 
-                key={idx}
-                style={{ width: `${width}px`, minWidth: `${width}px` }}
-                className="border-r border-border-default px-2 text-center font-semibold text-xs flex items-center justify-center"
-              >
-                {format(month, 'MMM yyyy')}
-              </div>
-            );
-          })}
+        <div className="relative border-b border-border-default bg-background-secondary h-8">
+          {renderMonthCells('px-2 text-xs flex items-center justify-center')}
         </div>
         
         {/* Day header with hours */}
-        <div className="flex border-b border-border-default bg-background-tertiary h-8">
-          {days.map((day, idx) => (
+        <div className="relative border-b border-border-default bg-background-tertiary h-8">
+          {days.map(day => (
             <div 
-              key={idx}
-              style={{ width: `${dayWidth}px`, minWidth: `${dayWidth}px` }}
-              className={`border-r border-border-default text-center text-xs flex flex-col items-center justify-center ${
+              key={day.getTime()}
+              style={{ left: `${dateLeft(day)}px`, width: `${dayWidth}px` }}
+              className={`absolute top-0 bottom-0 border-r border-border-default text-center text-xs flex flex-col items-center justify-center ${
                 isToday(day) ? 'bg-red-100 font-bold text-red-600' : ''
               }`}
             >
@@ -1626,6 +1487,7 @@ export const CustomGanttPro = () => {
       {/* Tooltip - Improved Visual Design */}
       {tooltip.visible && tooltip.task && (
         <div 
+          data-testid="gantt-tooltip"
           className="fixed z-50 bg-gray-900 text-white text-sm rounded-xl shadow-2xl p-4 pointer-events-none max-w-sm border-2 border-gray-700"
           style={{ 
             left: `${tooltip.x + 15}px`, 
@@ -1674,10 +1536,7 @@ export const CustomGanttPro = () => {
           {/* Dependencies Info */}
           {(() => {
             const predecessors = getTaskDependencies(tooltip.task);
-            const successors = tasks.filter(t => {
-              const deps = getTaskDependencies(t);
-              return deps.some(dep => dep.id === tooltip.task.id);
-            });
+            const successors = getSuccessors(dependencyIndex, tooltip.task.id);
             
             return (
               <>
@@ -1780,6 +1639,7 @@ export const CustomGanttPro = () => {
           onClose={() => setSelectedTask(null)} 
           onUpdate={loadData}
           allTasks={tasks} 
+          dependencyIndex={dependencyIndex}
         />
       )}
       
@@ -1894,6 +1754,17 @@ export const CustomGanttPro = () => {
             <span className="sm:hidden">Deps</span>
           </label>
           
+          {/* Renderer Toggle - canvas for very large charts */}
+          <label className="flex items-center gap-1.5 cursor-pointer text-xs sm:text-sm" title="Draw the timeline on canvas (faster with thousands of tasks)">
+            <input 
+              type="checkbox" 
+              checked={renderer === 'canvas'} 
+              onChange={() => setRenderer(renderer === 'canvas' ? 'dom' : 'canvas')} 
+              className="w-3 h-3 sm:w-4 sm:h-4"
+            />
+            <span>Canvas</span>
+          </label>
+          
           <div className="border-l border-border-default h-6 mx-1 sm:mx-2 hidden sm:block"></div>
           
           {/* Zoom Slider - Simplified */}
@@ -1948,6 +1819,7 @@ export const CustomGanttPro = () => {
         {!taskColumnCollapsed && (
           <div 
             ref={leftPanelRef}
+            data-testid="gantt-task-list"
             className="w-[400px] flex-shrink-0 overflow-y-auto border-r border-border-default transition-all"
             style={{ scrollbarWidth: 'thin' }}
           >
@@ -1972,102 +1844,107 @@ export const CustomGanttPro = () => {
               </div>
             </div>
           
-          {/* Task List */}
-          <div className="relative">
-            {phases.map(phase => (
-              <React.Fragment key={phase.id}>
-                {/* Phase Header with Collapse */}
+          {/* Task List (windowed: spacers stand in for rows outside the viewport) */}
+          <div className="relative" style={{ height: `${rowModel.totalHeight}px` }}>
+            <div style={{ height: `${rowModel.rows[visibleRows.start]?.top || 0}px` }}></div>
+            {rowModel.rows.slice(visibleRows.start, visibleRows.end).map(row => {
+              if (row.type === 'phase') {
+                const phase = row.phase;
+                return (
+                  // Phase Header with Collapse
+                  <div 
+                    key={row.key}
+                    className="h-10 flex items-center gap-2 p-2 sticky top-[60px] z-10 bg-background-tertiary border-b border-t border-border-default cursor-pointer hover:bg-background-secondary"
+                    onClick={() => togglePhase(phase.id)}
+                  >
+                    {collapsedPhases.has(phase.id) ? (
+                      <ChevronRight className="w-4 h-4 flex-shrink-0" />
+                    ) : (
+                      <ChevronDown className="w-4 h-4 flex-shrink-0" />
+                    )}
+                    <strong className="text-sm text-text-primary">{phase.name}</strong>
+                    <span className="text-xs text-text-tertiary ml-auto">
+                      ({row.taskCount} tasks)
+                    </span>
+                  </div>
+                );
+              }
+              
+              // Task row (phase not collapsed)
+              const task = row.task;
+              const hasChildren = task.children && task.children.length > 0;
+              const isCollapsed = collapsedTasks.has(task.id);
+              const indentPx = (task.level || 0) * 20; // 20px per level
+              
+              return (
                 <div 
-                  className="h-10 flex items-center gap-2 p-2 sticky top-[60px] z-10 bg-background-tertiary border-b border-t border-border-default cursor-pointer hover:bg-background-secondary"
-                  onClick={() => togglePhase(phase.id)}
+                  key={row.key}
+                  data-testid="gantt-task-row"
+                  data-task-id={task.id}
+                  style={{ height: `${rowHeight}px` }}
+                  className={`flex items-center justify-between text-sm border-b border-border-default cursor-pointer transition-colors ${
+                    highlightedTask?.id === task.id || selectedTask?.id === task.id ? 'bg-blue-100 dark:bg-blue-900/30 border-l-4 border-l-blue-500' :
+                    hoveredTask === task.id ? 'bg-blue-50 dark:bg-blue-900/10' :
+                    searchQuery && task.name?.toLowerCase().includes(searchQuery.toLowerCase()) ? 'bg-yellow-50 dark:bg-yellow-900/20' : 
+                    'hover:bg-background-tertiary'
+                  }`}
+                  onClick={() => handleTaskClick(task)}
+                  onDoubleClick={() => setSelectedTask(task)}
+                  onMouseEnter={(e) => {
+                    setHoveredTask(task.id);
+                    setTooltip({
+                      visible: true,
+                      task,
+                      x: e.clientX,
+                      y: e.clientY
+                    });
+                  }}
+                  onMouseLeave={() => {
+                    setHoveredTask(null);
+                    setTooltip({ visible: false, task: null, x: 0, y: 0 });
+                  }}
                 >
-                  {collapsedPhases.has(phase.id) ? (
-                    <ChevronRight className="w-4 h-4 flex-shrink-0" />
-                  ) : (
-                    <ChevronDown className="w-4 h-4 flex-shrink-0" />
-                  )}
-                  <strong className="text-sm text-text-primary">{phase.name}</strong>
-                  <span className="text-xs text-text-tertiary ml-auto">
-                    ({sortedTasks.filter(t => t.phase_id === phase.id).length} tasks)
-                  </span>
-                </div>
-                
-                {/* Tasks (only if phase not collapsed) */}
-                {!collapsedPhases.has(phase.id) && sortedTasks.filter(t => t.phase_id === phase.id).map(task => {
-                  const hasChildren = task.children && task.children.length > 0;
-                  const isCollapsed = collapsedTasks.has(task.id);
-                  const indentPx = (task.level || 0) * 20; // 20px per level
-                  
-                  return (
-                    <div 
-                      key={task.id}
-                      data-task-id={task.id}
-                      style={{ height: `${rowHeight}px` }}
-                      className={`flex items-center justify-between text-sm border-b border-border-default cursor-pointer transition-colors ${
-                        highlightedTask?.id === task.id || selectedTask?.id === task.id ? 'bg-blue-100 dark:bg-blue-900/30 border-l-4 border-l-blue-500' :
-                        hoveredTask === task.id ? 'bg-blue-50 dark:bg-blue-900/10' :
-                        searchQuery && task.name?.toLowerCase().includes(searchQuery.toLowerCase()) ? 'bg-yellow-50 dark:bg-yellow-900/20' : 
-                        'hover:bg-background-tertiary'
-                      }`}
-                      onClick={() => handleTaskClick(task)}
-                      onDoubleClick={() => setSelectedTask(task)}
-                      onMouseEnter={(e) => {
-                        setHoveredTask(task.id);
-                        setTooltip({
-                          visible: true,
-                          task,
-                          x: e.clientX,
-                          y: e.clientY
-                        });
-                      }}
-                      onMouseLeave={() => {
-                        setHoveredTask(null);
-                        setTooltip({ visible: false, task: null, x: 0, y: 0 });
-                      }}
-                    >
-                      <span 
-                        className="truncate pr-2 flex items-center gap-1"
-                        style={{ paddingLeft: `${8 + indentPx}px` }}
+                  <span 
+                    className="truncate pr-2 flex items-center gap-1"
+                    style={{ paddingLeft: `${8 + indentPx}px` }}
+                  >
+                    {/* Expand/Collapse for parent tasks */}
+                    {hasChildren ? (
+                      <button
+                        onClick={(e) => {
+                          e.stopPropagation();
+                          toggleTask(task.id);
+                        }}
+                        className="flex-shrink-0 hover:bg-background-secondary rounded p-0.5"
                       >
-                        {/* Expand/Collapse for parent tasks */}
-                        {hasChildren ? (
-                          <button
-                            onClick={(e) => {
-                              e.stopPropagation();
-                              toggleTask(task.id);
-                            }}
-                            className="flex-shrink-0 hover:bg-background-secondary rounded p-0.5"
-                          >
-                            {isCollapsed ? (
-                              <ChevronRight className="w-3 h-3" />
-                            ) : (
-                              <ChevronDown className="w-3 h-3" />
-                            )}
-                          </button>
+                        {isCollapsed ? (
+                          <ChevronRight className="w-3 h-3" />
                         ) : (
-                          <span className="w-4"></span>
+                          <ChevronDown className="w-3 h-3" />
                         )}
-                        
-                        {/* Milestone diamond */}
-                        {task.is_milestone && <span className="text-yellow-500 text-sm">◆</span>}
-                        
-                        {/* Task name */}
-                        <span className="truncate">{task.name}</span>
-                      </span>
-                      
-                      {/* Status badge */}
-                      <span className={`px-2 py-0.5 text-xs rounded-full flex-shrink-0 mr-2 ${
-                        task.status === 'DONE' ? 'bg-success-background text-success-text' : 
-                        task.status === 'IN_PROGRESS' ? 'bg-info-background text-info-text' :
-                        'bg-gray-200 text-gray-600'
-                      }`}>
-                        {task.status}
-                      </span>
-                    </div>
-                  );
-                })}
-              </React.Fragment>
-            ))}
+                      </button>
+                    ) : (
+                      <span className="w-4"></span>
+                    )}
+                    
+                    {/* Milestone diamond */}
+                    {task.is_milestone && <span className="text-yellow-500 text-sm">◆</span>}
+                    
+                    {/* Task name */}
+                    <span className="truncate">{task.name}</span>
+                  </span>
+                  
+                  {/* Status badge */}
+                  <span className={`px-2 py-0.5 text-xs rounded-full flex-shrink-0 mr-2 ${
+                    task.status === 'DONE' ? 'bg-success-background text-success-text' : 
+                    task.status === 'IN_PROGRESS' ? 'bg-info-background text-info-text' :
+                    'bg-gray-200 text-gray-600'
+                  }`}>
+                    {task.status}
+                  </span>
+                </div>
+              );
+            })}
           </div>
           </div>
         )}
@@ -2075,269 +1952,285 @@ export const CustomGanttPro = () => {
         {/* Right Panel - Timeline */}
         <div 
           ref={timelineRef}
+          data-testid="gantt-timeline"
           className="flex-1 overflow-auto relative"
           style={{ 
-            scrollbarWidth: 'thin',
-            userSelect: (draggedTask || resizingTask) ? 'none' : 'auto' // Prevent text selection during drag
+            scrollbarWidth: 'thin'
           }}
-          onMouseMove={handleMouseMove}
-          onMouseUp={handleMouseUp}
-          onMouseLeave={handleMouseUp}
         >
           {/* Sticky Timeline Headers */}
           <div className="sticky top-0 z-30 bg-background-primary">
             {renderTimelineHeaders()}
           </div>
           
-          <div style={{ width: ganttWidth, position: 'relative' }}>
+          {renderer === 'canvas' ? (
+            <GanttCanvas
+              ref={ganttCanvasRef}
+              rowModel={rowModel}
+              visibleRows={visibleRows}
+              visibleDates={visibleDates}
+              viewport={viewport}
+              ganttWidth={ganttWidth}
+              rowHeight={rowHeight}
+              dayWidth={dayWidth}
+              viewMode={viewMode}
+              zoomLevel={zoomLevel}
+              projectStart={projectDates.start}
+              todayPosition={todayPosition}
+              getTaskPosition={getTaskPosition}
+              criticalIds={calculateCriticalPath}
+              dependencyIndex={dependencyIndex}
+              showDependencies={showDependencies && tasks.length > 0 && phases.length > 0}
+              showBaseline={showBaseline}
+              hoveredTaskId={hoveredTask}
+              selectedTaskId={highlightedTask?.id ?? selectedTask?.id ?? null}
+              onBarMouseDown={handleBarMouseDown}
+              onBarClick={handleBarClick}
+              onBarContextMenu={handleBarRightClick}
+              onBarHover={(task, e) => {
+                // Same as the DOM bars: hover ring + tooltip following the pointer, not while dragging
+                if (!dragRef.current) {
+                  setHoveredTask(task.id);
+                  setTooltip({ visible: true, task, x: e.clientX, y: e.clientY });
+                }
+              }}
+              onBarLeave={() => {
+                setHoveredTask(null);
+                setTooltip({ visible: false, task: null, x: 0, y: 0 });
+              }}
+            />
+          ) : (
+            <div style={{ width: ganttWidth, position: 'relative' }}>
             
-            {/* Gantt Bars */}
-            <div className="relative" style={{ width: ganttWidth }}>
-              {/* Grid Lines (vertical lines for each hour/day/week) */}
-              {viewMode === 'hour' && eachDayOfInterval({ start: projectDates.start, end: projectDates.end }).map((day, dayIdx) => {
-                // Show grid line every 4 hours
-                return Array.from({ length: 6 }, (_, hourIdx) => {
-                  const hour = hourIdx * 4;
-                  const left = differenceInDays(day, projectDates.start) * dayWidth + (dayWidth / 24) * hour;
-                  return (
-                    <div 
-                      key={`grid-${dayIdx}-${hour}`}
-                      className="absolute top-0 bottom-0 w-px bg-gray-200 pointer-events-none"
-                      style={{ left: `${left}px` }}
-                    />
-                  );
-                });
-              })}
+              {/* Gantt Bars */}
+              <div className="relative" style={{ width: ganttWidth, height: rowModel.totalHeight }}>
+                {/* Grid Lines (vertical lines for each hour/day/week - visible columns only) */}
+                {viewMode === 'hour' && visibleDates.days.map(day => {
+                  // Show grid line every 4 hours
+                  return Array.from({ length: 6 }, (_, hourIdx) => {
+                    const hour = hourIdx * 4;
+                    const left = dateLeft(day) + (dayWidth / 24) * hour;
+                    return (
+                      <div 
+                        key={`grid-${day.getTime()}-${hour}`}
+                        className="absolute top-0 bottom-0 w-px bg-gray-200 pointer-events-none"
+                        style={{ left: `${left}px` }}
+                      />
+                    );
+                  });
+                })}
               
-              {viewMode === 'week' && eachWeekOfInterval({ start: projectDates.start, end: projectDates.end }, { weekStartsOn: 1 }).map((week, idx) => {
-                const weekStart = week;
-                const left = differenceInDays(weekStart, projectDates.start) * dayWidth;
-                return (
+                {viewMode === 'week' && visibleDates.weeks.map(week => (
                   <div 
-                    key={`grid-${idx}`}
+                    key={`grid-${week.getTime()}`}
                     className="absolute top-0 bottom-0 w-px bg-gray-200 pointer-events-none"
-                    style={{ left: `${left}px` }}
+                    style={{ left: `${dateLeft(week)}px` }}
                   />
-                );
-              })}
+                ))}
               
-              {viewMode === 'day' && eachDayOfInterval({ start: projectDates.start, end: projectDates.end }).map((day, idx) => {
-                const left = differenceInDays(day, projectDates.start) * dayWidth;
-                return (
+                {viewMode === 'day' && visibleDates.days.map(day => (
                   <div 
-                    key={`grid-${idx}`}
+                    key={`grid-${day.getTime()}`}
                     className="absolute top-0 bottom-0 w-px bg-gray-200 pointer-events-none"
-                    style={{ left: `${left}px` }}
+                    style={{ left: `${dateLeft(day)}px` }}
                   />
-                );
-              })}
+                ))}
               
-              {/* Today Marker */}
-              <div 
-                className="absolute top-0 bottom-0 w-0.5 bg-red-500 z-30 pointer-events-none"
-                style={{ left: `${todayPosition}px` }}
-              >
-                <div className="absolute -top-2 -left-8 bg-red-500 text-white text-xs px-2 py-0.5 rounded whitespace-nowrap">
-                  Today
+                {/* Today Marker */}
+                <div 
+                  className="absolute top-0 bottom-0 w-0.5 bg-red-500 z-30 pointer-events-none"
+                  style={{ left: `${todayPosition}px` }}
+                >
+                  <div className="absolute -top-2 -left-8 bg-red-500 text-white text-xs px-2 py-0.5 rounded whitespace-nowrap">
+                    Today
+                  </div>
                 </div>
-              </div>
               
-              {/* Dependency Arrows */}
-              {renderDependencyArrows()}
+                {/* Dependency Arrows */}
+                {renderDependencyArrows()}
               
-              {/* Task Bars */}
-              {phases.map(phase => {
-                const phaseTasks = sortedTasks.filter(t => t.phase_id === phase.id);
-                return (
-                <React.Fragment key={`phase-bars-${phase.id}`}>
-                  {/* Phase header row */}
-                  <div className="h-10 bg-background-tertiary/30 border-b border-t border-border-default"></div>
-                  
-                  {/* Task rows */}
-                  {!collapsedPhases.has(phase.id) && phaseTasks.map((task) => {
-                    // Use updated position if this task is being dragged/resized
-                    const displayTask = 
-                      draggedTask?.id === task.id ? draggedTask :
-                      resizingTask?.id === task.id ? resizingTask :
-                      task;
-                    
-                    const { left, width } = getTaskPosition(displayTask);
-                    const progress = task.progress_percentage || 0;
-                    
-                    // Calculate bar height based on row height
-                    const barHeight = Math.max(rowHeight - 10, 20); // Leave 10px padding, min 20px
-                    const barTop = (rowHeight - barHeight) / 2; // Center vertically
-                    
-                    return (
-                      <div 
-                        key={`bar-${task.id}`} 
-                        className="relative border-b border-border-default" 
-                        style={{ height: `${rowHeight}px` }}>
-                        {task.is_milestone ? (
-                          // Milestone Diamond
-                          <div
-                            style={{ left: `${left}px`, top: `${barTop}px` }}
-                            className={`absolute w-6 h-6 bg-yellow-400 border-2 border-yellow-600 transform rotate-45 cursor-pointer ${
-                              draggedTask?.id === task.id ? '' : 'transition-all'
-                            } z-10 ${
-                              highlightedTask?.id === task.id || selectedTask?.id === task.id ? 'scale-125 ring-4 ring-blue-400' :
-                              hoveredTask === task.id ? 'scale-110 ring-2 ring-blue-300' :
-                              'hover:scale-110'
-                            }`}
-                            onClick={(e) => handleBarClick(task, e)}
-                            onContextMenu={(e) => handleBarRightClick(task, e)}
-                            onMouseEnter={() => setHoveredTask(task.id)}
-                            onMouseLeave={() => setHoveredTask(null)}
-                            title={task.name}
-                          ></div>
-                        ) : (
-                          // Regular Task Bar
-                          <div
-                            style={{ left: `${left}px`, width: `${width}px`, top: `${barTop}px`, height: `${barHeight}px` }}
-                            className={`absolute rounded-md ${
-                              draggedTask?.id === task.id || resizingTask?.id === task.id ? '' : 'transition-all duration-200'
-                            } ${
-                              draggedTask?.id === task.id || resizingTask?.id === task.id ? 'cursor-grabbing' : 'cursor-grab'
-                            } ${
-                              calculateCriticalPath.has(task.id) ? 'bg-red-500 ring-2 ring-red-600' :
-                              task.status === 'DONE' ? 'bg-green-500' :
-                              task.status === 'IN_PROGRESS' ? 'bg-blue-500' :
-                              'bg-gray-400'
-                            } ${
-                              highlightedTask?.id === task.id || selectedTask?.id === task.id ? 'ring-4 ring-blue-400 ring-offset-2 scale-105' :
-                              draggedTask?.id === task.id || resizingTask?.id === task.id ? 'opacity-70 ring-4 ring-yellow-400' : 
-                              hoveredTask === task.id ? 'ring-2 ring-blue-300' :
-                              'hover:opacity-80'
-                            } shadow-md group`}
-                            onMouseDown={(e) => handleBarMouseDown(e, task)}
-                            onClick={(e) => handleBarClick(task, e)}
-                            onContextMenu={(e) => handleBarRightClick(task, e)}
-                            onMouseEnter={(e) => {
-                              // Only show tooltip if not dragging
-                              if (!draggedTask && !resizingTask) {
-                                setHoveredTask(task.id);
-                                setTooltip({
-                                  visible: true,
-                                  task,
-                                  x: e.clientX,
-                                  y: e.clientY
-                                });
-                              }
-                            }}
-                            onMouseLeave={() => {
-                              if (!draggedTask && !resizingTask) {
-                                setHoveredTask(null);
-                                setTooltip({ visible: false, task: null, x: 0, y: 0 });
-                              }
+                {/* Task Bars (windowed: same row range as the task list) */}
+                <div style={{ height: `${rowModel.rows[visibleRows.start]?.top || 0}px` }}></div>
+                {rowModel.rows.slice(visibleRows.start, visibleRows.end).map(row => {
+                  if (row.type === 'phase') {
+                    // Phase header row
+                    return <div key={`phase-bars-${row.phase.id}`} className="h-10 bg-background-tertiary/30 border-b border-t border-border-default"></div>;
+                  }
+                
+                  const task = row.task;
+                  // A bar being dragged keeps its stored dates here: the preview is painted over it
+                  const { left, width } = getTaskPosition(task);
+                  const progress = task.progress_percentage || 0;
+                  // Bars entirely outside the visible columns are skipped (the row keeps its height)
+                  const inView = (left + width >= visibleDays.left && left <= visibleDays.right) ||
+                    dragRef.current?.task.id === task.id;
+                
+                  // Calculate bar height based on row height
+                  const barHeight = Math.max(rowHeight - 10, 20); // Leave 10px padding, min 20px
+                  const barTop = (rowHeight - barHeight) / 2; // Center vertically
+                
+                  return (
+                    <div 
+                      key={row.key} 
+                      className="relative border-b border-border-default" 
+                      style={{ height: `${rowHeight}px` }}>
+                      {!inView ? null : task.is_milestone ? (
+                        // Milestone Diamond
+                        <div
+                          data-testid="gantt-bar"
+                          data-task-id={task.id}
+                          style={{ left: `${left}px`, top: `${barTop}px` }}
+                          className={`absolute w-6 h-6 bg-yellow-400 border-2 border-yellow-600 transform rotate-45 cursor-pointer transition-all z-10 ${
+                            highlightedTask?.id === task.id || selectedTask?.id === task.id ? 'scale-125 ring-4 ring-blue-400' :
+                            hoveredTask === task.id ? 'scale-110 ring-2 ring-blue-300' :
+                            'hover:scale-110'
+                          }`}
+                          onClick={(e) => handleBarClick(task, e)}
+                          onContextMenu={(e) => handleBarRightClick(task, e)}
+                          onMouseEnter={() => setHoveredTask(task.id)}
+                          onMouseLeave={() => setHoveredTask(null)}
+                          title={task.name}
+                        ></div>
+                      ) : (
+                        // Regular Task Bar
+                        <div
+                          data-testid="gantt-bar"
+                          data-task-id={task.id}
+                          style={{ left: `${left}px`, width: `${width}px`, top: `${barTop}px`, height: `${barHeight}px` }}
+                          className={`absolute rounded-md transition-all duration-200 cursor-grab ${
+                            calculateCriticalPath.has(task.id) ? 'bg-red-500 ring-2 ring-red-600' :
+                            task.status === 'DONE' ? 'bg-green-500' :
+                            task.status === 'IN_PROGRESS' ? 'bg-blue-500' :
+                            'bg-gray-400'
+                          } ${
+                            highlightedTask?.id === task.id || selectedTask?.id === task.id ? 'ring-4 ring-blue-400 ring-offset-2 scale-105' :
+                            hoveredTask === task.id ? 'ring-2 ring-blue-300' :
+                            'hover:opacity-80'
+                          } shadow-md group`}
+                          onMouseDown={(e) => handleBarMouseDown(e, task)}
+                          onClick={(e) => handleBarClick(task, e)}
+                          onContextMenu={(e) => handleBarRightClick(task, e)}
+                          onMouseEnter={(e) => {
+                            // Only show tooltip if not dragging
+                            if (!dragRef.current) {
+                              setHoveredTask(task.id);
+                              setTooltip({
+                                visible: true,
+                                task,
+                                x: e.clientX,
+                                y: e.clientY
+                              });
+                            }
+                          }}
+                          onMouseLeave={() => {
+                            if (!dragRef.current) {
+                              setHoveredTask(null);
+                              setTooltip({ visible: false, task: null, x: 0, y: 0 });
+                            }
+                          }}
+                          onMouseMove={(e) => {
+                            // Update tooltip position only if not dragging
+                            if (!dragRef.current && tooltip.visible && tooltip.task?.id === task.id) {
+                              setTooltip({
+                                visible: true,
+                                task,
+                                x: e.clientX,
+                                y: e.clientY
+                              });
+                            }
+                          }}
+                        >
+                          {/* Baseline (if enabled) */}
+                          {showBaseline && task.baseline_start_date && task.baseline_end_date && (
+                            <div
+                              className="absolute -top-1 left-0 h-1 bg-gray-300 rounded-full opacity-50"
+                              style={{
+                                width: `${differenceInDays(new Date(task.baseline_end_date), new Date(task.baseline_start_date)) * dayWidth}px`,
+                                left: `${differenceInDays(new Date(task.baseline_start_date), new Date(task.start_date || task.started_at)) * dayWidth}px`
+                              }}
+                            ></div>
+                          )}
+                        
+                          {/* Resize Handles - Wider for easier grab */}
+                          <div 
+                            className="absolute left-0 top-0 bottom-0 w-3 cursor-col-resize hover:bg-white/30 transition-all z-20"
+                            onMouseDown={(e) => {
+                              e.stopPropagation(); // Prevent bar drag
+                              handleBarMouseDown(e, task, 'left');
                             }}
-                            onMouseMove={(e) => {
-                              // Update tooltip position only if not dragging
-                              if (!draggedTask && !resizingTask && tooltip.visible && tooltip.task?.id === task.id) {
-                                setTooltip({
-                                  visible: true,
-                                  task,
-                                  x: e.clientX,
-                                  y: e.clientY
-                                });
-                              }
+                            title="◀ Drag to change start date"
+                          >
+                            <div className="absolute left-0.5 top-1/2 -translate-y-1/2 w-1 h-6 bg-white/80 rounded-full shadow"></div>
+                          </div>
+                          <div 
+                            className="absolute right-0 top-0 bottom-0 w-3 cursor-col-resize hover:bg-white/30 transition-all z-20"
+                            onMouseDown={(e) => {
+                              e.stopPropagation(); // Prevent bar drag
+                              handleBarMouseDown(e, task, 'right');
                             }}
+                            title="Drag to change end date ▶"
                           >
-                            {/* Baseline (if enabled) */}
-                            {showBaseline && task.baseline_start_date && task.baseline_end_date && (
-                              <div
-                                className="absolute -top-1 left-0 h-1 bg-gray-300 rounded-full opacity-50"
-                                style={{
-                                  width: `${differenceInDays(new Date(task.baseline_end_date), new Date(task.baseline_start_date)) * dayWidth}px`,
-                                  left: `${differenceInDays(new Date(task.baseline_start_date), new Date(task.start_date || task.started_at)) * dayWidth}px`
-                                }}
-                              ></div>
-                            )}
-                            
-                            {/* Resize Handles - Wider for easier grab */}
-                            <div 
-                              className="absolute left-0 top-0 bottom-0 w-3 cursor-col-resize hover:bg-white/30 transition-all z-20"
-                              onMouseDown={(e) => {
-                                e.stopPropagation(); // Prevent bar drag
-                                handleBarMouseDown(e, task, 'left');
-                              }}
-                              title="◀ Drag to change start date"
-                            >
-                              <div className="absolute left-0.5 top-1/2 -translate-y-1/2 w-1 h-6 bg-white/80 rounded-full shadow"></div>
-                            </div>
+                            <div className="absolute right-0.5 top-1/2 -translate-y-1/2 w-1 h-6 bg-white/80 rounded-full shadow"></div>
+                          </div>
+                        
+                          {/* Progress Bar */}
+                          {progress > 0 && (
                             <div 
-                              className="absolute right-0 top-0 bottom-0 w-3 cursor-col-resize hover:bg-white/30 transition-all z-20"
-                              onMouseDown={(e) => {
-                                e.stopPropagation(); // Prevent bar drag
-                                handleBarMouseDown(e, task, 'right');
-                              }}
-                              title="Drag to change end date ▶"
-                            >
-                              <div className="absolute right-0.5 top-1/2 -translate-y-1/2 w-1 h-6 bg-white/80 rounded-full shadow"></div>
-                            </div>
-                            
-                            {/* Progress Bar */}
-                            {progress > 0 && (
-                              <div 
-                                className="absolute top-0 left-0 bottom-0 bg-black/20 rounded-l-md"
-                                style={{ width: `${progress}%` }}
-                              ></div>
+                              className="absolute top-0 left-0 bottom-0 bg-black/20 rounded-l-md"
+                              style={{ width: `${progress}%` }}
+                            ></div>
+                          )}
+                        
+                          {/* Task Name + Status Badge + Dependencies */}
+                          <div className="absolute inset-0 flex items-center px-2 text-white font-semibold truncate pointer-events-none gap-1">
+                            {/* Status Badge */}
+                            {task.status === 'DONE' && (
+                              <span className="px-1.5 py-0.5 bg-green-600 rounded text-[10px] font-bold">✓</span>
+                            )}
+                            {task.status === 'IN_PROGRESS' && (
+                              <span className="px-1.5 py-0.5 bg-blue-600 rounded text-[10px] font-bold animate-pulse">⏳</span>
+                            )}
+                            {task.status === 'PENDING' && getTaskDependencies(task).length === 0 && (
+                              <span className="px-1.5 py-0.5 bg-green-500 rounded text-[10px] font-bold">✓</span>
                             )}
+                            {task.status === 'PENDING' && getTaskDependencies(task).length > 0 && (
+                              <span className="px-1.5 py-0.5 bg-red-500 rounded text-[10px] font-bold">🚫</span>
+                            )}
+                          
+                            {/* Dependency Count Badges */}
+                            {(() => {
+                              const depCount = getTaskDependencies(task).length;
+                              const blockCount = getSuccessorCount(dependencyIndex, task.id);
                             
-                            {/* Task Name + Status Badge + Dependencies */}
-                            <div className="absolute inset-0 flex items-center px-2 text-white font-semibold truncate pointer-events-none gap-1">
-                              {/* Status Badge */}
-                              {task.status === 'DONE' && (
-                                <span className="px-1.5 py-0.5 bg-green-600 rounded text-[10px] font-bold">✓</span>
-                              )}
-                              {task.status === 'IN_PROGRESS' && (
-                                <span className="px-1.5 py-0.5 bg-blue-600 rounded text-[10px] font-bold animate-pulse">⏳</span>
-                              )}
-                              {task.status === 'PENDING' && getTaskDependencies(task).length === 0 && (
-                                <span className="px-1.5 py-0.5 bg-green-500 rounded text-[10px] font-bold">✓</span>
-                              )}
-                              {task.status === 'PENDING' && getTaskDependencies(task).length > 0 && (
-                                <span className="px-1.5 py-0.5 bg-red-500 rounded text-[10px] font-bold">🚫</span>
-                              )}
-                              
-                              {/* Dependency Count Badges */}
-                              {(() => {
-                                const depCount = getTaskDependencies(task).length;
-                                const blockCount = tasks.filter(t => {
-                                  const deps = getTaskDependencies(t);
-                                  return deps.some(dep => dep.id === task.id);
-                                }).length;
-                                
-                                return (
-                                  <>
-                                    {depCount > 0 && (
-                                      <span className="px-1.5 py-0.5 bg-yellow-500/90 rounded text-[10px] font-bold" title={`Depends on ${depCount} task(s)`}>
-                                        ⬅️{depCount}
-                                      </span>
-                                    )}
-                                    {blockCount > 0 && (
-                                      <span className="px-1.5 py-0.5 bg-red-500/90 rounded text-[10px] font-bold" title={`Blocks ${blockCount} task(s)`}>
-                                        ➡️{blockCount}
-                                      </span>
-                                    )}
-                                  </>
-                                );
-                              })()}
-                              
-                              <span className="truncate text-xs">{task.name}</span>
-                              {task.assigned_to && width > 120 && (
-                                <span className="ml-auto text-xs opacity-90 flex-shrink-0">@{task.assigned_to.split('@')[0]}</span>
-                              )}
-                            </div>
+                              return (
+                                <>
+                                  {depCount > 0 && (
+                                    <span className="px-1.5 py-0.5 bg-yellow-500/90 rounded text-[10px] font-bold" title={`Depends on ${depCount} task(s)`}>
+                                      ⬅️{depCount}
+                                    </span>
+                                  )}
+                                  {blockCount > 0 && (
+                                    <span className="px-1.5 py-0.5 bg-red-500/90 rounded text-[10px] font-bold" title={`Blocks ${blockCount} task(s)`}>
+                                      ➡️{blockCount}
+                                    </span>
+                                  )}
+                                </>
+                              );
+                            })()}
+                          
+                            <span className="truncate text-xs">{task.name}</span>
+                            {task.assigned_to && width > 120 && (
+                              <span className="ml-auto text-xs opacity-90 flex-shrink-0">@{task.assigned_to.split('@')[0]}</span>
+                            )}
                           </div>
-                        )}
-                      </div>
-                    );
-                  })}
-                </React.Fragment>
-                );
-              })}
+                        </div>
+                      )}
+                    </div>
+                  );
+                })}
+              </div>
             </div>
-          </div>
+          )}
         </div>
       </div>
     </div>
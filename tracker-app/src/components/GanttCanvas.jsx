@@ -0,0 +1,211 @@
+import React, { forwardRef, useEffect, useImperativeHandle, useLayoutEffect, useMemo, useRef, useState } from 'react';
+import {
+  prepareCanvas,
+  drawGridLayer,
+  drawBarLayer,
+  drawOverlayLayer,
+  buildArrowSegments,
+  moveArrowSegments,
+  hitTestBar
+} from '../lib/ganttCanvas';
+
+const LAYER_STYLE = { position: 'absolute', top: 0, left: 0 };
+
+// The view with a dragged bar drawn at its preview dates
+const withPreview = (view, preview) => (!preview ? view : {
+  ...view,
+  activeTask: preview.task,
+  activeInvalid: preview.invalid,
+  arrows: moveArrowSegments(view.arrows, preview.task, view.getPosition)
+});
+
+/**
+ * Canvas renderer for the Gantt timeline body (the DOM headers stay as they are).
+ * Three stacked canvases the size of the viewport, pinned with position: sticky
+ * inside a spacer as large as the whole chart, so native scrolling still works:
+ *   grid    - row bands, grid columns, today line (scroll / zoom)
+ *   bars    - bars, milestones, dependency arrows (task or layout changes)
+ *   overlay - hover / selection / drag rings (pointer movement only)
+ * Bars are hit-tested by position, so there is no DOM node per bar.
+ * Drag previews go through ref.previewTask(task, { invalid }) and repaint the
+ * bar and overlay layers directly, without a React render.
+ */
+export const GanttCanvas = forwardRef(({
+  rowModel,
+  visibleRows,
+  visibleDates,
+  viewport,
+  ganttWidth,
+  rowHeight,
+  dayWidth,
+  viewMode,
+  zoomLevel,
+  projectStart,
+  todayPosition,
+  getTaskPosition,
+  criticalIds,
+  dependencyIndex,
+  showDependencies,
+  showBaseline,
+  hoveredTaskId,
+  selectedTaskId,
+  onBarMouseDown,
+  onBarClick,
+  onBarContextMenu,
+  onBarHover,
+  onBarLeave
+}, ref) => {
+  const spacerRef = useRef(null);
+  const gridCanvasRef = useRef(null);
+  const barCanvasRef = useRef(null);
+  const overlayCanvasRef = useRef(null);
+  const hoverIdRef = useRef(null);
+  const previewRef = useRef(null);
+  const [stickyTop, setStickyTop] = useState(0);
+
+  // The spacer starts right below the sticky date headers
+  useLayoutEffect(() => {
+    const top = spacerRef.current?.offsetTop || 0;
+    if (top !== stickyTop) setStickyTop(top);
+  });
+
+  const width = Math.max(0, Math.min(viewport.width, ganttWidth));
+  const height = Math.max(0, Math.min(viewport.height - stickyTop, rowModel.totalHeight));
+
+  // Everything except the scroll position: rebuilt on data / layout changes only
+  const layout = useMemo(() => ({
+    rows: rowModel.rows,
+    rowIndexByTaskId: rowModel.rowIndexByTaskId,
+    rowHeight,
+    dayWidth,
+    viewMode,
+    zoomLevel,
+    projectStart,
+    todayX: todayPosition,
+    getPosition: getTaskPosition,
+    criticalIds,
+    dependencyIndex,
+    showDependencies,
+    showBaseline
+  }), [rowModel, rowHeight, dayWidth, viewMode, zoomLevel, projectStart, todayPosition,
+    getTaskPosition, criticalIds, dependencyIndex, showDependencies, showBaseline]);
+
+  const arrows = useMemo(
+    () => (showDependencies ? buildArrowSegments(layout) : []),
+    [layout, showDependencies]
+  );
+
+  const view = useMemo(() => ({
+    ...layout,
+    arrows,
+    dates: visibleDates,
+    rowRange: visibleRows,
+    left: viewport.scrollLeft,
+    top: viewport.scrollTop,
+    width,
+    height
+  }), [layout, arrows, visibleDates, visibleRows, viewport.scrollLeft, viewport.scrollTop, width, height]);
+
+  useEffect(() => {
+    if (!gridCanvasRef.current || width === 0 || height === 0) return;
+    drawGridLayer(prepareCanvas(gridCanvasRef.current, view), view);
+  }, [view.rows, view.rowRange, view.dates, view.viewMode, view.dayWidth, view.todayX,
+    view.left, view.top, width, height]); // eslint-disable-line react-hooks/exhaustive-deps
+
+  const drawBars = () => {
+    if (!barCanvasRef.current || width === 0 || height === 0) return;
+    const current = withPreview(view, previewRef.current);
+    drawBarLayer(prepareCanvas(barCanvasRef.current, current), current);
+  };
+
+  const drawOverlay = () => {
+    if (!overlayCanvasRef.current || width === 0 || height === 0) return;
+    const current = withPreview(view, previewRef.current);
+    drawOverlayLayer(prepareCanvas(overlayCanvasRef.current, current), current, {
+      hoveredId: hoveredTaskId,
+      selectedId: selectedTaskId
+    });
+  };
+
+  useEffect(drawBars, [view, width, height]); // eslint-disable-line react-hooks/exhaustive-deps
+  useEffect(drawOverlay, [view, width, height, hoveredTaskId, selectedTaskId]); // eslint-disable-line react-hooks/exhaustive-deps
+
+  // One call per animation frame while dragging; null ends the preview
+  useImperativeHandle(ref, () => ({
+    previewTask: (task, { invalid = false } = {}) => {
+      previewRef.current = task ? { task, invalid } : null;
+      drawBars();
+      drawOverlay();
+    }
+  }));
+
+  // Pointer position -> bar under it (content coordinates)
+  const hitTest = (e) => {
+    const rect = overlayCanvasRef.current.getBoundingClientRect();
+    return hitTestBar(view, e.clientX - rect.left + view.left, e.clientY - rect.top + view.top);
+  };
+
+  const handleMouseMove = (e) => {
+    if (previewRef.current) return; // Dragging: the timeline's handlers own the pointer
+    const hit = hitTest(e);
+    const canvas = overlayCanvasRef.current;
+    canvas.style.cursor = !hit ? 'default'
+      : hit.rect.milestone ? 'pointer'
+      : hit.edge ? 'col-resize'
+      : 'grab';
+
+    const hitId = hit ? hit.task.id : null;
+    if (hitId !== null) {
+      onBarHover(hit.task, e);
+    } else if (hoverIdRef.current !== null) {
+      onBarLeave();
+    }
+    hoverIdRef.current = hitId;
+  };
+
+  const handleMouseLeave = () => {
+    if (hoverIdRef.current !== null && !previewRef.current) onBarLeave();
+    hoverIdRef.current = null;
+  };
+
+  const handleMouseDown = (e) => {
+    const hit = hitTest(e);
+    // Milestones are not draggable (same as the DOM diamonds)
+    if (hit && !hit.rect.milestone) onBarMouseDown(e, hit.task, hit.edge);
+  };
+
+  const handleClick = (e) => {
+    const hit = hitTest(e);
+    if (hit) onBarClick(hit.task, e);
+  };
+
+  const handleContextMenu = (e) => {
+    const hit = hitTest(e);
+    if (hit) onBarContextMenu(hit.task, e);
+  };
+
+  return (
+    <div ref={spacerRef} style={{ width: ganttWidth, height: rowModel.totalHeight, position: 'relative' }}>
+      <div
+        data-testid="gantt-canvas"
+        style={{ position: 'sticky', top: stickyTop, left: 0, width, height }}
+      >
+        <canvas ref={gridCanvasRef} style={LAYER_STYLE} />
+        <canvas ref={barCanvasRef} style={LAYER_STYLE} />
+        <canvas
+          ref={overlayCanvasRef}
+          style={LAYER_STYLE}
+          onMouseMove={handleMouseMove}
+          onMouseLeave={handleMouseLeave}
+          onMouseDown={handleMouseDown}
+          onClick={handleClick}
+          onContextMenu={handleContextMenu}
+        />
+      </div>
+    </div>
+  );
+});
+
+GanttCanvas.displayName = 'GanttCanvas';
+
+export default GanttCanvas;
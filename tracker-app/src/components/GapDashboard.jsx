@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { supabase, getGapAnalysis } from '../lib/supabase';
+import { getDashboardStats, subscribeDashboardChanges } from '../lib/dashboardStats';
 import { TrendingUp, Clock, Target, AlertTriangle, User, Bot, CheckCircle, Zap, ChevronRight } from 'lucide-react';
 import { AIActivityStream } from './AIActivityStream';
 import { TaskDetailModal } from './TaskDetailModal';
@@ -14,25 +15,27 @@ export const GapDashboard = () => {
   const [selectedTask, setSelectedTask] = useState(null);
 
   useEffect(() => {
+    // First load may use the cached stats; later ones follow a task change.
+    // Real-time: refresh once per burst (e.g. an agent updating 200 tasks),
+    // without loading the task rows
     loadStats();
-    
-    // Real-time subscription
-    const subscription = supabase
-      .channel('gap-updates')
-      .on('postgres_changes', { event: '*', schema: 'public', table: 'tasks' }, loadStats)
-      .subscribe();
-    
-    return () => subscription.unsubscribe();
+    return subscribeDashboardChanges(() => loadStats({ force: true }));
   }, []);
 
-  const loadStats = async () => {
+  const loadStats = async ({ force = false } = {}) => {
     try {
-      // Load recommended tasks - get more for better grouping
-      const { data: humanData } = await supabase
-        .rpc('get_next_recommended_tasks', { 
+      // Recommendations and aggregate stats in parallel - one round trip each
+      const [{ data: humanData }, { data: aiData }, dashboardStats] = await Promise.all([
+        supabase.rpc('get_next_recommended_tasks', {
           for_agent_type: 'HUMAN',
           limit_count: 10
-        });
+        }),
+        supabase.rpc('get_next_recommended_tasks', {
+          for_agent_type: 'AI',
+          limit_count: 10
+        }),
+        getDashboardStats({ force })
+      ]);
       
       // Group by phase
       const humanGrouped = (humanData || []).reduce((acc, task) => {
@@ -43,12 +46,6 @@ export const GapDashboard = () => {
       }, {});
       setHumanTasks(humanGrouped);
 
-      const { data: aiData } = await supabase
-        .rpc('get_next_recommended_tasks', { 
-          for_agent_type: 'AI',
-          limit_count: 10
-        });
-      
       // Group by phase
       const aiGrouped = (aiData || []).reduce((acc, task) => {
         const phase = `Phase ${task.phase_id}`;
@@ -59,64 +56,31 @@ export const GapDashboard = () => {
       setAiTasks(aiGrouped);
 
       // Overall stats
-      const { data: tasks } = await supabase
-        .from('tasks')
-        .select('status, phase_id, assigned_type, estimated_hours, actual_hours');
-      
-      const total = tasks.length;
-      const done = tasks.filter(t => t.status === 'DONE').length;
-      const inProgress = tasks.filter(t => t.status === 'IN_PROGRESS').length;
-      const pending = tasks.filter(t => t.status === 'PENDING').length;
-      const blocked = tasks.filter(t => t.status === 'BLOCKED').length;
-      
-      const completionPct = ((done / total) * 100).toFixed(2);
-      const gapPct = (((total - done) / total) * 100).toFixed(2);
-      
-      const filteredHumanTasks = tasks.filter(t => t.assigned_type === 'HUMAN');
-      const filteredAiTasks = tasks.filter(t => t.assigned_type === 'AI');
-      
-      const totalEstHours = tasks.reduce((sum, t) => sum + (parseFloat(t.estimated_hours) || 0), 0);
-      const totalActualHours = tasks.reduce((sum, t) => sum + (parseFloat(t.actual_hours) || 0), 0);
+      const { total, done } = dashboardStats;
+      const completionPct = total > 0 ? ((done / total) * 100).toFixed(2) : '0.00';
+      const gapPct = total > 0 ? (((total - done) / total) * 100).toFixed(2) : '0.00';
       
       setStats({
         total,
         done,
-        inProgress,
-        pending,
-        blocked,
+        inProgress: dashboardStats.inProgress,
+        pending: dashboardStats.pending,
+        blocked: dashboardStats.blocked,
         completionPct,
         gapPct,
-        humanTasks: filteredHumanTasks.length,
-        aiTasks: filteredAiTasks.length,
-        totalEstHours: totalEstHours.toFixed(1),
-        totalActualHours: totalActualHours.toFixed(1)
+        humanTasks: dashboardStats.humanTasks,
+        aiTasks: dashboardStats.aiTasks,
+        totalEstHours: dashboardStats.estimatedHours.toFixed(1),
+        totalActualHours: dashboardStats.actualHours.toFixed(1)
       });
       
-      // Phase stats
-      const { data: phases } = await supabase
-        .from('phases')
-        .select('*')
-        .order('order_index');
-      
-      const phaseData = await Promise.all(
-        phases.map(async (phase) => {
-          const { data: phaseTasks } = await supabase
-            .from('tasks')
-            .select('status')
-            .eq('phase_id', phase.id);
-          
-          const total = phaseTasks.length;
-          const done = phaseTasks.filter(t => t.status === 'DONE').length;
-          const pct = total > 0 ? ((done / total) * 100).toFixed(1) : 0;
-          
-          return {
-            ...phase,
-            totalTasks: total,
-            doneTasks: done,
-            completionPct: pct
-          };
-        })
-      );
+      // Phase stats (counted server-side, already ordered by order_index)
+      const phaseData = dashboardStats.phases.map(phase => ({
+        ...phase,
+        completionPct: phase.totalTasks > 0
+          ? ((phase.doneTasks / phase.totalTasks) * 100).toFixed(1)
+          : 0
+      }));
       
       setPhaseStats(phaseData);
       setLoading(false);
@@ -1,12 +1,15 @@
 import React, { useState, useEffect } from 'react';
 import { supabase } from '../lib/supabase';
+import { patchTasks, reloadTasks } from '../lib/taskStore';
+import { syncTable } from '../lib/localSnapshot';
+import { useTaskStore } from '../hooks/useTaskStore';
 import { User, Bot, CheckCircle, Clock, AlertCircle, Link2 } from 'lucide-react';
 import { TaskDetailModal } from './TaskDetailModal';
 import { UnifiedFilterBar } from './UnifiedFilterBar';
 
 export const KanbanView = () => {
-  const [tasks, setTasks] = useState([]);
-  const [loading, setLoading] = useState(true);
+  // Shared store: one realtime channel, changes applied as deltas (no reload per event)
+  const { tasks, loading } = useTaskStore();
   const [draggingTask, setDraggingTask] = useState(null);
   const [dragOverColumn, setDragOverColumn] = useState(null);
   const [selectedTask, setSelectedTask] = useState(null);
@@ -17,49 +20,18 @@ export const KanbanView = () => {
   const [phases, setPhases] = useState([]);
 
   useEffect(() => {
-    loadTasks();
     loadPhases();
-
-    const channel = supabase
-      .channel('kanban_tasks')
-      .on('postgres_changes', 
-        { event: '*', schema: 'public', table: 'tasks' },
-        loadTasks
-      )
-      .subscribe();
-
-    return () => supabase.removeChannel(channel);
   }, []);
 
   const loadPhases = async () => {
     try {
-      const { data, error } = await supabase.from('phases').select('*').order('order_index');
-      if (error) throw error;
-      setPhases(data || []);
+      const data = await syncTable('phases', { order: 'order_index', onSnapshot: setPhases });
+      setPhases(data);
     } catch (error) {
       console.error('Error loading phases:', error);
     }
   };
 
-  const loadTasks = async () => {
-    try {
-      const { data, error } = await supabase
-        .from('tasks_with_dependencies')
-        .select('*')
-        .order('phase_id')
-        .order('order_index');
-      
-      if (error) throw error;
-      console.log('[Kanban] Loaded tasks:', data?.length);
-      setTasks(data || []);
-      setLoading(false);
-    } catch (error) {
-      console.error('Error loading tasks:', error);
-      setTasks([]);
-      setLoading(false);
-    }
-  };
-
   const updateTaskStatus = async (taskId, newStatus) => {
     try {
       const updates = { status: newStatus };
@@ -73,14 +45,18 @@ export const KanbanView = () => {
         updates.progress_percentage = 100;
       }
 
-      await supabase
+      // Optimistic: move the card now, the realtime echo confirms it
+      patchTasks([{ id: taskId, ...updates }]);
+
+      const { error } = await supabase
         .from('tasks')
         .update(updates)
         .eq('id', taskId);
       
-      loadTasks();
+      if (error) throw error;
     } catch (error) {
       console.error('Error updating task:', error);
+      reloadTasks();
     }
   };
 
@@ -362,7 +338,7 @@ export const KanbanView = () => {
           task={selectedTask} 
           allTasks={tasks}
           onClose={() => setSelectedTask(null)} 
-          onUpdate={loadTasks}
+          onUpdate={reloadTasks}
         />
       )}
     </div>
@@ -0,0 +1,12 @@
+import React, { Profiler } from 'react';
+import { PERF_ENABLED, recordCommit } from '../lib/perf';
+
+/**
+ * React Profiler feeding commit durations to lib/perf under `id`.
+ * Renders the children as they are when perf instrumentation is off.
+ */
+export const PerfProfiler = ({ id, children }) => (
+  PERF_ENABLED ? <Profiler id={id} onRender={recordCommit}>{children}</Profiler> : children
+);
+
+export default PerfProfiler;
@@ -1,13 +1,32 @@
 import React, { useState, useEffect } from 'react';
 import { supabase } from '../lib/supabase';
+import { optimisticBulkUpdate } from '../lib/bulkUpdate';
+import { setStoreTasks, patchTasks, reloadTasks } from '../lib/taskStore';
+import { syncTable } from '../lib/localSnapshot';
+import { useTaskStore } from '../hooks/useTaskStore';
 import { Calendar, Plus, Trash2, Play, CheckCircle, TrendingUp, Brain, Zap } from 'lucide-react';
 import { TaskDetailModal } from './TaskDetailModal';
 
+// Backlog - all PENDING tasks, priority descending (NULLs first, as in Postgres) then phase
+const compareBacklog = (a, b) => {
+  if (a.priority !== b.priority) {
+    if (a.priority === null || a.priority === undefined) return -1;
+    if (b.priority === null || b.priority === undefined) return 1;
+    return a.priority < b.priority ? 1 : -1;
+  }
+  return (a.phase_id ?? Infinity) - (b.phase_id ?? Infinity);
+};
+
+const selectBacklog = (tasks) => tasks
+  .filter(task => task.status === 'PENDING')
+  .sort(compareBacklog);
+
 export const SprintPlanning = () => {
   const [sprints, setSprints] = useState([]);
   const [currentSprint, setCurrentSprint] = useState(null);
-  const [backlog, setBacklog] = useState([]);
-  const [loading, setLoading] = useState(true);
+  // Shared store keeps the backlog current (realtime deltas, no reloads)
+  const { tasks: backlog, loading: backlogLoading, error: backlogError } = useTaskStore(selectBacklog);
+  const [sprintsLoading, setSprintsLoading] = useState(true);
   const [showCreateSprint, setShowCreateSprint] = useState(false);
   const [aiSuggestions, setAiSuggestions] = useState(null);
   const [selectedTask, setSelectedTask] = useState(null);
@@ -16,16 +35,38 @@ export const SprintPlanning = () => {
     loadData();
   }, []);
 
+  // Re-suggest whenever the backlog or sprint history changes
+  useEffect(() => {
+    if (backlogLoading || sprintsLoading) return;
+
+    if (backlogError) {
+      setAiSuggestions({
+        tasks: [],
+        velocity: '5.0',
+        totalHours: '0',
+        maxHours: '40',
+        reasoning: 'Unable to load sprint data. Please check database connection.'
+      });
+    } else if (backlog.length > 0) {
+      generateAISuggestions(backlog, sprints);
+    } else {
+      // No tasks available - generate empty suggestions with helpful message
+      setAiSuggestions({
+        tasks: [],
+        velocity: '5.0',
+        totalHours: '0',
+        maxHours: '40',
+        reasoning: 'No pending tasks available for sprint planning. All tasks may be completed or in progress.'
+      });
+    }
+  }, [backlog, sprints, backlogLoading, sprintsLoading, backlogError]);
+
   const loadData = async () => {
     try {
       // Load sprints (ignore errors if table doesn't exist)
       let sprintsData = [];
       try {
-        const { data } = await supabase
-          .from('sprints')
-          .select('*')
-          .order('start_date', { ascending: false });
-        sprintsData = data || [];
+        sprintsData = await syncTable('sprints', { order: 'start_date', ascending: false });
       } catch (sprintError) {
         console.warn('Sprints table not available, using default velocity');
       }
@@ -38,46 +79,15 @@ export const SprintPlanning = () => {
         new Date(s.start_date) <= now && new Date(s.end_date) >= now
       );
       setCurrentSprint(active);
-      
-      // Load backlog - all PENDING tasks
-      const { data: tasks } = await supabase
-        .from('tasks_with_dependencies')
-        .select('*')
-        .eq('status', 'PENDING')
-        .order('priority', { ascending: false })
-        .order('phase_id');
-      
-      setBacklog(tasks);
-      
-      // Generate AI suggestions (always, even if no sprints data)
-      if (tasks && tasks.length > 0) {
-        generateAISuggestions(tasks, sprintsData);
-      } else {
-        // No tasks available - generate empty suggestions with helpful message
-        setAiSuggestions({
-          tasks: [],
-          velocity: '5.0',
-          totalHours: '0',
-          maxHours: '40',
-          reasoning: 'No pending tasks available for sprint planning. All tasks may be completed or in progress.'
-        });
-      }
-      
-      setLoading(false);
     } catch (error) {
       console.error('Error loading sprint data:', error);
-      // Even on error, show AI suggestions with fallback
-      setAiSuggestions({
-        tasks: [],
-        velocity: '5.0',
-        totalHours: '0',
-        maxHours: '40',
-        reasoning: 'Unable to load sprint data. Please check database connection.'
-      });
-      setLoading(false);
+    } finally {
+      setSprintsLoading(false);
     }
   };
 
+  const loading = backlogLoading || sprintsLoading;
+
   const generateAISuggestions = (tasks, sprints) => {
     // Calculate team velocity from past sprints
     const completedSprints = sprints?.filter(s => new Date(s.end_date) < new Date()) || [];
@@ -153,11 +163,15 @@ export const SprintPlanning = () => {
           sprint_id: data.id
         }));
         
-        for (const update of taskUpdates) {
-          await supabase
-            .from('tasks')
-            .update({ sprint_id: update.sprint_id })
-            .eq('id', update.id);
+        // One bulk write (optimistic on the backlog, failed rows reverted)
+        const { failed } = await optimisticBulkUpdate({
+          tasks: backlog,
+          setTasks: setStoreTasks,
+          updates: taskUpdates
+        });
+        if (failed.length > 0) {
+          console.error('Sprint assignment failed rows:', failed);
+          alert(`Sprint created, but ${failed.length} task(s) could not be added: ${failed.map(f => `#${f.id} (${f.message})`).join(', ')}`);
         }
       }
       
@@ -171,27 +185,31 @@ export const SprintPlanning = () => {
 
   const addTaskToSprint = async (taskId, sprintId) => {
     try {
-      await supabase
+      patchTasks([{ id: taskId, sprint_id: sprintId }]);
+      const { error } = await supabase
         .from('tasks')
         .update({ sprint_id: sprintId })
         .eq('id', taskId);
       
-      loadData();
+      if (error) throw error;
     } catch (error) {
       console.error('Error adding task to sprint:', error);
+      reloadTasks();
     }
   };
 
   const removeTaskFromSprint = async (taskId) => {
     try {
-      await supabase
+      patchTasks([{ id: taskId, sprint_id: null }]);
+      const { error } = await supabase
         .from('tasks')
         .update({ sprint_id: null })
         .eq('id', taskId);
       
-      loadData();
+      if (error) throw error;
     } catch (error) {
       console.error('Error removing task from sprint:', error);
+      reloadTasks();
     }
   };
 
@@ -399,7 +417,7 @@ export const SprintPlanning = () => {
           task={selectedTask}
           allTasks={tasks}
           onClose={() => setSelectedTask(null)}
-          onUpdate={loadData}
+          onUpdate={reloadTasks}
         />
       )}
     </div>
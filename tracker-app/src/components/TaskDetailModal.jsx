@@ -3,8 +3,9 @@ import { X, User, Bot, Clock, TrendingUp, ArrowRight, Shield, CheckCircle, Alert
 import { supabase } from '../lib/supabase';
 import toast from 'react-hot-toast';
 import { validateStatusChange, validateTaskUpdate } from '../lib/validation';
+import { buildDependencyIndex, getPredecessors, getSuccessors } from '../lib/dependencyGraph';
 
-export const TaskDetailModal = ({ task, onClose, onUpdate, allTasks = [] }) => {
+export const TaskDetailModal = ({ task, onClose, onUpdate, allTasks = [], dependencyIndex = null }) => {
   const [updating, setUpdating] = useState(false);
   const [dependencies, setDependencies] = useState([]);
   const [blockedBy, setBlockedBy] = useState([]);
@@ -18,16 +19,16 @@ export const TaskDetailModal = ({ task, onClose, onUpdate, allTasks = [] }) => {
       return;
     }
 
+    // Share the caller's index when it has one (Gantt Pro), otherwise build it once here
+    const index = dependencyIndex || buildDependencyIndex(allTasks);
+
     // Get tasks this depends on (predecessors)
     const deps = task.depends_on || [];
-    const depTasks = deps.map(id => allTasks.find(t => t.id === id)).filter(Boolean);
+    const depTasks = getPredecessors(index, task);
     setDependencies(depTasks);
 
     // Get tasks that depend on this (successors)
-    const blocked = allTasks.filter(t => {
-      const taskDeps = t.depends_on || [];
-      return taskDeps.includes(task.id);
-    });
+    const blocked = getSuccessors(index, task.id);
     setBlockedBy(blocked);
     
     console.log(`📋 Modal "${task.name}":`, {
@@ -36,7 +37,7 @@ export const TaskDetailModal = ({ task, onClose, onUpdate, allTasks = [] }) => {
       successors: blocked.length,
       allTasksCount: allTasks.length
     });
-  }, [task, allTasks]);
+  }, [task, allTasks, dependencyIndex]);
 
   // ✅ FIXED: Use toast instead of alert + added validation
   const handleStatusChange = async (newStatus) => {
@@ -118,6 +119,7 @@ export const TaskDetailModal = ({ task, onClose, onUpdate, allTasks = [] }) => {
       />
       {/* ✅ FIXED: Mobile responsive - w-full on mobile, w-[600px] on md+ screens */}
       <div
+        data-testid="task-detail-modal"
         className="fixed right-0 top-0 h-full w-full md:w-[600px] bg-white/70 backdrop-blur-md shadow-2xl z-50 overflow-y-auto animate-slideInRight"
         onClick={(e) => e.stopPropagation()}
       >
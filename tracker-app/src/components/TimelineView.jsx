@@ -1,13 +1,15 @@
 import React, { useState, useEffect } from 'react';
-import { supabase } from '../lib/supabase';
+import { reloadTasks } from '../lib/taskStore';
+import { syncTable } from '../lib/localSnapshot';
+import { useTaskStore } from '../hooks/useTaskStore';
 import { CheckCircle, Clock, AlertCircle, ChevronRight, ChevronDown, User, Bot } from 'lucide-react';
 import { TaskDetailModal } from './TaskDetailModal';
 import { UnifiedFilterBar } from './UnifiedFilterBar';
 
 export const TimelineView = () => {
   const [phases, setPhases] = useState([]);
-  const [tasks, setTasks] = useState([]);
-  const [loading, setLoading] = useState(true);
+  const { tasks, loading: tasksLoading } = useTaskStore();
+  const [phasesLoading, setPhasesLoading] = useState(true);
   const [expandedPhases, setExpandedPhases] = useState(new Set());
   const [selectedTask, setSelectedTask] = useState(null);
   const [searchQuery, setSearchQuery] = useState('');
@@ -15,50 +17,38 @@ export const TimelineView = () => {
   const [filterPriority, setFilterPriority] = useState('all');
   const [filterStatus, setFilterStatus] = useState('all');
 
+  // Tasks come from the shared store (kept current by its realtime channel)
   useEffect(() => {
-    loadData();
-
-    const channel = supabase
-      .channel('timeline_data')
-      .on('postgres_changes', 
-        { event: '*', schema: 'public', table: 'tasks' },
-        loadData
-      )
-      .subscribe();
-
-    return () => supabase.removeChannel(channel);
+    loadPhases();
   }, []);
 
-  const loadData = async () => {
+  const loadPhases = async () => {
     try {
-      const [phasesRes, tasksRes] = await Promise.all([
-        supabase
-          .from('phases')
-          .select('*')
-          .order('order_index'),
-        supabase
-          .from('tasks_with_dependencies')
-          .select('*')
-          .order('phase_id')
-          .order('order_index')
-      ]);
+      // Expand all phases by default for better UX - only once, so the
+      // network result does not undo what the user toggled on the snapshot
+      const applyPhases = (phasesData) => {
+        setPhases(phasesData);
+        setExpandedPhases(prev => (prev.size > 0 ? prev : new Set(phasesData.map(p => p.id))));
+      };
 
-      if (phasesRes.error) throw phasesRes.error;
-      if (tasksRes.error) throw tasksRes.error;
-
-      const phasesData = phasesRes.data || [];
-      setPhases(phasesData);
-      setTasks(tasksRes.data || []);
-      
-      // Expand all phases by default for better UX
-      setExpandedPhases(new Set(phasesData.map(p => p.id)));
+      // Cached phases draw first; only changed rows come over the network
+      const phasesData = await syncTable('phases', {
+        order: 'order_index',
+        onSnapshot: (cached) => {
+          applyPhases(cached);
+          setPhasesLoading(false);
+        }
+      });
+      applyPhases(phasesData);
     } catch (error) {
       console.error('Error loading data:', error);
     } finally {
-      setLoading(false);
+      setPhasesLoading(false);
     }
   };
 
+  const loading = tasksLoading || phasesLoading;
+
   const getPhaseStatus = (phaseId) => {
     const phaseTasks = tasks.filter(t => t.phase_id === phaseId);
     if (phaseTasks.length === 0) return 'PENDING';
@@ -380,7 +370,7 @@ export const TimelineView = () => {
           task={selectedTask} 
           allTasks={tasks}
           onClose={() => setSelectedTask(null)} 
-          onUpdate={loadData}
+          onUpdate={reloadTasks}
         />
       )}
     </div>
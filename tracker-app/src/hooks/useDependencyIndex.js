@@ -0,0 +1,25 @@
+// ✅ Custom hook: useDependencyIndex
+// Keep a dependency index in step with a task list, patching it incrementally
+// Used in: CustomGanttPro.jsx
+
+import { useMemo, useRef } from 'react';
+import { buildDependencyIndex, updateDependencyIndex } from '../lib/dependencyGraph';
+import { measure } from '../lib/perf';
+
+/**
+ * Dependency index for the current task list
+ * @param {Array} tasks - Task rows (state array; replaced on every change)
+ * @returns {Object} Index from lib/dependencyGraph (new identity whenever edges or tasks change)
+ */
+export const useDependencyIndex = (tasks) => {
+  const indexRef = useRef(null);
+
+  return useMemo(() => {
+    indexRef.current = indexRef.current
+      ? measure('dependencyIndex:update', () => updateDependencyIndex(indexRef.current, tasks))
+      : measure('dependencyIndex:build', () => buildDependencyIndex(tasks));
+    return indexRef.current;
+  }, [tasks]);
+};
+
+export default useDependencyIndex;
@@ -0,0 +1,108 @@
+// ✅ Custom hook: useLogStream
+// Newest-first, infinitely scrollable view of a log table: keyset pages on
+// demand, realtime inserts/updates merged in as deltas (no refetch per event)
+// Used in: AIActivityStream.jsx
+
+import { useState, useEffect, useCallback, useRef } from 'react';
+import {
+  LOG_PAGE_SIZE,
+  fetchLogPage,
+  getLogCursor,
+  mergeLogRows,
+  subscribeLogChanges
+} from '../lib/logPipeline';
+
+/**
+ * Stream a log table
+ * @param {string} table - 'ai_execution_logs' | 'logs'
+ * @param {number} pageSize - Rows per page (default: LOG_PAGE_SIZE)
+ * @returns {Object} { rows, loading, loadingMore, hasMore, error, loadMore }
+ */
+export const useLogStream = (table, pageSize = LOG_PAGE_SIZE) => {
+  const [state, setState] = useState({
+    rows: [],
+    loading: true,
+    loadingMore: false,
+    hasMore: false,
+    error: null
+  });
+  const stateRef = useRef(state);
+  stateRef.current = state;
+  const loadingMoreRef = useRef(false);
+
+  useEffect(() => {
+    let cancelled = false;
+
+    // First page; also used after a reconnect to pick up missed rows
+    const loadNewest = async () => {
+      try {
+        const page = await fetchLogPage(table, { limit: pageSize });
+        if (cancelled) return;
+        setState(prev => {
+          // Initial load: keep realtime rows that arrived while it was in flight
+          if (prev.loading) {
+            const rows = mergeLogRows(page.rows, prev.rows, { hasMore: page.hasMore });
+            return { ...prev, rows, hasMore: page.hasMore, loading: false, error: null };
+          }
+          // Reconnect: the page overlaps what we have, or more rows than a page were missed
+          const newestLoaded = prev.rows[0];
+          if (newestLoaded && page.rows.some(row => row.id === newestLoaded.id)) {
+            return { ...prev, rows: mergeLogRows(prev.rows, page.rows, { hasMore: prev.hasMore }), error: null };
+          }
+          return { ...prev, rows: page.rows, hasMore: page.hasMore, error: null };
+        });
+      } catch (error) {
+        if (cancelled) return;
+        console.error(`Error loading ${table}:`, error);
+        setState(prev => ({ ...prev, loading: false, error }));
+      }
+    };
+
+    const unsubscribe = subscribeLogChanges(table, ({ inserted, updated, reconnected }) => {
+      if (reconnected) {
+        loadNewest();
+        return;
+      }
+      setState(prev => {
+        let rows = mergeLogRows(prev.rows, inserted, { hasMore: prev.hasMore });
+        rows = mergeLogRows(rows, updated, { insert: false });
+        return rows === prev.rows ? prev : { ...prev, rows };
+      });
+    });
+
+    setState({ rows: [], loading: true, loadingMore: false, hasMore: false, error: null });
+    loadNewest();
+
+    return () => {
+      cancelled = true;
+      unsubscribe();
+    };
+  }, [table, pageSize]);
+
+  /** Append the next older page (no-op while one is loading or none is left) */
+  const loadMore = useCallback(async () => {
+    const { rows, hasMore, loading } = stateRef.current;
+    if (loadingMoreRef.current || loading || !hasMore) return;
+
+    loadingMoreRef.current = true;
+    setState(prev => ({ ...prev, loadingMore: true }));
+    try {
+      const page = await fetchLogPage(table, { limit: pageSize, before: getLogCursor(rows) });
+      setState(prev => ({
+        ...prev,
+        rows: mergeLogRows(prev.rows, page.rows),
+        hasMore: page.hasMore,
+        loadingMore: false
+      }));
+    } catch (error) {
+      console.error(`Error loading older ${table}:`, error);
+      setState(prev => ({ ...prev, loadingMore: false, error }));
+    } finally {
+      loadingMoreRef.current = false;
+    }
+  }, [table, pageSize]);
+
+  return { ...state, loadMore };
+};
+
+export default useLogStream;
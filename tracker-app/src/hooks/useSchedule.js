@@ -0,0 +1,43 @@
+// ✅ Custom hook: useSchedule
+// CPM schedule that follows the dependency index, recomputing incrementally
+// when only task dates changed (e.g. while dragging or resizing a bar)
+// Used in: CustomGanttPro.jsx for critical path highlighting
+
+import { useMemo, useRef } from 'react';
+import { computeSchedule, updateSchedule } from '../lib/scheduling';
+import { measure } from '../lib/perf';
+
+/**
+ * Schedule for the current dependency index
+ * @param {Object} dependencyIndex - Index from useDependencyIndex
+ * @param {boolean} enabled - Skip all work when false (returns null)
+ * @returns {Object|null} Schedule from lib/scheduling
+ */
+export const useSchedule = (dependencyIndex, enabled = true) => {
+  const cacheRef = useRef({ schedule: null, indexVersion: -1 });
+
+  return useMemo(() => {
+    const cache = cacheRef.current;
+    if (!enabled || dependencyIndex.byId.size === 0) {
+      cacheRef.current = { schedule: null, indexVersion: -1 };
+      return null;
+    }
+
+    // Incremental only when we hold the schedule for the immediately preceding index
+    const canPatch = cache.schedule &&
+      cache.indexVersion === dependencyIndex.version - 1 &&
+      dependencyIndex.changedIds &&
+      !dependencyIndex.edgesChanged;
+
+    const schedule = cache.indexVersion === dependencyIndex.version && cache.schedule
+      ? cache.schedule
+      : canPatch
+        ? measure('schedule:update', () => updateSchedule(cache.schedule, dependencyIndex, dependencyIndex.changedIds))
+        : measure('schedule:compute', () => computeSchedule(dependencyIndex));
+
+    cacheRef.current = { schedule, indexVersion: dependencyIndex.version };
+    return schedule;
+  }, [dependencyIndex, enabled]);
+};
+
+export default useSchedule;
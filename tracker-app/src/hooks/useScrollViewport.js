@@ -0,0 +1,74 @@
+// ✅ Custom hook: useScrollViewport
+// Track the scroll offset and size of a scroll container, at most once per frame
+// Used in: CustomGanttPro.jsx for windowed rendering of rows and date columns
+
+import { useState, useEffect } from 'react';
+
+const readViewport = (el) => ({
+  scrollTop: el.scrollTop,
+  scrollLeft: el.scrollLeft,
+  width: el.clientWidth,
+  height: el.clientHeight
+});
+
+/**
+ * Observe a scroll container's viewport
+ * @param {React.RefObject} ref - Ref to the scrolling element
+ * @param {Array} deps - Re-attach when these change (e.g. once the element is mounted)
+ * @returns {{scrollTop: number, scrollLeft: number, width: number, height: number}}
+ */
+export const useScrollViewport = (ref, deps = []) => {
+  const [viewport, setViewport] = useState(() => ({
+    scrollTop: 0,
+    scrollLeft: 0,
+    width: typeof window !== 'undefined' ? window.innerWidth : 0,
+    height: typeof window !== 'undefined' ? window.innerHeight : 0
+  }));
+
+  useEffect(() => {
+    const el = ref.current;
+    if (!el) return;
+
+    let frame = null;
+    const update = () => {
+      frame = null;
+      const next = readViewport(el);
+      setViewport(prev => (
+        prev.scrollTop === next.scrollTop &&
+        prev.scrollLeft === next.scrollLeft &&
+        prev.width === next.width &&
+        prev.height === next.height
+      ) ? prev : next);
+    };
+    // Coalesce bursts of scroll events into one render per animation frame
+    const schedule = () => {
+      if (frame === null) frame = requestAnimationFrame(update);
+    };
+
+    update();
+    el.addEventListener('scroll', schedule, { passive: true });
+
+    let resizeObserver = null;
+    if (typeof ResizeObserver !== 'undefined') {
+      resizeObserver = new ResizeObserver(schedule);
+      resizeObserver.observe(el);
+    } else {
+      window.addEventListener('resize', schedule);
+    }
+
+    return () => {
+      if (frame !== null) cancelAnimationFrame(frame);
+      el.removeEventListener('scroll', schedule);
+      if (resizeObserver) {
+        resizeObserver.disconnect();
+      } else {
+        window.removeEventListener('resize', schedule);
+      }
+    };
+  // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, deps);
+
+  return viewport;
+};
+
+export default useScrollViewport;
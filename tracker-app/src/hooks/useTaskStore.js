@@ -0,0 +1,56 @@
+// ✅ Custom hook: useTaskStore
+// Read tasks from the shared task store through a memoized selector
+// Components re-render only when their selection changes
+// Used in: KanbanView, TimelineView, SprintPlanning, CustomGanttPro
+
+import { useMemo, useSyncExternalStore } from 'react';
+import {
+  subscribeTaskStore,
+  getTaskStoreState,
+  getTaskStoreStatus,
+  reloadTasks
+} from '../lib/taskStore';
+
+const selectAllTasks = (tasks) => tasks;
+
+const shallowEqual = (a, b) => {
+  if (Object.is(a, b)) return true;
+  if (!Array.isArray(a) || !Array.isArray(b) || a.length !== b.length) return false;
+  return a.every((item, i) => item === b[i]);
+};
+
+// getSnapshot for one selector: recomputed only when the task list changes,
+// and the previous result is kept when the new one has the same items
+const createSelection = (selector) => {
+  let lastTasks = null;
+  let lastResult;
+  return () => {
+    const { tasks } = getTaskStoreState();
+    if (tasks !== lastTasks) {
+      const result = selector(tasks);
+      lastTasks = tasks;
+      if (!shallowEqual(result, lastResult)) lastResult = result;
+    }
+    return lastResult;
+  };
+};
+
+/**
+ * Tasks from the shared store
+ * @param {Function} selector - (tasks) => selection; keep it stable (module level or useCallback)
+ * @returns {{tasks: any, loading: boolean, error: Object|null, reload: Function}}
+ */
+export const useTaskStore = (selector = selectAllTasks) => {
+  const getSelection = useMemo(() => createSelection(selector), [selector]);
+  const tasks = useSyncExternalStore(subscribeTaskStore, getSelection);
+  const status = useSyncExternalStore(subscribeTaskStore, getTaskStoreStatus);
+
+  return {
+    tasks,
+    loading: status === 'idle' || status === 'loading',
+    error: status === 'error' ? getTaskStoreState().error : null,
+    reload: reloadTasks
+  };
+};
+
+export default useTaskStore;
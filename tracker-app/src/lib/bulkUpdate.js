@@ -0,0 +1,126 @@
+// ✅ Bulk Task Updates
+// Send many partial task updates as a few bulk_update_tasks RPC calls
+// (see supabase-migrations/005) instead of one request per task
+// Used in: CustomGanttPro.jsx (auto-schedule), SprintPlanning.jsx (sprint assignment)
+
+import { supabase } from './supabase';
+
+export const BULK_CHUNK_SIZE = 500;       // Rows per RPC call
+const FALLBACK_CONCURRENCY = 10;          // Parallel single-row updates when the RPC is missing
+
+const chunk = (items, size) => {
+  const chunks = [];
+  for (let i = 0; i < items.length; i += size) {
+    chunks.push(items.slice(i, i + size));
+  }
+  return chunks;
+};
+
+// Used until migration 005 is applied: same result shape, bounded parallelism
+const updateRowsIndividually = async (rows) => {
+  const results = [];
+  for (const group of chunk(rows, FALLBACK_CONCURRENCY)) {
+    const settled = await Promise.all(group.map(async ({ id, ...patch }) => {
+      const { data, error } = await supabase
+        .from('tasks')
+        .update(patch)
+        .eq('id', id)
+        .select();
+      if (error) return { id, ok: false, error_code: error.code, error_message: error.message, task: null };
+      if (!data || data.length === 0) return { id, ok: false, error_code: 'P0002', error_message: `Task ${id} not found`, task: null };
+      return { id, ok: true, error_code: null, error_message: null, task: data[0] };
+    }));
+    results.push(...settled);
+  }
+  return results;
+};
+
+/**
+ * Update many tasks with partial rows
+ * @param {Array} updates - [{ id, ...columns }]
+ * @param {Object} options
+ * @param {number} options.chunkSize - Rows per request (default 500)
+ * @returns {Promise<{updated: Array, failed: Array}>} Updated rows, and
+ *   { id, code, message } for every row that was not written
+ */
+export const bulkUpdateTasks = async (updates, { chunkSize = BULK_CHUNK_SIZE } = {}) => {
+  const updated = [];
+  const failed = [];
+  let rpcAvailable = true;
+
+  for (const rows of chunk(updates, chunkSize)) {
+    let results;
+    try {
+      if (rpcAvailable) {
+        const { data, error } = await supabase.rpc('bulk_update_tasks', { updates: rows });
+        if (error?.code === 'PGRST202') {
+          console.warn('bulk_update_tasks not found - falling back to per-row updates (apply migration 005)');
+          rpcAvailable = false;
+        } else if (error) {
+          throw error;
+        } else {
+          results = data || [];
+        }
+      }
+      if (!rpcAvailable) results = await updateRowsIndividually(rows);
+    } catch (error) {
+      // Whole chunk lost (network / auth) - every row in it failed
+      console.error('Bulk update chunk failed:', error);
+      rows.forEach(row => failed.push({ id: row.id, code: error.code || 'NETWORK', message: error.message }));
+      continue;
+    }
+
+    results.forEach(result => {
+      if (result.ok) {
+        updated.push(result.task);
+      } else {
+        failed.push({ id: result.id, code: result.error_code, message: result.error_message });
+      }
+    });
+  }
+
+  return { updated, failed };
+};
+
+/**
+ * Apply updates to local state immediately, write them in bulk, then merge
+ * the server rows and roll back only the rows that failed
+ * @param {Object} params
+ * @param {Array} params.tasks - Current local rows (used for the rollback snapshot)
+ * @param {Function} params.setTasks - State setter for those rows
+ * @param {Array} params.updates - [{ id, ...columns }]
+ * @param {number} params.chunkSize - Rows per request
+ * @returns {Promise<{updated: Array, failed: Array}>} Same as bulkUpdateTasks
+ */
+export const optimisticBulkUpdate = async ({ tasks, setTasks, updates, chunkSize }) => {
+  const updatesById = new Map(updates.map(update => [update.id, update]));
+  const snapshot = new Map();
+  tasks.forEach(task => {
+    if (updatesById.has(task.id)) snapshot.set(task.id, task);
+  });
+
+  // Optimistic: show the new values right away
+  setTasks(prev => prev.map(task => (
+    updatesById.has(task.id) ? { ...task, ...updatesById.get(task.id) } : task
+  )));
+
+  const result = await bulkUpdateTasks(updates, { chunkSize });
+
+  const serverRows = new Map(result.updated.map(row => [row.id, row]));
+  const failedIds = new Set(result.failed.map(failure => failure.id));
+  if (serverRows.size > 0 || failedIds.size > 0) {
+    setTasks(prev => prev.map(task => {
+      if (failedIds.has(task.id) && snapshot.has(task.id)) {
+        // Roll back only the columns this update touched
+        const original = snapshot.get(task.id);
+        const restored = { ...task };
+        Object.keys(updatesById.get(task.id)).forEach(key => { restored[key] = original[key]; });
+        return restored;
+      }
+      if (serverRows.has(task.id)) return { ...task, ...serverRows.get(task.id) };
+      return task;
+    }));
+  }
+
+  return result;
+};
@@ -0,0 +1,218 @@
+// ✅ Dashboard Stats
+// Totals, per-phase completion, human/AI split and hour sums from one
+// get_dashboard_stats() call (see supabase-migrations/007), behind a short-TTL cache
+// Also serves Today's Focus (bounded query) and a realtime "tasks changed"
+// signal, so the dashboards never load the task rows
+// Used in: GapDashboard.jsx, DashboardPage.jsx
+
+import { supabase } from './supabase';
+
+export const STATS_TTL_MS = 10000; // Serve cached stats for this long (e.g. switching tabs)
+
+let cache = { value: null, fetchedAt: 0 };
+let inFlight = null;
+
+const toNumber = (value) => Number(value) || 0;
+
+// RPC JSON (snake_case, numerics as strings) -> numbers the pages use
+const normalizeStats = (raw) => ({
+  total: toNumber(raw.total),
+  done: toNumber(raw.done),
+  inProgress: toNumber(raw.in_progress),
+  pending: toNumber(raw.pending),
+  blocked: toNumber(raw.blocked),
+  humanTasks: toNumber(raw.human_tasks),
+  aiTasks: toNumber(raw.ai_tasks),
+  estimatedHours: toNumber(raw.estimated_hours),
+  actualHours: toNumber(raw.actual_hours),
+  completedLast7Days: toNumber(raw.completed_last_7_days),
+  phases: (raw.phases || []).map(phase => ({
+    ...phase,
+    totalTasks: toNumber(phase.total_tasks),
+    doneTasks: toNumber(phase.done_tasks),
+    inProgressTasks: toNumber(phase.in_progress_tasks),
+    pendingTasks: toNumber(phase.pending_tasks),
+    blockedTasks: toNumber(phase.blocked_tasks)
+  })),
+  generatedAt: raw.generated_at
+});
+
+// Same JSON as get_dashboard_stats(), built from a narrow tasks select
+// Only used until migration 007 is applied
+const aggregateStatsLocally = async () => {
+  const [{ data: tasks, error: tasksError }, { data: phases, error: phasesError }] = await Promise.all([
+    supabase
+      .from('tasks')
+      .select('id, status, phase_id, assigned_type, estimated_hours, actual_hours, completed_at, depends_on'),
+    supabase.from('phases').select('*').order('order_index')
+  ]);
+  if (tasksError) throw tasksError;
+  if (phasesError) throw phasesError;
+
+  const statusById = new Map(tasks.map(t => [t.id, t.status]));
+  const sevenDaysAgo = Date.now() - 7 * 24 * 60 * 60 * 1000;
+  const emptyCounts = () => ({
+    total_tasks: 0, done_tasks: 0, in_progress_tasks: 0, pending_tasks: 0,
+    blocked_tasks: 0, estimated_hours: 0, actual_hours: 0
+  });
+  const totals = { ...emptyCounts(), human_tasks: 0, ai_tasks: 0, completed_last_7_days: 0 };
+  const byPhase = new Map();
+
+  tasks.forEach(task => {
+    if (!byPhase.has(task.phase_id)) byPhase.set(task.phase_id, emptyCounts());
+    const blocked = task.status !== 'DONE' &&
+      (task.depends_on || []).some(id => statusById.has(id) && statusById.get(id) !== 'DONE');
+
+    [totals, byPhase.get(task.phase_id)].forEach(counts => {
+      counts.total_tasks += 1;
+      if (task.status === 'DONE') counts.done_tasks += 1;
+      if (task.status === 'IN_PROGRESS') counts.in_progress_tasks += 1;
+      if (task.status === 'PENDING') counts.pending_tasks += 1;
+      if (blocked) counts.blocked_tasks += 1;
+      counts.estimated_hours += parseFloat(task.estimated_hours) || 0;
+      counts.actual_hours += parseFloat(task.actual_hours) || 0;
+    });
+    if (task.assigned_type === 'HUMAN') totals.human_tasks += 1;
+    if (task.assigned_type === 'AI') totals.ai_tasks += 1;
+    if (task.status === 'DONE' && task.completed_at && new Date(task.completed_at) >= sevenDaysAgo) {
+      totals.completed_last_7_days += 1;
+    }
+  });
+
+  return {
+    total: totals.total_tasks,
+    done: totals.done_tasks,
+    in_progress: totals.in_progress_tasks,
+    pending: totals.pending_tasks,
+    blocked: totals.blocked_tasks,
+    human_tasks: totals.human_tasks,
+    ai_tasks: totals.ai_tasks,
+    estimated_hours: totals.estimated_hours,
+    actual_hours: totals.actual_hours,
+    completed_last_7_days: totals.completed_last_7_days,
+    phases: (phases || []).map(phase => ({ ...phase, ...(byPhase.get(phase.id) || emptyCounts()) })),
+    generated_at: new Date().toISOString()
+  };
+};
+
+/**
+ * Dashboard stats, cached for STATS_TTL_MS. Concurrent callers share one request.
+ * @param {Object} options
+ * @param {boolean} options.force - Skip the cache (e.g. after a realtime change)
+ * @returns {Promise<Object>} { total, done, inProgress, pending, blocked, humanTasks,
+ *   aiTasks, estimatedHours, actualHours, completedLast7Days, phases, generatedAt }
+ */
+export const getDashboardStats = async ({ force = false } = {}) => {
+  if (!force && cache.value && Date.now() - cache.fetchedAt < STATS_TTL_MS) {
+    return cache.value;
+  }
+  if (inFlight) return inFlight;
+
+  inFlight = (async () => {
+    try {
+      let { data, error } = await supabase.rpc('get_dashboard_stats');
+      if (error?.code === 'PGRST202') {
+        console.warn('get_dashboard_stats not found - aggregating in the browser (apply migration 007)');
+        data = await aggregateStatsLocally();
+      } else if (error) {
+        throw error;
+      }
+      cache = { value: normalizeStats(data || {}), fetchedAt: Date.now() };
+      return cache.value;
+    } finally {
+      inFlight = null;
+    }
+  })();
+  return inFlight;
+};
+
+/** Drop the cached stats so the next getDashboardStats() call refetches */
+export const invalidateDashboardStats = () => {
+  cache = { value: null, fetchedAt: 0 };
+};
+
+// ==================== TODAY'S FOCUS ====================
+
+export const FOCUS_LIMIT = 5;
+
+// Display order: in progress before ready-to-start, HIGH priority first,
+// then by phase - one bounded query per bucket instead of loading every task
+const FOCUS_BUCKETS = [
+  { status: 'IN_PROGRESS', high: true },
+  { status: 'IN_PROGRESS', high: false },
+  { status: 'PENDING', high: true },
+  { status: 'PENDING', high: false }
+];
+
+/**
+ * Today's Focus: the first `limit` in-progress or ready (PENDING, no open
+ * dependencies) tasks in display order
+ * @param {number} limit
+ * @returns {Promise<Array>} tasks_with_dependencies rows
+ */
+export const getFocusTasks = async (limit = FOCUS_LIMIT) => {
+  const results = await Promise.all(FOCUS_BUCKETS.map(({ status, high }) => {
+    let query = supabase
+      .from('tasks_with_dependencies')
+      .select('*')
+      .eq('status', status)
+      .order('phase_id', { ascending: true })
+      .order('order_index', { ascending: true })
+      .limit(limit);
+    if (status === 'PENDING') query = query.eq('execution_status', 'READY');
+    return high ? query.eq('priority', 'HIGH') : query.or('priority.is.null,priority.neq.HIGH');
+  }));
+
+  const failed = results.find(({ error }) => error);
+  if (failed) throw failed.error;
+  return results.flatMap(({ data }) => data || []).slice(0, limit);
+};
+
+// ==================== REALTIME ====================
+
+const CHANGE_SETTLE_MS = 1000; // One refresh per burst (e.g. an agent updating 200 tasks)
+
+const changeListeners = new Set();
+let changeChannel = null;
+let settleTimer = null;
+
+const scheduleChange = () => {
+  clearTimeout(settleTimer);
+  settleTimer = setTimeout(() => {
+    settleTimer = null;
+    invalidateDashboardStats();
+    changeListeners.forEach(listener => listener());
+  }, CHANGE_SETTLE_MS);
+};
+
+/**
+ * Call listener once a burst of task changes has settled (the stats cache is
+ * already dropped by then). Only the change events are used: unlike the shared
+ * task store, no task rows are loaded. A reconnect counts as a change, since
+ * events may have been missed while the socket was down.
+ * @param {Function} listener - () => void
+ * @returns {Function} Unsubscribe
+ */
+export const subscribeDashboardChanges = (listener) => {
+  if (!changeChannel) {
+    let subscribedOnce = false;
+    changeChannel = supabase
+      .channel('dashboard-stats:tasks')
+      .on('postgres_changes', { event: '*', schema: 'public', table: 'tasks' }, scheduleChange)
+      .subscribe((status) => {
+        if (status !== 'SUBSCRIBED') return;
+        if (subscribedOnce) scheduleChange();
+        subscribedOnce = true;
+      });
+  }
+  changeListeners.add(listener);
+
+  return () => {
+    changeListeners.delete(listener);
+    if (changeListeners.size > 0 || !changeChannel) return;
+    clearTimeout(settleTimer);
+    settleTimer = null;
+    supabase.removeChannel(changeChannel);
+    changeChannel = null;
+  };
+};
@@ -0,0 +1,159 @@
+// ✅ Dependency Index
+// Maps each task ID to its task, predecessors, successors and children
+// Built once per task list and patched incrementally when individual tasks change
+// Used in: CustomGanttPro.jsx (arrows, badges, tooltip, drag/delete guards), TaskDetailModal.jsx
+
+/**
+ * Normalize the depends_on field (array of task IDs, single ID or null)
+ * @param {any} deps - Raw depends_on value
+ * @returns {Array} Array of task IDs
+ */
+export const normalizeDependsOn = (deps) => {
+  if (deps === null || deps === undefined) return [];
+  return Array.isArray(deps) ? deps : [deps];
+};
+
+// Parent column: tasks.parent_id, exposed as parent_task_id by tracker_app_data
+const getParentId = (task) => task.parent_task_id ?? task.parent_id ?? null;
+
+const addToSet = (map, key, value) => {
+  let set = map.get(key);
+  if (!set) {
+    set = new Set();
+    map.set(key, set);
+  }
+  set.add(value);
+};
+
+const removeFromSet = (map, key, value) => {
+  const set = map.get(key);
+  if (!set) return;
+  set.delete(value);
+  if (set.size === 0) map.delete(key);
+};
+
+const linkTask = (index, task) => {
+  index.byId.set(task.id, task);
+  const deps = normalizeDependsOn(task.depends_on);
+  index.predecessorIds.set(task.id, deps);
+  deps.forEach(depId => addToSet(index.successorIds, depId, task.id));
+  const parentId = getParentId(task);
+  if (parentId !== null) addToSet(index.childIds, parentId, task.id);
+};
+
+const unlinkTask = (index, task) => {
+  index.byId.delete(task.id);
+  (index.predecessorIds.get(task.id) || []).forEach(depId => removeFromSet(index.successorIds, depId, task.id));
+  index.predecessorIds.delete(task.id);
+  const parentId = getParentId(task);
+  if (parentId !== null) removeFromSet(index.childIds, parentId, task.id);
+};
+
+/**
+ * Build the index in one pass over the tasks
+ * @param {Array} tasks - Task rows
+ * @returns {Object} Index ({ byId, predecessorIds, successorIds, childIds, version })
+ */
+export const buildDependencyIndex = (tasks = []) => {
+  const index = {
+    byId: new Map(),
+    predecessorIds: new Map(), // task ID -> [depends_on IDs]
+    successorIds: new Map(),   // task ID -> Set of IDs that depend on it
+    childIds: new Map(),       // parent ID -> Set of child IDs
+    version: 0,
+    changedIds: null,          // IDs re-linked by the last update (null = full build)
+    edgesChanged: true         // Whether the last update added/removed dependency edges or tasks
+  };
+  tasks.forEach(task => linkTask(index, task));
+  return index;
+};
+
+/**
+ * Patch the index for a new task list. Only tasks whose object identity
+ * changed (the usual result of `prev.map(t => t.id === id ? {...} : t)`)
+ * are re-linked, so a drag or a single update costs O(n) reference checks
+ * plus O(k) edge updates instead of a full rebuild.
+ * @param {Object} index - Index for the previous task list (mutated in place)
+ * @param {Array} nextTasks - New task list
+ * @returns {Object} A new index object sharing the patched maps, with
+ *   changedIds / edgesChanged describing the patch
+ */
+export const updateDependencyIndex = (index, nextTasks = []) => {
+  const seen = new Set();
+  const changedIds = [];
+  let edgesChanged = false;
+
+  nextTasks.forEach(task => {
+    seen.add(task.id);
+    const previous = index.byId.get(task.id);
+    if (previous === task) return;
+    if (previous) {
+      const before = index.predecessorIds.get(task.id) || [];
+      const after = normalizeDependsOn(task.depends_on);
+      if (before.length !== after.length || before.some((id, i) => id !== after[i])) edgesChanged = true;
+      unlinkTask(index, previous);
+    } else {
+      edgesChanged = true;
+    }
+    linkTask(index, task);
+    changedIds.push(task.id);
+  });
+
+  if (seen.size !== index.byId.size) {
+    Array.from(index.byId.values()).forEach(task => {
+      if (!seen.has(task.id)) {
+        unlinkTask(index, task);
+        changedIds.push(task.id);
+        edgesChanged = true;
+      }
+    });
+  }
+
+  if (changedIds.length === 0) return index;
+  return { ...index, version: index.version + 1, changedIds, edgesChanged };
+};
+
+const resolve = (index, ids) => {
+  const result = [];
+  ids.forEach(id => {
+    const task = index.byId.get(id);
+    if (task) result.push(task);
+  });
+  return result;
+};
+
+/**
+ * Tasks a task depends on. Resolved from the task's own depends_on, so it
+ * also works for in-flight copies (e.g. the task being dragged).
+ * @param {Object} index - Dependency index
+ * @param {Object} task - Task row
+ * @returns {Array} Predecessor tasks that exist in the index
+ */
+export const getPredecessors = (index, task) => {
+  if (!task) return [];
+  return resolve(index, normalizeDependsOn(task.depends_on));
+};
+
+/**
+ * Tasks that depend on a task
+ * @param {Object} index - Dependency index
+ * @param {string|number} taskId - Task ID
+ * @returns {Array} Successor tasks
+ */
+export const getSuccessors = (index, taskId) => resolve(index, index.successorIds.get(taskId) || []);
+
+/**
+ * Number of tasks that depend on a task (no array allocation)
+ * @param {Object} index - Dependency index
+ * @param {string|number} taskId - Task ID
+ * @returns {number} Successor count
+ */
+export const getSuccessorCount = (index, taskId) => index.successorIds.get(taskId)?.size || 0;
+
+/**
+ * Direct children of a parent task
+ * @param {Object} index - Dependency index
+ * @param {string|number} taskId - Parent task ID
+ * @returns {Array} Child tasks
+ */
+export const getChildren = (index, taskId) => resolve(index, index.childIds.get(taskId) || []);
@@ -0,0 +1,534 @@
+// ✅ Gantt Canvas Renderer
+// Draws the timeline grid, bars, progress fills, milestones, today line and
+// dependency arrows on canvas layers, and hit-tests bars by position: binary
+// search over the row model for the row, then the row's single bar
+// Used in: components/GanttCanvas.jsx, CustomGanttPro.jsx (PNG export)
+
+import {
+  differenceInDays, eachDayOfInterval, eachWeekOfInterval, eachMonthOfInterval, endOfMonth, format
+} from 'date-fns';
+import { colors } from '../styles/design-tokens';
+import { findRowAt } from './ganttWindow';
+import { getPredecessors, getSuccessorCount } from './dependencyGraph';
+
+export const RESIZE_HANDLE_WIDTH = 12; // Matches the w-3 resize handles of the DOM bars
+const MILESTONE_SIZE = 24;             // w-6 h-6 diamond
+const EXPORT_HEADER_HEIGHT = 32;
+const MAX_EXPORT_SIDE = 16384;         // Browser canvas limits (per side / total area)
+const MAX_EXPORT_AREA = 64 * 1024 * 1024;
+
+const PALETTE = {
+  grid: '#E5E7EB',                     // gray-200
+  rowBorder: colors.border.default,
+  phaseRow: 'rgba(233, 238, 243, 0.3)', // background-tertiary/30
+  today: colors.error[500],
+  done: colors.success[500],
+  inProgress: colors.info[500],
+  pending: '#9CA3AF',                  // gray-400
+  critical: colors.error[500],
+  criticalRing: colors.error[600],
+  milestone: '#FACC15',                // yellow-400
+  milestoneBorder: '#CA8A04',          // yellow-600
+  dependency: colors.info[500],
+  criticalDependency: colors.error[600],
+  hoverRing: '#93C5FD',                // blue-300
+  selectedRing: '#60A5FA',             // blue-400
+  activeRing: '#FACC15',               // yellow-400
+  invalidRing: colors.error[600],
+  baseline: '#D1D5DB',                 // gray-300
+  background: colors.background.secondary,
+  headerText: colors.text.primary,
+  barText: '#FFFFFF'
+};
+
+// ==================== GEOMETRY ====================
+
+/** Bar height/offset inside a task row (same centering as the DOM bars) */
+export const getBarMetrics = (rowHeight) => {
+  const barHeight = Math.max(rowHeight - 10, 20);
+  return { barHeight, barTop: (rowHeight - barHeight) / 2 };
+};
+
+const dateLeft = (view, date) => differenceInDays(date, view.projectStart) * view.dayWidth;
+
+// The copy being dragged/resized is drawn in place of the stored row
+const displayTask = (view, task) =>
+  (view.activeTask && view.activeTask.id === task.id ? view.activeTask : task);
+
+/**
+ * Pixel rectangle of a task's bar in timeline content coordinates
+ * @returns {{x: number, y: number, width: number, height: number, milestone: boolean}}
+ */
+export const getBarRect = (view, row) => {
+  const task = displayTask(view, row.task);
+  const { left, width } = view.getPosition(task);
+  const { barHeight, barTop } = getBarMetrics(view.rowHeight);
+  if (task.is_milestone) {
+    return { x: left, y: row.top + barTop, width: MILESTONE_SIZE, height: MILESTONE_SIZE, milestone: true };
+  }
+  return { x: left, y: row.top + barTop, width, height: barHeight, milestone: false };
+};
+
+/**
+ * Bar under a point (timeline content coordinates): O(log rows)
+ * @param {Object} view - See drawBarLayer
+ * @param {number} x
+ * @param {number} y
+ * @returns {{task: Object, edge: 'left'|'right'|null, rect: Object}|null}
+ */
+export const hitTestBar = (view, x, y) => {
+  const { rows } = view;
+  if (!rows.length || y < 0) return null;
+  const row = rows[findRowAt(rows, y)];
+  if (!row || row.type !== 'task' || y > row.top + row.height) return null;
+
+  const rect = getBarRect(view, row);
+  if (rect.milestone) {
+    // Rotated square: inside when |dx| + |dy| <= half its diagonal
+    const half = (rect.width * Math.SQRT2) / 2;
+    const dx = Math.abs(x - (rect.x + rect.width / 2));
+    const dy = Math.abs(y - (rect.y + rect.height / 2));
+    return dx + dy <= half ? { task: row.task, edge: null, rect } : null;
+  }
+
+  if (x < rect.x || x > rect.x + rect.width || y < rect.y || y > rect.y + rect.height) return null;
+  let edge = null;
+  if (x <= rect.x + RESIZE_HANDLE_WIDTH) edge = 'left';
+  else if (x >= rect.x + rect.width - RESIZE_HANDLE_WIDTH) edge = 'right';
+  return { task: row.task, edge, rect };
+};
+
+/**
+ * Dependency arrows as line segments with bounding boxes, computed once per
+ * layout change so each frame only culls and strokes
+ * @param {Object} view - rows, rowIndexByTaskId, dependencyIndex, getPosition, rowHeight
+ * @returns {Array} [{ fromId, toId, x1, y1, x2, y2, critical, minX, maxX, minY, maxY }]
+ */
+export const buildArrowSegments = (view) => {
+  const { rows, rowIndexByTaskId, dependencyIndex } = view;
+  const { barHeight, barTop } = getBarMetrics(view.rowHeight);
+  const centerY = (rowIndex) => rows[rowIndex].top + barTop + barHeight / 2;
+  const segments = [];
+
+  rowIndexByTaskId.forEach((toIndex, taskId) => {
+    const task = rows[toIndex].task;
+    (dependencyIndex.predecessorIds.get(taskId) || []).forEach(depId => {
+      const fromIndex = rowIndexByTaskId.get(depId);
+      if (fromIndex === undefined) return; // Collapsed or filtered out
+      const dep = rows[fromIndex].task;
+      const fromPos = view.getPosition(displayTask(view, dep));
+      const toPos = view.getPosition(displayTask(view, task));
+      const x1 = fromPos.left + fromPos.width;
+      const y1 = centerY(fromIndex);
+      const x2 = toPos.left;
+      const y2 = centerY(toIndex);
+      segments.push({
+        fromId: depId, toId: taskId,
+        x1, y1, x2, y2,
+        critical: task.priority === 'HIGH' || dep.priority === 'HIGH',
+        minX: Math.min(x1, x2), maxX: Math.max(x1, x2),
+        minY: Math.min(y1, y2), maxY: Math.max(y1, y2)
+      });
+    });
+  });
+  return segments;
+};
+
+/**
+ * Arrow segments with only the ones attached to a dragged task moved: a drag
+ * frame touches that task's arrows instead of rebuilding all of them
+ * @param {Array} segments - From buildArrowSegments
+ * @param {Object} task - Task with its preview dates
+ * @param {Function} getPosition - Same as view.getPosition
+ * @returns {Array} New segment list (unchanged segments are shared)
+ */
+export const moveArrowSegments = (segments, task, getPosition) => {
+  const { left, width } = getPosition(task);
+  const move = (segment, x1, x2) => ({
+    ...segment, x1, x2, minX: Math.min(x1, x2), maxX: Math.max(x1, x2)
+  });
+  return segments.map(segment => {
+    if (segment.fromId === task.id) return move(segment, left + width, segment.x2);
+    if (segment.toId === task.id) return move(segment, segment.x1, left);
+    return segment;
+  });
+};
+
+// ==================== CANVAS SETUP ====================
+
+/**
+ * Size a canvas for the device pixel ratio and map content coordinates onto it
+ * @param {HTMLCanvasElement} canvas
+ * @param {Object} view - width, height (CSS px), left, top (content offset)
+ * @returns {CanvasRenderingContext2D}
+ */
+export const prepareCanvas = (canvas, view, pixelRatio = window.devicePixelRatio || 1) => {
+  const width = Math.max(1, Math.round(view.width * pixelRatio));
+  const height = Math.max(1, Math.round(view.height * pixelRatio));
+  if (canvas.width !== width) canvas.width = width;
+  if (canvas.height !== height) canvas.height = height;
+  canvas.style.width = `${view.width}px`;
+  canvas.style.height = `${view.height}px`;
+
+  const ctx = canvas.getContext('2d');
+  ctx.setTransform(1, 0, 0, 1, 0, 0);
+  ctx.clearRect(0, 0, canvas.width, canvas.height);
+  ctx.setTransform(pixelRatio, 0, 0, pixelRatio, -view.left * pixelRatio, -view.top * pixelRatio);
+  return ctx;
+};
+
+const roundRect = (ctx, x, y, width, height, radius) => {
+  const r = Math.min(radius, width / 2, height / 2);
+  ctx.beginPath();
+  ctx.moveTo(x + r, y);
+  ctx.arcTo(x + width, y, x + width, y + height, r);
+  ctx.arcTo(x + width, y + height, x, y + height, r);
+  ctx.arcTo(x, y + height, x, y, r);
+  ctx.arcTo(x, y, x + width, y, r);
+  ctx.closePath();
+};
+
+const diamondPath = (ctx, rect) => {
+  const cx = rect.x + rect.width / 2;
+  const cy = rect.y + rect.height / 2;
+  const half = (rect.width * Math.SQRT2) / 2;
+  ctx.beginPath();
+  ctx.moveTo(cx, cy - half);
+  ctx.lineTo(cx + half, cy);
+  ctx.lineTo(cx, cy + half);
+  ctx.lineTo(cx - half, cy);
+  ctx.closePath();
+};
+
+const verticalLine = (ctx, x, top, bottom) => {
+  const crisp = Math.round(x) + 0.5;
+  ctx.moveTo(crisp, top);
+  ctx.lineTo(crisp, bottom);
+};
+
+// ==================== LAYERS ====================
+
+/**
+ * Background layer: row bands, grid columns for the view mode, today line
+ * @param {CanvasRenderingContext2D} ctx - From prepareCanvas
+ * @param {Object} view - rows, rowRange, left, top, width, height, viewMode, dates,
+ *   projectStart, dayWidth, todayX
+ */
+export const drawGridLayer = (ctx, view) => {
+  const { rows, rowRange, left, top, width, height } = view;
+  const right = left + width;
+  const bottom = top + height;
+
+  // Row bands + separators
+  ctx.lineWidth = 1;
+  ctx.strokeStyle = PALETTE.rowBorder;
+  ctx.beginPath();
+  for (let i = rowRange.start; i < rowRange.end; i++) {
+    const row = rows[i];
+    if (row.type === 'phase') {
+      ctx.fillStyle = PALETTE.phaseRow;
+      ctx.fillRect(left, row.top, width, row.height);
+      ctx.moveTo(left, Math.round(row.top) + 0.5);
+      ctx.lineTo(right, Math.round(row.top) + 0.5);
+    }
+    const y = Math.round(row.top + row.height) - 0.5;
+    ctx.moveTo(left, y);
+    ctx.lineTo(right, y);
+  }
+  ctx.stroke();
+
+  // Grid columns (month view has none, like the DOM grid)
+  ctx.strokeStyle = PALETTE.grid;
+  ctx.beginPath();
+  if (view.viewMode === 'hour') {
+    view.dates.days.forEach(day => {
+      const dayX = dateLeft(view, day);
+      for (let hour = 0; hour < 24; hour += 4) verticalLine(ctx, dayX + (view.dayWidth / 24) * hour, top, bottom);
+    });
+  } else if (view.viewMode === 'week') {
+    view.dates.weeks.forEach(week => verticalLine(ctx, dateLeft(view, week), top, bottom));
+  } else if (view.viewMode === 'day') {
+    view.dates.days.forEach(day => verticalLine(ctx, dateLeft(view, day), top, bottom));
+  }
+  ctx.stroke();
+
+  // Today marker + label pinned to the top of the viewport
+  if (view.todayX >= left - 40 && view.todayX <= right + 40) {
+    ctx.fillStyle = PALETTE.today;
+    ctx.fillRect(view.todayX - 1, top, 2, height);
+    ctx.font = '12px sans-serif';
+    const labelWidth = ctx.measureText('Today').width + 16;
+    roundRect(ctx, view.todayX - 32, top + 2, labelWidth, 18, 4);
+    ctx.fill();
+    ctx.fillStyle = PALETTE.barText;
+    ctx.textBaseline = 'middle';
+    ctx.fillText('Today', view.todayX - 24, top + 11);
+  }
+};
+
+const barColor = (view, task) => {
+  if (view.criticalIds.has(task.id)) return PALETTE.critical;
+  if (task.status === 'DONE') return PALETTE.done;
+  if (task.status === 'IN_PROGRESS') return PALETTE.inProgress;
+  return PALETTE.pending;
+};
+
+// Status glyph + dependency counts + name, as in the DOM bar label
+const barLabel = (view, task, width) => {
+  const depCount = getPredecessors(view.dependencyIndex, task).length;
+  const blockCount = getSuccessorCount(view.dependencyIndex, task.id);
+  let glyph = '';
+  if (task.status === 'DONE') glyph = '✓ ';
+  else if (task.status === 'IN_PROGRESS') glyph = '⏳ ';
+  else if (task.status === 'PENDING') glyph = depCount > 0 ? '🚫 ' : '✓ ';
+
+  let label = glyph;
+  if (depCount > 0) label += `⬅️${depCount} `;
+  if (blockCount > 0) label += `➡️${blockCount} `;
+  label += task.name || '';
+  if (task.assigned_to && width > 120) label += `  @${task.assigned_to.split('@')[0]}`;
+  return label;
+};
+
+const drawTaskBar = (ctx, view, task, rect) => {
+  const active = view.activeTask && view.activeTask.id === task.id;
+  ctx.globalAlpha = active ? 0.7 : 1;
+  ctx.fillStyle = barColor(view, task);
+  roundRect(ctx, rect.x, rect.y, rect.width, rect.height, 6);
+  ctx.fill();
+
+  if (view.criticalIds.has(task.id)) {
+    ctx.lineWidth = 2;
+    ctx.strokeStyle = PALETTE.criticalRing;
+    ctx.stroke();
+  }
+
+  // Progress fill (black/20 over the completed share)
+  const progress = Math.min(100, task.progress_percentage || 0);
+  if (progress > 0) {
+    ctx.save();
+    roundRect(ctx, rect.x, rect.y, rect.width, rect.height, 6);
+    ctx.clip();
+    ctx.fillStyle = 'rgba(0, 0, 0, 0.2)';
+    ctx.fillRect(rect.x, rect.y, (rect.width * progress) / 100, rect.height);
+    ctx.restore();
+  }
+
+  // Baseline above the bar
+  if (view.showBaseline && task.baseline_start_date && task.baseline_end_date) {
+    const baselineX = rect.x + differenceInDays(new Date(task.baseline_start_date), new Date(task.start_date || task.started_at)) * view.dayWidth;
+    const baselineWidth = differenceInDays(new Date(task.baseline_end_date), new Date(task.baseline_start_date)) * view.dayWidth;
+    ctx.fillStyle = PALETTE.baseline;
+    ctx.fillRect(baselineX, rect.y - 4, baselineWidth, 2);
+  }
+
+  // Resize grips
+  if (rect.width > RESIZE_HANDLE_WIDTH * 2) {
+    ctx.fillStyle = 'rgba(255, 255, 255, 0.8)';
+    const gripHeight = Math.min(24, rect.height - 6);
+    const gripTop = rect.y + (rect.height - gripHeight) / 2;
+    roundRect(ctx, rect.x + 2, gripTop, 4, gripHeight, 2);
+    ctx.fill();
+    roundRect(ctx, rect.x + rect.width - 6, gripTop, 4, gripHeight, 2);
+    ctx.fill();
+  }
+
+  // Label, clipped to the bar
+  if (rect.width > 24) {
+    ctx.save();
+    ctx.beginPath();
+    ctx.rect(rect.x + 8, rect.y, rect.width - 16, rect.height);
+    ctx.clip();
+    ctx.fillStyle = PALETTE.barText;
+    ctx.font = '600 12px sans-serif';
+    ctx.textBaseline = 'middle';
+    ctx.fillText(barLabel(view, task, rect.width), rect.x + 8, rect.y + rect.height / 2);
+    ctx.restore();
+  }
+  ctx.globalAlpha = 1;
+};
+
+const drawMilestone = (ctx, rect) => {
+  diamondPath(ctx, rect);
+  ctx.fillStyle = PALETTE.milestone;
+  ctx.fill();
+  ctx.lineWidth = 2;
+  ctx.strokeStyle = PALETTE.milestoneBorder;
+  ctx.stroke();
+};
+
+const drawArrows = (ctx, view) => {
+  const { left, top, width, height } = view;
+  // Thinner and fainter at low zoom, like the SVG arrows
+  const opacity = view.zoomLevel < 1.0 ? 0.3 : 0.7;
+  const headScale = Math.max(0.2, Math.min(view.zoomLevel * 0.3, 0.5));
+
+  [false, true].forEach(critical => {
+    const baseWidth = critical ? 4 : 3;
+    const lineWidth = Math.max(1, Math.min(baseWidth * view.zoomLevel, baseWidth * 2));
+    const headSize = (critical ? 5 : 4) * headScale * lineWidth;
+    ctx.globalAlpha = opacity;
+    ctx.strokeStyle = critical ? PALETTE.criticalDependency : PALETTE.dependency;
+    ctx.fillStyle = ctx.strokeStyle;
+    ctx.lineWidth = lineWidth;
+
+    ctx.beginPath();
+    const heads = [];
+    view.arrows.forEach(segment => {
+      if (segment.critical !== critical) return;
+      if (segment.maxX < left || segment.minX > left + width) return;
+      if (segment.maxY < top || segment.minY > top + height) return;
+      ctx.moveTo(segment.x1, segment.y1);
+      ctx.lineTo(segment.x2, segment.y2);
+      heads.push(segment);
+    });
+    ctx.stroke();
+
+    ctx.beginPath();
+    heads.forEach(({ x1, y1, x2, y2 }) => {
+      const angle = Math.atan2(y2 - y1, x2 - x1);
+      ctx.moveTo(x2, y2);
+      ctx.lineTo(x2 - headSize * Math.cos(angle - Math.PI / 6), y2 - headSize * Math.sin(angle - Math.PI / 6));
+      ctx.lineTo(x2 - headSize * Math.cos(angle + Math.PI / 6), y2 - headSize * Math.sin(angle + Math.PI / 6));
+      ctx.closePath();
+    });
+    ctx.fill();
+  });
+  ctx.globalAlpha = 1;
+};
+
+/**
+ * Bar layer: bars with progress/baseline/labels, milestones, then dependency
+ * arrows on top (as the SVG overlay was)
+ * @param {CanvasRenderingContext2D} ctx - From prepareCanvas
+ * @param {Object} view - Grid fields plus getPosition, rowHeight, criticalIds,
+ *   dependencyIndex, arrows (buildArrowSegments), showDependencies, showBaseline,
+ *   zoomLevel, activeTask
+ */
+export const drawBarLayer = (ctx, view) => {
+  const { rows, rowRange, left, width } = view;
+  const right = left + width;
+
+  for (let i = rowRange.start; i < rowRange.end; i++) {
+    const row = rows[i];
+    if (row.type !== 'task') continue;
+    const rect = getBarRect(view, row);
+    // Bars outside the visible columns are skipped
+    if (rect.x + rect.width < left || rect.x > right) continue;
+    if (rect.milestone) {
+      drawMilestone(ctx, rect);
+    } else {
+      drawTaskBar(ctx, view, displayTask(view, row.task), rect);
+    }
+  }
+
+  // Hidden at very low zoom (too cluttered), like the SVG arrows
+  if (view.showDependencies && view.zoomLevel >= 0.7) drawArrows(ctx, view);
+};
+
+/**
+ * Overlay layer: hover/selection/drag rings only, so pointer movement never
+ * repaints the bars
+ * @param {CanvasRenderingContext2D} ctx - From prepareCanvas
+ * @param {Object} view - Bar layer fields (activeInvalid: drop not allowed here)
+ * @param {{hoveredId: number|null, selectedId: number|null}} highlight
+ */
+export const drawOverlayLayer = (ctx, view, { hoveredId, selectedId }) => {
+  const ring = (taskId, color, lineWidth) => {
+    const rowIndex = view.rowIndexByTaskId.get(taskId);
+    if (rowIndex === undefined) return;
+    const rect = getBarRect(view, view.rows[rowIndex]);
+    if (rect.milestone) {
+      diamondPath(ctx, rect);
+    } else {
+      roundRect(ctx, rect.x - 2, rect.y - 2, rect.width + 4, rect.height + 4, 8);
+    }
+    ctx.lineWidth = lineWidth;
+    ctx.strokeStyle = color;
+    ctx.stroke();
+  };
+
+  if (view.activeTask) {
+    ring(view.activeTask.id, view.activeInvalid ? PALETTE.invalidRing : PALETTE.activeRing, 4);
+    return;
+  }
+  if (hoveredId !== null && hoveredId !== undefined && hoveredId !== selectedId) ring(hoveredId, PALETTE.hoverRing, 2);
+  if (selectedId !== null && selectedId !== undefined) ring(selectedId, PALETTE.selectedRing, 4);
+};
+
+// ==================== EXPORT ====================
+
+const drawExportHeader = (ctx, view) => {
+  ctx.fillStyle = colors.background.tertiary;
+  ctx.fillRect(0, 0, view.width, EXPORT_HEADER_HEIGHT);
+  ctx.strokeStyle = PALETTE.rowBorder;
+  ctx.lineWidth = 1;
+  ctx.fillStyle = PALETTE.headerText;
+  ctx.font = '600 12px sans-serif';
+  ctx.textBaseline = 'middle';
+
+  ctx.beginPath();
+  view.dates.months.forEach(month => {
+    const x = dateLeft(view, month);
+    const monthWidth = (differenceInDays(endOfMonth(month), month) + 1) * view.dayWidth;
+    verticalLine(ctx, x, 0, EXPORT_HEADER_HEIGHT);
+    if (monthWidth > 60) ctx.fillText(format(month, 'MMM yyyy'), x + 6, EXPORT_HEADER_HEIGHT / 2);
+  });
+  ctx.moveTo(0, EXPORT_HEADER_HEIGHT - 0.5);
+  ctx.lineTo(view.width, EXPORT_HEADER_HEIGHT - 0.5);
+  ctx.stroke();
+};
+
+/**
+ * Whole chart (every row, full date range) drawn into one offscreen canvas,
+ * scaled down when it would exceed browser canvas limits
+ * @param {Object} view - Bar layer fields; left/top/width/height/rowRange/dates/arrows are filled in
+ * @param {Date} projectEnd
+ * @returns {HTMLCanvasElement}
+ */
+export const renderGanttImage = (view, projectEnd, pixelRatio = 2) => {
+  const width = Math.max(1, differenceInDays(projectEnd, view.projectStart) * view.dayWidth);
+  const height = view.rows.length
+    ? view.rows[view.rows.length - 1].top + view.rows[view.rows.length - 1].height
+    : 0;
+  const fullView = {
+    ...view,
+    left: 0,
+    top: 0,
+    width,
+    height,
+    rowRange: { start: 0, end: view.rows.length },
+    arrows: view.showDependencies ? buildArrowSegments(view) : [],
+    dates: {
+      days: view.viewMode === 'day' || view.viewMode === 'hour'
+        ? eachDayOfInterval({ start: view.projectStart, end: projectEnd })
+        : [],
+      weeks: view.viewMode === 'week'
+        ? eachWeekOfInterval({ start: view.projectStart, end: projectEnd }, { weekStartsOn: 1 })
+        : [],
+      months: eachMonthOfInterval({ start: view.projectStart, end: projectEnd })
+    }
+  };
+
+  const totalHeight = height + EXPORT_HEADER_HEIGHT;
+  const scale = Math.min(
+    pixelRatio,
+    MAX_EXPORT_SIDE / width,
+    MAX_EXPORT_SIDE / totalHeight,
+    Math.sqrt(MAX_EXPORT_AREA / (width * totalHeight))
+  );
+
+  const canvas = document.createElement('canvas');
+  canvas.width = Math.max(1, Math.floor(width * scale));
+  canvas.height = Math.max(1, Math.floor(totalHeight * scale));
+  const ctx = canvas.getContext('2d');
+  ctx.setTransform(scale, 0, 0, scale, 0, 0);
+  ctx.fillStyle = PALETTE.background;
+  ctx.fillRect(0, 0, width, totalHeight);
+  drawExportHeader(ctx, fullView);
+
+  ctx.translate(0, EXPORT_HEADER_HEIGHT);
+  drawGridLayer(ctx, fullView);
+  drawBarLayer(ctx, fullView);
+  return canvas;
+};
@@ -0,0 +1,102 @@
+// ✅ Gantt windowing helpers
+// Pure row/column math for rendering only what is inside the viewport
+// Used in: CustomGanttPro.jsx (task list, timeline headers, grid, bars, arrows)
+
+export const PHASE_HEADER_HEIGHT = 40; // Matches the h-10 phase header rows
+export const ROW_OVERSCAN = 8;         // Extra rows rendered above/below the viewport
+export const COLUMN_OVERSCAN = 7;      // Extra days rendered left/right of the viewport
+
+/**
+ * Build the flat row model shown in both panels: one header row per phase,
+ * followed by that phase's tasks unless the phase is collapsed.
+ * Tasks are grouped in a single pass instead of filtering once per phase.
+ * @param {Array} phases - Phases in display order
+ * @param {Array} tasks - Sorted + flattened tasks (already respects collapsed parents)
+ * @param {Set} collapsedPhases - Phase IDs whose tasks are hidden
+ * @param {number} rowHeight - Task row height in px
+ * @returns {{rows: Array, totalHeight: number, rowIndexByTaskId: Map}}
+ */
+export const buildRowModel = (phases, tasks, collapsedPhases, rowHeight) => {
+  const tasksByPhase = new Map();
+  tasks.forEach(task => {
+    if (!tasksByPhase.has(task.phase_id)) tasksByPhase.set(task.phase_id, []);
+    tasksByPhase.get(task.phase_id).push(task);
+  });
+
+  const rows = [];
+  const rowIndexByTaskId = new Map();
+  let top = 0;
+
+  phases.forEach(phase => {
+    const phaseTasks = tasksByPhase.get(phase.id) || [];
+    rows.push({ type: 'phase', key: `phase-${phase.id}`, phase, taskCount: phaseTasks.length, top, height: PHASE_HEADER_HEIGHT });
+    top += PHASE_HEADER_HEIGHT;
+
+    if (collapsedPhases.has(phase.id)) return;
+    phaseTasks.forEach(task => {
+      rowIndexByTaskId.set(task.id, rows.length);
+      rows.push({ type: 'task', key: `task-${task.id}`, task, top, height: rowHeight });
+      top += rowHeight;
+    });
+  });
+
+  return { rows, totalHeight: top, rowIndexByTaskId };
+};
+
+/**
+ * Index of the row containing pixel offset y (binary search over row tops)
+ * @param {Array} rows - Rows from buildRowModel
+ * @param {number} y - Offset from the top of the first row
+ * @returns {number} Row index (clamped to the row range)
+ */
+export const findRowAt = (rows, y) => {
+  let low = 0;
+  let high = rows.length - 1;
+  while (low < high) {
+    const mid = (low + high + 1) >> 1;
+    if (rows[mid].top <= y) {
+      low = mid;
+    } else {
+      high = mid - 1;
+    }
+  }
+  return Math.max(0, low);
+};
+
+/**
+ * Rows intersecting the viewport, plus overscan
+ * @param {Array} rows - Rows from buildRowModel
+ * @param {number} scrollTop - Current vertical scroll offset
+ * @param {number} viewportHeight - Visible height in px
+ * @param {number} overscan - Extra rows on each side
+ * @returns {{start: number, end: number}} Half-open index range [start, end)
+ */
+export const getVisibleRowRange = (rows, scrollTop, viewportHeight, overscan = ROW_OVERSCAN) => {
+  if (!rows.length) return { start: 0, end: 0 };
+  const first = findRowAt(rows, Math.max(0, scrollTop));
+  const last = findRowAt(rows, scrollTop + viewportHeight);
+  return {
+    start: Math.max(0, first - overscan),
+    end: Math.min(rows.length, last + 1 + overscan)
+  };
+};
+
+/**
+ * Day columns intersecting the viewport, plus overscan
+ * @param {number} scrollLeft - Current horizontal scroll offset
+ * @param {number} viewportWidth - Visible width in px
+ * @param {number} dayWidth - Width of one day in px
+ * @param {number} totalDays - Number of days in the project range
+ * @param {number} overscan - Extra days on each side
+ * @returns {{startDay: number, endDay: number, left: number, right: number}} Inclusive day range and its pixel bounds
+ */
+export const getVisibleDayRange = (scrollLeft, viewportWidth, dayWidth, totalDays, overscan = COLUMN_OVERSCAN) => {
+  const startDay = Math.max(0, Math.floor(scrollLeft / dayWidth) - overscan);
+  const endDay = Math.max(startDay, Math.min(totalDays, Math.ceil((scrollLeft + viewportWidth) / dayWidth) + overscan));
+  return {
+    startDay,
+    endDay,
+    left: startDay * dayWidth,
+    right: (endDay + 1) * dayWidth
+  };
+};
@@ -0,0 +1,228 @@
+// ✅ Local Snapshot
+// IndexedDB copy of tasks, phases and sprints: views draw from it immediately,
+// then only rows changed since the last sync (updated_at high-water mark) and
+// tombstones from deleted_records are fetched (see supabase-migrations/008)
+// Used in: taskStore.js, CustomGanttPro.jsx, TimelineView.jsx, KanbanView.jsx, SprintPlanning.jsx
+
+import { supabase, SUPABASE_URL } from './supabase';
+import { measureAsync } from './perf';
+
+// One database per backend: `dev` and `dev:standin` share an origin, and a
+// snapshot delta-synced against another project would keep its rows forever
+const DB_NAME = `codia-tracker-snapshot:${SUPABASE_URL}`;
+const LEGACY_DB_NAME = 'codia-tracker-snapshot';
+const META_STORE = 'meta';
+export const SNAPSHOT_TABLES = ['tasks', 'phases', 'sprints'];
+
+// Bump when the synced columns change: the IndexedDB upgrade drops every old snapshot
+export const SNAPSHOT_SCHEMA_VERSION = 1;
+
+// updated_at is the transaction start time, so a slow transaction can commit rows
+// stamped before the mark we already hold - re-read this far behind it
+const SYNC_OVERLAP_MS = 60 * 1000;
+
+// Tombstones are purged after 30 days (purge_deleted_records); older snapshots reload fully
+const TOMBSTONE_RETENTION_MS = 29 * 24 * 60 * 60 * 1000;
+
+let dbPromise = null;
+const inFlight = new Map();
+
+// ==================== INDEXEDDB ====================
+
+const promisify = (request) => new Promise((resolve, reject) => {
+  request.onsuccess = () => resolve(request.result);
+  request.onerror = () => reject(request.error);
+});
+
+const transactionDone = (tx) => new Promise((resolve, reject) => {
+  tx.oncomplete = () => resolve();
+  tx.onerror = () => reject(tx.error);
+  tx.onabort = () => reject(tx.error);
+});
+
+/** Open (or upgrade) the snapshot database; resolves null where IndexedDB is unavailable */
+const openDb = () => {
+  if (dbPromise) return dbPromise;
+  if (typeof indexedDB === 'undefined') return Promise.resolve(null);
+
+  // Snapshot from before databases were per backend - nothing says which one it holds
+  try {
+    indexedDB.deleteDatabase(LEGACY_DB_NAME);
+  } catch (error) {
+    // Not there or not allowed; it is never read either way
+  }
+
+  dbPromise = new Promise((resolve) => {
+    const request = indexedDB.open(DB_NAME, SNAPSHOT_SCHEMA_VERSION);
+    request.onupgradeneeded = () => {
+      const db = request.result;
+      // Snapshots from another schema version are not trusted - start over
+      Array.from(db.objectStoreNames).forEach(name => db.deleteObjectStore(name));
+      SNAPSHOT_TABLES.forEach(table => db.createObjectStore(table, { keyPath: 'id' }));
+      db.createObjectStore(META_STORE, { keyPath: 'table' });
+    };
+    request.onsuccess = () => resolve(request.result);
+    // Private browsing, quota, blocked upgrade... the app still works without a snapshot
+    request.onerror = () => {
+      console.warn('Local snapshot unavailable:', request.error);
+      resolve(null);
+    };
+    request.onblocked = () => resolve(null);
+  });
+  return dbPromise;
+};
+
+const readSnapshot = async (table) => {
+  const db = await openDb();
+  if (!db) return null;
+
+  const tx = db.transaction([table, META_STORE], 'readonly');
+  const [rows, meta] = await Promise.all([
+    promisify(tx.objectStore(table).getAll()),
+    promisify(tx.objectStore(META_STORE).get(table))
+  ]);
+  return meta ? { rows, meta } : null;
+};
+
+// A failed write (e.g. quota) only costs the next startup a full fetch
+const writeSnapshot = async (table, { rows, deletedIds = [], meta, replace = false }) => {
+  const db = await openDb();
+  if (!db) return;
+
+  try {
+    const tx = db.transaction([table, META_STORE], 'readwrite');
+    const rowStore = tx.objectStore(table);
+    if (replace) rowStore.clear();
+    rows.forEach(row => rowStore.put(row));
+    deletedIds.forEach(id => rowStore.delete(id));
+    tx.objectStore(META_STORE).put({ table, ...meta });
+    await transactionDone(tx);
+  } catch (error) {
+    console.warn(`Could not save ${table} snapshot:`, error);
+  }
+};
+
+// ==================== SYNC ====================
+
+// Server timestamps are handled on their wall clock. tasks/phases updated_at are
+// TIMESTAMP columns, returned without an offset (Date.parse would read them in
+// the browser's zone); timestamptz values (deleted_at) are rendered in the
+// session zone, so their wall clock lines up with the TIMESTAMP ones
+const wallClockMs = (value) =>
+  Date.parse(`${value.replace(/(T[\d:.]+)(Z|[+-]\d{2}(:?\d{2})?)$/, '$1')}Z`);
+
+// Filter value `ms` before a server timestamp, without an offset: a TIMESTAMP
+// column compares it as is and a timestamptz column reads it in the session zone
+const serverTimeBefore = (value, ms) =>
+  new Date(wallClockMs(value) - ms).toISOString().slice(0, -1);
+
+// Latest server timestamp seen (raw strings from PostgREST, compared by wall clock)
+const maxTimestamp = (current, values) => values.reduce((max, value) => {
+  if (!value) return max;
+  return !max || wallClockMs(value) > wallClockMs(max) ? value : max;
+}, current);
+
+// Single-column ordering like Postgres ORDER BY (NULLs last), ties by id
+const sortRows = (rows, column, ascending = true) => {
+  if (!column) return rows;
+  const direction = ascending ? 1 : -1;
+  return [...rows].sort((a, b) => {
+    const x = a[column];
+    const y = b[column];
+    if (x === y || (x == null && y == null)) return a.id - b.id;
+    if (x == null) return 1;
+    if (y == null) return -1;
+    return (x < y ? -1 : 1) * direction;
+  });
+};
+
+const fetchAll = async (table) => {
+  const { data, error } = await supabase.from(table).select('*');
+  if (error) throw error;
+
+  const rows = data || [];
+  const highWaterMark = maxTimestamp(null, rows.map(row => row.updated_at));
+  await writeSnapshot(table, {
+    rows,
+    meta: { highWaterMark, syncedAt: Date.now(), schemaVersion: SNAPSHOT_SCHEMA_VERSION, source: SUPABASE_URL },
+    replace: true
+  });
+  return rows;
+};
+
+const fetchDelta = async (table, snapshot) => {
+  const since = serverTimeBefore(snapshot.meta.highWaterMark, SYNC_OVERLAP_MS);
+  const [changedResult, tombstoneResult] = await Promise.all([
+    supabase.from(table).select('*').gte('updated_at', since),
+    supabase
+      .from('deleted_records')
+      .select('record_id, deleted_at')
+      .eq('table_name', table)
+      .gte('deleted_at', since)
+  ]);
+  if (changedResult.error) throw changedResult.error;
+  if (tombstoneResult.error) throw tombstoneResult.error;
+
+  const changed = changedResult.data || [];
+  const tombstones = tombstoneResult.data || [];
+  const deletedIds = tombstones.map(tombstone => tombstone.record_id);
+
+  const byId = new Map(snapshot.rows.map(row => [row.id, row]));
+  changed.forEach(row => byId.set(row.id, row));
+  deletedIds.forEach(id => byId.delete(id));
+
+  const highWaterMark = maxTimestamp(snapshot.meta.highWaterMark, [
+    ...changed.map(row => row.updated_at),
+    ...tombstones.map(tombstone => tombstone.deleted_at)
+  ]);
+  await writeSnapshot(table, {
+    rows: changed,
+    deletedIds,
+    meta: { highWaterMark, syncedAt: Date.now(), schemaVersion: SNAPSHOT_SCHEMA_VERSION, source: SUPABASE_URL }
+  });
+  return Array.from(byId.values());
+};
+
+const canSyncDelta = (snapshot) =>
+  Boolean(snapshot?.meta.highWaterMark) &&
+  snapshot.meta.schemaVersion === SNAPSHOT_SCHEMA_VERSION &&
+  snapshot.meta.source === SUPABASE_URL &&
+  Date.now() - snapshot.meta.syncedAt < TOMBSTONE_RETENTION_MS;
+
+/**
+ * Rows of a table, served from the local snapshot and brought up to date with
+ * a delta fetch (full fetch on first visit, expired snapshot or missing
+ * migration 008). Concurrent calls for the same table share one sync.
+ * @param {string} table - One of SNAPSHOT_TABLES
+ * @param {Object} options
+ * @param {string} options.order - Column to sort by (NULLs last, ties by id)
+ * @param {boolean} options.ascending - Sort direction (default true)
+ * @param {Function} options.onSnapshot - Called with the cached rows before the network round trip
+ * @returns {Promise<Array>} Current rows
+ */
+export const syncTable = (table, { order, ascending = true, onSnapshot } = {}) => {
+  if (inFlight.has(table)) return inFlight.get(table);
+
+  const sync = measureAsync(`sync:${table}`, async () => {
+    try {
+      const snapshot = await readSnapshot(table).catch(error => {
+        console.warn(`Could not read ${table} snapshot:`, error);
+        return null;
+      });
+      if (snapshot && onSnapshot) onSnapshot(sortRows(snapshot.rows, order, ascending));
+
+      if (canSyncDelta(snapshot)) {
+        try {
+          return sortRows(await fetchDelta(table, snapshot), order, ascending);
+        } catch (error) {
+          console.warn(`Delta sync of ${table} failed - reloading everything (apply migration 008?):`, error);
+        }
+      }
+      return sortRows(await fetchAll(table), order, ascending);
+    } finally {
+      inFlight.delete(table);
+    }
+  });
+  inFlight.set(table, sync);
+  return sync;
+};
@@ -0,0 +1,264 @@
+// ✅ Log Pipeline
+// Reads and writes for the append-only log tables (ai_execution_logs, logs).
+// Writes are buffered and flushed as one multi-row INSERT per table; reads
+// page newest-first with a (timestamp, id) keyset cursor, backed by the
+// indexes in supabase-migrations/009; realtime INSERT/UPDATE events are
+// delivered as deltas, coalesced into one batch per animation frame
+// Used in: hooks/useLogStream.js (AIActivityStream), DashboardPage.jsx
+
+import { supabase } from './supabase';
+import { measureAsync, countEvent } from './perf';
+
+export const LOG_PAGE_SIZE = 20;
+const MAX_BATCH_ROWS = 100;      // Flush right away once this many rows are queued
+const FLUSH_DELAY_MS = 1000;     // Otherwise flush this long after the first queued row
+
+// ==================== ORDERING ====================
+
+const timeOf = (row) => {
+  const time = Date.parse(row.timestamp);
+  return Number.isNaN(time) ? 0 : time;
+};
+
+/** Newest first, same order as ORDER BY timestamp DESC, id DESC */
+export const compareLogsDesc = (a, b) => timeOf(b) - timeOf(a) || b.id - a.id;
+
+/**
+ * Keyset cursor for the page after rows (raw timestamp string, so the
+ * database compares at full precision)
+ * @param {Array} rows - Loaded rows, newest first
+ * @returns {{timestamp: string, id: number}|null}
+ */
+export const getLogCursor = (rows) => {
+  const last = rows[rows.length - 1];
+  return last ? { timestamp: last.timestamp, id: last.id } : null;
+};
+
+/**
+ * Apply rows to a newest-first list: known IDs are patched in place, new rows
+ * are merged at their position. While older pages are still unread, rows that
+ * would land past the end are dropped - paging reaches them, and appending
+ * them would move the cursor past rows nobody has loaded yet.
+ * @param {Array} rows - Current list (not mutated)
+ * @param {Array} incoming - Rows to apply, any order
+ * @param {Object} options
+ * @param {boolean} options.hasMore - Older pages remain unread
+ * @param {boolean} options.insert - false = only patch rows already in the list
+ * @returns {Array} rows itself when nothing changed
+ */
+export const mergeLogRows = (rows, incoming, { hasMore = false, insert = true } = {}) => {
+  if (incoming.length === 0) return rows;
+
+  const pending = new Map(incoming.map(row => [row.id, row]));
+  let changed = false;
+  const patched = rows.map(row => {
+    const next = pending.get(row.id);
+    if (!next) return row;
+    pending.delete(row.id);
+    changed = true;
+    return { ...row, ...next };
+  });
+
+  const oldest = patched[patched.length - 1];
+  const added = insert
+    ? Array.from(pending.values())
+      .filter(row => !hasMore || !oldest || compareLogsDesc(row, oldest) < 0)
+      .sort(compareLogsDesc)
+    : [];
+  if (added.length === 0) return changed ? patched : rows;
+
+  // Two sorted lists -> one
+  const merged = [];
+  let i = 0;
+  let j = 0;
+  while (i < added.length && j < patched.length) {
+    merged.push(compareLogsDesc(added[i], patched[j]) <= 0 ? added[i++] : patched[j++]);
+  }
+  return merged.concat(added.slice(i), patched.slice(j));
+};
+
+// ==================== READS ====================
+
+// PostgREST logic-tree values with reserved characters (':' '.' ',') must be quoted
+const quoteValue = (value) => `"${String(value).replace(/"/g, '\\"')}"`;
+
+/**
+ * One page of a log table, newest first, strictly older than `before`
+ * @param {string} table - 'ai_execution_logs' | 'logs'
+ * @param {Object} options
+ * @param {{timestamp: string, id: number}|null} options.before - Cursor from getLogCursor
+ * @param {number} options.limit - Page size
+ * @param {string} options.select - Columns
+ * @returns {Promise<{rows: Array, hasMore: boolean}>}
+ */
+export const fetchLogPage = (table, { before = null, limit = LOG_PAGE_SIZE, select = '*' } = {}) =>
+  measureAsync(`load:${table}`, async () => {
+    let query = supabase
+      .from(table)
+      .select(select)
+      .order('timestamp', { ascending: false })
+      .order('id', { ascending: false })
+      .limit(limit + 1); // One extra row tells whether another page exists
+
+    if (before) {
+      // (timestamp, id) < (before.timestamp, before.id); the lte bound lets
+      // the index scan start at the cursor instead of filtering from the top
+      query = query
+        .lte('timestamp', before.timestamp)
+        .or(`timestamp.lt.${quoteValue(before.timestamp)},id.lt.${before.id}`);
+    }
+
+    const { data, error } = await query;
+    if (error) throw error;
+
+    const rows = data || [];
+    return { rows: rows.slice(0, limit), hasMore: rows.length > limit };
+  });
+
+// ==================== WRITES ====================
+
+const writeQueues = new Map(); // table -> { rows, waiters, timer }
+
+/**
+ * Write every row queued for table as one INSERT
+ * @param {string} table
+ * @returns {Promise<void>} Rejects with the insert error (queued callers get it too)
+ */
+export const flushLogQueue = async (table) => {
+  const queue = writeQueues.get(table);
+  if (!queue || queue.rows.length === 0) return;
+  writeQueues.delete(table);
+  clearTimeout(queue.timer);
+
+  countEvent(`logs:${table}:batches`);
+  const { error } = await supabase.from(table).insert(queue.rows);
+  if (error) {
+    console.error(`Error writing ${queue.rows.length} ${table} rows:`, error);
+    queue.waiters.forEach(({ reject }) => reject(error));
+    throw error;
+  }
+  queue.waiters.forEach(({ resolve }) => resolve());
+};
+
+/** Flush every table (page hide, tests) */
+export const flushAllLogQueues = () =>
+  Promise.allSettled(Array.from(writeQueues.keys(), flushLogQueue));
+
+/**
+ * Queue a row; rows queued within FLUSH_DELAY_MS go out together
+ * @param {string} table - 'ai_execution_logs' | 'logs'
+ * @param {Object} row - Column values (timestamp defaults to now, so the
+ *   entry keeps its place in the feed however long it waits in the queue)
+ * @returns {Promise<void>} Resolves once the batch holding the row is written
+ */
+export const queueLogRow = (table, row) => new Promise((resolve, reject) => {
+  let queue = writeQueues.get(table);
+  if (!queue) {
+    queue = { rows: [], waiters: [], timer: null };
+    queue.timer = setTimeout(() => flushLogQueue(table).catch(() => {}), FLUSH_DELAY_MS);
+    writeQueues.set(table, queue);
+  }
+
+  queue.rows.push({ timestamp: new Date().toISOString(), ...row });
+  queue.waiters.push({ resolve, reject });
+  if (queue.rows.length >= MAX_BATCH_ROWS) flushLogQueue(table).catch(() => {});
+});
+
+// Don't lose the tail of the buffer when the tab goes away
+if (typeof window !== 'undefined') {
+  window.addEventListener('pagehide', () => { flushAllLogQueues(); });
+}
+
+// ==================== REALTIME ====================
+
+const streams = new Map(); // table -> { channel, listeners, inserted, updated, frame, subscribedOnce }
+
+const flushStream = (table) => {
+  const stream = streams.get(table);
+  if (!stream) return;
+  stream.frame = null;
+  const batch = { inserted: stream.inserted, updated: stream.updated, reconnected: false };
+  stream.inserted = [];
+  stream.updated = [];
+  countEvent(`realtime:${table}:flushes`);
+  stream.listeners.forEach(listener => listener(batch));
+};
+
+const scheduleStreamFlush = (table, stream) => {
+  if (stream.frame !== null) return;
+  stream.frame = typeof requestAnimationFrame === 'function'
+    ? requestAnimationFrame(() => flushStream(table))
+    : setTimeout(() => flushStream(table), 16);
+};
+
+/**
+ * Realtime deltas for a log table. Listeners share one channel per table and
+ * get { inserted, updated, reconnected } once per frame; reconnected = true
+ * means events may have been missed while the socket was down (re-read the
+ * first page). Deletes are not delivered - retention only removes rows far
+ * below anything on screen.
+ * @param {string} table
+ * @param {Function} listener - (batch) => void
+ * @returns {Function} Unsubscribe
+ */
+export const subscribeLogChanges = (table, listener) => {
+  let stream = streams.get(table);
+  if (!stream) {
+    stream = { channel: null, listeners: new Set(), inserted: [], updated: [], frame: null, subscribedOnce: false };
+    const current = stream;
+    const onChange = (payload) => {
+      if (!payload.new || payload.new.id === undefined) return;
+      countEvent(`realtime:${table}:${payload.eventType}`);
+      (payload.eventType === 'INSERT' ? current.inserted : current.updated).push(payload.new);
+      scheduleStreamFlush(table, current);
+    };
+
+    stream.channel = supabase
+      .channel(`log-stream:${table}`)
+      .on('postgres_changes', { event: 'INSERT', schema: 'public', table }, onChange)
+      .on('postgres_changes', { event: 'UPDATE', schema: 'public', table }, onChange)
+      .subscribe((status) => {
+        if (status !== 'SUBSCRIBED') return;
+        if (current.subscribedOnce) {
+          current.listeners.forEach(fn => fn({ inserted: [], updated: [], reconnected: true }));
+        }
+        current.subscribedOnce = true;
+      });
+    streams.set(table, stream);
+  }
+
+  stream.listeners.add(listener);
+
+  return () => {
+    const current = streams.get(table);
+    if (!current) return;
+    current.listeners.delete(listener);
+    if (current.listeners.size > 0) return;
+    if (current.frame !== null) {
+      if (typeof requestAnimationFrame === 'function') cancelAnimationFrame(current.frame);
+      else clearTimeout(current.frame);
+    }
+    supabase.removeChannel(current.channel);
+    streams.delete(table);
+  };
+};
+
+// ==================== logs TABLE ====================
+
+/**
+ * Newest logs rows
+ * @param {number} limit
+ * @param {{timestamp: string, id: number}|null} before - Cursor for older rows
+ * @returns {Promise<Array>}
+ */
+export const getLogs = async (limit = 50, before = null) => {
+  const { rows } = await fetchLogPage('logs', { limit, before });
+  return rows;
+};
+
+/**
+ * Append a logs row (batched with other rows written within a second)
+ * @returns {Promise<void>}
+ */
+export const addLog = (action, details, status = 'SUCCESS') =>
+  queueLogRow('logs', { action, details, status });
@@ -0,0 +1,208 @@
+// ✅ Performance Instrumentation
+// Opt-in timing of the hot paths: User Timing measures around data loads, the
+// Gantt calculations and realtime handlers, realtime event counters, request
+// count/bytes/time per Supabase endpoint and React Profiler commit durations.
+// Off by default (every helper is a pass-through). Switch on before the app
+// loads with VITE_PERF=true, localStorage.tracker_perf = 'true' or
+// window.__TRACKER_PERF__ = true (what testsprite_tests/perf_benchmark.py does),
+// then read window.__trackerPerf.snapshot() / .reset()
+// Used in: supabase.js, taskStore.js, localSnapshot.js, logPipeline.js, useSchedule.js,
+// useDependencyIndex.js, CustomGanttPro.jsx, main.jsx
+
+const MEASURE_PREFIX = 'tracker:';
+
+const readEnabled = () => {
+  if (import.meta.env?.VITE_PERF === 'true') return true;
+  if (typeof window === 'undefined') return false;
+  if (window.__TRACKER_PERF__ === true) return true;
+  try {
+    return window.localStorage.getItem('tracker_perf') === 'true';
+  } catch (error) {
+    return false; // Storage blocked (e.g. sandboxed iframe)
+  }
+};
+
+export const PERF_ENABLED = readEnabled();
+
+const now = () => (typeof performance !== 'undefined' ? performance.now() : Date.now());
+
+let measures = new Map();  // name -> { count, totalMs, maxMs, lastMs }
+let counters = new Map();  // name -> count
+let requests = new Map();  // 'METHOD endpoint' -> { count, errors, bytes, totalMs, maxMs }
+let commits = new Map();   // Profiler id -> { count, mounts, updates, totalMs, maxMs }
+let startedAt = now();
+
+const addDuration = (map, key, durationMs, extra = {}) => {
+  const entry = map.get(key) || { count: 0, totalMs: 0, maxMs: 0, lastMs: 0 };
+  entry.count += 1;
+  entry.totalMs += durationMs;
+  entry.maxMs = Math.max(entry.maxMs, durationMs);
+  entry.lastMs = durationMs;
+  Object.entries(extra).forEach(([field, amount]) => {
+    entry[field] = (entry[field] || 0) + amount;
+  });
+  map.set(key, entry);
+  return entry;
+};
+
+const finishMeasure = (name, start) => {
+  const end = now();
+  addDuration(measures, name, end - start);
+  // Same span as a User Timing entry, for the DevTools Performance panel
+  try {
+    performance.measure(MEASURE_PREFIX + name, { start, end });
+  } catch (error) {
+    // Older browsers without measure options: the totals above still count
+  }
+};
+
+// ==================== TIMING ====================
+
+/**
+ * Run fn and record its duration under name
+ * @param {string} name - e.g. 'gantt:sortedTasks'
+ * @param {Function} fn - Synchronous work
+ * @returns {any} Whatever fn returns
+ */
+export const measure = (name, fn) => {
+  if (!PERF_ENABLED) return fn();
+  const start = now();
+  try {
+    return fn();
+  } finally {
+    finishMeasure(name, start);
+  }
+};
+
+/**
+ * Await fn() and record the time until it settles
+ * @param {string} name - e.g. 'sync:tasks'
+ * @param {Function} fn - Returns a promise
+ * @returns {Promise<any>} Result of fn
+ */
+export const measureAsync = async (name, fn) => {
+  if (!PERF_ENABLED) return fn();
+  const start = now();
+  try {
+    return await fn();
+  } finally {
+    finishMeasure(name, start);
+  }
+};
+
+/**
+ * Bump a counter (realtime events, cache hits...)
+ * @param {string} name - e.g. 'realtime:tasks:UPDATE'
+ * @param {number} amount
+ */
+export const countEvent = (name, amount = 1) => {
+  if (!PERF_ENABLED) return;
+  counters.set(name, (counters.get(name) || 0) + amount);
+};
+
+// ==================== REQUESTS ====================
+
+// '/rest/v1/tasks?select=*' -> 'tasks', '/rest/v1/rpc/get_dashboard_stats' -> 'rpc/get_dashboard_stats'
+const endpointOf = (url) => {
+  try {
+    const { pathname } = new URL(url, 'http://localhost');
+    const rest = pathname.match(/\/rest\/v1\/(.+)$/);
+    if (rest) return rest[1];
+    return pathname.split('/').filter(Boolean).slice(0, 2).join('/') || pathname;
+  } catch (error) {
+    return 'unknown';
+  }
+};
+
+/**
+ * Wrap a fetch implementation so every call is counted per endpoint with its
+ * time to response headers and decoded body size. Returns fetchImpl unchanged
+ * when instrumentation is off.
+ * @param {Function} fetchImpl - (input, init) => Promise<Response>
+ * @returns {Function} Same signature
+ */
+export const instrumentFetch = (fetchImpl) => {
+  if (!PERF_ENABLED) return fetchImpl;
+
+  return async (input, init = {}) => {
+    const url = typeof input === 'string' ? input : input.url;
+    const method = (init.method || input.method || 'GET').toUpperCase();
+    const key = `${method} ${endpointOf(url)}`;
+    const start = now();
+
+    let response;
+    try {
+      response = await fetchImpl(input, init);
+    } catch (error) {
+      addDuration(requests, key, now() - start, { errors: 1, bytes: 0 });
+      throw error;
+    }
+
+    const entry = addDuration(requests, key, now() - start, { errors: response.ok ? 0 : 1, bytes: 0 });
+    // Body size is read from a clone in the background, so the caller is not delayed
+    response.clone().arrayBuffer()
+      .then(buffer => { entry.bytes += buffer.byteLength; })
+      .catch(() => {});
+    return response;
+  };
+};
+
+// ==================== REACT ====================
+
+/**
+ * onRender callback for <React.Profiler>
+ * @param {string} id - Profiler id
+ * @param {string} phase - 'mount' | 'update' | 'nested-update'
+ * @param {number} actualDuration - Time spent rendering the committed update
+ */
+export const recordCommit = (id, phase, actualDuration) => {
+  if (!PERF_ENABLED) return;
+  addDuration(commits, id, actualDuration, {
+    mounts: phase === 'mount' ? 1 : 0,
+    updates: phase === 'mount' ? 0 : 1
+  });
+};
+
+// ==================== SNAPSHOT ====================
+
+const copyEntries = (map) => Object.fromEntries(
+  Array.from(map, ([key, entry]) => [key, { ...entry }])
+);
+
+/**
+ * Everything recorded since the last reset (plain JSON, safe to serialize)
+ * @returns {Object} { enabled, elapsedMs, measures, counters, requests, commits }
+ */
+export const getPerfSnapshot = () => ({
+  enabled: PERF_ENABLED,
+  elapsedMs: now() - startedAt,
+  measures: copyEntries(measures),
+  counters: Object.fromEntries(counters),
+  requests: copyEntries(requests),
+  commits: copyEntries(commits)
+});
+
+/** Start a new measurement window (e.g. one benchmark scenario) */
+export const resetPerf = () => {
+  measures.forEach((entry, name) => {
+    try {
+      performance.clearMeasures(MEASURE_PREFIX + name);
+    } catch (error) {
+      // Nothing to clear
+    }
+  });
+  measures = new Map();
+  counters = new Map();
+  requests = new Map();
+  commits = new Map();
+  startedAt = now();
+};
+
+// Global hook for the Playwright tests (present even when disabled, so they can tell)
+if (typeof window !== 'undefined') {
+  window.__trackerPerf = {
+    enabled: PERF_ENABLED,
+    snapshot: getPerfSnapshot,
+    reset: resetPerf
+  };
+}
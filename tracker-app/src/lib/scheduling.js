@@ -0,0 +1,241 @@
+// ✅ CPM Scheduling Engine
+// Topological (Kahn) ordering with cycle detection, early/late start + finish,
+// total float and critical path - all iterative, no recursion over the graph
+// Used in: CustomGanttPro.jsx (critical path highlight, auto-schedule)
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+const FLOAT_EPSILON = 1e-6; // Float below this counts as zero (durations are fractional days)
+
+/**
+ * Duration of a task in days: its scheduled dates when it has both ends
+ * (TIMESTAMP columns first), otherwise the estimate (8h per day, default 3 days)
+ * @param {Object} task - Task row
+ * @returns {number} Duration in (possibly fractional) days
+ */
+export const getTaskDurationDays = (task) => {
+  const start = task.start_datetime || task.start_date;
+  const end = task.due_datetime || task.due_date;
+  if (start && end) {
+    const days = (new Date(end).getTime() - new Date(start).getTime()) / DAY_MS;
+    if (Number.isFinite(days) && days > 0) return days;
+  }
+  return task.estimated_hours ? Math.ceil(task.estimated_hours / 8) : 3;
+};
+
+// Predecessors that exist in the index (depends_on may reference deleted tasks)
+const knownPredecessors = (index, taskId) => {
+  const ids = index.predecessorIds.get(taskId);
+  if (!ids || ids.length === 0) return [];
+  const known = ids.filter(id => index.byId.has(id));
+  return known.length > 1 ? Array.from(new Set(known)) : known;
+};
+
+/**
+ * Topological order of all tasks (Kahn's algorithm)
+ * @param {Object} index - Dependency index (lib/dependencyGraph)
+ * @returns {{order: Array, cycle: Array|null, blocked: Set}} Ordered IDs; when
+ *   depends_on has a cycle, one cycle (IDs in dependency order) and every task
+ *   that could not be ordered because of it
+ */
+export const topologicalOrder = (index) => {
+  const inDegree = new Map();
+  const queue = [];
+
+  index.byId.forEach((task, id) => {
+    const degree = knownPredecessors(index, id).length;
+    inDegree.set(id, degree);
+    if (degree === 0) queue.push(id);
+  });
+
+  const order = [];
+  for (let head = 0; head < queue.length; head++) {
+    const id = queue[head];
+    order.push(id);
+    (index.successorIds.get(id) || []).forEach(succId => {
+      if (!inDegree.has(succId)) return;
+      const degree = inDegree.get(succId) - 1;
+      inDegree.set(succId, degree);
+      if (degree === 0) queue.push(succId);
+    });
+  }
+
+  if (order.length === index.byId.size) {
+    return { order, cycle: null, blocked: new Set() };
+  }
+
+  const blocked = new Set(Array.from(inDegree.keys()).filter(id => inDegree.get(id) > 0));
+  return { order, cycle: findCycle(index, blocked), blocked };
+};
+
+// Walk predecessors inside the blocked set until a task repeats; every
+// blocked task has a blocked predecessor, so the walk must close a loop
+const findCycle = (index, blocked) => {
+  const start = blocked.values().next().value;
+  const visitedAt = new Map();
+  const path = [];
+  let current = start;
+  while (!visitedAt.has(current)) {
+    visitedAt.set(current, path.length);
+    path.push(current);
+    current = knownPredecessors(index, current).find(id => blocked.has(id));
+    if (current === undefined) return null;
+  }
+  return path.slice(visitedAt.get(current)).reverse();
+};
+
+/**
+ * Full CPM pass: forward (ES/EF), backward (LS/LF), float, critical path
+ * @param {Object} index - Dependency index
+ * @param {Object} options
+ * @param {Function} options.duration - task -> days (default getTaskDurationDays)
+ * @param {Function} options.earliestStart - task -> lower bound for ES in days (default 0)
+ * @param {number} options.lag - Days between a predecessor's finish and its successor's start
+ * @returns {Object} Schedule ({ order, position, es, ef, ls, lf, float, critical, projectEnd, cycle, blocked, version })
+ */
+export const computeSchedule = (index, options = {}) => {
+  const { order, cycle, blocked } = topologicalOrder(index);
+  const schedule = {
+    order,
+    position: new Map(order.map((id, i) => [id, i])),
+    duration: new Map(),
+    es: new Map(),
+    ef: new Map(),
+    ls: new Map(),
+    lf: new Map(),
+    float: new Map(),
+    critical: new Set(),
+    projectEnd: 0,
+    cycle,
+    blocked,
+    options,
+    version: 0
+  };
+
+  order.forEach(id => schedule.duration.set(id, durationOf(schedule, index.byId.get(id))));
+  forwardPass(index, schedule, order);
+  schedule.projectEnd = maxFinish(schedule);
+  backwardPass(index, schedule, order);
+  updateFloat(schedule, order);
+  return schedule;
+};
+
+/**
+ * Recompute after some tasks' durations changed (same dependency edges).
+ * Only successors of the changed tasks are moved forward; late dates are
+ * recomputed for their predecessors, or for everything if the project end moved.
+ * When the index reports added/removed edges or tasks, falls back to a full pass.
+ * @param {Object} schedule - Schedule from computeSchedule (mutated in place)
+ * @param {Object} index - Dependency index after the change
+ * @param {Array} changedIds - IDs of tasks whose rows changed
+ * @returns {Object} The same schedule with a new identity, or the input if nothing moved
+ */
+export const updateSchedule = (schedule, index, changedIds) => {
+  if (index.edgesChanged) return computeSchedule(index, schedule.options);
+  const changed = [];
+  for (const id of changedIds) {
+    if (!schedule.position.has(id)) return computeSchedule(index, schedule.options);
+    const task = index.byId.get(id);
+    if (!task) return computeSchedule(index, schedule.options);
+    const duration = durationOf(schedule, task);
+    if (duration !== schedule.duration.get(id)) {
+      schedule.duration.set(id, duration);
+      changed.push(id);
+    }
+  }
+  if (changed.length === 0) return schedule;
+
+  const byPosition = (a, b) => schedule.position.get(a) - schedule.position.get(b);
+  const downstream = collect(changed, id => index.successorIds.get(id)).sort(byPosition);
+  forwardPass(index, schedule, downstream);
+
+  const previousEnd = schedule.projectEnd;
+  schedule.projectEnd = maxFinish(schedule);
+
+  if (Math.abs(schedule.projectEnd - previousEnd) > FLOAT_EPSILON) {
+    backwardPass(index, schedule, schedule.order);
+    updateFloat(schedule, schedule.order);
+  } else {
+    const upstream = collect(changed, id => knownPredecessors(index, id)).sort(byPosition);
+    backwardPass(index, schedule, upstream);
+    updateFloat(schedule, downstream.concat(upstream));
+  }
+  return { ...schedule, version: schedule.version + 1 };
+};
+
+const durationOf = (schedule, task) => (schedule.options.duration || getTaskDurationDays)(task);
+
+// IDs reachable from `startIds` (inclusive) through `next`, iteratively
+const collect = (startIds, next) => {
+  const seen = new Set(startIds);
+  const stack = [...startIds];
+  while (stack.length) {
+    (next(stack.pop()) || []).forEach(id => {
+      if (!seen.has(id)) {
+        seen.add(id);
+        stack.push(id);
+      }
+    });
+  }
+  return Array.from(seen);
+};
+
+const forwardPass = (index, schedule, ids) => {
+  const lag = schedule.options.lag || 0;
+  const earliestStart = schedule.options.earliestStart;
+  ids.forEach(id => {
+    if (!schedule.position.has(id)) return;
+    let es = earliestStart ? earliestStart(index.byId.get(id)) : 0;
+    knownPredecessors(index, id).forEach(predId => {
+      if (schedule.ef.has(predId)) es = Math.max(es, schedule.ef.get(predId) + lag);
+    });
+    schedule.es.set(id, es);
+    schedule.ef.set(id, es + schedule.duration.get(id));
+  });
+};
+
+const backwardPass = (index, schedule, ids) => {
+  const lag = schedule.options.lag || 0;
+  for (let i = ids.length - 1; i >= 0; i--) {
+    const id = ids[i];
+    if (!schedule.position.has(id)) continue;
+    let lf = schedule.projectEnd;
+    (index.successorIds.get(id) || []).forEach(succId => {
+      if (schedule.ls.has(succId)) lf = Math.min(lf, schedule.ls.get(succId) - lag);
+    });
+    schedule.lf.set(id, lf);
+    schedule.ls.set(id, lf - schedule.duration.get(id));
+  }
+};
+
+const updateFloat = (schedule, ids) => {
+  ids.forEach(id => {
+    if (!schedule.position.has(id)) return;
+    const float = schedule.ls.get(id) - schedule.es.get(id);
+    schedule.float.set(id, float);
+    if (float <= FLOAT_EPSILON) {
+      schedule.critical.add(id);
+    } else {
+      schedule.critical.delete(id);
+    }
+  });
+};
+
+const maxFinish = (schedule) => {
+  let end = 0;
+  schedule.ef.forEach(ef => {
+    if (ef > end) end = ef;
+  });
+  return end;
+};
+
+/**
+ * Human readable description of a dependency cycle
+ * @param {Object} index - Dependency index
+ * @param {Array} cycle - Cycle IDs from topologicalOrder
+ * @returns {string} e.g. "Design → Build → Design"
+ */
+export const describeCycle = (index, cycle) => {
+  if (!cycle || cycle.length === 0) return '';
+  const names = cycle.map(id => index.byId.get(id)?.name || `#${id}`);
+  return [...names, names[0]].join(' → ');
+};
@@ -0,0 +1,451 @@
+// ✅ Shared Task Store
+// One normalized copy of the tasks table for every view, kept current by a
+// single realtime channel. postgres_changes payloads are applied as deltas,
+// bursts are coalesced into one update per animation frame, and the
+// tasks_with_dependencies columns the views read (execution_status,
+// child_count, parent_name, ...) are derived locally for affected tasks only.
+// Loads start from the IndexedDB snapshot and fetch only the delta (localSnapshot.js).
+// Used in: hooks/useTaskStore.js (KanbanView, TimelineView, SprintPlanning, CustomGanttPro, GapDashboard)
+
+import { supabase } from './supabase';
+import { buildDependencyIndex, updateDependencyIndex, normalizeDependsOn } from './dependencyGraph';
+import { syncTable } from './localSnapshot';
+import { measure, measureAsync, countEvent } from './perf';
+
+const CHANNEL_NAME = 'task-store';
+const CHANNEL_IDLE_MS = 30000; // Keep the channel open this long after the last view unmounts
+
+// Columns computed by the store (same meaning as in tasks_with_dependencies)
+export const DERIVED_FIELDS = [
+  'child_count',
+  'completed_child_count',
+  'parent_name',
+  'parent_type',
+  'depends_on_names',
+  'blocking_dependencies',
+  'blocking_count',
+  'execution_status',
+  'calculated_progress'
+];
+
+// Columns the derived fields read - changes to anything else (dates, notes...) derive nothing
+const RELATION_FIELDS = ['name', 'status', 'parent_id', 'depends_on', 'progress_percentage', 'task_type'];
+
+let state = {
+  tasks: [],          // Sorted by phase_id, order_index, id
+  byId: new Map(),
+  status: 'idle',     // idle | loading | ready | error
+  error: null,
+  version: 0
+};
+let index = buildDependencyIndex([]);
+
+const listeners = new Set();
+let channel = null;
+let channelIdleTimer = null;
+let needsReload = false;    // Channel was closed, so changes may have been missed
+let loadPromise = null;
+let pendingEvents = [];
+let flushHandle = null;
+
+// ==================== ORDERING ====================
+
+// Postgres ORDER BY puts NULLs last
+const orderValue = (value) => (value === null || value === undefined ? Infinity : value);
+
+const compareTasks = (a, b) =>
+  orderValue(a.phase_id) - orderValue(b.phase_id) ||
+  orderValue(a.order_index) - orderValue(b.order_index) ||
+  a.id - b.id;
+
+const orderChanged = (prev, next) =>
+  prev.phase_id !== next.phase_id || prev.order_index !== next.order_index;
+
+// ==================== DERIVED FIELDS ====================
+
+const sameValue = (a, b) => {
+  if (Array.isArray(a) && Array.isArray(b)) {
+    return a.length === b.length && a.every((value, i) => value === b[i]);
+  }
+  return a === b;
+};
+
+const relationChanged = (prev, next) =>
+  RELATION_FIELDS.some(field => !sameValue(prev[field], next[field]));
+
+/**
+ * Task row with its derived columns recomputed from the index.
+ * Returns the same object when nothing changed (keeps memoized rows stable).
+ */
+const deriveTask = (task) => {
+  const children = [];
+  (index.childIds.get(task.id) || []).forEach(id => {
+    const child = index.byId.get(id);
+    if (child) children.push(child);
+  });
+  const doneChildren = children.filter(child => child.status === 'DONE').length;
+
+  const predecessors = [];
+  normalizeDependsOn(task.depends_on).forEach(id => {
+    const predecessor = index.byId.get(id);
+    if (predecessor) predecessors.push(predecessor);
+  });
+
+  const blocking = Array.from(index.successorIds.get(task.id) || [])
+    .filter(id => index.byId.has(id))
+    .sort((a, b) => a - b);
+
+  const parent = task.parent_id !== null && task.parent_id !== undefined
+    ? index.byId.get(task.parent_id)
+    : null;
+
+  let executionStatus = 'READY';
+  if (task.status === 'DONE') {
+    executionStatus = 'DONE';
+  } else if (predecessors.some(predecessor => predecessor.status !== 'DONE')) {
+    executionStatus = 'BLOCKED';
+  }
+
+  const derived = {
+    child_count: children.length,
+    completed_child_count: doneChildren,
+    parent_name: parent?.name ?? null,
+    parent_type: parent?.task_type ?? null,
+    depends_on_names: task.depends_on === null || task.depends_on === undefined || predecessors.length === 0
+      ? null
+      : predecessors.map(predecessor => predecessor.name).sort(),
+    blocking_dependencies: blocking,
+    blocking_count: blocking.length,
+    execution_status: executionStatus,
+    calculated_progress: children.length > 0
+      ? Math.round((doneChildren / children.length) * 100)
+      : task.progress_percentage
+  };
+
+  if (DERIVED_FIELDS.every(field => sameValue(task[field], derived[field]))) return task;
+  return { ...task, ...derived };
+};
+
+/**
+ * Copy of a task without the store's derived columns (for inserts/upserts)
+ * @param {Object} task - Task row from the store
+ * @returns {Object} Plain tasks-table row
+ */
+export const stripDerivedFields = (task) => {
+  const row = { ...task };
+  DERIVED_FIELDS.forEach(field => { delete row[field]; });
+  return row;
+};
+
+// ==================== COMMIT ====================
+
+const emit = () => listeners.forEach(listener => listener());
+
+const setState = (patch) => {
+  state = { ...state, ...patch };
+  emit();
+};
+
+// Children copy the parent's name/type (parent_name, parent_type)
+const parentFieldsChanged = (prev, next) =>
+  !prev || !next || prev.name !== next.name || prev.task_type !== next.task_type;
+
+// IDs whose derived columns can change when `prev` becomes `next` (either may
+// be null). Reads the index from before the change; IDs whose children must
+// also be re-derived against the new index are added to `parents`.
+const collectAffected = (affected, parents, prev, next) => {
+  const task = next || prev;
+  affected.add(task.id);
+  if (prev && next && !relationChanged(prev, next)) return;
+
+  [prev, next].forEach(row => {
+    if (!row) return;
+    if (row.parent_id !== null && row.parent_id !== undefined) affected.add(row.parent_id);
+    normalizeDependsOn(row.depends_on).forEach(id => affected.add(id));
+  });
+  (index.successorIds.get(task.id) || []).forEach(id => affected.add(id));
+
+  if (parentFieldsChanged(prev, next)) {
+    (index.childIds.get(task.id) || []).forEach(id => affected.add(id));
+    parents.add(task.id);
+  }
+};
+
+/**
+ * Apply full rows (or null for deletes) keyed by task ID, re-derive the
+ * affected tasks and notify subscribers once
+ * @param {Map} changes - task ID -> row | null
+ */
+const commit = (changes) => {
+  if (changes.size === 0) return;
+
+  const byId = new Map(state.byId);
+  const affected = new Set();
+  const parents = new Set();
+  let structural = false;
+
+  changes.forEach((row, id) => {
+    const prev = byId.get(id) || null;
+    if (!prev && !row) return;
+    if (!prev || !row || orderChanged(prev, row)) structural = true;
+    collectAffected(affected, parents, prev, row);
+    if (row) {
+      byId.set(id, row);
+    } else {
+      byId.delete(id);
+    }
+  });
+
+  let tasks = structural
+    ? Array.from(byId.values()).sort(compareTasks)
+    : state.tasks.map(task => (changes.has(task.id) ? byId.get(task.id) : task));
+
+  index = updateDependencyIndex(index, tasks);
+  // Children that point at a new/renamed parent (e.g. inserted before it)
+  parents.forEach(id => (index.childIds.get(id) || []).forEach(childId => affected.add(childId)));
+
+  const derived = new Map();
+  affected.forEach(id => {
+    const task = byId.get(id);
+    if (!task) return;
+    const next = deriveTask(task);
+    if (next !== task) derived.set(id, next);
+  });
+  if (derived.size > 0) {
+    // Derived columns never change edges, so only the row objects are swapped
+    derived.forEach((task, id) => {
+      byId.set(id, task);
+      index.byId.set(id, task);
+    });
+    tasks = tasks.map(task => derived.get(task.id) || task);
+  }
+
+  setState({ tasks, byId, version: state.version + 1 });
+};
+
+const replaceAll = (rows) => {
+  const tasks = [...rows].sort(compareTasks);
+  index = buildDependencyIndex(tasks);
+  const derivedTasks = tasks.map(task => deriveTask(task));
+  derivedTasks.forEach(task => index.byId.set(task.id, task));
+  setState({
+    tasks: derivedTasks,
+    byId: new Map(derivedTasks.map(task => [task.id, task])),
+    status: 'ready',
+    error: null,
+    version: state.version + 1
+  });
+};
+
+// Server row differs from the stored one (derived columns are ignored)
+const rowChanged = (current, row) => Object.keys(row).some(field => {
+  if (DERIVED_FIELDS.includes(field)) return false;
+  const a = current[field];
+  const b = row[field];
+  if (a && b && typeof a === 'object' && typeof b === 'object' && !Array.isArray(a)) {
+    return JSON.stringify(a) !== JSON.stringify(b); // JSONB columns (custom_fields)
+  }
+  return !sameValue(a, b);
+});
+
+// A reload over a populated store (snapshot, reconnect) is applied as a diff,
+// so rows that did not change keep their identity and memoized rows stay put
+const applyReload = (rows) => {
+  if (state.status !== 'ready') {
+    replaceAll(rows);
+    return;
+  }
+
+  const changes = new Map();
+  const seen = new Set();
+  rows.forEach(row => {
+    seen.add(row.id);
+    const current = state.byId.get(row.id);
+    if (!current) {
+      changes.set(row.id, row);
+    } else if (rowChanged(current, row)) {
+      changes.set(row.id, { ...current, ...row });
+    }
+  });
+  state.byId.forEach((task, id) => {
+    if (!seen.has(id)) changes.set(id, null);
+  });
+  commit(changes);
+  if (state.error) setState({ error: null });
+};
+
+// ==================== REALTIME ====================
+
+// Payload older than what we hold (e.g. delivered after a fresher reload)
+const isStale = (incoming, current) => {
+  if (!incoming.updated_at || !current?.updated_at) return false;
+  return Date.parse(incoming.updated_at) < Date.parse(current.updated_at);
+};
+
+const flushEvents = () => measure('realtime:tasks:flush', () => {
+  flushHandle = null;
+  // Rows from an in-flight load would overwrite these; apply them after it lands
+  if (loadPromise) return;
+
+  const events = pendingEvents;
+  pendingEvents = [];
+  const changes = new Map();
+
+  events.forEach(({ eventType, new: row, old }) => {
+    if (eventType === 'DELETE') {
+      if (old?.id !== undefined) changes.set(old.id, null);
+      return;
+    }
+    if (!row || row.id === undefined) return;
+    const current = changes.has(row.id) ? changes.get(row.id) : state.byId.get(row.id);
+    if (current && isStale(row, current)) return;
+    // Keep derived columns until commit() recomputes them
+    changes.set(row.id, current ? { ...current, ...row } : row);
+  });
+
+  countEvent('realtime:tasks:flushes');
+  commit(changes);
+});
+
+const scheduleFlush = () => {
+  if (flushHandle !== null) return;
+  flushHandle = typeof requestAnimationFrame === 'function'
+    ? requestAnimationFrame(flushEvents)
+    : setTimeout(flushEvents, 16);
+};
+
+const handleChange = (payload) => {
+  countEvent(`realtime:tasks:${payload.eventType}`);
+  pendingEvents.push(payload);
+  scheduleFlush();
+};
+
+const openChannel = () => {
+  if (channelIdleTimer) {
+    clearTimeout(channelIdleTimer);
+    channelIdleTimer = null;
+  }
+  if (channel) return;
+
+  let subscribedOnce = false;
+  channel = supabase
+    .channel(CHANNEL_NAME)
+    .on('postgres_changes', { event: '*', schema: 'public', table: 'tasks' }, handleChange)
+    .subscribe((status) => {
+      if (status !== 'SUBSCRIBED') return;
+      // Reconnected: events during the gap are lost, so re-read once
+      if (subscribedOnce && state.status === 'ready') reloadTasks();
+      subscribedOnce = true;
+    });
+};
+
+const closeChannel = () => {
+  channelIdleTimer = null;
+  if (!channel) return;
+  supabase.removeChannel(channel);
+  channel = null;
+  needsReload = true;
+};
+
+// ==================== PUBLIC API ====================
+
+/**
+ * Sync tasks (snapshot + delta) and replace the store contents. The cached
+ * snapshot is shown first when the store is still empty. Concurrent calls
+ * share one request; realtime events that arrive meanwhile are applied afterwards.
+ * @returns {Promise<Array>} Loaded tasks
+ */
+export const reloadTasks = () => {
+  if (loadPromise) return loadPromise;
+  if (state.status !== 'ready') setState({ status: 'loading', error: null });
+
+  loadPromise = measureAsync('load:tasks', async () => {
+    try {
+      const rows = await syncTable('tasks', {
+        onSnapshot: (cached) => {
+          if (state.status !== 'ready' && cached.length > 0) replaceAll(cached);
+        }
+      });
+
+      needsReload = false;
+      loadPromise = null;
+      applyReload(rows);
+      if (pendingEvents.length > 0) flushEvents();
+    } catch (error) {
+      console.error('Error loading tasks:', error);
+      loadPromise = null;
+      setState({ status: state.status === 'ready' ? 'ready' : 'error', error });
+    }
+    return state.tasks;
+  });
+  return loadPromise;
+};
+
+/**
+ * Subscribe to store changes (useSyncExternalStore contract). The first
+ * subscriber opens the realtime channel and triggers the initial load.
+ * @param {Function} listener - Called after every change
+ * @returns {Function} Unsubscribe
+ */
+export const subscribeTaskStore = (listener) => {
+  listeners.add(listener);
+  openChannel();
+  if (state.status === 'idle' || state.status === 'error' || needsReload) reloadTasks();
+
+  return () => {
+    listeners.delete(listener);
+    if (listeners.size === 0 && !channelIdleTimer) {
+      channelIdleTimer = setTimeout(closeChannel, CHANNEL_IDLE_MS);
+    }
+  };
+};
+
+/** Current store state ({ tasks, byId, status, error, version }) */
+export const getTaskStoreState = () => state;
+
+/** Current load status (stable primitive for useSyncExternalStore) */
+export const getTaskStoreStatus = () => state.status;
+
+/**
+ * setState-style local write: `updater` gets the current task list and
+ * returns the next one. Only rows whose identity changed are applied.
+ * @param {Function|Array} updater - (tasks) => tasks, or the next list
+ */
+export const setStoreTasks = (updater) => {
+  const next = typeof updater === 'function' ? updater(state.tasks) : updater;
+  if (next === state.tasks) return;
+
+  const changes = new Map();
+  const seen = new Set();
+  next.forEach(task => {
+    seen.add(task.id);
+    if (state.byId.get(task.id) !== task) changes.set(task.id, task);
+  });
+  if (seen.size !== state.byId.size) {
+    state.byId.forEach((task, id) => {
+      if (!seen.has(id)) changes.set(id, null);
+    });
+  }
+  commit(changes);
+};
+
+/**
+ * Merge partial rows into the store (optimistic updates)
+ * @param {Array} patches - [{ id, ...columns }]
+ */
+export const patchTasks = (patches) => {
+  const changes = new Map();
+  patches.forEach(patch => {
+    const current = changes.get(patch.id) || state.byId.get(patch.id);
+    if (current) changes.set(patch.id, { ...current, ...patch });
+  });
+  commit(changes);
+};
+
+/**
+ * Remove tasks from the store (after a delete)
+ * @param {Array} ids - Task IDs
+ */
+export const removeTasks = (ids) => {
+  commit(new Map(ids.map(id => [id, null])));
+};
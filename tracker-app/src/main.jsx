@@ -5,12 +5,15 @@ import './styles/main.css';
 import './App.css'
 import { Toaster } from 'react-hot-toast';
 import ErrorBoundary from './components/ErrorBoundary';
+import { PerfProfiler } from './components/PerfProfiler';
 
 // ✅ ADDED: Global toast notifications + Error Boundary
 ReactDOM.createRoot(document.getElementById('root')).render(
   <React.StrictMode>
     <ErrorBoundary>
-      <App />
+      <PerfProfiler id="app">
+        <App />
+      </PerfProfiler>
       <Toaster
         position="top-right"
         toastOptions={{
@@ -1,5 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { supabase } from '../lib/supabase';
+import { getDashboardStats, getFocusTasks, subscribeDashboardChanges } from '../lib/dashboardStats';
+import { fetchLogPage } from '../lib/logPipeline';
 import { TrendingUp, Clock, CheckCircle, AlertCircle, User, Bot, Target, Zap } from 'lucide-react';
 import { AIActivityStream } from '../components/AIActivityStream';
 import { AIAnalysisPanel } from '../components/AIAnalysisPanel';
@@ -7,8 +9,8 @@ import toast from 'react-hot-toast';
 
 export const DashboardPage = ({ onNavigate }) => {
   const [stats, setStats] = useState(null);
+  const [focusTasks, setFocusTasks] = useState([]);
   const [recentActivity, setRecentActivity] = useState([]);
-  const [allTasks, setAllTasks] = useState([]);
   const [loading, setLoading] = useState(true);
   
   const navigateToTasks = (filter) => {
@@ -18,13 +20,8 @@ export const DashboardPage = ({ onNavigate }) => {
 
   useEffect(() => {
     loadDashboardData();
-    
-    const subscription = supabase
-      .channel('dashboard-updates')
-      .on('postgres_changes', { event: '*', schema: 'public', table: 'tasks' }, loadDashboardData)
-      .subscribe();
-    
-    return () => subscription.unsubscribe();
+    // Real-time: refetch once per burst of task changes, bypassing the stats cache
+    return subscribeDashboardChanges(() => loadDashboardData({ force: true }));
   }, []);
 
   // ✅ FIXED: Use toast instead of alert
@@ -74,7 +71,7 @@ export const DashboardPage = ({ onNavigate }) => {
         });
       }
 
-      loadDashboardData(); // Refresh
+      loadDashboardData({ force: true }); // Refresh
     } catch (error) {
       console.error('Error applying recommendation:', error);
       toast.error(`❌ Failed to apply recommendation: ${error.message}`, {
@@ -83,67 +80,39 @@ export const DashboardPage = ({ onNavigate }) => {
     }
   };
 
-  const loadDashboardData = async () => {
+  const loadDashboardData = async ({ force = false } = {}) => {
     try {
-      // Load full tasks for AI analysis
-      const { data: fullTasks } = await supabase
-        .from('tasks_with_dependencies')
-        .select('*');
-      
-      setAllTasks(fullTasks || []);
-      
-      // Load overall stats
-      const tasks = fullTasks || [];
-      const { data: statsData } = await supabase
-        .from('tasks')
-        .select('status, assigned_type, estimated_hours, actual_hours, completed_at');
-      
-      // ✅ FIXED: BLOCKED is execution_status not status
-      const total = tasks.length;
-      const done = tasks.filter(t => t.status === 'DONE').length;
-      const inProgress = tasks.filter(t => t.status === 'IN_PROGRESS').length;
-      const pending = tasks.filter(t => t.status === 'PENDING').length;
-      const blocked = tasks.filter(t => t.execution_status === 'BLOCKED').length;
-      
-      const completionPct = ((done / total) * 100).toFixed(1);
-      const humanTasks = tasks.filter(t => t.assigned_type === 'HUMAN').length;
-      const aiTasks = tasks.filter(t => t.assigned_type === 'AI').length;
-      
-      const totalEstHours = tasks.reduce((sum, t) => sum + (parseFloat(t.estimated_hours) || 0), 0);
-      const totalActualHours = tasks.reduce((sum, t) => sum + (parseFloat(t.actual_hours) || 0), 0);
-      
-      // Calculate velocity (tasks completed in last 7 days)
-      const sevenDaysAgo = new Date();
-      sevenDaysAgo.setDate(sevenDaysAgo.getDate() - 7);
-      const recentlyCompleted = tasks.filter(t => 
-        t.status === 'DONE' && 
-        t.completed_at && 
-        new Date(t.completed_at) >= sevenDaysAgo
-      ).length;
-      const velocity = (recentlyCompleted / 7).toFixed(1);
-      
+      // Totals, per-phase counts and hour sums in one call, Today's Focus as
+      // a bounded query (see lib/dashboardStats)
+      const [dashboardStats, focus] = await Promise.all([
+        getDashboardStats({ force }),
+        getFocusTasks()
+      ]);
+      const { total, done } = dashboardStats;
+
       setStats({
         total,
         done,
-        inProgress,
-        pending,
-        blocked,
-        completionPct,
-        humanTasks,
-        aiTasks,
-        totalEstHours: totalEstHours.toFixed(0),
-        totalActualHours: totalActualHours.toFixed(0),
-        velocity
+        inProgress: dashboardStats.inProgress,
+        pending: dashboardStats.pending,
+        blocked: dashboardStats.blocked,
+        completionPct: total > 0 ? ((done / total) * 100).toFixed(1) : '0.0',
+        humanTasks: dashboardStats.humanTasks,
+        aiTasks: dashboardStats.aiTasks,
+        totalEstHours: dashboardStats.estimatedHours.toFixed(0),
+        totalActualHours: dashboardStats.actualHours.toFixed(0),
+        // Tasks completed per day over the last 7 days
+        velocity: (dashboardStats.completedLast7Days / 7).toFixed(1),
+        phases: dashboardStats.phases
+          .filter(phase => phase.totalTasks > 0)
+          .sort((a, b) => a.id - b.id)
       });
+      setFocusTasks(focus);
       
-      // Load recent activity
-      const { data: logs } = await supabase
-        .from('ai_execution_logs')
-        .select('*')
-        .order('timestamp', { ascending: false })
-        .limit(5);
+      // Load recent activity (first keyset page, served by the (timestamp, id) index)
+      const { rows: logs } = await fetchLogPage('ai_execution_logs', { limit: 5 });
       
-      setRecentActivity(logs || []);
+      setRecentActivity(logs);
       setLoading(false);
     } catch (error) {
       console.error('Error loading dashboard:', error);
@@ -236,17 +205,7 @@ export const DashboardPage = ({ onNavigate }) => {
         </div>
         
         <div className="space-y-3">
-          {allTasks
-            .filter(t => t.status === 'IN_PROGRESS' || (t.status === 'PENDING' && t.execution_status === 'READY'))
-            .sort((a, b) => {
-              // Sort by: IN_PROGRESS first, then HIGH priority, then phase
-              if (a.status === 'IN_PROGRESS' && b.status !== 'IN_PROGRESS') return -1;
-              if (a.status !== 'IN_PROGRESS' && b.status === 'IN_PROGRESS') return 1;
-              if (a.priority === 'HIGH' && b.priority !== 'HIGH') return -1;
-              if (a.priority !== 'HIGH' && b.priority === 'HIGH') return 1;
-              return a.phase_id - b.phase_id;
-            })
-            .slice(0, 5)
+          {focusTasks
             .map((task, idx) => (
               <div 
                 key={task.id}
@@ -291,7 +250,7 @@ export const DashboardPage = ({ onNavigate }) => {
               </div>
             ))}
           
-          {allTasks.filter(t => t.status === 'IN_PROGRESS' || (t.status === 'PENDING' && t.execution_status === 'READY')).length === 0 && (
+          {focusTasks.length === 0 && (
             <div className="text-center py-8 text-text-tertiary">
               <div className="text-4xl mb-2">🎉</div>
               <p>No tasks in progress. Start a new task!</p>
@@ -419,43 +378,39 @@ export const DashboardPage = ({ onNavigate }) => {
       <div className="bg-background-secondary rounded-xl border border-border-default p-6 mb-6">
         <h2 className="text-xl font-bold text-text-primary mb-4">📊 Phase Progress</h2>
         <div className="space-y-4">
-          {(() => {
-            const phases = [...new Set(allTasks.map(t => t.phase_id))].sort((a, b) => a - b);
-            return phases.map(phaseId => {
-              const phaseTasks = allTasks.filter(t => t.phase_id === phaseId);
-              const done = phaseTasks.filter(t => t.status === 'DONE').length;
-              const inProgress = phaseTasks.filter(t => t.status === 'IN_PROGRESS').length;
-              const total = phaseTasks.length;
-              const progress = total > 0 ? ((done / total) * 100).toFixed(0) : 0;
-              const phaseTask = phaseTasks[0];
-              
-              return (
-                <div key={phaseId} className="bg-background-tertiary rounded-lg p-4">
-                  <div className="flex items-center justify-between mb-2">
-                    <div className="flex items-center gap-3">
-                      <div className="w-10 h-10 bg-brand-primary/20 rounded-lg flex items-center justify-center font-bold text-brand-primary">
-                        {phaseId}
-                      </div>
-                      <div>
-                        <h3 className="font-bold text-text-primary">Phase {phaseId}</h3>
-                        <p className="text-xs text-text-tertiary">{done} done, {inProgress} in progress, {total - done - inProgress} pending</p>
-                      </div>
+          {stats.phases.map(phase => {
+            const phaseId = phase.id;
+            const done = phase.doneTasks;
+            const inProgress = phase.inProgressTasks;
+            const total = phase.totalTasks;
+            const progress = total > 0 ? ((done / total) * 100).toFixed(0) : 0;
+            
+            return (
+              <div key={phaseId} className="bg-background-tertiary rounded-lg p-4">
+                <div className="flex items-center justify-between mb-2">
+                  <div className="flex items-center gap-3">
+                    <div className="w-10 h-10 bg-brand-primary/20 rounded-lg flex items-center justify-center font-bold text-brand-primary">
+                      {phaseId}
                     </div>
-                    <div className="text-right">
-                      <div className="text-2xl font-bold text-brand-primary">{progress}%</div>
-                      <div className="text-xs text-text-tertiary">{done}/{total}</div>
+                    <div>
+                      <h3 className="font-bold text-text-primary">Phase {phaseId}</h3>
+                      <p className="text-xs text-text-tertiary">{done} done, {inProgress} in progress, {total - done - inProgress} pending</p>
                     </div>
                   </div>
-                  <div className="w-full bg-background-primary rounded-full h-3">
-                    <div 
-                      className="bg-gradient-to-r from-brand-primary to-brand-secondary h-3 rounded-full transition-all"
-                      style={{ width: `${progress}%` }}
-                    />
+                  <div className="text-right">
+                    <div className="text-2xl font-bold text-brand-primary">{progress}%</div>
+                    <div className="text-xs text-text-tertiary">{done}/{total}</div>
                   </div>
                 </div>
-              );
-            });
-          })()}
+                <div className="w-full bg-background-primary rounded-full h-3">
+                  <div 
+                    className="bg-gradient-to-r from-brand-primary to-brand-secondary h-3 rounded-full transition-all"
+                    style={{ width: `${progress}%` }}
+                  />
+                </div>
+              </div>
+            );
+          })}
         </div>
       </div>
 
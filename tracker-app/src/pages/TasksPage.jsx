@@ -5,6 +5,7 @@ import { KanbanView } from '../components/KanbanView';
 import { CustomGanttPro } from '../components/CustomGanttPro';
 import { TimelineView } from '../components/TimelineView';
 import { SprintPlanning } from '../components/SprintPlanning';
+import { PerfProfiler } from '../components/PerfProfiler';
 
 const viewOptions = [
   { id: 'list', name: 'List', icon: List, component: WorkflowDashboard },
@@ -46,7 +47,11 @@ export const TasksPage = () => {
         </div>
       </header>
       <main className="flex-1 overflow-hidden">
-        {ActiveComponent && <ActiveComponent />}
+        {ActiveComponent && (
+          <PerfProfiler id={`tasks:${activeView}`}>
+            <ActiveComponent />
+          </PerfProfiler>
+        )}
       </main>
     </div>
   );
@@ -0,0 +1,152 @@
+-- ============================================
+-- SERVER-SIDE DATE CASCADE
+-- Move a task and shift its whole downstream subgraph in one call
+-- Date: 2025-11-12
+-- ============================================
+
+-- ============================================
+-- PROBLEM:
+-- - Gantt drag wrote the task, then one UPDATE per DIRECT successor
+--   (sequentially), then re-fetched every task and phase
+-- - Successors of successors were never moved, leaving chains inconsistent
+-- ============================================
+
+-- ============================================
+-- SOLUTION:
+-- cascade_task_dates() runs in a single transaction:
+-- 1. Update the moved task
+-- 2. Collect its downstream tasks (same recursion as get_downstream_tasks,
+--    without the level < 10 cap - UNION de-duplicates, so cycles terminate)
+-- 3. Relax start dates wave by wave: each task starts lag_days after its
+--    latest predecessor finishes, keeping its own duration
+-- 4. Return ONLY the rows that changed so the client can merge them locally
+--
+-- The legacy start_date / due_date columns hold the CLIENT's calendar day
+-- (the browser writes format(d, 'yyyy-MM-dd') everywhere else), not the
+-- server's UTC day: the moved task takes the client's date strings as-is,
+-- downstream dates are read in the client's time zone.
+-- ============================================
+
+-- Earlier revision without the client date parameters
+DROP FUNCTION IF EXISTS cascade_task_dates(INTEGER, TIMESTAMP WITH TIME ZONE, TIMESTAMP WITH TIME ZONE, INTEGER);
+
+CREATE OR REPLACE FUNCTION cascade_task_dates(
+  task_id_param INTEGER,
+  new_start TIMESTAMP WITH TIME ZONE,
+  new_due TIMESTAMP WITH TIME ZONE,
+  lag_days INTEGER DEFAULT 1,
+  new_start_date DATE DEFAULT NULL,
+  new_due_date DATE DEFAULT NULL,
+  client_time_zone TEXT DEFAULT 'UTC'
+)
+RETURNS SETOF tasks AS $$
+DECLARE
+  downstream_ids INTEGER[];
+  frontier INTEGER[];
+  changed_ids INTEGER[];
+  waves INTEGER := 0;
+BEGIN
+  IF new_due < new_start THEN
+    RAISE EXCEPTION 'Due date (%) is before start date (%)', new_due, new_start
+      USING ERRCODE = '22023';
+  END IF;
+
+  IF NOT EXISTS (SELECT 1 FROM pg_timezone_names WHERE name = client_time_zone) THEN
+    RAISE EXCEPTION 'Unknown time zone %', client_time_zone USING ERRCODE = '22023';
+  END IF;
+
+  -- 1. The moved task
+  UPDATE tasks
+  SET
+    start_datetime = new_start,
+    due_datetime = new_due,
+    start_date = COALESCE(new_start_date, (new_start AT TIME ZONE client_time_zone)::DATE),
+    due_date = COALESCE(new_due_date, (new_due AT TIME ZONE client_time_zone)::DATE),
+    updated_at = NOW()
+  WHERE id = task_id_param;
+
+  IF NOT FOUND THEN
+    RAISE EXCEPTION 'Task % not found', task_id_param USING ERRCODE = 'P0002';
+  END IF;
+
+  -- 2. Whole downstream subgraph
+  WITH RECURSIVE downstream AS (
+    SELECT t.id
+    FROM tasks t
+    WHERE task_id_param = ANY(t.depends_on)
+
+    UNION
+
+    SELECT t.id
+    FROM tasks t
+    JOIN downstream d ON d.id = ANY(t.depends_on)
+  )
+  SELECT COALESCE(array_agg(id), '{}') INTO downstream_ids FROM downstream;
+
+  IF task_id_param = ANY(downstream_ids) THEN
+    RAISE EXCEPTION 'Dependency cycle: task % depends on itself', task_id_param
+      USING ERRCODE = '23514';
+  END IF;
+
+  changed_ids := ARRAY[task_id_param];
+  frontier := ARRAY[task_id_param];
+
+  -- 3. Relax successors of the tasks that moved in the previous wave.
+  -- On a DAG this takes at most (longest chain) waves; more means a cycle.
+  WHILE array_length(frontier, 1) IS NOT NULL LOOP
+    waves := waves + 1;
+    IF waves > COALESCE(array_length(downstream_ids, 1), 0) + 1 THEN
+      RAISE EXCEPTION 'Dependency cycle below task %', task_id_param
+        USING ERRCODE = '23514';
+    END IF;
+
+    WITH candidates AS (
+      SELECT DISTINCT t.id
+      FROM tasks t
+      WHERE t.id = ANY(downstream_ids)
+        AND t.depends_on && frontier
+    ),
+    required AS (
+      SELECT
+        t.id,
+        MAX(COALESCE(p.due_datetime, p.due_date::TIMESTAMP WITH TIME ZONE))
+          + make_interval(days => lag_days) AS start_at,
+        COALESCE(t.due_datetime, t.due_date::TIMESTAMP WITH TIME ZONE)
+          - COALESCE(t.start_datetime, t.start_date::TIMESTAMP WITH TIME ZONE) AS duration
+      FROM tasks t
+      JOIN candidates c ON c.id = t.id
+      JOIN tasks p ON p.id = ANY(t.depends_on)
+      GROUP BY t.id
+    ),
+    moved AS (
+      UPDATE tasks t
+      SET
+        start_datetime = r.start_at,
+        due_datetime = r.start_at + COALESCE(r.duration, INTERVAL '0'),
+        start_date = (r.start_at AT TIME ZONE client_time_zone)::DATE,
+        due_date = ((r.start_at + COALESCE(r.duration, INTERVAL '0')) AT TIME ZONE client_time_zone)::DATE,
+        updated_at = NOW()
+      FROM required r
+      WHERE t.id = r.id
+        AND r.start_at IS NOT NULL
+        AND t.start_datetime IS DISTINCT FROM r.start_at
+      RETURNING t.id
+    )
+    SELECT COALESCE(array_agg(id), '{}') INTO frontier FROM moved;
+
+    changed_ids := changed_ids || frontier;
+  END LOOP;
+
+  -- 4. Changed rows only
+  RETURN QUERY
+  SELECT * FROM tasks WHERE id = ANY(changed_ids) ORDER BY id;
+END;
+$$ LANGUAGE plpgsql VOLATILE;
+
+COMMENT ON FUNCTION cascade_task_dates IS 'Move a task and shift every downstream task (start = latest predecessor due + lag_days, duration kept) in one transaction. start_date / due_date are calendar days in client_time_zone. Returns only the changed rows.';
+
+GRANT EXECUTE ON FUNCTION cascade_task_dates(INTEGER, TIMESTAMP WITH TIME ZONE, TIMESTAMP WITH TIME ZONE, INTEGER, DATE, DATE, TEXT) TO anon, authenticated;
+
+-- ============================================
+-- END OF MIGRATION
+-- ============================================
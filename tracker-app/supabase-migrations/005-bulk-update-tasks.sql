@@ -0,0 +1,116 @@
+-- ============================================
+-- BULK TASK UPDATES
+-- Apply many partial task updates in one round trip
+-- Date: 2025-11-12
+-- ============================================
+
+-- ============================================
+-- PROBLEM:
+-- - Auto-schedule and sprint assignment sent one UPDATE request per task
+--   (thousands of sequential round trips for large projects)
+-- - A plain upsert cannot carry partial rows (INSERT path hits NOT NULL columns)
+-- ============================================
+
+-- ============================================
+-- SOLUTION:
+-- bulk_update_tasks(updates) takes a JSON array of partial rows
+-- ([{ "id": 1, "start_date": "...", ... }, ...]) and applies each one in
+-- its own savepoint, so a bad row is reported without losing the others.
+-- Returns one result per input row:
+--   ok = true  -> task holds the updated row
+--   ok = false -> error_code / error_message explain why
+-- ============================================
+
+CREATE OR REPLACE FUNCTION bulk_update_tasks(updates JSONB)
+RETURNS TABLE (
+  id INTEGER,
+  ok BOOLEAN,
+  error_code TEXT,
+  error_message TEXT,
+  task JSONB
+) AS $$
+DECLARE
+  item JSONB;
+  patch JSONB;
+  row_id INTEGER;
+  current_row tasks;
+  merged tasks;
+  set_clause TEXT;
+  unknown_column TEXT;
+  updated JSONB;
+  task_columns TEXT[];
+BEGIN
+  IF jsonb_typeof(updates) IS DISTINCT FROM 'array' THEN
+    RAISE EXCEPTION 'updates must be a JSON array' USING ERRCODE = '22023';
+  END IF;
+
+  -- Column names are looked up once per call, not once per row
+  SELECT array_agg(c.column_name::TEXT)
+  INTO task_columns
+  FROM information_schema.columns c
+  WHERE c.table_schema = 'public' AND c.table_name = 'tasks';
+
+  FOR item IN SELECT value FROM jsonb_array_elements(updates) LOOP
+    row_id := NULL;
+    BEGIN
+      row_id := (item ->> 'id')::INTEGER;
+      IF row_id IS NULL THEN
+        RAISE EXCEPTION 'Missing id' USING ERRCODE = '22023';
+      END IF;
+
+      -- id / created_at are immutable, updated_at is always NOW()
+      patch := item - 'id' - 'created_at' - 'updated_at';
+
+      SELECT key INTO unknown_column
+      FROM jsonb_object_keys(patch) AS key
+      WHERE key <> ALL(task_columns)
+      LIMIT 1;
+      IF unknown_column IS NOT NULL THEN
+        RAISE EXCEPTION 'Column "%" of tasks does not exist', unknown_column USING ERRCODE = '42703';
+      END IF;
+
+      SELECT * INTO current_row FROM tasks t WHERE t.id = row_id FOR UPDATE;
+      IF NOT FOUND THEN
+        RAISE EXCEPTION 'Task % not found', row_id USING ERRCODE = 'P0002';
+      END IF;
+
+      -- Current row with the patched columns replaced (types coerced by Postgres)
+      merged := jsonb_populate_record(current_row, patch);
+
+      SELECT string_agg(format('%I = ($1).%I', key, key), ', ')
+      INTO set_clause
+      FROM jsonb_object_keys(patch) AS key;
+
+      EXECUTE format(
+        'UPDATE tasks SET %s updated_at = NOW() WHERE id = $2 RETURNING to_jsonb(tasks.*)',
+        COALESCE(set_clause || ',', '')
+      )
+      INTO updated
+      USING merged, row_id;
+
+      id := row_id;
+      ok := true;
+      error_code := NULL;
+      error_message := NULL;
+      task := updated;
+      RETURN NEXT;
+    EXCEPTION WHEN OTHERS THEN
+      -- Only this row's savepoint is rolled back
+      id := row_id;
+      ok := false;
+      error_code := SQLSTATE;
+      error_message := SQLERRM;
+      task := NULL;
+      RETURN NEXT;
+    END;
+  END LOOP;
+END;
+$$ LANGUAGE plpgsql VOLATILE;
+
+COMMENT ON FUNCTION bulk_update_tasks IS 'Apply a JSON array of partial task rows ({id, ...columns}) in one call. Each row runs in its own savepoint; returns per-row ok/error and the updated row.';
+
+GRANT EXECUTE ON FUNCTION bulk_update_tasks(JSONB) TO anon, authenticated;
+
+-- ============================================
+-- END OF MIGRATION
+-- ============================================
@@ -0,0 +1,404 @@
+-- ============================================
+-- TRIGGER-MAINTAINED DEPENDENCY STATS
+-- Store the derived task columns instead of computing them per row
+-- Date: 2025-11-13
+-- ============================================
+
+-- ============================================
+-- PROBLEM:
+-- - tasks_with_dependencies / tracker_app_data (migration 002) run several
+--   correlated subqueries for EVERY row: child_count (twice),
+--   depends_on_names, blocking_dependencies, blocking_count,
+--   execution_status, calculated_progress and three last_agent lookups
+-- - "t.id = ANY(depends_on)" cannot use the GIN index, so blocking_* is a
+--   full scan of tasks per row: reading either view is O(n^2)
+-- - Kanban, Timeline, SprintPlanning and the dashboard read them in full
+-- ============================================
+
+-- ============================================
+-- SOLUTION:
+-- 1. task_dependency_stats: one row per task holding the aggregates
+-- 2. refresh_task_dependency_stats(ids) recomputes the rows for given tasks
+-- 3. Statement-level triggers on tasks refresh only the tasks a change can
+--    affect: the task, its old/new parent, its old/new predecessors and its
+--    successors. Date/progress edits (drag, resize) refresh nothing.
+-- 4. A trigger on ai_execution_logs keeps last_agent_* current
+-- 5. Both views become plain joins against task_dependency_stats
+-- Benchmark: sql/benchmark-task-views.sql
+-- ============================================
+
+-- ============================================
+-- 1. STATS TABLE
+-- ============================================
+CREATE TABLE IF NOT EXISTS task_dependency_stats (
+  task_id INTEGER PRIMARY KEY REFERENCES tasks(id) ON DELETE CASCADE,
+
+  -- Subtasks
+  child_count BIGINT NOT NULL DEFAULT 0,
+  completed_child_count BIGINT NOT NULL DEFAULT 0,
+
+  -- Predecessors (tasks this task depends on that still exist)
+  depends_on_names TEXT[],
+  depends_on_ids INTEGER[],
+  open_dependency_count BIGINT NOT NULL DEFAULT 0, -- predecessors not DONE
+
+  -- Successors (tasks that depend on this task)
+  blocking_dependencies INTEGER[] NOT NULL DEFAULT ARRAY[]::INTEGER[],
+  blocking_count BIGINT NOT NULL DEFAULT 0,
+
+  -- Latest ai_execution_logs entry
+  last_agent TEXT,
+  last_agent_status TEXT,
+  last_agent_activity TIMESTAMP WITH TIME ZONE,
+
+  refreshed_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+COMMENT ON TABLE task_dependency_stats IS 'Per-task dependency/subtask aggregates, maintained by triggers on tasks and ai_execution_logs. Read through tasks_with_dependencies / tracker_app_data.';
+
+-- Successor lookups below use depends_on @> ARRAY[id] (GIN: idx_tasks_depends_on)
+CREATE INDEX IF NOT EXISTS idx_tasks_depends_on ON tasks USING GIN(depends_on);
+CREATE INDEX IF NOT EXISTS idx_tasks_parent_id ON tasks(parent_id);
+CREATE INDEX IF NOT EXISTS idx_ai_execution_logs_task_timestamp ON ai_execution_logs(task_id, timestamp DESC);
+
+-- ============================================
+-- 2. REFRESH FUNCTION
+-- ============================================
+CREATE OR REPLACE FUNCTION refresh_task_dependency_stats(task_ids INTEGER[])
+RETURNS VOID AS $$
+BEGIN
+  IF task_ids IS NULL OR array_length(task_ids, 1) IS NULL THEN
+    RETURN;
+  END IF;
+
+  -- Two transactions refreshing the same task (e.g. two subtasks of one
+  -- parent marked DONE) serialize on this lock; the INSERT below is a new
+  -- statement, so it sees whatever the other transaction committed
+  PERFORM 1
+  FROM task_dependency_stats
+  WHERE task_id = ANY(task_ids)
+  ORDER BY task_id
+  FOR UPDATE;
+
+  INSERT INTO task_dependency_stats AS s (
+    task_id,
+    child_count,
+    completed_child_count,
+    depends_on_names,
+    depends_on_ids,
+    open_dependency_count,
+    blocking_dependencies,
+    blocking_count,
+    last_agent,
+    last_agent_status,
+    last_agent_activity,
+    refreshed_at
+  )
+  SELECT
+    t.id,
+    children.total,
+    children.done,
+    CASE WHEN t.depends_on IS NOT NULL THEN deps.names ELSE NULL END,
+    CASE WHEN t.depends_on IS NOT NULL THEN deps.ids ELSE ARRAY[]::INTEGER[] END,
+    COALESCE(deps.open_count, 0),
+    COALESCE(blocking.ids, ARRAY[]::INTEGER[]),
+    blocking.total,
+    agent.agent_name,
+    agent.status,
+    agent.timestamp,
+    NOW()
+  FROM tasks t
+  LEFT JOIN LATERAL (
+    SELECT
+      COUNT(*) AS total,
+      COUNT(*) FILTER (WHERE c.status = 'DONE') AS done
+    FROM tasks c
+    WHERE c.parent_id = t.id
+  ) children ON true
+  LEFT JOIN LATERAL (
+    SELECT
+      array_agg(d.name ORDER BY d.name) AS names,
+      array_agg(d.id ORDER BY d.id) AS ids,
+      COUNT(*) FILTER (WHERE d.status != 'DONE') AS open_count
+    FROM tasks d
+    WHERE d.id = ANY(t.depends_on)
+  ) deps ON true
+  LEFT JOIN LATERAL (
+    SELECT
+      array_agg(b.id ORDER BY b.id) AS ids,
+      COUNT(*) AS total
+    FROM tasks b
+    WHERE b.depends_on @> ARRAY[t.id]
+  ) blocking ON true
+  LEFT JOIN LATERAL (
+    SELECT l.agent_name, l.status, l.timestamp
+    FROM ai_execution_logs l
+    WHERE l.task_id = t.id
+    ORDER BY l.timestamp DESC
+    LIMIT 1
+  ) agent ON true
+  WHERE t.id = ANY(task_ids)
+  ON CONFLICT (task_id) DO UPDATE SET
+    child_count = EXCLUDED.child_count,
+    completed_child_count = EXCLUDED.completed_child_count,
+    depends_on_names = EXCLUDED.depends_on_names,
+    depends_on_ids = EXCLUDED.depends_on_ids,
+    open_dependency_count = EXCLUDED.open_dependency_count,
+    blocking_dependencies = EXCLUDED.blocking_dependencies,
+    blocking_count = EXCLUDED.blocking_count,
+    last_agent = EXCLUDED.last_agent,
+    last_agent_status = EXCLUDED.last_agent_status,
+    last_agent_activity = EXCLUDED.last_agent_activity,
+    refreshed_at = EXCLUDED.refreshed_at;
+END;
+$$ LANGUAGE plpgsql VOLATILE SECURITY DEFINER SET search_path = public;
+
+COMMENT ON FUNCTION refresh_task_dependency_stats IS 'Recompute task_dependency_stats rows for the given task IDs (missing tasks are skipped).';
+
+-- ============================================
+-- 3. TRIGGERS ON tasks
+-- Statement level with transition tables: a bulk write (bulk_update_tasks,
+-- cascade_task_dates, imports) refreshes each affected task once
+-- ============================================
+CREATE OR REPLACE FUNCTION sync_task_dependency_stats()
+RETURNS TRIGGER AS $$
+DECLARE
+  affected INTEGER[];
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    SELECT array_agg(DISTINCT ids.id) INTO affected
+    FROM (
+      SELECT n.id FROM new_rows n
+      UNION ALL SELECT n.parent_id FROM new_rows n
+      UNION ALL SELECT unnest(n.depends_on) FROM new_rows n
+      -- Existing tasks whose depends_on already named the new ID
+      UNION ALL SELECT t.id FROM new_rows n JOIN tasks t ON t.depends_on @> ARRAY[n.id]
+    ) ids
+    WHERE ids.id IS NOT NULL;
+
+  ELSIF TG_OP = 'UPDATE' THEN
+    -- Only columns the aggregates read; date/progress edits skip the refresh
+    WITH changed AS (
+      SELECT o.id, o.parent_id AS old_parent, n.parent_id AS new_parent,
+             o.depends_on AS old_depends_on, n.depends_on AS new_depends_on
+      FROM old_rows o
+      JOIN new_rows n ON n.id = o.id
+      WHERE (o.name, o.status, o.parent_id, o.depends_on)
+        IS DISTINCT FROM (n.name, n.status, n.parent_id, n.depends_on)
+    )
+    SELECT array_agg(DISTINCT ids.id) INTO affected
+    FROM (
+      SELECT c.id FROM changed c
+      UNION ALL SELECT c.old_parent FROM changed c
+      UNION ALL SELECT c.new_parent FROM changed c
+      UNION ALL SELECT unnest(c.old_depends_on) FROM changed c
+      UNION ALL SELECT unnest(c.new_depends_on) FROM changed c
+      UNION ALL SELECT t.id FROM changed c JOIN tasks t ON t.depends_on @> ARRAY[c.id]
+    ) ids
+    WHERE ids.id IS NOT NULL;
+
+  ELSE -- DELETE (the deleted rows' stats go with ON DELETE CASCADE)
+    SELECT array_agg(DISTINCT ids.id) INTO affected
+    FROM (
+      SELECT o.parent_id AS id FROM old_rows o
+      UNION ALL SELECT unnest(o.depends_on) FROM old_rows o
+      UNION ALL SELECT t.id FROM old_rows o JOIN tasks t ON t.depends_on @> ARRAY[o.id]
+    ) ids
+    WHERE ids.id IS NOT NULL;
+  END IF;
+
+  PERFORM refresh_task_dependency_stats(affected);
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Transition tables need one trigger per event
+DROP TRIGGER IF EXISTS trigger_task_dependency_stats_insert ON tasks;
+CREATE TRIGGER trigger_task_dependency_stats_insert
+  AFTER INSERT ON tasks
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION sync_task_dependency_stats();
+
+DROP TRIGGER IF EXISTS trigger_task_dependency_stats_update ON tasks;
+CREATE TRIGGER trigger_task_dependency_stats_update
+  AFTER UPDATE ON tasks
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION sync_task_dependency_stats();
+
+DROP TRIGGER IF EXISTS trigger_task_dependency_stats_delete ON tasks;
+CREATE TRIGGER trigger_task_dependency_stats_delete
+  AFTER DELETE ON tasks
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION sync_task_dependency_stats();
+
+-- ============================================
+-- 4. TRIGGER ON ai_execution_logs (last_agent_*)
+-- ============================================
+CREATE OR REPLACE FUNCTION sync_task_agent_activity()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.task_id IS NOT NULL THEN
+    PERFORM refresh_task_dependency_stats(ARRAY[OLD.task_id::INTEGER]);
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.task_id IS NOT NULL THEN
+    PERFORM refresh_task_dependency_stats(ARRAY[NEW.task_id::INTEGER]);
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS trigger_task_agent_activity ON ai_execution_logs;
+CREATE TRIGGER trigger_task_agent_activity
+  AFTER INSERT OR UPDATE OF task_id, agent_name, status, timestamp OR DELETE ON ai_execution_logs
+  FOR EACH ROW
+  EXECUTE FUNCTION sync_task_agent_activity();
+
+-- ============================================
+-- 5. BACKFILL
+-- ============================================
+SELECT refresh_task_dependency_stats(ARRAY(SELECT id FROM tasks));
+
+-- ============================================
+-- 6. VIEWS (same columns as migration 002)
+-- Dropped and recreated: column types now come from task_dependency_stats.
+-- is_milestone, milestone_description and the timestamps are no longer
+-- repeated after t.* (a duplicate column name is rejected by CREATE VIEW)
+-- ============================================
+DROP VIEW IF EXISTS tasks_with_dependencies;
+CREATE VIEW tasks_with_dependencies AS
+SELECT
+  t.*,
+  p.name as phase_name,
+  p.description as phase_description,
+  p.order_index as phase_order,
+
+  -- Parent task info
+  parent.name as parent_name,
+  parent.task_type as parent_type,
+
+  COALESCE(st.child_count, 0) as child_count,
+  st.depends_on_names,
+  COALESCE(st.blocking_dependencies, ARRAY[]::INTEGER[]) as blocking_dependencies,
+  COALESCE(st.blocking_count, 0) as blocking_count,
+
+  CASE
+    WHEN t.status = 'DONE' THEN 'DONE'
+    WHEN t.depends_on IS NULL OR array_length(t.depends_on, 1) IS NULL THEN 'READY'
+    WHEN st.open_dependency_count > 0 THEN 'BLOCKED'
+    ELSE 'READY'
+  END as execution_status,
+
+  -- Days since started (for detecting stuck tasks)
+  CASE
+    WHEN t.started_at IS NOT NULL AND t.status = 'IN_PROGRESS'
+    THEN EXTRACT(DAY FROM (NOW() - t.started_at))
+    ELSE NULL
+  END as days_in_progress,
+
+  CASE
+    WHEN st.child_count > 0 THEN
+      ROUND((st.completed_child_count::DECIMAL / st.child_count) * 100)
+    ELSE t.progress_percentage
+  END as calculated_progress,
+
+  -- Sprint info (if assigned to sprint)
+  s.name as sprint_name,
+  s.start_date as sprint_start,
+  s.end_date as sprint_end,
+  s.status as sprint_status
+
+FROM tasks t
+LEFT JOIN task_dependency_stats st ON st.task_id = t.id
+LEFT JOIN phases p ON t.phase_id = p.id
+LEFT JOIN tasks parent ON t.parent_id = parent.id
+LEFT JOIN sprints s ON t.sprint_id = s.id;
+
+COMMENT ON VIEW tasks_with_dependencies IS 'Tasks with full dependency information, parent/child relationships, and calculated fields (aggregates from task_dependency_stats)';
+
+DROP VIEW IF EXISTS tracker_app_data;
+CREATE VIEW tracker_app_data AS
+SELECT
+  t.*,
+  p.name as phase_name,
+  p.description as phase_description,
+  p.progress as phase_progress,
+  p.order_index as phase_order,
+  p.kpi as phase_kpi,
+  p.deliverable as phase_deliverable,
+
+  -- Parent task info
+  parent.name as parent_name,
+  parent.task_type as parent_type,
+  parent.id as parent_task_id,
+
+  COALESCE(st.child_count, 0) as child_count,
+  COALESCE(st.completed_child_count, 0) as completed_child_count,
+
+  st.depends_on_names,
+  COALESCE(st.depends_on_ids, ARRAY[]::INTEGER[]) as depends_on_ids,
+  COALESCE(st.blocking_dependencies, ARRAY[]::INTEGER[]) as blocking_dependencies,
+  COALESCE(st.blocking_count, 0) as blocking_count,
+
+  -- The old WAITING branch sat after "any dependency not DONE" and could
+  -- never match, so READY / BLOCKED / DONE are the only outcomes
+  CASE
+    WHEN t.status = 'DONE' THEN 'DONE'
+    WHEN t.depends_on IS NULL OR array_length(t.depends_on, 1) IS NULL THEN 'READY'
+    WHEN st.open_dependency_count > 0 THEN 'BLOCKED'
+    ELSE 'READY'
+  END as execution_status,
+
+  -- Days metrics
+  CASE
+    WHEN t.started_at IS NOT NULL AND t.completed_at IS NULL
+    THEN EXTRACT(DAY FROM (NOW() - t.started_at))
+    ELSE NULL
+  END as days_in_progress,
+
+  CASE
+    WHEN t.started_at IS NOT NULL AND t.completed_at IS NOT NULL
+    THEN EXTRACT(DAY FROM (t.completed_at - t.started_at))
+    ELSE NULL
+  END as days_to_complete,
+
+  CASE
+    WHEN st.child_count > 0 THEN
+      ROUND((st.completed_child_count::DECIMAL / st.child_count) * 100)
+    WHEN t.status = 'DONE' THEN 100
+    ELSE COALESCE(t.progress_percentage, 0)
+  END as calculated_progress,
+
+  -- Sprint info
+  s.name as sprint_name,
+  s.start_date as sprint_start,
+  s.end_date as sprint_end,
+  s.status as sprint_status,
+  s.velocity as sprint_velocity,
+
+  -- AI Agent info (latest ai_execution_logs row)
+  st.last_agent,
+  st.last_agent_status,
+  st.last_agent_activity
+
+FROM tasks t
+LEFT JOIN task_dependency_stats st ON st.task_id = t.id
+LEFT JOIN phases p ON t.phase_id = p.id
+LEFT JOIN tasks parent ON t.parent_id = parent.id
+LEFT JOIN sprints s ON t.sprint_id = s.id;
+
+COMMENT ON VIEW tracker_app_data IS 'Complete task data with all relationships, calculations, and metadata for dashboard (aggregates from task_dependency_stats)';
+
+-- ============================================
+-- GRANT PERMISSIONS
+-- ============================================
+GRANT SELECT ON task_dependency_stats TO anon, authenticated;
+GRANT SELECT ON tasks_with_dependencies TO anon, authenticated;
+GRANT SELECT ON tracker_app_data TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION refresh_task_dependency_stats(INTEGER[]) TO authenticated;
+
+-- ============================================
+-- END OF MIGRATION
+-- ============================================
@@ -0,0 +1,232 @@
+-- ============================================
+-- DASHBOARD STATS IN ONE CALL
+-- Trigger-maintained per-phase counters + get_dashboard_stats()
+-- Date: 2025-11-13
+-- ============================================
+
+-- ============================================
+-- PROBLEM:
+-- - GapDashboard downloaded every task row to count statuses and sum
+--   hours in the browser, then ran one more tasks query PER PHASE (N+1)
+-- - DashboardPage did the same against tasks_with_dependencies
+-- - Both grow linearly with task count (and phase count) on every load
+-- ============================================
+
+-- ============================================
+-- SOLUTION:
+-- 1. phase_task_counters: task count and hour sums per
+--    (phase, status, assigned_type), kept current by statement-level
+--    triggers that add/subtract only the rows a statement touched
+-- 2. Blocked tasks come from task_dependency_stats (migration 006) through
+--    a partial index, so the scan covers tasks with open dependencies only
+-- 3. get_dashboard_stats() returns totals, per-phase completion, human/AI
+--    split, hour sums and recent completions as one JSON document
+-- Client: src/lib/dashboardStats.js (short-TTL cache)
+-- ============================================
+
+-- ============================================
+-- 1. COUNTERS TABLE
+-- NULL keys are stored as 0 / '' so they can be part of the primary key
+-- ============================================
+CREATE TABLE IF NOT EXISTS phase_task_counters (
+  phase_id INTEGER NOT NULL,          -- 0 = no phase
+  status TEXT NOT NULL,               -- '' = no status
+  assigned_type TEXT NOT NULL,        -- '' = unassigned
+  task_count BIGINT NOT NULL DEFAULT 0,
+  estimated_hours NUMERIC NOT NULL DEFAULT 0,
+  actual_hours NUMERIC NOT NULL DEFAULT 0,
+  PRIMARY KEY (phase_id, status, assigned_type)
+);
+
+COMMENT ON TABLE phase_task_counters IS 'Task count and hour sums per (phase, status, assigned_type), maintained by triggers on tasks. Read through get_dashboard_stats().';
+
+-- ============================================
+-- 2. TRIGGERS ON tasks
+-- Each statement contributes +row for new rows and -row for old rows;
+-- ON CONFLICT increments make concurrent writers safe
+-- ============================================
+CREATE OR REPLACE FUNCTION sync_phase_task_counters()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    INSERT INTO phase_task_counters AS c (phase_id, status, assigned_type, task_count, estimated_hours, actual_hours)
+    SELECT
+      COALESCE(n.phase_id, 0), COALESCE(n.status, ''), COALESCE(n.assigned_type, ''),
+      COUNT(*), COALESCE(SUM(n.estimated_hours), 0), COALESCE(SUM(n.actual_hours), 0)
+    FROM new_rows n
+    GROUP BY 1, 2, 3
+    ON CONFLICT (phase_id, status, assigned_type) DO UPDATE SET
+      task_count = c.task_count + EXCLUDED.task_count,
+      estimated_hours = c.estimated_hours + EXCLUDED.estimated_hours,
+      actual_hours = c.actual_hours + EXCLUDED.actual_hours;
+
+  ELSIF TG_OP = 'UPDATE' THEN
+    -- Only rows whose counted columns changed (dates, names... touch nothing)
+    WITH changed AS (
+      SELECT o.phase_id AS old_phase, o.status AS old_status, o.assigned_type AS old_type,
+             o.estimated_hours AS old_estimated, o.actual_hours AS old_actual,
+             n.phase_id AS new_phase, n.status AS new_status, n.assigned_type AS new_type,
+             n.estimated_hours AS new_estimated, n.actual_hours AS new_actual
+      FROM old_rows o
+      JOIN new_rows n ON n.id = o.id
+      WHERE (o.phase_id, o.status, o.assigned_type, o.estimated_hours, o.actual_hours)
+        IS DISTINCT FROM (n.phase_id, n.status, n.assigned_type, n.estimated_hours, n.actual_hours)
+    ),
+    deltas AS (
+      SELECT COALESCE(new_phase, 0) AS phase_id, COALESCE(new_status, '') AS status,
+             COALESCE(new_type, '') AS assigned_type, 1 AS task_count,
+             COALESCE(new_estimated, 0) AS estimated_hours, COALESCE(new_actual, 0) AS actual_hours
+      FROM changed
+      UNION ALL
+      SELECT COALESCE(old_phase, 0), COALESCE(old_status, ''), COALESCE(old_type, ''), -1,
+             -COALESCE(old_estimated, 0), -COALESCE(old_actual, 0)
+      FROM changed
+    )
+    INSERT INTO phase_task_counters AS c (phase_id, status, assigned_type, task_count, estimated_hours, actual_hours)
+    SELECT phase_id, status, assigned_type, SUM(task_count), SUM(estimated_hours), SUM(actual_hours)
+    FROM deltas
+    GROUP BY 1, 2, 3
+    ON CONFLICT (phase_id, status, assigned_type) DO UPDATE SET
+      task_count = c.task_count + EXCLUDED.task_count,
+      estimated_hours = c.estimated_hours + EXCLUDED.estimated_hours,
+      actual_hours = c.actual_hours + EXCLUDED.actual_hours;
+
+  ELSE -- DELETE
+    INSERT INTO phase_task_counters AS c (phase_id, status, assigned_type, task_count, estimated_hours, actual_hours)
+    SELECT
+      COALESCE(o.phase_id, 0), COALESCE(o.status, ''), COALESCE(o.assigned_type, ''),
+      -COUNT(*), -COALESCE(SUM(o.estimated_hours), 0), -COALESCE(SUM(o.actual_hours), 0)
+    FROM old_rows o
+    GROUP BY 1, 2, 3
+    ON CONFLICT (phase_id, status, assigned_type) DO UPDATE SET
+      task_count = c.task_count + EXCLUDED.task_count,
+      estimated_hours = c.estimated_hours + EXCLUDED.estimated_hours,
+      actual_hours = c.actual_hours + EXCLUDED.actual_hours;
+  END IF;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Transition tables need one trigger per event
+DROP TRIGGER IF EXISTS trigger_phase_task_counters_insert ON tasks;
+CREATE TRIGGER trigger_phase_task_counters_insert
+  AFTER INSERT ON tasks
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION sync_phase_task_counters();
+
+DROP TRIGGER IF EXISTS trigger_phase_task_counters_update ON tasks;
+CREATE TRIGGER trigger_phase_task_counters_update
+  AFTER UPDATE ON tasks
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION sync_phase_task_counters();
+
+DROP TRIGGER IF EXISTS trigger_phase_task_counters_delete ON tasks;
+CREATE TRIGGER trigger_phase_task_counters_delete
+  AFTER DELETE ON tasks
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION sync_phase_task_counters();
+
+-- ============================================
+-- 3. BACKFILL
+-- One DO block = one transaction: the lock keeps writers out until the
+-- counters match the table, so no write is counted twice or missed
+-- ============================================
+DO $$
+BEGIN
+  LOCK TABLE tasks IN SHARE ROW EXCLUSIVE MODE;
+  DELETE FROM phase_task_counters;
+  INSERT INTO phase_task_counters (phase_id, status, assigned_type, task_count, estimated_hours, actual_hours)
+  SELECT
+    COALESCE(phase_id, 0), COALESCE(status, ''), COALESCE(assigned_type, ''),
+    COUNT(*), COALESCE(SUM(estimated_hours), 0), COALESCE(SUM(actual_hours), 0)
+  FROM tasks
+  GROUP BY 1, 2, 3;
+END $$;
+
+-- ============================================
+-- 4. INDEXES
+-- ============================================
+-- Blocked = has an unfinished dependency; only those stats rows are scanned
+CREATE INDEX IF NOT EXISTS idx_task_dependency_stats_open
+  ON task_dependency_stats(task_id) WHERE open_dependency_count > 0;
+
+-- Completions in the last 7 days (velocity)
+CREATE INDEX IF NOT EXISTS idx_tasks_completed_at ON tasks(completed_at) WHERE status = 'DONE';
+
+-- ============================================
+-- 5. STATS FUNCTION
+-- ============================================
+CREATE OR REPLACE FUNCTION get_dashboard_stats()
+RETURNS JSONB AS $$
+  WITH phase_totals AS (
+    SELECT
+      phase_id,
+      SUM(task_count) AS total_tasks,
+      SUM(task_count) FILTER (WHERE status = 'DONE') AS done_tasks,
+      SUM(task_count) FILTER (WHERE status = 'IN_PROGRESS') AS in_progress_tasks,
+      SUM(task_count) FILTER (WHERE status = 'PENDING') AS pending_tasks,
+      SUM(task_count) FILTER (WHERE assigned_type = 'HUMAN') AS human_tasks,
+      SUM(task_count) FILTER (WHERE assigned_type = 'AI') AS ai_tasks,
+      SUM(estimated_hours) AS estimated_hours,
+      SUM(actual_hours) AS actual_hours
+    FROM phase_task_counters
+    GROUP BY phase_id
+  ),
+  blocked AS (
+    SELECT COALESCE(t.phase_id, 0) AS phase_id, COUNT(*) AS blocked_tasks
+    FROM task_dependency_stats s
+    JOIN tasks t ON t.id = s.task_id
+    WHERE s.open_dependency_count > 0
+      AND t.status != 'DONE'
+    GROUP BY 1
+  )
+  SELECT jsonb_build_object(
+    'total', COALESCE((SELECT SUM(total_tasks) FROM phase_totals), 0),
+    'done', COALESCE((SELECT SUM(done_tasks) FROM phase_totals), 0),
+    'in_progress', COALESCE((SELECT SUM(in_progress_tasks) FROM phase_totals), 0),
+    'pending', COALESCE((SELECT SUM(pending_tasks) FROM phase_totals), 0),
+    'blocked', COALESCE((SELECT SUM(blocked_tasks) FROM blocked), 0),
+    'human_tasks', COALESCE((SELECT SUM(human_tasks) FROM phase_totals), 0),
+    'ai_tasks', COALESCE((SELECT SUM(ai_tasks) FROM phase_totals), 0),
+    'estimated_hours', COALESCE((SELECT SUM(estimated_hours) FROM phase_totals), 0),
+    'actual_hours', COALESCE((SELECT SUM(actual_hours) FROM phase_totals), 0),
+    'completed_last_7_days', (
+      SELECT COUNT(*) FROM tasks
+      WHERE status = 'DONE' AND completed_at >= NOW() - INTERVAL '7 days'
+    ),
+    'phases', COALESCE((
+      SELECT jsonb_agg(
+        to_jsonb(p) || jsonb_build_object(
+          'total_tasks', COALESCE(pt.total_tasks, 0),
+          'done_tasks', COALESCE(pt.done_tasks, 0),
+          'in_progress_tasks', COALESCE(pt.in_progress_tasks, 0),
+          'pending_tasks', COALESCE(pt.pending_tasks, 0),
+          'blocked_tasks', COALESCE(b.blocked_tasks, 0),
+          'estimated_hours', COALESCE(pt.estimated_hours, 0),
+          'actual_hours', COALESCE(pt.actual_hours, 0)
+        )
+        ORDER BY p.order_index, p.id
+      )
+      FROM phases p
+      LEFT JOIN phase_totals pt ON pt.phase_id = p.id
+      LEFT JOIN blocked b ON b.phase_id = p.id
+    ), '[]'::JSONB),
+    'generated_at', NOW()
+  );
+$$ LANGUAGE SQL STABLE SECURITY DEFINER SET search_path = public;
+
+COMMENT ON FUNCTION get_dashboard_stats IS 'Dashboard totals, per-phase completion, human/AI split and hour sums in one call (phase_task_counters + task_dependency_stats).';
+
+-- ============================================
+-- GRANT PERMISSIONS
+-- ============================================
+GRANT SELECT ON phase_task_counters TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_dashboard_stats() TO anon, authenticated;
+
+-- ============================================
+-- END OF MIGRATION
+-- ============================================
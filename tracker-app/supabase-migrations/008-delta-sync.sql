@@ -0,0 +1,135 @@
+-- ============================================
+-- DELTA SYNC FOR LOCAL SNAPSHOTS
+-- updated_at on every synced table + deleted_records tombstones
+-- Date: 2025-11-14
+-- ============================================
+
+-- ============================================
+-- PROBLEM:
+-- - Every page load pulls the whole tasks, phases and sprints tables with
+--   select('*') before the Gantt can draw
+-- - The client keeps an IndexedDB snapshot (src/lib/localSnapshot.js) and
+--   only needs rows changed since its last sync, but:
+--   * only tasks had a trigger maintaining updated_at
+--   * a deleted row leaves nothing behind to tell the snapshot it is gone
+-- ============================================
+
+-- ============================================
+-- SOLUTION:
+-- 1. update_updated_at_column() triggers on phases and sprints too
+-- 2. Indexes on updated_at so "changed since" reads are index range scans
+-- 3. deleted_records: one tombstone per deleted row, written by
+--    statement-level triggers; clients read tombstones newer than their mark
+-- 4. purge_deleted_records(): drop old tombstones (clients whose snapshot is
+--    older than the retention window reload everything instead)
+-- ============================================
+
+-- ============================================
+-- 1. updated_at TRIGGERS
+-- ============================================
+CREATE OR REPLACE FUNCTION update_updated_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = CURRENT_TIMESTAMP;
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS update_tasks_updated_at ON tasks;
+CREATE TRIGGER update_tasks_updated_at
+  BEFORE UPDATE ON tasks
+  FOR EACH ROW
+  EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_phases_updated_at ON phases;
+CREATE TRIGGER update_phases_updated_at
+  BEFORE UPDATE ON phases
+  FOR EACH ROW
+  EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_sprints_updated_at ON sprints;
+CREATE TRIGGER update_sprints_updated_at
+  BEFORE UPDATE ON sprints
+  FOR EACH ROW
+  EXECUTE FUNCTION update_updated_at_column();
+
+-- ============================================
+-- 2. INDEXES
+-- ============================================
+CREATE INDEX IF NOT EXISTS idx_tasks_updated_at ON tasks(updated_at);
+CREATE INDEX IF NOT EXISTS idx_phases_updated_at ON phases(updated_at);
+CREATE INDEX IF NOT EXISTS idx_sprints_updated_at ON sprints(updated_at);
+
+-- ============================================
+-- 3. TOMBSTONES
+-- ============================================
+CREATE TABLE IF NOT EXISTS deleted_records (
+  id BIGSERIAL PRIMARY KEY,
+  table_name TEXT NOT NULL,
+  record_id BIGINT NOT NULL,
+  deleted_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_deleted_records_table_time
+  ON deleted_records(table_name, deleted_at);
+
+COMMENT ON TABLE deleted_records IS 'One row per deleted tasks/phases/sprints row, so local snapshots can drop it on their next delta sync. Purged by purge_deleted_records().';
+
+-- One INSERT per statement (deleting a phase with 500 tasks = 1 insert of 500 rows)
+CREATE OR REPLACE FUNCTION record_deleted_rows()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO deleted_records (table_name, record_id)
+  SELECT TG_TABLE_NAME, o.id
+  FROM old_rows o;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS trigger_tasks_tombstones ON tasks;
+CREATE TRIGGER trigger_tasks_tombstones
+  AFTER DELETE ON tasks
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION record_deleted_rows();
+
+DROP TRIGGER IF EXISTS trigger_phases_tombstones ON phases;
+CREATE TRIGGER trigger_phases_tombstones
+  AFTER DELETE ON phases
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION record_deleted_rows();
+
+DROP TRIGGER IF EXISTS trigger_sprints_tombstones ON sprints;
+CREATE TRIGGER trigger_sprints_tombstones
+  AFTER DELETE ON sprints
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION record_deleted_rows();
+
+-- ============================================
+-- 4. RETENTION
+-- Keep in sync with TOMBSTONE_RETENTION_MS in src/lib/localSnapshot.js
+-- ============================================
+CREATE OR REPLACE FUNCTION purge_deleted_records(older_than INTERVAL DEFAULT INTERVAL '30 days')
+RETURNS INTEGER AS $$
+DECLARE
+  purged INTEGER;
+BEGIN
+  DELETE FROM deleted_records WHERE deleted_at < NOW() - older_than;
+  GET DIAGNOSTICS purged = ROW_COUNT;
+  RETURN purged;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+COMMENT ON FUNCTION purge_deleted_records IS 'Delete tombstones older than the retention window (run from a scheduled job). Returns the number removed.';
+
+-- ============================================
+-- GRANT PERMISSIONS
+-- ============================================
+GRANT SELECT ON deleted_records TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION purge_deleted_records(INTERVAL) TO authenticated;
+
+-- ============================================
+-- END OF MIGRATION
+-- ============================================
@@ -0,0 +1,191 @@
+-- ============================================
+-- LOG PIPELINE
+-- Keyset reads, batched writes and retention for ai_execution_logs / logs
+-- Date: 2025-11-15
+-- ============================================
+
+-- ============================================
+-- PROBLEM:
+-- - AIActivityStream re-read the newest 20 ai_execution_logs (joined to
+--   tasks) on every realtime INSERT; the only index is (task_id, timestamp),
+--   so "newest N" sorts the whole table and gets slower as agents log
+-- - Older entries were unreachable: reads were a bare limit(), no cursor
+-- - trigger_task_agent_activity (migration 006) runs per row, so an agent
+--   writing 100 entries in one INSERT refreshed task_dependency_stats 100 times
+-- - Nothing ever removes old rows from ai_execution_logs or logs
+-- ============================================
+
+-- ============================================
+-- SOLUTION:
+-- 1. (timestamp DESC, id DESC) indexes: a page is an index range scan
+--    from the cursor, "WHERE (timestamp, id) < (cursor)" (src/lib/logPipeline.js)
+-- 2. Statement-level INSERT/DELETE triggers for last_agent_*: one refresh
+--    per statement for the distinct tasks it touched. Clients flush buffered
+--    entries as one multi-row INSERT; agents should do the same
+--    (INSERT ... VALUES (...), (...), ...)
+-- 3. ai_execution_log_daily + rollup_ai_execution_logs(): old entries are
+--    folded into per-day counts, then deleted (the newest entry of each task
+--    is kept, it feeds last_agent_*)
+-- 4. purge_logs(): plain retention for the logs table
+-- ============================================
+
+-- ============================================
+-- 1. KEYSET INDEXES
+-- ============================================
+CREATE INDEX IF NOT EXISTS idx_ai_execution_logs_timestamp_id
+  ON ai_execution_logs(timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_logs_timestamp_id
+  ON logs(timestamp DESC, id DESC);
+
+-- ============================================
+-- 2. TRIGGERS ON ai_execution_logs (last_agent_*)
+-- INSERT and DELETE move to statement level; UPDATE keeps the row-level
+-- trigger from migration 006 (transition tables cannot be combined with
+-- its UPDATE OF column list)
+-- ============================================
+CREATE OR REPLACE FUNCTION sync_task_agent_activity_rows()
+RETURNS TRIGGER AS $$
+DECLARE
+  affected INTEGER[];
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    SELECT array_agg(DISTINCT n.task_id::INTEGER) INTO affected
+    FROM new_rows n
+    WHERE n.task_id IS NOT NULL;
+  ELSE -- DELETE
+    SELECT array_agg(DISTINCT o.task_id::INTEGER) INTO affected
+    FROM old_rows o
+    WHERE o.task_id IS NOT NULL;
+  END IF;
+
+  PERFORM refresh_task_dependency_stats(affected);
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS trigger_task_agent_activity ON ai_execution_logs;
+CREATE TRIGGER trigger_task_agent_activity
+  AFTER UPDATE OF task_id, agent_name, status, timestamp ON ai_execution_logs
+  FOR EACH ROW
+  EXECUTE FUNCTION sync_task_agent_activity();
+
+DROP TRIGGER IF EXISTS trigger_task_agent_activity_insert ON ai_execution_logs;
+CREATE TRIGGER trigger_task_agent_activity_insert
+  AFTER INSERT ON ai_execution_logs
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION sync_task_agent_activity_rows();
+
+DROP TRIGGER IF EXISTS trigger_task_agent_activity_delete ON ai_execution_logs;
+CREATE TRIGGER trigger_task_agent_activity_delete
+  AFTER DELETE ON ai_execution_logs
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION sync_task_agent_activity_rows();
+
+-- ============================================
+-- 3. ROLLUP + RETENTION FOR ai_execution_logs
+-- ============================================
+CREATE TABLE IF NOT EXISTS ai_execution_log_daily (
+  day DATE NOT NULL,
+  agent_name TEXT NOT NULL,
+  status TEXT NOT NULL,
+  entries INTEGER NOT NULL DEFAULT 0,
+  first_at TIMESTAMP WITH TIME ZONE,
+  last_at TIMESTAMP WITH TIME ZONE,
+  PRIMARY KEY (day, agent_name, status)
+);
+
+COMMENT ON TABLE ai_execution_log_daily IS 'Per-day entry counts by agent and status for ai_execution_logs rows removed by rollup_ai_execution_logs().';
+
+-- Bounded batches keep each call a short transaction; a scheduled job calls
+-- it until it returns 0, e.g. with pg_cron:
+--   SELECT cron.schedule('rollup-ai-logs', '15 3 * * *', 'SELECT rollup_ai_execution_logs()');
+CREATE OR REPLACE FUNCTION rollup_ai_execution_logs(
+  older_than INTERVAL DEFAULT INTERVAL '30 days',
+  max_rows INTEGER DEFAULT 50000
+)
+RETURNS INTEGER AS $$
+DECLARE
+  rolled_up INTEGER;
+BEGIN
+  WITH latest_per_task AS (
+    SELECT DISTINCT ON (task_id) id
+    FROM ai_execution_logs
+    WHERE task_id IS NOT NULL
+    ORDER BY task_id, timestamp DESC, id DESC
+  ),
+  expired AS (
+    SELECT l.id
+    FROM ai_execution_logs l
+    WHERE l.timestamp < NOW() - older_than
+      AND l.id NOT IN (SELECT id FROM latest_per_task)
+    ORDER BY l.timestamp, l.id
+    LIMIT max_rows
+  ),
+  removed AS (
+    DELETE FROM ai_execution_logs l
+    USING expired e
+    WHERE l.id = e.id
+    RETURNING l.timestamp, l.agent_name, l.status
+  ),
+  folded AS (
+    INSERT INTO ai_execution_log_daily (day, agent_name, status, entries, first_at, last_at)
+    SELECT r.timestamp::DATE,
+           COALESCE(r.agent_name::TEXT, 'unknown'),
+           COALESCE(r.status::TEXT, 'unknown'),
+           COUNT(*),
+           MIN(r.timestamp),
+           MAX(r.timestamp)
+    FROM removed r
+    GROUP BY 1, 2, 3
+    ON CONFLICT (day, agent_name, status) DO UPDATE SET
+      entries = ai_execution_log_daily.entries + EXCLUDED.entries,
+      first_at = LEAST(ai_execution_log_daily.first_at, EXCLUDED.first_at),
+      last_at = GREATEST(ai_execution_log_daily.last_at, EXCLUDED.last_at)
+    RETURNING 1
+  )
+  SELECT COUNT(*) INTO rolled_up FROM removed;
+
+  RETURN rolled_up;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+COMMENT ON FUNCTION rollup_ai_execution_logs IS 'Fold ai_execution_logs entries older than the retention window into ai_execution_log_daily and delete them, at most max_rows per call (run from a scheduled job until it returns 0). The newest entry of each task is kept.';
+
+-- ============================================
+-- 4. RETENTION FOR logs
+-- ============================================
+CREATE OR REPLACE FUNCTION purge_logs(
+  older_than INTERVAL DEFAULT INTERVAL '90 days',
+  max_rows INTEGER DEFAULT 50000
+)
+RETURNS INTEGER AS $$
+DECLARE
+  purged INTEGER;
+BEGIN
+  DELETE FROM logs
+  WHERE id IN (
+    SELECT id
+    FROM logs
+    WHERE timestamp < NOW() - older_than
+    ORDER BY timestamp, id
+    LIMIT max_rows
+  );
+  GET DIAGNOSTICS purged = ROW_COUNT;
+  RETURN purged;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+COMMENT ON FUNCTION purge_logs IS 'Delete logs rows older than the retention window, at most max_rows per call (run from a scheduled job). Returns the number removed.';
+
+-- ============================================
+-- GRANT PERMISSIONS
+-- ============================================
+GRANT SELECT ON ai_execution_log_daily TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION rollup_ai_execution_logs(INTERVAL, INTEGER) TO authenticated;
+GRANT EXECUTE ON FUNCTION purge_logs(INTERVAL, INTEGER) TO authenticated;
+
+-- ============================================
+-- END OF MIGRATION
+-- ============================================
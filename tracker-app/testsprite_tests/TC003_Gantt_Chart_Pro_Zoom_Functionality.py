@@ -1,94 +1,44 @@
-import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to the Gantt Chart Pro view by clicking the 'Tasks' button
-        frame = context.pages[-1]
-        # Click the 'Tasks' button to navigate to Gantt Chart Pro view
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from case_support import BASE_URL, open_app, run_standalone, wait_for_gantt
+
+
+async def run_case(context, base_url=BASE_URL):
+    page = await open_app(context, base_url)
+
+    # Interact with the page elements to simulate user flow
+    # -> Navigate to the Gantt Chart Pro view by clicking the 'Tasks' button
+    frame = context.pages[-1]
+    # Click the 'Tasks' button to navigate to Gantt Chart Pro view
+    elem = frame.locator('xpath=html/body/div/div/div/div/nav/button[2]').nth(0)
+    await elem.click()
+    await wait_for_gantt(page)
 
-        # -> Adjust zoom slider to 50% by clicking or dragging the slider control
-        frame = context.pages[-1]
-        # Click zoom slider to adjust zoom level to 50%
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[2]/div[2]/div[4]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Adjust zoom slider to 50% by clicking or dragging the slider control
+    frame = context.pages[-1]
+    # Click zoom slider to adjust zoom level to 50%
+    elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[2]/div[2]/div[4]/input').nth(0)
+    await elem.click()
 
-        # -> Attempt to set zoom level to 50% by adjusting the zoom slider or using alternative controls
-        frame = context.pages[-1]
-        # Click zoom slider to try to adjust zoom level to 50%
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[2]/div[2]/div[4]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Attempt to set zoom level to 50% by adjusting the zoom slider or using alternative controls
+    frame = context.pages[-1]
+    # Click zoom slider to try to adjust zoom level to 50%
+    elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[2]/div[2]/div[4]/input').nth(0)
+    await elem.click()
+
+    # -> Attempt to set zoom level to 50% by adjusting the zoom slider or alternative controls
+    frame = context.pages[-1]
+    # Click zoom slider to try to adjust zoom level to 50%
+    elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[2]/div[2]/div[4]/input').nth(0)
+    await elem.click()
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    try:
+        await expect(frame.locator('text=Zoom Level Exceeds Maximum Limit').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test case failed: The zoom feature of the Gantt Chart Pro did not execute as expected. Zoom levels from 50% to 300% must scale tasks and dependency arrows properly with no UI distortion, but this was not verified.")
 
-        # -> Attempt to set zoom level to 50% by adjusting the zoom slider or alternative controls
-        frame = context.pages[-1]
-        # Click zoom slider to try to adjust zoom level to 50%
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[2]/div[2]/div[4]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Zoom Level Exceeds Maximum Limit').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test case failed: The zoom feature of the Gantt Chart Pro did not execute as expected. Zoom levels from 50% to 300% must scale tasks and dependency arrows properly with no UI distortion, but this was not verified.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    run_standalone(run_case)
@@ -1,161 +1,78 @@
-import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on the 'Tasks' button to navigate to the Gantt Chart Pro or task list
-        frame = context.pages[-1]
-        # Click on the 'Tasks' button to navigate to the Gantt Chart Pro or task list
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from case_support import (
+    BASE_URL,
+    close_task,
+    open_app,
+    open_task,
+    run_standalone,
+    scroll_to_bar,
+    scroll_to_task,
+    wait_for_gantt,
+)
 
-        # -> Drag the task '2. Basic Setup (All VPS)' to a new start date to test drag functionality
-        frame = context.pages[-1]
-        # Select the task '2. Basic Setup (All VPS)' to prepare for drag action
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[3]/div[2]/div[2]/div/div[113]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+TASK = "2. Basic Setup (All VPS)"
+OTHER_TASKS = ("0.2.3 Create DNS Records", "4.1 Deploy Grafana")
+DRAG_PX = 120
 
-        # -> Drag the task bar for '2. Basic Setup (All VPS)' in the Gantt chart to a new start date
-        frame = context.pages[-1]
-        # Close the task detail panel to enable dragging the task in the Gantt chart
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[3]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # -> Drag the task '2. Basic Setup (All VPS)' to a new start date to test drag functionality and verify backend update
-        frame = context.pages[-1]
-        # Select the task '2. Basic Setup (All VPS)' to prepare for drag action
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[3]/div[2]/div[2]/div/div[113]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+async def drag_right(page, handle, by_px):
+    """Press on the middle of ``handle`` and move the mouse ``by_px`` to the right."""
+    box = await handle.bounding_box()
+    x = box["x"] + box["width"] / 2
+    y = box["y"] + box["height"] / 2
+    await page.mouse.move(x, y)
+    await page.mouse.down()
+    await page.mouse.move(x + by_px, y, steps=10)
+    await page.mouse.up()
 
-        # -> Close the task detail panel to enable dragging the task in the Gantt chart
-        frame = context.pages[-1]
-        # Click Close button to close the task detail panel for '2. Basic Setup (All VPS)'
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[3]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # -> Drag the task bar for '2. Basic Setup (All VPS)' to a new start date on the Gantt chart
-        frame = context.pages[-1]
-        # Select the task bar for '2. Basic Setup (All VPS)' to drag it to a new start date
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[3]/div[2]/div[2]/div/div[113]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+async def run_case(context, base_url=BASE_URL):
+    page = await open_app(context, base_url)
 
-        # -> Close the task detail panel to enable dragging the task in the Gantt chart
-        frame = context.pages[-1]
-        # Click Close button to close the task detail panel for '2. Basic Setup (All VPS)' to enable drag and resize
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[3]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Interact with the page elements to simulate user flow
+    # -> Click on the 'Tasks' button to navigate to the Gantt Chart Pro or task list
+    frame = context.pages[-1]
+    # Click on the 'Tasks' button to navigate to the Gantt Chart Pro or task list
+    elem = frame.locator('xpath=html/body/div/div/div/div/nav/button[2]').nth(0)
+    await elem.click()
+    await wait_for_gantt(page)
 
-        # -> Reload the Tasks page to attempt to resolve the loading issue and display the Gantt chart properly
-        await page.goto('http://localhost:3000/#tasks', timeout=10000)
-        await asyncio.sleep(3)
-        
+    # -> Open the task detail panel of '2. Basic Setup (All VPS)' from its bar, then close it
+    modal = await open_task(page, TASK)
+    await expect(modal.get_by_role("heading", name=TASK)).to_be_visible()
+    await close_task(page)
 
-        # -> Drag the task '2. Basic Setup (All VPS)' to a new start date to test drag functionality and verify backend update
-        frame = context.pages[-1]
-        # Select the task '2. Basic Setup (All VPS)' to prepare for drag action
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[3]/div[2]/div[2]/div/div[113]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Reload the Tasks page and check the panel still opens and closes
+    await page.goto(f"{base_url.rstrip('/')}/#tasks")
+    await wait_for_gantt(page)
+    await open_task(page, TASK)
+    await close_task(page)
 
-        # -> Close the task detail panel to enable dragging the task in the Gantt chart
-        frame = context.pages[-1]
-        # Click Close button to close the task detail panel for '2. Basic Setup (All VPS)'
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[3]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Drag the task bar for '2. Basic Setup (All VPS)' to a later start date
+    bar = await scroll_to_bar(page, TASK)
+    await bar.hover()  # Waits until the bar has stopped scrolling
+    before = await bar.bounding_box()
+    await drag_right(page, bar, DRAG_PX)
+    await page.wait_for_function(
+        "([el, left]) => el.getBoundingClientRect().left > left + 10",
+        arg=[await bar.element_handle(), before["x"]],
+    )
 
-        # -> Drag the task '2. Basic Setup (All VPS)' to a new start date to test drag functionality and verify backend update
-        frame = context.pages[-1]
-        # Select the task '2. Basic Setup (All VPS)' bar in the Gantt chart to prepare for drag action
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[3]/div[2]/div[2]/div/div[113]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Resize the task bar for '2. Basic Setup (All VPS)' from its right edge
+    end_handle = bar.get_by_title("Drag to change end date ▶")
+    await end_handle.hover()
+    before = await bar.bounding_box()
+    await drag_right(page, end_handle, DRAG_PX)
+    await page.wait_for_function(
+        "([el, width]) => el.getBoundingClientRect().width > width + 10",
+        arg=[await bar.element_handle(), before["width"]],
+    )
 
-        # -> Close the task detail panel to enable dragging the task in the Gantt chart
-        frame = context.pages[-1]
-        # Click Close button to close the task detail panel for '2. Basic Setup (All VPS)'
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[3]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # --> Assertions to verify final state
+    for name in (TASK, *OTHER_TASKS):
+        await expect(await scroll_to_task(page, name)).to_be_visible(timeout=30000)
 
-        # -> Drag the task bar for '2. Basic Setup (All VPS)' to a new start date to test drag functionality and verify backend update
-        frame = context.pages[-1]
-        # Select the task bar for '2. Basic Setup (All VPS)' to drag it to a new start date
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[3]/div[2]/div[2]/div/div[113]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # -> Close the task detail panel to enable dragging the task in the Gantt chart
-        frame = context.pages[-1]
-        # Click Close button to close the task detail panel for '2. Basic Setup (All VPS)'
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[3]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=2. Basic Setup (All VPS)').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=0.2.3 Create DNS Records').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=4.1 Deploy Grafana').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    run_standalone(run_case)
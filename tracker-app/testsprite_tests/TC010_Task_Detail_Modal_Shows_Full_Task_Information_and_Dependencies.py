@@ -1,163 +1,65 @@
-import asyncio
-from playwright import async_api
-from playwright.async_api import expect
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on the 'Tasks' button to open the task view
-        frame = context.pages[-1]
-        # Click the 'Tasks' button to open the task view
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Open task detail modal for task '2. Basic Setup (All VPS)' to verify details and dependencies
-        frame = context.pages[-1]
-        # Click on task '2. Basic Setup (All VPS)' to open task detail modal
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[3]/div[2]/div[2]/div/div[113]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+import re
 
-        # -> Close this modal and open task detail modal for '0.2.3 Create DNS Records' to verify details and dependencies
-        frame = context.pages[-1]
-        # Click 'Close' button to close the current task detail modal
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[3]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from playwright.async_api import expect
 
-        # -> Close this modal and open task detail modal for '4.1 Deploy Grafana' to verify details and dependencies
-        frame = context.pages[-1]
-        # Click 'Close' button to close the current task detail modal
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/header/div/div/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from case_support import (
+    BASE_URL,
+    TOOLTIP_SELECTOR,
+    close_task,
+    open_app,
+    open_task,
+    run_standalone,
+    scroll_to_bar,
+    scroll_to_task,
+    wait_for_gantt,
+)
 
-        # -> Verify consistency of dependency information between tooltip and modal for all three tasks and report any inconsistencies
-        frame = context.pages[-1]
-        # Click 'Close' button to close the current task detail modal
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/header/div/div/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+TASKS = ("2. Basic Setup (All VPS)", "0.2.3 Create DNS Records", "4.1 Deploy Grafana")
+DEPENDS_ON = re.compile(r"Depends on \((\d+)\)")
 
-        # -> Manually verify tooltip dependency display for the 3 key tasks and report any inconsistencies or missing dependency information.
-        frame = context.pages[-1]
-        # Hover or click on task '2. Basic Setup (All VPS)' to trigger tooltip
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[2]/div/div[2]/div[2]/div[2]/div[2]/div[5]/div[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # -> Trigger tooltip for '4.1 Deploy Grafana' task to verify dependency display and consistency with modal
-        frame = context.pages[-1]
-        # Hover or click on task '4.1 Deploy Grafana' to trigger tooltip
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[2]/div/div[2]/div[2]/div[2]/div[2]/div[5]/div[29]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+async def run_case(context, base_url=BASE_URL):
+    page = await open_app(context, base_url)
 
-        # -> Close the '4.1 Deploy Grafana' modal and report the findings including the missing dependency details in this modal, and the tooltip inconsistency for '0.2.3 Create DNS Records'.
-        frame = context.pages[-1]
-        # Click 'Close' button to close the '4.1 Deploy Grafana' task detail modal
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[4]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Interact with the page elements to simulate user flow
+    # -> Click on the 'Tasks' button to open the task view
+    frame = context.pages[-1]
+    # Click the 'Tasks' button to open the task view
+    elem = frame.locator('xpath=html/body/div/div/div/div/nav/button[2]').nth(0)
+    await elem.click()
+    await wait_for_gantt(page)
 
-        # -> Try to adjust zoom level by clicking on zoom percentage buttons or other UI controls if available, or use alternative method to test zoom functionality and dependency arrow alignment.
-        frame = context.pages[-1]
-        # Click 'Day' button to check if it affects zoom or view and triggers dependency arrow redraw
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[2]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    for name in TASKS:
+        # -> Hover the task row to show its tooltip and read the dependency count
+        row = await scroll_to_task(page, name)
+        status = (await row.locator("span").last.inner_text()).strip()
+        await row.hover()
+        tooltip = page.locator(TOOLTIP_SELECTOR)
+        await expect(tooltip).to_contain_text(name)
+        match = DEPENDS_ON.search(await tooltip.inner_text())
 
-        frame = context.pages[-1]
-        # Click 'Week' button to check if it affects zoom or view and triggers dependency arrow redraw
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[2]/div[2]/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        # -> Open the task detail modal and verify details and dependencies match the list and tooltip
+        modal = await open_task(page, name)
+        await expect(modal.get_by_role("heading", name=name)).to_be_visible()
+        await expect(modal.get_by_text(status, exact=True).first).to_be_visible()
+        if match:
+            await expect(modal.get_by_text(match.group(0))).to_be_visible()
+        else:
+            await expect(modal.get_by_text(DEPENDS_ON)).to_have_count(0)
 
-        frame = context.pages[-1]
-        # Click 'Month' button to check if it affects zoom or view and triggers dependency arrow redraw
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[2]/div[2]/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        # -> Close the modal
+        await close_task(page)
 
-        # -> Perform drag and drop of a task and resize a task to verify that dependency arrows update correctly as per critical test TC006.
+    # -> Switch the view mode and check the bars are redrawn at every zoom level
+    for mode in ("Day", "Week", "Month"):
         frame = context.pages[-1]
-        # Click on task '2. Basic Setup (All VPS)' to select for drag and drop test
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[3]/div/div[2]/div[37]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await frame.get_by_role("button", name=mode, exact=True).click()
+        await scroll_to_bar(page, TASKS[0])
 
-        frame = context.pages[-1]
-        # Drag and drop task '2. Basic Setup (All VPS)' to a new position to test dependency arrow update
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[4]/div/div[2]/div[49]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # --> Assertions to verify final state
+    for name in TASKS:
+        await expect(await scroll_to_task(page, name)).to_be_visible(timeout=30000)
 
-        frame = context.pages[-1]
-        # Resize task '2. Basic Setup (All VPS)' to test dependency arrow update
-        elem = frame.locator('xpath=html/body/div/div/main/div[2]/main/div/div[4]/div/div[2]/div[49]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Status: PENDING').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Priority: MEDIUM').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=2. Basic Setup (All VPS)').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=0.2.3 Create DNS Records').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=4.1 Deploy Grafana').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=IN_PROGRESS').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=DONE').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    run_standalone(run_case)
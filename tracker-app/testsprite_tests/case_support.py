@@ -0,0 +1,169 @@
+"""Shared pieces for the TC00x cases, the concurrent runner and the benchmark.
+
+Cases expose ``async def run_case(context, base_url)`` and only drive pages
+inside the browser context they are given; launching browsers is left to
+``run_suite.py`` (many cases, one browser) or ``run_standalone`` (one case).
+Readiness is signalled by the app itself through ``data-testid`` attributes
+instead of fixed sleeps.
+"""
+
+import asyncio
+import os
+
+from playwright import async_api
+
+BASE_URL = os.environ.get("TRACKER_URL", "http://localhost:3000")
+
+BAR_SELECTOR = '[data-testid="gantt-bar"]'
+TIMELINE_SELECTOR = '[data-testid="gantt-timeline"]'
+MODAL_SELECTOR = '[data-testid="task-detail-modal"]'
+TASK_LIST_SELECTOR = '[data-testid="gantt-task-list"]'
+TASK_ROW_SELECTOR = '[data-testid="gantt-task-row"]'
+TOOLTIP_SELECTOR = '[data-testid="gantt-tooltip"]'
+
+BROWSER_ARGS = [
+    "--window-size=1280,720",
+    "--disable-dev-shm-usage",
+]
+VIEWPORT = {"width": 1280, "height": 720}
+DEFAULT_TIMEOUT_MS = 5000
+DATA_TIMEOUT_MS = 30000
+
+# Switches on the app's perf instrumentation (src/lib/perf.js) before its scripts run
+PERF_INIT_JS = "window.__TRACKER_PERF__ = true;"
+
+
+async def open_app(context, base_url=BASE_URL, page_name=""):
+    """Open the app (optionally on ``#tasks`` etc.) and wait for the DOM."""
+    page = await context.new_page()
+    target = base_url.rstrip("/") + (f"/#{page_name}" if page_name else "")
+    await page.goto(target, wait_until="domcontentloaded", timeout=DATA_TIMEOUT_MS)
+    return page
+
+
+async def wait_for_gantt(page):
+    """Gantt Chart Pro has loaded tasks once its first bar is attached."""
+    await page.locator(BAR_SELECTOR).first.wait_for(state="attached", timeout=DATA_TIMEOUT_MS)
+
+
+async def wait_for_modal(page, state="visible"):
+    await page.locator(MODAL_SELECTOR).wait_for(state=state, timeout=DATA_TIMEOUT_MS)
+
+
+def task_row(page, name):
+    """List row of the task called ``name`` (attached only while scrolled into view)."""
+    return page.locator(TASK_ROW_SELECTOR, has_text=name).first
+
+
+def task_bar(page, task_id):
+    return page.locator(f'{BAR_SELECTOR}[data-task-id="{task_id}"]')
+
+
+# Scroll the task list (the timeline follows it) without the app's smooth
+# scrolling: to the top, down by a share of the viewport, or to centre a row.
+# Resolves once the rows for the new offset have rendered; false if nothing moved.
+_SCROLL_TASK_LIST_JS = """([taskList, by, row]) => new Promise((resolve) => {
+    const before = taskList.scrollTop;
+    let top = by === null ? 0 : before + by * taskList.clientHeight;
+    if (row) {
+        const offset = row.getBoundingClientRect().top - taskList.getBoundingClientRect().top;
+        top = before + offset - (taskList.clientHeight - row.offsetHeight) / 2;
+    }
+    taskList.scrollTo({ top, behavior: "instant" });
+    const moved = taskList.scrollTop !== before;
+    requestAnimationFrame(() => requestAnimationFrame(() => resolve(moved)));
+})"""
+
+
+async def scroll_to_task(page, name):
+    """Centre the list row for ``name`` in view and return it.
+
+    The task list is windowed, so rows outside the viewport are not in the
+    DOM: page through it from the top until the row is mounted.
+    """
+    row = task_row(page, name)
+    task_list = await page.locator(TASK_LIST_SELECTOR).element_handle()
+    await page.evaluate(_SCROLL_TASK_LIST_JS, [task_list, None, None])
+    while await row.count() == 0:
+        if not await page.evaluate(_SCROLL_TASK_LIST_JS, [task_list, 0.8, None]):
+            raise AssertionError(f"Task {name!r} is not in the Gantt task list")
+    await page.evaluate(_SCROLL_TASK_LIST_JS, [task_list, 0, await row.element_handle()])
+    return row
+
+
+async def scroll_to_bar(page, name):
+    """Return the timeline bar of ``name`` once it is mounted.
+
+    Clicking the list row scrolls the timeline to the task, which mounts the bar.
+    """
+    row = await scroll_to_task(page, name)
+    await row.click()
+    bar = task_bar(page, await row.get_attribute("data-task-id"))
+    await bar.wait_for(state="visible", timeout=DATA_TIMEOUT_MS)
+    return bar
+
+
+async def open_task(page, name):
+    """Open the detail modal of ``name`` from its bar and return the modal."""
+    await (await scroll_to_bar(page, name)).click()
+    await wait_for_modal(page)
+    return page.locator(MODAL_SELECTOR)
+
+
+async def close_task(page):
+    await page.locator(MODAL_SELECTOR).get_by_role("button", name="Close", exact=True).click()
+    await wait_for_modal(page, state="detached")
+
+
+async def enable_perf(page):
+    """Turn on ``window.__trackerPerf`` for this page; call before ``page.goto``."""
+    await page.add_init_script(PERF_INIT_JS)
+
+
+async def read_perf(page, reset=False):
+    """Snapshot of ``window.__trackerPerf`` (measures, counters, requests, commits).
+
+    Returns None when the app was loaded without instrumentation. With
+    ``reset=True`` the next snapshot only covers what happens afterwards.
+    """
+    return await page.evaluate(
+        """(reset) => {
+            const perf = window.__trackerPerf;
+            if (!perf || !perf.enabled) return null;
+            const snapshot = perf.snapshot();
+            if (reset) perf.reset();
+            return snapshot;
+        }""",
+        reset,
+    )
+
+
+async def launch_browser(pw, headless=True):
+    return await pw.chromium.launch(headless=headless, args=BROWSER_ARGS)
+
+
+async def new_case_context(browser):
+    context = await browser.new_context(viewport=VIEWPORT)
+    context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    return context
+
+
+async def _standalone(case, base_url):
+    pw = await async_api.async_playwright().start()
+    browser = None
+    try:
+        browser = await launch_browser(pw)
+        context = await new_case_context(browser)
+        try:
+            await case(context, base_url)
+        finally:
+            await context.close()
+    finally:
+        if browser:
+            await browser.close()
+        await pw.stop()
+
+
+def run_standalone(case, base_url=BASE_URL):
+    """Entry point for running a single TC file directly."""
+    asyncio.run(_standalone(case, base_url))
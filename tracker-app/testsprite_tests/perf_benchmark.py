@@ -0,0 +1,428 @@
+"""Performance benchmark for Gantt Chart Pro.
+
+Runs alongside the TC00x functional scripts but records numbers instead of
+visibility checks:
+
+- time-to-first-bar after ``page.goto``
+- frame times and long tasks during Ctrl+wheel zoom (0.5x - 2x)
+- render time of Day/Week/Month view switches
+- drag-to-commit latency on a task bar
+- task detail modal open latency
+
+The app's own instrumentation (``window.__trackerPerf``, src/lib/perf.js) is
+switched on and read per scenario (load, zoom, view_switch, modal, drag):
+React commit time and count, Supabase requests and bytes, realtime events
+and time spent in the instrumented hot paths.
+
+Results are compared against a JSON baseline and the run fails (exit code 1)
+when any metric regresses beyond the allowed tolerance, or exceeds an absolute
+budget from ``perf_budgets.json`` (``{"metrics": {"load_requests": 12, ...}}``).
+
+Usage:
+    python perf_benchmark.py                     # compare against baseline
+    python perf_benchmark.py --update-baseline   # record a new baseline
+    python perf_benchmark.py --url http://localhost:3000 --runs 5
+    python perf_benchmark.py --budgets my_budgets.json
+
+The drag scenario writes task dates through the app, so point it at a
+throwaway project (or a local stand-in), not production data.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import re
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from playwright import async_api
+
+from case_support import (
+    BAR_SELECTOR,
+    MODAL_SELECTOR,
+    TIMELINE_SELECTOR,
+    VIEWPORT,
+    enable_perf,
+    launch_browser,
+    read_perf,
+)
+
+HERE = Path(__file__).resolve().parent
+DEFAULT_BASELINE = HERE / "perf_baseline.json"
+DEFAULT_BUDGETS = HERE / "perf_budgets.json"
+DEFAULT_RESULTS = HERE / "tmp" / "perf_results.json"
+
+DRAG_COMMIT_TOAST = re.compile(r"Task dates updated|Updated task")
+
+# Injected before any app script runs. Records when the first Gantt bar is
+# attached, and exposes a frame/long-task recorder the scenarios start/stop.
+INSTRUMENTATION_JS = """
+(() => {
+  const bench = {
+    firstBarAt: null,
+    frames: [],
+    longTasks: [],
+    recording: false,
+    lastFrame: null,
+  };
+  window.__bench = bench;
+
+  const observer = new MutationObserver(() => {
+    if (bench.firstBarAt === null && document.querySelector('[data-testid="gantt-bar"]')) {
+      bench.firstBarAt = performance.now();
+      observer.disconnect();
+    }
+  });
+  document.addEventListener('DOMContentLoaded', () => {
+    observer.observe(document.body, { childList: true, subtree: true });
+  });
+
+  try {
+    new PerformanceObserver((list) => {
+      if (!bench.recording) return;
+      for (const entry of list.getEntries()) {
+        bench.longTasks.push(entry.duration);
+      }
+    }).observe({ type: 'longtask', buffered: false });
+  } catch (e) {
+    // longtask entries are Chromium-only; frame times still work elsewhere
+  }
+
+  const tick = (now) => {
+    if (!bench.recording) return;
+    if (bench.lastFrame !== null) bench.frames.push(now - bench.lastFrame);
+    bench.lastFrame = now;
+    requestAnimationFrame(tick);
+  };
+
+  bench.start = () => {
+    bench.frames = [];
+    bench.longTasks = [];
+    bench.lastFrame = null;
+    bench.recording = true;
+    requestAnimationFrame(tick);
+  };
+
+  bench.stop = () => {
+    bench.recording = false;
+    return { frames: bench.frames.slice(), longTasks: bench.longTasks.slice() };
+  };
+
+  // Resolves after the next paint following the current task
+  bench.nextPaint = () => new Promise((resolve) => {
+    requestAnimationFrame(() => requestAnimationFrame(resolve));
+  });
+})();
+"""
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile; 0 for an empty sample."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return float(ordered[rank])
+
+
+def summarize_frames(sample, prefix):
+    frames = sample["frames"]
+    long_tasks = sample["longTasks"]
+    return {
+        f"{prefix}_frame_p95_ms": percentile(frames, 95),
+        f"{prefix}_frame_max_ms": float(max(frames)) if frames else 0.0,
+        f"{prefix}_long_task_count": float(len(long_tasks)),
+        f"{prefix}_long_task_total_ms": float(sum(long_tasks)),
+    }
+
+
+def summarize_perf(snapshot, prefix):
+    """Per-scenario totals from a ``window.__trackerPerf`` snapshot.
+
+    Async spans (``load:*``, ``sync:*``) wait on the network, so they are
+    reported apart from the synchronous hot paths they would double count.
+    """
+    if not snapshot:
+        return {}
+    measures = snapshot["measures"]
+    requests = snapshot["requests"].values()
+    app_commits = snapshot["commits"].get("app", {})
+    compute = [m["totalMs"] for name, m in measures.items() if not name.startswith(("load:", "sync:"))]
+    data = [m["totalMs"] for name, m in measures.items() if name.startswith(("load:", "sync:"))]
+    realtime = [count for name, count in snapshot["counters"].items()
+                if name.startswith("realtime:") and not name.endswith(":flushes")]
+    return {
+        f"{prefix}_react_commit_ms": float(app_commits.get("totalMs", 0.0)),
+        f"{prefix}_react_commits": float(app_commits.get("count", 0)),
+        f"{prefix}_requests": float(sum(r["count"] for r in requests)),
+        f"{prefix}_request_kb": sum(r["bytes"] for r in requests) / 1024.0,
+        f"{prefix}_compute_ms": float(sum(compute)),
+        f"{prefix}_data_ms": float(sum(data)),
+        f"{prefix}_realtime_events": float(sum(realtime)),
+    }
+
+
+async def open_gantt(context, url):
+    """Open the Tasks page (Gantt is its default view) and wait for bars."""
+    page = await context.new_page()
+    await page.add_init_script(INSTRUMENTATION_JS)
+    await enable_perf(page)
+    await page.goto(f"{url.rstrip('/')}/#tasks", wait_until="commit", timeout=30000)
+    await page.wait_for_selector(BAR_SELECTOR, state="attached", timeout=30000)
+    first_bar_ms = await page.evaluate("window.__bench.firstBarAt")
+    return page, float(first_bar_ms or 0.0)
+
+
+async def measure_zoom(page):
+    """Ctrl+wheel from the current zoom down to 0.5x, up to 2x and back."""
+    timeline = page.locator(TIMELINE_SELECTOR)
+    box = await timeline.bounding_box()
+    await page.mouse.move(box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
+
+    await page.evaluate("window.__bench.start()")
+    await page.keyboard.down("Control")
+    try:
+        # Zoom steps are 0.1 and clamp at [0.5, 2]; overshoot to hit both ends
+        for delta, steps in ((100, 16), (-100, 16), (100, 6)):
+            for _ in range(steps):
+                await page.mouse.wheel(0, delta)
+                await page.evaluate("window.__bench.nextPaint()")
+    finally:
+        await page.keyboard.up("Control")
+    sample = await page.evaluate("window.__bench.stop()")
+    return summarize_frames(sample, "zoom")
+
+
+async def measure_view_switches(page):
+    """Time from clicking a view-mode button to the following paint."""
+    timings = {}
+    await page.evaluate("window.__bench.start()")
+    for mode in ("Week", "Month", "Day"):
+        duration = await page.evaluate(
+            """async (label) => {
+                const button = [...document.querySelectorAll('button')]
+                  .find((b) => b.textContent.trim() === label);
+                if (!button) return null;
+                const start = performance.now();
+                button.click();
+                await window.__bench.nextPaint();
+                return performance.now() - start;
+            }""",
+            mode,
+        )
+        if duration is not None:
+            timings[f"view_switch_{mode.lower()}_ms"] = float(duration)
+    sample = await page.evaluate("window.__bench.stop()")
+    timings.update(summarize_frames(sample, "view_switch"))
+    return timings
+
+
+async def find_draggable_bar(page):
+    """First regular bar without unfinished dependencies (drag is blocked otherwise)."""
+    bars = page.locator(BAR_SELECTOR)
+    count = await bars.count()
+    for index in range(count):
+        bar = bars.nth(index)
+        text = await bar.inner_text()
+        if "🚫" in text or "⬅️" in text:
+            continue
+        box = await bar.bounding_box()
+        if box and box["width"] > 20:
+            return bar, box
+    return None, None
+
+
+async def drag_bar(page, box, offset_x):
+    start_x = box["x"] + box["width"] / 2
+    start_y = box["y"] + box["height"] / 2
+    await page.mouse.move(start_x, start_y)
+    await page.mouse.down()
+    await page.mouse.move(start_x + offset_x, start_y, steps=10)
+    started = time.perf_counter()
+    await page.mouse.up()
+    await page.get_by_text(DRAG_COMMIT_TOAST).first.wait_for(state="visible", timeout=15000)
+    return (time.perf_counter() - started) * 1000.0
+
+
+async def measure_drag_commit(page):
+    """Drag a bar right then back, timing mouseup -> commit toast."""
+    # Decline "auto-adjust dependents" prompts so only the dragged task moves
+    page.on("dialog", lambda dialog: asyncio.ensure_future(dialog.dismiss()))
+
+    bar, box = await find_draggable_bar(page)
+    if bar is None:
+        return {}
+
+    await bar.scroll_into_view_if_needed()
+    box = await bar.bounding_box()
+    forward = await drag_bar(page, box, 120)
+    # Wait for the first toast to go away so the second wait sees a fresh one
+    await page.get_by_text(DRAG_COMMIT_TOAST).first.wait_for(state="hidden", timeout=15000)
+    box = await bar.bounding_box()
+    backward = await drag_bar(page, box, -120)
+    return {"drag_commit_ms": statistics.median([forward, backward])}
+
+
+async def measure_modal_open(page, repeats=3):
+    """Click a bar and time until the task detail modal is visible."""
+    timings = []
+    bars = page.locator(BAR_SELECTOR)
+    for index in range(min(repeats, await bars.count())):
+        bar = bars.nth(index)
+        await bar.scroll_into_view_if_needed()
+        started = time.perf_counter()
+        await bar.click()
+        await page.locator(MODAL_SELECTOR).wait_for(state="visible", timeout=10000)
+        timings.append((time.perf_counter() - started) * 1000.0)
+        await page.keyboard.press("Escape")
+        await page.locator(MODAL_SELECTOR).wait_for(state="detached", timeout=10000)
+    return {"modal_open_ms": statistics.median(timings)} if timings else {}
+
+
+SCENARIOS = (
+    ("zoom", measure_zoom),
+    ("view_switch", measure_view_switches),
+    ("modal", measure_modal_open),
+    ("drag", measure_drag_commit),
+)
+
+
+async def run_once(browser, url):
+    """One pass over every scenario: (metrics, app perf snapshot per scenario)."""
+    context = await browser.new_context(viewport=VIEWPORT)
+    context.set_default_timeout(10000)
+    try:
+        page, first_bar_ms = await open_gantt(context, url)
+        metrics = {"time_to_first_bar_ms": first_bar_ms}
+        snapshots = {"load": await read_perf(page, reset=True)}
+        for name, scenario in SCENARIOS:
+            metrics.update(await scenario(page))
+            snapshots[name] = await read_perf(page, reset=True)
+        for name, snapshot in snapshots.items():
+            metrics.update(summarize_perf(snapshot, name))
+        return metrics, snapshots
+    finally:
+        await context.close()
+
+
+async def collect(url, runs):
+    pw = await async_api.async_playwright().start()
+    browser = None
+    try:
+        browser = await launch_browser(pw)
+        results = [await run_once(browser, url) for _ in range(runs)]
+    finally:
+        if browser:
+            await browser.close()
+        await pw.stop()
+
+    # Median per metric across runs; a metric missing from a run is skipped
+    samples = [metrics for metrics, _ in results]
+    names = sorted({name for sample in samples for name in sample})
+    medians = {
+        name: statistics.median([s[name] for s in samples if name in s])
+        for name in names
+    }
+    # Raw snapshots of the last run, for digging into a regression
+    return medians, results[-1][1]
+
+
+def compare(metrics, baseline, tolerance, slack_ms, slack_count=1.0):
+    """Return a list of human-readable regressions against the baseline.
+
+    ``slack_ms`` is added to the limit of timings (``*_ms``), ``slack_count``
+    to everything else (commits, requests, events, KB).
+    """
+    regressions = []
+    for name, expected in baseline.get("metrics", {}).items():
+        if name not in metrics:
+            regressions.append(f"{name}: missing from this run (baseline {expected:.1f})")
+            continue
+        slack = slack_ms if name.endswith("_ms") else slack_count
+        limit = expected * (1 + tolerance) + slack
+        if metrics[name] > limit:
+            regressions.append(
+                f"{name}: {metrics[name]:.1f} > {limit:.1f} (baseline {expected:.1f})"
+            )
+    return regressions
+
+
+def check_budgets(metrics, budgets):
+    """Return a list of metrics above their absolute budget."""
+    failures = []
+    for name, limit in budgets.get("metrics", {}).items():
+        if name in metrics and metrics[name] > limit:
+            failures.append(f"{name}: {metrics[name]:.1f} > budget {limit:.1f}")
+    return failures
+
+
+def write_json(path, payload):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:3000")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--budgets", type=Path, default=DEFAULT_BUDGETS,
+                        help="absolute per-metric limits, checked when the file exists")
+    parser.add_argument("--results", type=Path, default=DEFAULT_RESULTS)
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative slowdown per metric (default 0.25)")
+    parser.add_argument("--slack-ms", type=float, default=5.0,
+                        help="absolute allowance added to every *_ms limit (default 5)")
+    parser.add_argument("--slack-count", type=float, default=1.0,
+                        help="absolute allowance added to count and size limits (default 1)")
+    parser.add_argument("--update-baseline", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    metrics, snapshots = asyncio.run(collect(args.url, max(1, args.runs)))
+    report = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "url": args.url,
+        "runs": args.runs,
+        "metrics": metrics,
+    }
+    write_json(args.results, {**report, "perf": snapshots})
+
+    for name, value in metrics.items():
+        print(f"{name:32s} {value:10.1f}")
+
+    over_budget = []
+    if args.budgets.exists():
+        budgets = json.loads(args.budgets.read_text(encoding="utf-8"))
+        over_budget = check_budgets(metrics, budgets)
+        if over_budget:
+            print("Over budget:")
+            for line in over_budget:
+                print(f"  - {line}")
+
+    if args.update_baseline or not args.baseline.exists():
+        write_json(args.baseline, report)
+        print(f"Baseline written to {args.baseline}")
+        return 1 if over_budget else 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(metrics, baseline, args.tolerance, args.slack_ms, args.slack_count)
+    if regressions:
+        print("Performance regressions:")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    if over_budget:
+        return 1
+    print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
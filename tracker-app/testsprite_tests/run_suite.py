@@ -0,0 +1,168 @@
+"""Run the testsprite cases concurrently against one shared browser.
+
+Every case in ``testsprite_frontend_test_plan.json`` that has a
+``TC00x_*.py`` script runs in its own browser context, up to ``--workers``
+at a time. Each context records a Playwright trace; traces are kept for
+failed cases (or for all with ``--trace on``). Per-case timings and
+outcomes are written to ``tmp/suite_results.json``.
+
+Usage:
+    python run_suite.py                          # whole plan, 4 workers
+    python run_suite.py --cases TC003,TC010 --workers 2
+    python run_suite.py --standin-tasks 5000     # also serve the offline stand-in
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import sys
+import time
+import traceback
+from datetime import datetime, timezone
+from pathlib import Path
+
+from playwright import async_api
+
+from case_support import BASE_URL, launch_browser, new_case_context
+
+HERE = Path(__file__).resolve().parent
+PLAN = HERE / "testsprite_frontend_test_plan.json"
+RESULTS = HERE / "tmp" / "suite_results.json"
+TRACES = HERE / "tmp" / "traces"
+
+
+def discover_cases(plan_path):
+    """Map plan entries to their scripts; entries without one are reported as missing."""
+    plan = json.loads(plan_path.read_text(encoding="utf-8"))
+    scripts = {path.name.split("_", 1)[0]: path for path in HERE.glob("TC[0-9]*_*.py")}
+    return [(entry["id"], entry["title"], scripts.get(entry["id"])) for entry in plan]
+
+
+def load_case(path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.run_case
+
+
+async def run_one(browser, case_id, title, path, args, semaphore):
+    result = {"id": case_id, "title": title, "script": path.name if path else None}
+    if path is None:
+        result.update(status="missing", duration_ms=0.0)
+        return result
+
+    async with semaphore:
+        started = time.perf_counter()
+        context = await new_case_context(browser)
+        tracing = args.trace != "off"
+        if tracing:
+            await context.tracing.start(title=case_id, screenshots=True, snapshots=True)
+        try:
+            case = load_case(path)
+            await asyncio.wait_for(case(context, args.url), timeout=args.timeout)
+            result["status"] = "passed"
+        except AssertionError as error:
+            result.update(status="failed", error=str(error))
+        except asyncio.TimeoutError:
+            result.update(status="failed", error=f"timed out after {args.timeout:.0f}s")
+        except Exception as error:  # noqa: BLE001 - any case error is a result, not a runner crash
+            result.update(status="error", error=f"{type(error).__name__}: {error}",
+                          traceback=traceback.format_exc())
+        finally:
+            result["duration_ms"] = (time.perf_counter() - started) * 1000.0
+            if tracing:
+                if args.trace == "on" or result["status"] != "passed":
+                    TRACES.mkdir(parents=True, exist_ok=True)
+                    trace_path = TRACES / f"{case_id}.zip"
+                    await context.tracing.stop(path=str(trace_path))
+                    result["trace"] = str(trace_path.relative_to(HERE))
+                else:
+                    await context.tracing.stop()
+            await context.close()
+
+    print(f"  {case_id} {result['status']:7s} {result['duration_ms'] / 1000:6.1f}s  {title}", flush=True)
+    return result
+
+
+async def run_suite(cases, args):
+    pw = await async_api.async_playwright().start()
+    browser = None
+    try:
+        browser = await launch_browser(pw, headless=not args.headed)
+        semaphore = asyncio.Semaphore(max(1, args.workers))
+        return await asyncio.gather(*(
+            run_one(browser, case_id, title, path, args, semaphore)
+            for case_id, title, path in cases
+        ))
+    finally:
+        if browser:
+            await browser.close()
+        await pw.stop()
+
+
+def start_standin(task_count):
+    from supabase_standin import StandIn, generate_dataset
+
+    standin = StandIn(generate_dataset(tasks=task_count), port=54321).start_in_thread()
+    print(f"Supabase stand-in on {standin.url} with {task_count} tasks "
+          "(the dev server must run with `npm run dev:standin`)")
+    return standin
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=BASE_URL)
+    parser.add_argument("--plan", type=Path, default=PLAN)
+    parser.add_argument("--cases", help="comma separated ids, e.g. TC003,TC006")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--timeout", type=float, default=120.0, help="per-case timeout in seconds")
+    parser.add_argument("--trace", choices=("off", "on", "retain-on-failure"), default="retain-on-failure")
+    parser.add_argument("--results", type=Path, default=RESULTS)
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--standin-tasks", type=int, help="serve the offline stand-in with this many tasks")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cases = discover_cases(args.plan)
+    if args.cases:
+        wanted = {case_id.strip() for case_id in args.cases.split(",")}
+        cases = [case for case in cases if case[0] in wanted]
+
+    standin = start_standin(args.standin_tasks) if args.standin_tasks else None
+    print(f"Running {sum(1 for c in cases if c[2])} of {len(cases)} cases with {args.workers} workers")
+    started = time.perf_counter()
+    try:
+        results = asyncio.run(run_suite(cases, args))
+    finally:
+        if standin:
+            standin.stop()
+    wall_ms = (time.perf_counter() - started) * 1000.0
+
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    report = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "url": args.url,
+        "workers": args.workers,
+        "wall_ms": wall_ms,
+        "summed_case_ms": sum(r["duration_ms"] for r in results),
+        "counts": counts,
+        "results": results,
+    }
+    args.results.parent.mkdir(parents=True, exist_ok=True)
+    args.results.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    print(f"\n{', '.join(f'{n} {s}' for s, n in sorted(counts.items()))} "
+          f"in {wall_ms / 1000:.1f}s (cases summed {report['summed_case_ms'] / 1000:.1f}s)")
+    for result in results:
+        if result["status"] in ("failed", "error"):
+            print(f"  {result['id']}: {result.get('error')}")
+    return 1 if counts.get("failed") or counts.get("error") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""Offline stand-in for the tracker's Supabase project.
+
+Serves PostgREST-compatible REST, the RPCs the app calls and Supabase
+Realtime ``postgres_changes`` over a websocket, backed by a synthetic dataset
+of configurable size, so the Playwright scripts and benchmarks run without
+network access or production data.
+
+Start it with ``python -m supabase_standin --tasks 10000`` from the
+``testsprite_tests`` directory, then run the app with ``npm run dev:standin``
+(``vite --mode standin``), which reads the URL and key from ``.env.standin``
+and leaves ``.env.local`` alone::
+
+    VITE_SUPABASE_URL=http://127.0.0.1:54321
+    VITE_SUPABASE_KEY=standin
+
+It can also run in-process::
+
+    standin = StandIn(generate_dataset(tasks=10000)).start_in_thread()
+    ...
+    standin.stop()
+"""
+
+from .datagen import generate_dataset
+from .server import StandIn
+from .store import Store
+
+__all__ = ["StandIn", "Store", "generate_dataset"]
@@ -0,0 +1,60 @@
+"""Command line entry point: ``python -m supabase_standin``."""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from .datagen import generate_dataset
+from .server import StandIn
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Offline Supabase stand-in for the tracker app")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--tasks", type=int, default=1000, help="number of tasks (default 1000)")
+    parser.add_argument("--phases", type=int, default=None)
+    parser.add_argument("--dependency-density", type=float, default=0.35,
+                        help="probability that a task has predecessors (default 0.35)")
+    parser.add_argument("--max-dependencies", type=int, default=3)
+    parser.add_argument("--parent-ratio", type=float, default=0.25)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency-ms", type=float, default=0,
+                        help="artificial delay added to every HTTP response")
+    parser.add_argument("--dataset", type=Path, help="load tables from a JSON file instead of generating")
+    parser.add_argument("--dump", type=Path, help="write the generated dataset to JSON and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.dataset:
+        dataset = json.loads(args.dataset.read_text(encoding="utf-8"))
+    else:
+        dataset = generate_dataset(
+            tasks=args.tasks,
+            phases=args.phases,
+            dependency_density=args.dependency_density,
+            max_dependencies=args.max_dependencies,
+            parent_ratio=args.parent_ratio,
+            seed=args.seed,
+        )
+    if args.dump:
+        args.dump.write_text(json.dumps(dataset, indent=1), encoding="utf-8")
+        print(f"Wrote {len(dataset['tasks'])} tasks to {args.dump}")
+        return 0
+
+    standin = StandIn(dataset, host=args.host, port=args.port, latency_ms=args.latency_ms)
+    print(f"Supabase stand-in on {standin.url} with {len(dataset['tasks'])} tasks "
+          f"({len(dataset['phases'])} phases)")
+    try:
+        asyncio.run(standin.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
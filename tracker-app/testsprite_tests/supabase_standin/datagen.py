@@ -0,0 +1,241 @@
+"""Synthetic tracker datasets: phases, parent/child trees and dependency DAGs.
+
+The generated rows use the same column names as the hosted project so every
+view and script can read them unchanged. Generation is deterministic for a
+given seed.
+"""
+
+import random
+from datetime import date, datetime, time, timedelta, timezone
+
+STATUSES = ("PENDING", "IN_PROGRESS", "DONE")
+PRIORITIES = ("HIGH", "MEDIUM", "LOW")
+AGENTS = ("Cascade", "DevOps Commander", "Data Orchestrator", "QA Sentinel")
+HUMANS = ("founder@codia.vn", "ops@codia.vn")
+AI_LOG_STATUSES = ("started", "progress", "completed", "failed")
+PHASE_THEMES = (
+    "Infrastructure", "Capabilities", "Operations", "Observability", "Security",
+    "Data Platform", "AI Agents", "CI/CD", "Backup & DR", "Compliance",
+)
+TASK_VERBS = ("Deploy", "Configure", "Harden", "Migrate", "Benchmark", "Document", "Automate", "Verify")
+TASK_OBJECTS = (
+    "Grafana", "DNS Records", "Postgres replica", "VPS firewall", "MinIO bucket", "Traefik routes",
+    "Vault secrets", "Redis cluster", "Agent runtime", "Backup schedule", "CI runners", "Loki pipeline",
+)
+# Hosted tasks the TestSprite cases look up: (position in the task list, name,
+# the named task it depends on). Spread out so that finding them has to page
+# through the windowed list.
+NAMED_TASKS = (
+    (0.05, "0.2.3 Create DNS Records", None),
+    (0.35, "2. Basic Setup (All VPS)", None),
+    (0.7, "4.1 Deploy Grafana", "0.2.3 Create DNS Records"),
+)
+
+
+def _iso(moment):
+    return moment.astimezone(timezone.utc).isoformat()
+
+
+def _at_midnight(day):
+    return datetime.combine(day, time(0, 0), tzinfo=timezone.utc)
+
+
+def generate_dataset(tasks=1000, phases=None, dependency_density=0.35, max_dependencies=3,
+                     dependency_window=60, parent_ratio=0.25, seed=42, today=None):
+    """Build a dict of table name -> list of rows.
+
+    Args:
+        tasks: number of task rows.
+        phases: number of phases (defaults to roughly one per 150 tasks, 3..20).
+        dependency_density: probability that a task depends on earlier tasks.
+        max_dependencies: upper bound on ``depends_on`` entries per task.
+        dependency_window: predecessors are drawn from this many preceding tasks,
+            which keeps chains realistic and guarantees an acyclic graph.
+        parent_ratio: share of tasks that are children of another task.
+        seed: RNG seed.
+        today: anchor date for statuses (defaults to the current date).
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    now = datetime.now(timezone.utc)
+    phase_count = phases or max(3, min(20, tasks // 150 or 1))
+
+    # Spread the project so roughly 40% of it lies in the past
+    project_days = max(60, int(tasks ** 0.5 * 12))
+    project_start = today - timedelta(days=int(project_days * 0.4))
+    phase_span = project_days / phase_count
+
+    phase_rows = []
+    for index in range(phase_count):
+        theme = PHASE_THEMES[index % len(PHASE_THEMES)]
+        phase_rows.append({
+            "id": index + 1,
+            "name": f"Phase {index + 1}: {theme}",
+            "description": f"{theme} workstream",
+            "week_start": int(index * phase_span // 7) + 1,
+            "week_end": int((index + 1) * phase_span // 7) + 1,
+            "status": "PENDING",
+            "progress": 0,
+            "order_index": index + 1,
+            "kpi": f"{theme} KPIs met",
+            "deliverable": f"{theme} ready",
+            "created_at": _iso(now),
+            "updated_at": _iso(now),
+        })
+
+    sprint_rows = []
+    sprint_start = today - timedelta(days=28)
+    for index in range(4):
+        start = sprint_start + timedelta(days=14 * index)
+        end = start + timedelta(days=13)
+        status = "COMPLETED" if end < today else "ACTIVE" if start <= today <= end else "PLANNED"
+        sprint_rows.append({
+            "id": index + 1,
+            "name": f"Sprint {start.isoformat()}",
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "goal": f"Sprint goal {index + 1}",
+            "status": status,
+            "planned_tasks": 0,
+            "completed_tasks": 0,
+            "total_estimated_hours": 0,
+            "total_actual_hours": 0,
+            "velocity": None,
+            "created_at": _iso(now),
+            "updated_at": _iso(now),
+        })
+
+    named = {int(tasks * fraction): name for fraction, name, _ in NAMED_TASKS}
+    task_rows = []
+    ends = {}
+    for index in range(tasks):
+        task_id = index + 1
+        phase_index = min(phase_count - 1, int(index * phase_count / tasks))
+        phase_id = phase_index + 1
+
+        depends_on = []
+        if index and rng.random() < dependency_density:
+            low = max(0, index - dependency_window)
+            pool = range(low + 1, index + 1)
+            count = rng.randint(1, min(max_dependencies, len(pool)))
+            depends_on = sorted(rng.sample(pool, count))
+
+        parent_id = None
+        if index and rng.random() < parent_ratio:
+            # Parents come from the same phase so trees stay inside one phase
+            candidates = [t for t in task_rows[-20:] if t["phase_id"] == phase_id and t["parent_id"] is None]
+            if candidates:
+                parent_id = rng.choice(candidates)["id"]
+
+        estimated_hours = rng.choice((2, 4, 4, 8, 8, 16, 24, 40))
+        duration = max(1, -(-estimated_hours // 8))
+        phase_offset = int(phase_index * phase_span + rng.random() * phase_span * 0.5)
+        start = project_start + timedelta(days=phase_offset)
+        if depends_on:
+            start = max(start, max(ends[d] for d in depends_on) + timedelta(days=1))
+        end = start + timedelta(days=duration)
+        ends[task_id] = end
+
+        if end < today:
+            status = "DONE"
+        elif start <= today:
+            status = "IN_PROGRESS"
+        else:
+            status = "PENDING"
+
+        is_milestone = rng.random() < 0.03
+        assigned_type = "AI" if rng.random() < 0.55 else "HUMAN"
+        started_at = _iso(_at_midnight(start) + timedelta(hours=9)) if status != "PENDING" else None
+        completed_at = _iso(_at_midnight(end) + timedelta(hours=17)) if status == "DONE" else None
+        progress = 100 if status == "DONE" else rng.choice((10, 25, 50, 75)) if status == "IN_PROGRESS" else 0
+        sprint_id = None
+        for sprint in sprint_rows:
+            if sprint["start_date"] <= start.isoformat() <= sprint["end_date"]:
+                sprint_id = sprint["id"]
+
+        name = f"{phase_id}.{index + 1} {rng.choice(TASK_VERBS)} {rng.choice(TASK_OBJECTS)}"
+        name = named.get(index, name)
+        task_rows.append({
+            "id": task_id,
+            "phase_id": phase_id,
+            "name": name,
+            "description": f"{name} for phase {phase_id}",
+            "status": status,
+            "priority": rng.choice(PRIORITIES),
+            "complexity": rng.randint(1, 5),
+            "estimated_hours": estimated_hours,
+            "actual_hours": round(estimated_hours * rng.uniform(0.6, 1.4), 1) if status == "DONE" else None,
+            "assigned_type": assigned_type,
+            "assigned_to": rng.choice(AGENTS) if assigned_type == "AI" else rng.choice(HUMANS),
+            "order_index": index + 1,
+            "week": int(phase_offset // 7) + 1,
+            "task_type": "MILESTONE" if is_milestone else "TASK",
+            "parent_id": parent_id,
+            "depends_on": depends_on,
+            "start_date": start.isoformat(),
+            "due_date": end.isoformat(),
+            "start_datetime": _iso(_at_midnight(start)),
+            "due_datetime": _iso(_at_midnight(end)),
+            "baseline_start_date": start.isoformat(),
+            "baseline_end_date": end.isoformat(),
+            "started_at": started_at,
+            "completed_at": completed_at,
+            "progress_percentage": progress,
+            "is_milestone": is_milestone,
+            "milestone_description": f"{name} reached" if is_milestone else None,
+            "sprint_id": sprint_id,
+            "notes": "",
+            "created_at": _iso(now),
+            "updated_at": _iso(now),
+        })
+
+    # Named tasks are plain bars with fixed dependencies (so they can be dragged)
+    named_ids = {task_rows[index]["name"]: index + 1 for index in named if index < tasks}
+    for _, name, predecessor in NAMED_TASKS:
+        if name in named_ids:
+            task_rows[named_ids[name] - 1].update({
+                "depends_on": [named_ids[predecessor]] if predecessor in named_ids else [],
+                "is_milestone": False,
+                "milestone_description": None,
+                "task_type": "TASK",
+            })
+
+    by_phase = {}
+    for task in task_rows:
+        by_phase.setdefault(task["phase_id"], []).append(task)
+    for phase in phase_rows:
+        phase_tasks = by_phase.get(phase["id"], [])
+        done = sum(1 for t in phase_tasks if t["status"] == "DONE")
+        phase["progress"] = round(done * 100 / len(phase_tasks)) if phase_tasks else 0
+        phase["status"] = ("DONE" if phase_tasks and done == len(phase_tasks)
+                           else "IN_PROGRESS" if done or any(t["status"] == "IN_PROGRESS" for t in phase_tasks)
+                           else "PENDING")
+
+    active = [t for t in task_rows if t["status"] != "PENDING" and t["assigned_type"] == "AI"]
+    log_rows = []
+    for index, task in enumerate(rng.sample(active, min(len(active), 200))):
+        status = rng.choice(AI_LOG_STATUSES)
+        log_rows.append({
+            "id": index + 1,
+            "task_id": task["id"],
+            "agent_name": task["assigned_to"],
+            "action": f"Working on {task['name']}",
+            "status": status,
+            "current_step": None if status == "completed" else "Applying configuration",
+            "progress_percentage": 100 if status == "completed" else rng.choice((10, 40, 70)),
+            "timestamp": _iso(now - timedelta(minutes=rng.randint(1, 60 * 24 * 7))),
+        })
+    log_rows.sort(key=lambda row: row["timestamp"])
+
+    return {
+        "phases": phase_rows,
+        "tasks": task_rows,
+        "sprints": sprint_rows,
+        "logs": [
+            {"id": 1, "timestamp": _iso(now), "action": "Dataset generated",
+             "details": f"{tasks} tasks / {phase_count} phases", "status": "SUCCESS"},
+        ],
+        "ai_execution_logs": log_rows,
+        "ai_recommendations": [],
+        "gap_analysis": [],
+    }
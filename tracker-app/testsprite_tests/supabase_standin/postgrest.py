@@ -0,0 +1,326 @@
+"""The subset of the PostgREST query language the tracker uses.
+
+Covers ``select`` with embedded resources, horizontal filters (including
+``not.`` and nested ``or``/``and`` groups), ``order``, ``limit``/``offset``
+and ``Range`` headers, which is everything supabase-js emits for this app.
+"""
+
+import re
+from datetime import datetime, timezone
+
+RESERVED_PARAMS = {"select", "order", "limit", "offset", "on_conflict", "columns", "or", "and"}
+
+# (table, embedded resource) -> (local column, remote column, to-one?)
+RELATIONSHIPS = {
+    ("ai_execution_logs", "tasks"): ("task_id", "id", True),
+    ("tasks", "phases"): ("phase_id", "id", True),
+    ("tasks", "sprints"): ("sprint_id", "id", True),
+    ("tasks_with_dependencies", "phases"): ("phase_id", "id", True),
+    ("tracker_app_data", "phases"): ("phase_id", "id", True),
+    ("phases", "tasks"): ("id", "phase_id", False),
+    ("sprints", "tasks"): ("id", "sprint_id", False),
+    ("tasks", "ai_execution_logs"): ("id", "task_id", False),
+}
+
+
+class QueryError(Exception):
+    """Raised for requests PostgREST would reject; carries its error payload."""
+
+    def __init__(self, message, code="PGRST100", status=400, details=None, hint=None):
+        super().__init__(message)
+        self.status = status
+        self.payload = {"code": code, "message": message, "details": details, "hint": hint}
+
+
+def split_top_level(text, separator=","):
+    """Split on ``separator`` outside parentheses, braces and double quotes."""
+    parts, depth, quoted, current = [], 0, False, []
+    for char in text:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char in "({":
+            depth += 1
+        elif not quoted and char in ")}":
+            depth -= 1
+        if char == separator and depth == 0 and not quoted:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    if current or parts:
+        parts.append("".join(current))
+    return parts
+
+
+# ---------------------------------------------------------------------------
+# select
+# ---------------------------------------------------------------------------
+
+def parse_select(text):
+    """Return a list of ``(alias, column)`` or ``(alias, (resource, children))``."""
+    items = []
+    for raw in split_top_level(text or "*"):
+        raw = raw.strip()
+        if not raw:
+            continue
+        alias = None
+        match = re.match(r"^([A-Za-z_][\w]*):(?!:)(.*)$", raw)
+        if match:
+            alias, raw = match.group(1), match.group(2)
+        if raw.endswith(")") and "(" in raw:
+            head, inner = raw[:-1].split("(", 1)
+            resource = head.split("!", 1)[0]
+            items.append((alias or resource, (resource, parse_select(inner))))
+        else:
+            column = raw.split("::", 1)[0].split("->", 1)[0]
+            items.append((alias or column, column))
+    return items
+
+
+def project(table, rows, select_items, resolve_table):
+    if select_items == [("*", "*")]:
+        return [dict(row) for row in rows]
+    embeds = {}
+    for alias, column in select_items:
+        if isinstance(column, tuple):
+            resource, _ = column
+            relation = RELATIONSHIPS.get((table, resource))
+            if relation is None:
+                raise QueryError(
+                    f"Could not find a relationship between '{table}' and '{resource}' in the schema cache",
+                    code="PGRST200", status=400,
+                )
+            local, remote, to_one = relation
+            index = {}
+            for candidate in resolve_table(resource):
+                index.setdefault(candidate.get(remote), []).append(candidate)
+            embeds[alias] = (index, local, to_one, resource)
+
+    projected = []
+    for row in rows:
+        out = {}
+        for alias, column in select_items:
+            if column == "*":
+                out.update(row)
+            elif isinstance(column, tuple):
+                index, local, to_one, resource = embeds[alias]
+                matches = index.get(row.get(local), [])
+                children = project(resource, matches, column[1], resolve_table)
+                out[alias] = (children[0] if children else None) if to_one else children
+            else:
+                out[alias] = row.get(column)
+        projected.append(out)
+    return projected
+
+
+# ---------------------------------------------------------------------------
+# filters
+# ---------------------------------------------------------------------------
+
+def _unquote(value):
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"')
+    return value
+
+
+def _coerce(raw, sample):
+    """Convert a filter literal to the type of the column it is compared with."""
+    if raw == "null":
+        return None
+    if isinstance(sample, bool):
+        return raw.lower() == "true"
+    if isinstance(sample, (int, float)) or sample is None:
+        try:
+            return int(raw)
+        except ValueError:
+            try:
+                return float(raw)
+            except ValueError:
+                return raw
+    return raw
+
+
+def _parse_array(raw):
+    inner = raw.strip()[1:-1]
+    return [_unquote(v.strip()) for v in split_top_level(inner)] if inner else []
+
+
+def _like(pattern, value, flags=0):
+    regex = "^" + re.escape(pattern).replace(r"\*", ".*").replace("%", ".*").replace("_", ".") + "$"
+    return value is not None and re.match(regex, str(value), flags | re.S) is not None
+
+
+def _as_timestamp(value):
+    """ISO timestamp string -> aware datetime (``Z`` and ``+00:00`` compare equal)."""
+    if not isinstance(value, str) or len(value) < 19 or value[10:11] != "T":
+        return None
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def _compare(value, op, raw):
+    if op == "is":
+        token = raw.lower()
+        if token == "null":
+            return value is None
+        if token in ("true", "false"):
+            return value is (token == "true")
+        raise QueryError(f'"failed to parse filter (is.{raw})"')
+    if op == "in":
+        options = [_unquote(v.strip()) for v in split_top_level(raw.strip()[1:-1])]
+        return value in [_coerce(o, value) for o in options]
+    if op in ("cs", "cd", "ov"):
+        wanted = [_coerce(v, (value or [None])[0]) for v in _parse_array(raw)]
+        have = value or []
+        if op == "cs":
+            return all(w in have for w in wanted)
+        if op == "cd":
+            return all(h in wanted for h in have)
+        return any(w in have for w in wanted)
+    if op == "like":
+        return _like(raw, value)
+    if op == "ilike":
+        return _like(raw, value, re.I)
+    target = _coerce(_unquote(raw), value)
+    if op == "eq":
+        return value == target
+    if op == "neq":
+        return value != target
+    if value is None or target is None:
+        return False
+    # timestamptz columns order by time, not by their text
+    value_moment, target_moment = _as_timestamp(value), _as_timestamp(target)
+    if value_moment is not None and target_moment is not None:
+        value, target = value_moment, target_moment
+    try:
+        if op == "gt":
+            return value > target
+        if op == "gte":
+            return value >= target
+        if op == "lt":
+            return value < target
+        if op == "lte":
+            return value <= target
+    except TypeError:
+        return str(value) < str(target) if op in ("lt", "lte") else str(value) > str(target)
+    raise QueryError(f'"failed to parse filter ({op}.{raw})"')
+
+
+def parse_condition(column, expression):
+    """``column=op.value`` (optionally ``not.op.value``) -> predicate."""
+    negate = False
+    if expression.startswith("not."):
+        negate, expression = True, expression[4:]
+    if "." not in expression:
+        raise QueryError(f'"failed to parse filter ({expression})"')
+    op, raw = expression.split(".", 1)
+
+    def predicate(row):
+        result = _compare(row.get(column), op, raw)
+        return not result if negate else result
+
+    return predicate
+
+
+def parse_logic(kind, expression):
+    """``or=(a.eq.1,and(b.gt.2,c.lt.3))`` -> predicate."""
+    negate = False
+    if kind.startswith("not."):
+        negate, kind = True, kind[4:]
+    body = expression.strip()
+    if not (body.startswith("(") and body.endswith(")")):
+        raise QueryError(f'"failed to parse logic tree ({expression})"')
+    predicates = []
+    for part in split_top_level(body[1:-1]):
+        part = part.strip()
+        match = re.match(r"^(not\.)?(and|or)(\(.*\))$", part, re.S)
+        if match:
+            predicates.append(parse_logic((match.group(1) or "") + match.group(2), match.group(3)))
+            continue
+        column, condition = part.split(".", 1)
+        predicates.append(parse_condition(column, condition))
+    combine = any if kind == "or" else all
+
+    def predicate(row):
+        result = combine(p(row) for p in predicates)
+        return not result if negate else result
+
+    return predicate
+
+
+def build_filters(params):
+    predicates = []
+    for key, value in params:
+        if key in ("or", "and", "not.or", "not.and"):
+            predicates.append(parse_logic(key, value))
+        elif key not in RESERVED_PARAMS and "." not in key:
+            predicates.append(parse_condition(key, value))
+    return predicates
+
+
+# ---------------------------------------------------------------------------
+# order / paging
+# ---------------------------------------------------------------------------
+
+def parse_order(text):
+    terms = []
+    for part in split_top_level(text or ""):
+        pieces = part.strip().split(".")
+        if not pieces[0]:
+            continue
+        column = pieces[0]
+        descending = "desc" in pieces[1:]
+        if "nullsfirst" in pieces[1:]:
+            nulls_first = True
+        elif "nullslast" in pieces[1:]:
+            nulls_first = False
+        else:
+            # Postgres default: NULLS LAST for ASC, NULLS FIRST for DESC
+            nulls_first = descending
+        terms.append((column, descending, nulls_first))
+    return terms
+
+
+def apply_order(rows, terms):
+    for column, descending, nulls_first in reversed(terms):
+        present = [r for r in rows if r.get(column) is not None]
+        missing = [r for r in rows if r.get(column) is None]
+        present.sort(key=lambda r: r[column], reverse=descending)
+        rows = missing + present if nulls_first else present + missing
+    return rows
+
+
+def parse_range(header):
+    if not header:
+        return None
+    match = re.match(r"^\s*(\d+)-(\d*)\s*$", header)
+    if not match:
+        return None
+    start = int(match.group(1))
+    end = int(match.group(2)) if match.group(2) else None
+    return start, end
+
+
+def run_query(table, rows, params, headers, resolve_table, include_count=False):
+    """Filter, order, page and project ``rows``; returns ``(rows, total, offset)``."""
+    lookup = dict(params)
+    for predicate in build_filters(params):
+        rows = [row for row in rows if predicate(row)]
+    total = len(rows) if include_count else None
+
+    rows = apply_order(rows, parse_order(lookup.get("order")))
+
+    offset = int(lookup.get("offset") or 0)
+    limit = int(lookup["limit"]) if lookup.get("limit") else None
+    requested = parse_range(headers.get("range"))
+    if requested:
+        offset = requested[0]
+        if requested[1] is not None:
+            span = requested[1] - requested[0] + 1
+            limit = span if limit is None else min(limit, span)
+    rows = rows[offset:offset + limit] if limit is not None else rows[offset:]
+
+    return project(table, rows, parse_select(lookup.get("select")), resolve_table), total, offset
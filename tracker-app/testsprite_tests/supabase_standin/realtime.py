@@ -0,0 +1,222 @@
+"""Supabase Realtime over a minimal RFC 6455 websocket.
+
+Speaks the Phoenix channel protocol realtime-js uses (``vsn=1.0.0``, JSON
+object frames): ``phx_join`` with ``postgres_changes`` bindings, heartbeats,
+``phx_leave`` and ``postgres_changes`` events carrying binding ids.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+from datetime import datetime, timezone
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_CONTINUATION, OP_TEXT, OP_BINARY, OP_CLOSE, OP_PING, OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+
+
+def accept_key(client_key):
+    digest = hashlib.sha1((client_key + WS_GUID).encode("ascii")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def encode_frame(opcode, payload):
+    header = bytearray([0x80 | opcode])
+    length = len(payload)
+    if length < 126:
+        header.append(length)
+    elif length < 1 << 16:
+        header.append(126)
+        header += struct.pack("!H", length)
+    else:
+        header.append(127)
+        header += struct.pack("!Q", length)
+    return bytes(header) + payload
+
+
+async def read_frame(reader):
+    first, second = await reader.readexactly(2)
+    fin = bool(first & 0x80)
+    opcode = first & 0x0F
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", await reader.readexactly(8))
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return fin, opcode, payload
+
+
+def _filter_predicate(expression):
+    """``column=op.value`` as used by realtime filters (eq, neq, lt, lte, gt, gte, in)."""
+    if not expression:
+        return lambda record: True
+    column, condition = expression.split("=", 1)
+    op, raw = condition.split(".", 1)
+
+    def coerce(value, sample):
+        if isinstance(sample, bool):
+            return value.lower() == "true"
+        if isinstance(sample, int):
+            try:
+                return int(value)
+            except ValueError:
+                return value
+        if isinstance(sample, float):
+            return float(value)
+        return value
+
+    def predicate(record):
+        if column not in record:
+            return False
+        value = record[column]
+        if op == "in":
+            return value in [coerce(v.strip().strip('"'), value) for v in raw.strip("()").split(",")]
+        target = coerce(raw, value)
+        if op == "eq":
+            return value == target
+        if op == "neq":
+            return value != target
+        if value is None:
+            return False
+        return {"lt": value < target, "lte": value <= target,
+                "gt": value > target, "gte": value >= target}.get(op, False)
+
+    return predicate
+
+
+class Connection:
+    def __init__(self, writer):
+        self.writer = writer
+        self.channels = {}  # topic -> list of (binding id, binding, predicate)
+        self.lock = asyncio.Lock()
+
+    async def send(self, message):
+        data = encode_frame(OP_TEXT, json.dumps(message, separators=(",", ":")).encode("utf-8"))
+        async with self.lock:
+            self.writer.write(data)
+            await self.writer.drain()
+
+
+class RealtimeHub:
+    """Tracks websocket subscribers and fans store changes out to them."""
+
+    def __init__(self):
+        self.connections = set()
+        self.next_binding_id = 1
+        self.loop = None
+        self.events_sent = 0
+
+    def on_change(self, table, change_type, record, old_record):
+        """Store listener; may be called from any thread."""
+        if self.loop is None:
+            return
+        change = {
+            "schema": "public",
+            "table": table,
+            "commit_timestamp": datetime.now(timezone.utc).isoformat(),
+            "type": change_type,
+            "columns": [],
+            "record": record,
+            "old_record": old_record,
+            "errors": None,
+        }
+        self.loop.call_soon_threadsafe(self._dispatch, change)
+
+    def _dispatch(self, change):
+        row = change["record"] or change["old_record"]
+        for connection in list(self.connections):
+            for topic, bindings in connection.channels.items():
+                ids = [
+                    binding_id for binding_id, binding, predicate in bindings
+                    if binding.get("table") in (change["table"], "*", None)
+                    and binding.get("schema", "public") in ("public", "*")
+                    and binding.get("event", "*") in ("*", change["type"])
+                    and predicate(row)
+                ]
+                if ids:
+                    self.events_sent += 1
+                    asyncio.ensure_future(connection.send({
+                        "topic": topic,
+                        "event": "postgres_changes",
+                        "payload": {"ids": ids, "data": change},
+                        "ref": None,
+                    }))
+
+    async def serve(self, reader, writer, headers):
+        key = headers.get("sec-websocket-key")
+        writer.write((
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept_key(key)}\r\n\r\n"
+        ).encode("ascii"))
+        await writer.drain()
+
+        connection = Connection(writer)
+        self.connections.add(connection)
+        fragments = []
+        try:
+            while True:
+                fin, opcode, payload = await read_frame(reader)
+                if opcode == OP_CLOSE:
+                    async with connection.lock:
+                        writer.write(encode_frame(OP_CLOSE, payload[:2]))
+                        await writer.drain()
+                    break
+                if opcode == OP_PING:
+                    async with connection.lock:
+                        writer.write(encode_frame(OP_PONG, payload))
+                        await writer.drain()
+                    continue
+                if opcode in (OP_TEXT, OP_CONTINUATION):
+                    fragments.append(payload)
+                    if not fin:
+                        continue
+                    message = json.loads(b"".join(fragments).decode("utf-8"))
+                    fragments = []
+                    await self._handle(connection, message)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.connections.discard(connection)
+            writer.close()
+
+    async def _handle(self, connection, message):
+        topic = message.get("topic")
+        event = message.get("event")
+        ref = message.get("ref")
+
+        if event == "heartbeat":
+            await connection.send({"topic": "phoenix", "event": "phx_reply",
+                                   "payload": {"status": "ok", "response": {}}, "ref": ref})
+        elif event == "phx_join":
+            config = (message.get("payload") or {}).get("config") or {}
+            bindings = []
+            response = []
+            for binding in config.get("postgres_changes") or []:
+                binding_id = self.next_binding_id
+                self.next_binding_id += 1
+                bindings.append((binding_id, binding, _filter_predicate(binding.get("filter"))))
+                # Echo the binding verbatim; realtime-js matches it field by field
+                response.append({"id": binding_id, **binding})
+            connection.channels[topic] = bindings
+            await connection.send({"topic": topic, "event": "phx_reply",
+                                   "payload": {"status": "ok", "response": {"postgres_changes": response}},
+                                   "ref": ref})
+            await connection.send({"topic": topic, "event": "system",
+                                   "payload": {"status": "ok", "message": "Subscribed to PostgreSQL",
+                                               "extension": "postgres_changes", "channel": topic.split(":", 1)[-1]},
+                                   "ref": None})
+        elif event == "phx_leave":
+            connection.channels.pop(topic, None)
+            await connection.send({"topic": topic, "event": "phx_reply",
+                                   "payload": {"status": "ok", "response": {}}, "ref": ref})
+        elif ref is not None and event not in ("access_token",):
+            await connection.send({"topic": topic, "event": "phx_reply",
+                                   "payload": {"status": "ok", "response": {}}, "ref": ref})
@@ -0,0 +1,253 @@
+"""Database functions exposed under ``/rest/v1/rpc/<name>``.
+
+Each function takes the store and the JSON arguments and returns what the
+SQL function would: a list of rows for set-returning functions (filters and
+ordering from the query string are applied afterwards), a scalar otherwise.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .postgrest import QueryError
+
+FUNCTIONS = {}
+
+PRIORITY_RANK = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
+
+
+def rpc(name):
+    def register(fn):
+        FUNCTIONS[name] = fn
+        return fn
+    return register
+
+
+def _walk(start_id, neighbours, by_id, max_level=10):
+    """Breadth-first walk with the ``level < 10`` cap the SQL functions use."""
+    seen = {start_id}
+    frontier = [start_id]
+    rows = []
+    level = 0
+    while frontier and level < max_level:
+        level += 1
+        following = []
+        for task_id in frontier:
+            for neighbour in neighbours(task_id):
+                if neighbour in seen or neighbour not in by_id:
+                    continue
+                seen.add(neighbour)
+                following.append(neighbour)
+                task = by_id[neighbour]
+                rows.append({"id": task["id"], "name": task["name"], "status": task["status"], "level": level})
+        frontier = following
+    return rows
+
+
+@rpc("get_upstream_dependencies")
+def get_upstream_dependencies(store, args):
+    by_id = {t["id"]: t for t in store.rows("tasks")}
+    return _walk(args["task_id_param"], lambda i: by_id.get(i, {}).get("depends_on") or [], by_id)
+
+
+@rpc("get_downstream_tasks")
+def get_downstream_tasks(store, args):
+    tasks = store.rows("tasks")
+    by_id = {t["id"]: t for t in tasks}
+    successors = {}
+    for task in tasks:
+        for dep in task.get("depends_on") or []:
+            successors.setdefault(dep, []).append(task["id"])
+    return _walk(args["task_id_param"], lambda i: successors.get(i, []), by_id)
+
+
+@rpc("is_task_ready")
+def is_task_ready(store, args):
+    task = store.get("tasks", args["task_id_param"])
+    if task is None:
+        return False
+    return all((store.get("tasks", d) or {}).get("status") == "DONE" for d in task.get("depends_on") or [])
+
+
+@rpc("get_next_recommended_tasks")
+def get_next_recommended_tasks(store, args):
+    """Pending tasks whose dependencies are done, most important first."""
+    agent_type = args.get("for_agent_type")
+    limit = args.get("limit_count") or 10
+    by_id = {t["id"]: t for t in store.rows("tasks")}
+    ready = [
+        task for task in by_id.values()
+        if task.get("status") == "PENDING"
+        and (agent_type is None or task.get("assigned_type") == agent_type)
+        and all(by_id.get(d, {}).get("status") == "DONE" for d in task.get("depends_on") or [])
+    ]
+    ready.sort(key=lambda t: (PRIORITY_RANK.get(t.get("priority"), 3), t.get("phase_id") or 0,
+                              t.get("order_index") or 0))
+    return [dict(task) for task in ready[:limit]]
+
+
+def _moment(value):
+    """timestamptz / date literal -> aware datetime (dates are midnight UTC)."""
+    if not value:
+        return None
+    moment = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def _dates_patch(start, due, zone, start_date=None, due_date=None):
+    """DATE columns are calendar days in the client's zone unless given."""
+    return {
+        "start_datetime": start.astimezone(timezone.utc).isoformat(),
+        "due_datetime": due.astimezone(timezone.utc).isoformat(),
+        "start_date": (start_date or start.astimezone(zone).date()).isoformat(),
+        "due_date": (due_date or due.astimezone(zone).date()).isoformat(),
+    }
+
+
+@rpc("cascade_task_dates")
+def cascade_task_dates(store, args):
+    """Mirror of 004-cascade-task-dates.sql: move a task, relax its downstream
+    subgraph wave by wave, write everything at once and return changed rows."""
+    task_id = args["task_id_param"]
+    new_start, new_due = _moment(args["new_start"]), _moment(args["new_due"])
+    lag = timedelta(days=args.get("lag_days", 1))
+    if new_due < new_start:
+        raise QueryError(f"Due date ({new_due}) is before start date ({new_start})", code="22023")
+    try:
+        zone = ZoneInfo(args.get("client_time_zone") or "UTC")
+    except (ZoneInfoNotFoundError, ValueError):
+        raise QueryError(f"Unknown time zone {args.get('client_time_zone')}", code="22023")
+    given = {
+        "start_date": args.get("new_start_date") and date.fromisoformat(args["new_start_date"]),
+        "due_date": args.get("new_due_date") and date.fromisoformat(args["new_due_date"]),
+    }
+
+    with store.lock:
+        tasks = store.rows("tasks")
+        by_id = {t["id"]: t for t in tasks}
+        if task_id not in by_id:
+            raise QueryError(f"Task {task_id} not found", code="P0002")
+        successors = {}
+        for task in tasks:
+            for dep in task.get("depends_on") or []:
+                successors.setdefault(dep, set()).add(task["id"])
+
+        downstream, stack = set(), [task_id]
+        while stack:
+            for succ in successors.get(stack.pop(), ()):
+                if succ not in downstream:
+                    downstream.add(succ)
+                    stack.append(succ)
+        if task_id in downstream:
+            raise QueryError(f"Dependency cycle: task {task_id} depends on itself", code="23514")
+
+        planned = {task_id: (new_start, new_due)}
+
+        def dates(tid):
+            if tid in planned:
+                return planned[tid]
+            task = by_id[tid]
+            return (_moment(task.get("start_datetime") or task.get("start_date")),
+                    _moment(task.get("due_datetime") or task.get("due_date")))
+
+        frontier, waves = {task_id}, 0
+        while frontier:
+            waves += 1
+            if waves > len(downstream) + 1:
+                raise QueryError(f"Dependency cycle below task {task_id}", code="23514")
+            candidates = {s for f in frontier for s in successors.get(f, ()) if s in downstream}
+            moved = {}
+            for tid in candidates:
+                dues = [dates(d)[1] for d in by_id[tid].get("depends_on") or [] if d in by_id]
+                dues = [d for d in dues if d is not None]
+                if not dues:
+                    continue
+                start_at = max(dues) + lag
+                start, due = dates(tid)
+                if start == start_at:
+                    continue
+                duration = (due - start) if start and due else timedelta(0)
+                moved[tid] = (start_at, start_at + duration)
+            planned.update(moved)
+            frontier = set(moved)
+
+        for tid, (start, due) in planned.items():
+            store.update("tasks", [{"id": tid}], _dates_patch(start, due, zone, **(given if tid == task_id else {})))
+        return sorted((dict(store.get("tasks", tid)) for tid in planned), key=lambda t: t["id"])
+
+
+@rpc("bulk_update_tasks")
+def bulk_update_tasks(store, args):
+    """Mirror of 005-bulk-update-tasks.sql: per-row results, bad rows don't abort the batch."""
+    updates = args.get("updates")
+    if not isinstance(updates, list):
+        raise QueryError("updates must be a JSON array", code="22023")
+    with store.lock:
+        columns = set()
+        for task in store.rows("tasks"):
+            columns.update(task)
+        results = []
+        for item in updates:
+            row_id = item.get("id") if isinstance(item, dict) else None
+            patch = {k: v for k, v in (item or {}).items() if k not in ("id", "created_at", "updated_at")}
+            unknown = next((k for k in patch if k not in columns), None)
+            if row_id is None:
+                error = ("22023", "Missing id")
+            elif unknown:
+                error = ("42703", f'Column "{unknown}" of tasks does not exist')
+            elif store.get("tasks", row_id) is None:
+                error = ("P0002", f"Task {row_id} not found")
+            else:
+                updated = store.update("tasks", [{"id": row_id}], patch)
+                results.append({"id": row_id, "ok": True, "error_code": None, "error_message": None,
+                                "task": updated[0]})
+                continue
+            results.append({"id": row_id, "ok": False, "error_code": error[0], "error_message": error[1],
+                            "task": None})
+        return results
+
+
+@rpc("get_dashboard_stats")
+def get_dashboard_stats(store, args):
+    """Mirror of 007-dashboard-stats.sql, computed from the rows instead of counters."""
+    with store.lock:
+        tasks = store.rows("tasks")
+        by_id = {t["id"]: t for t in tasks}
+        phases = sorted(store.rows("phases"), key=lambda p: (p.get("order_index") is None, p.get("order_index"), p["id"]))
+
+    def blocked(task):
+        return task.get("status") != "DONE" and any(
+            by_id[d].get("status") != "DONE" for d in task.get("depends_on") or [] if d in by_id)
+
+    def hours(rows, column):
+        return sum(float(t.get(column) or 0) for t in rows)
+
+    week_ago = datetime.now(timezone.utc) - timedelta(days=7)
+    per_phase = []
+    for phase in phases:
+        rows = [t for t in tasks if t.get("phase_id") == phase["id"]]
+        per_phase.append({
+            **phase,
+            "total_tasks": len(rows),
+            "done_tasks": sum(1 for t in rows if t.get("status") == "DONE"),
+            "in_progress_tasks": sum(1 for t in rows if t.get("status") == "IN_PROGRESS"),
+            "pending_tasks": sum(1 for t in rows if t.get("status") == "PENDING"),
+            "blocked_tasks": sum(1 for t in rows if blocked(t)),
+            "estimated_hours": hours(rows, "estimated_hours"),
+            "actual_hours": hours(rows, "actual_hours"),
+        })
+    return {
+        "total": len(tasks),
+        "done": sum(1 for t in tasks if t.get("status") == "DONE"),
+        "in_progress": sum(1 for t in tasks if t.get("status") == "IN_PROGRESS"),
+        "pending": sum(1 for t in tasks if t.get("status") == "PENDING"),
+        "blocked": sum(1 for t in tasks if blocked(t)),
+        "human_tasks": sum(1 for t in tasks if t.get("assigned_type") == "HUMAN"),
+        "ai_tasks": sum(1 for t in tasks if t.get("assigned_type") == "AI"),
+        "estimated_hours": hours(tasks, "estimated_hours"),
+        "actual_hours": hours(tasks, "actual_hours"),
+        "completed_last_7_days": sum(
+            1 for t in tasks
+            if t.get("status") == "DONE" and (_moment(t.get("completed_at")) or week_ago) > week_ago),
+        "phases": per_phase,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+    }
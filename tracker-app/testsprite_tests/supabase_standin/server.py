@@ -0,0 +1,326 @@
+"""asyncio HTTP server exposing the stand-in under Supabase's URL layout.
+
+    /rest/v1/<table>        PostgREST GET/HEAD/POST/PATCH/DELETE
+    /rest/v1/rpc/<name>     database functions (see rpc.py)
+    /realtime/v1/websocket  postgres_changes (see realtime.py)
+    /__standin/...          test controls: health, reset, mutate, burst
+"""
+
+import asyncio
+import json
+import random
+import threading
+from urllib.parse import parse_qsl, urlsplit
+
+from .datagen import generate_dataset
+from .postgrest import QueryError, run_query
+from .realtime import RealtimeHub
+from .rpc import FUNCTIONS
+from .store import VIEWS, ConflictError, Store, utcnow_iso
+
+OBJECT_MEDIA_TYPE = "application/vnd.pgrst.object+json"
+
+STATUS_TEXT = {
+    200: "OK", 201: "Created", 204: "No Content", 206: "Partial Content", 400: "Bad Request",
+    404: "Not Found", 405: "Method Not Allowed", 406: "Not Acceptable", 409: "Conflict",
+    500: "Internal Server Error",
+}
+
+
+class Request:
+    def __init__(self, method, target, headers, body):
+        parts = urlsplit(target)
+        self.method = method
+        self.path = parts.path
+        self.params = parse_qsl(parts.query, keep_blank_values=True)
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body.decode("utf-8")) if self.body else None
+
+    def prefer(self):
+        values = {}
+        for item in self.headers.get("prefer", "").split(","):
+            if "=" in item:
+                key, value = item.strip().split("=", 1)
+                values[key] = value
+        return values
+
+
+class StandIn:
+    """Owns the store, the realtime hub and the listening socket."""
+
+    def __init__(self, dataset=None, host="127.0.0.1", port=54321, latency_ms=0):
+        self.store = Store(dataset if dataset is not None else generate_dataset())
+        self.hub = RealtimeHub()
+        self.store.subscribe(self.hub.on_change)
+        self.host = host
+        self.port = port
+        self.latency = latency_ms / 1000.0
+        self.request_count = 0
+        self.loop = None
+        self.server = None
+        self._thread = None
+        self._ready = threading.Event()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    # ------------------------------------------------------------------
+    # lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        self.loop = asyncio.get_running_loop()
+        self.hub.loop = self.loop
+        self.server = await asyncio.start_server(self._client, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    def start_in_thread(self):
+        """Run on a daemon thread; returns once the socket is listening."""
+
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            self._ready.set()
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="supabase-standin", daemon=True)
+        self._thread.start()
+        self._ready.wait(10)
+        return self
+
+    def stop(self):
+        if self.loop is None:
+            return
+        if self._thread is not None:
+            self.loop.call_soon_threadsafe(self.server.close)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(5)
+        else:
+            self.server.close()
+
+    # ------------------------------------------------------------------
+    # HTTP plumbing
+    # ------------------------------------------------------------------
+
+    async def _client(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                if headers.get("upgrade", "").lower() == "websocket":
+                    await self.hub.serve(reader, writer, headers)
+                    return
+
+                length = int(headers.get("content-length") or 0)
+                body = await reader.readexactly(length) if length else b""
+                request = Request(method, target, headers, body)
+                self.request_count += 1
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+
+                status, extra, payload = self._dispatch(request)
+                self._write(writer, request, status, extra, payload)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def _write(self, writer, request, status, extra, payload):
+        body = b""
+        if payload is not None:
+            body = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+        if request.method == "HEAD":
+            body = b""
+        origin = request.headers.get("origin", "*")
+        lines = [
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'OK')}",
+            f"Access-Control-Allow-Origin: {origin}",
+            "Access-Control-Allow-Credentials: true",
+            "Access-Control-Allow-Methods: GET, HEAD, POST, PATCH, PUT, DELETE, OPTIONS",
+            "Access-Control-Allow-Headers: "
+            + request.headers.get("access-control-request-headers", "*"),
+            "Access-Control-Expose-Headers: Content-Range, Content-Location",
+            "Vary: Origin",
+            f"Content-Length: {len(body)}",
+        ]
+        if payload is not None:
+            lines.append("Content-Type: application/json; charset=utf-8")
+        lines.extend(f"{name}: {value}" for name, value in extra.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+
+    def _dispatch(self, request):
+        if request.method == "OPTIONS":
+            return 204, {}, None
+        try:
+            if request.path.startswith("/rest/v1/rpc/"):
+                return self._rpc(request, request.path[len("/rest/v1/rpc/"):])
+            if request.path.startswith("/rest/v1/"):
+                return self._table(request, request.path[len("/rest/v1/"):])
+            if request.path.startswith("/__standin/"):
+                return self._control(request, request.path[len("/__standin/"):])
+            if request.path.startswith("/auth/v1/"):
+                return 200, {}, {}
+            return 404, {}, {"message": "no route"}
+        except QueryError as error:
+            return error.status, {}, error.payload
+        except ConflictError as error:
+            return 409, {}, {"code": "23505", "message": str(error), "details": error.details, "hint": None}
+        except (KeyError, TypeError, ValueError) as error:
+            return 400, {}, {"code": "22P02", "message": str(error), "details": None, "hint": None}
+
+    # ------------------------------------------------------------------
+    # PostgREST
+    # ------------------------------------------------------------------
+
+    def _resolve(self, name):
+        if name in VIEWS:
+            return self.store.view(name)
+        if self.store.has_table(name):
+            return self.store.rows(name)
+        raise QueryError(f"Could not find the table 'public.{name}' in the schema cache",
+                         code="PGRST205", status=404)
+
+    def _respond_rows(self, request, table, rows, status=200):
+        prefer = request.prefer()
+        counting = prefer.get("count") in ("exact", "planned", "estimated")
+        result, total, offset = run_query(table, rows, request.params, request.headers, self._resolve,
+                                          include_count=counting)
+        extra = {}
+        end = offset + len(result) - 1
+        range_text = f"{offset}-{end}" if result else "*"
+        extra["Content-Range"] = f"{range_text}/{total if counting else '*'}"
+        if counting and result and len(result) < total and status == 200:
+            status = 206
+
+        if request.headers.get("accept", "").startswith(OBJECT_MEDIA_TYPE):
+            if len(result) != 1:
+                raise QueryError("JSON object requested, multiple (or no) rows returned",
+                                 code="PGRST116", status=406,
+                                 details=f"The result contains {len(result)} rows")
+            return status, extra, result[0]
+        return status, extra, result
+
+    def _table(self, request, table):
+        prefer = request.prefer()
+        representation = prefer.get("return") == "representation"
+
+        if request.method in ("GET", "HEAD"):
+            return self._respond_rows(request, table, self._resolve(table))
+
+        if table in VIEWS:
+            raise QueryError(f'cannot modify view "{table}"', code="55000")
+
+        if request.method == "POST":
+            body = request.json()
+            rows = body if isinstance(body, list) else [body]
+            lookup = dict(request.params)
+            created = self.store.insert(
+                table, rows,
+                upsert=prefer.get("resolution") in ("merge-duplicates", "ignore-duplicates"),
+                on_conflict=lookup.get("on_conflict", "id"),
+                ignore_duplicates=prefer.get("resolution") == "ignore-duplicates",
+            )
+            if not representation:
+                return 201, {}, None
+            return self._respond_rows(Request("GET", self._select_only(request), request.headers, b""),
+                                      table, created, status=201)
+
+        if request.method in ("PATCH", "DELETE"):
+            matched, _, _ = run_query(table, self._resolve(table),
+                                      [p for p in request.params if p[0] != "select"],
+                                      {}, self._resolve)
+            if request.method == "PATCH":
+                changed = self.store.update(table, matched, request.json() or {})
+            else:
+                changed = self.store.delete(table, matched)
+            if not representation:
+                return 204, {}, None
+            return self._respond_rows(Request("GET", self._select_only(request), request.headers, b""),
+                                      table, changed)
+
+        return 405, {}, {"message": f"{request.method} not supported"}
+
+    @staticmethod
+    def _select_only(request):
+        select = dict(request.params).get("select")
+        return f"/?select={select}" if select else "/"
+
+    def _rpc(self, request, name):
+        fn = FUNCTIONS.get(name)
+        if fn is None:
+            raise QueryError(f"Could not find the function public.{name} in the schema cache",
+                             code="PGRST202", status=404)
+        if request.method in ("GET", "HEAD"):
+            args = {k: v for k, v in request.params if k not in ("select", "order", "limit", "offset")}
+        else:
+            args = request.json() or {}
+        result = fn(self.store, args)
+        if isinstance(result, list):
+            return self._respond_rows(request, f"rpc:{name}", result)
+        return 200, {}, result
+
+    # ------------------------------------------------------------------
+    # test controls
+    # ------------------------------------------------------------------
+
+    def _control(self, request, action):
+        body = request.json() or {}
+        if action == "health":
+            return 200, {}, {
+                "tables": {name: len(self.store.tables[name]) for name in self.store.tables},
+                "requests": self.request_count,
+                "realtime_connections": len(self.hub.connections),
+                "realtime_events_sent": self.hub.events_sent,
+            }
+        if action == "reset":
+            # Reloading does not emit realtime events; clients should reload
+            self.store.load(generate_dataset(**body))
+            self.request_count = 0
+            return 200, {}, {"tasks": len(self.store.tables.get("tasks", {}))}
+        if action == "mutate":
+            # {"table": "tasks", "id": 1, "changes": {...}} -> one UPDATE event
+            row = self.store.get(body["table"], body["id"])
+            if row is None:
+                return 404, {}, {"message": "row not found"}
+            return 200, {}, self.store.update(body["table"], [row], body["changes"])[0]
+        if action == "burst":
+            return 200, {}, {"updated": self.burst(**body)}
+        return 404, {}, {"message": f"unknown control {action}"}
+
+    def burst(self, count=50, seed=None, table="tasks"):
+        """Touch ``count`` random tasks the way an agent reporting progress would."""
+        rng = random.Random(seed)
+        rows = self.store.rows(table)
+        for row in rng.sample(rows, min(count, len(rows))):
+            progress = min(100, (row.get("progress_percentage") or 0) + rng.choice((5, 10, 25)))
+            changes = {"progress_percentage": progress}
+            if row.get("status") == "PENDING":
+                changes.update(status="IN_PROGRESS", started_at=utcnow_iso())
+            elif progress == 100:
+                changes.update(status="DONE", completed_at=utcnow_iso())
+            self.store.update(table, [row], changes)
+        return min(count, len(rows))
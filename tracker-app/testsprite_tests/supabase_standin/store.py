@@ -0,0 +1,300 @@
+"""In-memory tables with change notifications and the computed tracker views."""
+
+import copy
+import threading
+from datetime import datetime, timezone
+
+# Tables whose updated_at is maintained by a trigger in the hosted schema
+TOUCHED_TABLES = {"tasks", "phases", "sprints"}
+
+# Deletes from these leave a row in deleted_records (migration 008)
+TOMBSTONE_TABLE = "deleted_records"
+
+
+def utcnow_iso():
+    return datetime.now(timezone.utc).isoformat()
+
+
+class Store:
+    """Rows keyed by id per table.
+
+    Every mutation bumps ``version`` and is reported to listeners as a
+    ``(table, type, record, old_record)`` change so the realtime hub can fan
+    it out like ``postgres_changes``.
+    """
+
+    def __init__(self, dataset=None):
+        self.lock = threading.RLock()
+        self.listeners = []
+        self.version = 0
+        self.tables = {}
+        self.sequences = {}
+        self._view_cache = {}
+        self.load(dataset or {})
+
+    def load(self, dataset):
+        with self.lock:
+            self.tables = {}
+            self.sequences = {}
+            for name, rows in dataset.items():
+                self.tables[name] = {row["id"]: dict(row) for row in rows}
+                self.sequences[name] = max(self.tables[name], default=0)
+            self.tables.setdefault(TOMBSTONE_TABLE, {})
+            self.sequences.setdefault(TOMBSTONE_TABLE, 0)
+            self.version += 1
+            self._view_cache = {}
+
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+
+    def _notify(self, table, change_type, record, old_record):
+        for listener in self.listeners:
+            listener(table, change_type, record, old_record)
+
+    def has_table(self, name):
+        return name in self.tables
+
+    def rows(self, name):
+        with self.lock:
+            return list(self.tables.get(name, {}).values())
+
+    def get(self, name, row_id):
+        with self.lock:
+            return self.tables.get(name, {}).get(row_id)
+
+    def insert(self, table, rows, upsert=False, on_conflict="id", ignore_duplicates=False):
+        created = []
+        changes = []
+        with self.lock:
+            target = self.tables.setdefault(table, {})
+            self.sequences.setdefault(table, max(target, default=0))
+            for values in rows:
+                values = dict(values)
+                existing = None
+                if on_conflict == "id" and values.get("id") in target:
+                    existing = target[values["id"]]
+                elif on_conflict != "id" and on_conflict in values:
+                    existing = next((r for r in target.values() if r.get(on_conflict) == values[on_conflict]), None)
+                if existing is not None:
+                    if not upsert:
+                        raise ConflictError(table, on_conflict, values.get(on_conflict))
+                    if ignore_duplicates:
+                        continue
+                    existing.update(values)
+                    if table in TOUCHED_TABLES and "updated_at" not in values:
+                        existing["updated_at"] = utcnow_iso()
+                    created.append(dict(existing))
+                    changes.append(("UPDATE", dict(existing), {"id": existing["id"]}))
+                    continue
+                if values.get("id") is None:
+                    self.sequences[table] += 1
+                    values["id"] = self.sequences[table]
+                else:
+                    self.sequences[table] = max(self.sequences[table], values["id"])
+                stamp = utcnow_iso()
+                if table in TOUCHED_TABLES:
+                    values.setdefault("created_at", stamp)
+                    values.setdefault("updated_at", stamp)
+                if table in ("logs", "ai_execution_logs"):
+                    values.setdefault("timestamp", stamp)
+                if table == "tasks":
+                    values.setdefault("depends_on", [])
+                target[values["id"]] = values
+                created.append(dict(values))
+                changes.append(("INSERT", dict(values), {}))
+            self._touch()
+        for change_type, record, old in changes:
+            self._notify(table, change_type, record, old)
+        return created
+
+    def update(self, table, rows, patch):
+        updated = []
+        with self.lock:
+            target = self.tables.get(table, {})
+            for row in rows:
+                current = target.get(row["id"])
+                if current is None:
+                    continue
+                current.update(copy.deepcopy(patch))
+                if table in TOUCHED_TABLES and "updated_at" not in patch:
+                    current["updated_at"] = utcnow_iso()
+                updated.append(dict(current))
+            self._touch()
+        for record in updated:
+            # Default REPLICA IDENTITY only ships the primary key of the old row
+            self._notify(table, "UPDATE", record, {"id": record["id"]})
+        return updated
+
+    def delete(self, table, rows):
+        removed = []
+        with self.lock:
+            target = self.tables.get(table, {})
+            for row in rows:
+                current = target.pop(row["id"], None)
+                if current is not None:
+                    removed.append(current)
+            if table in TOUCHED_TABLES:
+                tombstones = self.tables[TOMBSTONE_TABLE]
+                stamp = utcnow_iso()
+                for record in removed:
+                    self.sequences[TOMBSTONE_TABLE] += 1
+                    tombstone_id = self.sequences[TOMBSTONE_TABLE]
+                    tombstones[tombstone_id] = {"id": tombstone_id, "table_name": table,
+                                                "record_id": record["id"], "deleted_at": stamp}
+            self._touch()
+        for record in removed:
+            self._notify(table, "DELETE", {}, {"id": record["id"]})
+        return removed
+
+    def _touch(self):
+        self.version += 1
+        self._view_cache = {}
+
+    def view(self, name):
+        """Rows of a computed view, cached until the next mutation."""
+        with self.lock:
+            cached = self._view_cache.get(name)
+            if cached is None:
+                cached = VIEWS[name](self)
+                self._view_cache[name] = cached
+            return cached
+
+
+class ConflictError(Exception):
+    def __init__(self, table, column, value):
+        super().__init__(f'duplicate key value violates unique constraint "{table}_pkey"')
+        self.details = f"Key ({column})=({value}) already exists."
+
+
+def _task_context(store):
+    tasks = store.rows("tasks")
+    by_id = {t["id"]: t for t in tasks}
+    children = {}
+    successors = {}
+    for task in tasks:
+        if task.get("parent_id") is not None:
+            children.setdefault(task["parent_id"], []).append(task)
+        for dep in task.get("depends_on") or []:
+            successors.setdefault(dep, []).append(task["id"])
+    phases = {p["id"]: p for p in store.rows("phases")}
+    sprints = {s["id"]: s for s in store.rows("sprints")}
+    return tasks, by_id, children, successors, phases, sprints
+
+
+def _days_between(start, end=None):
+    if not start:
+        return None
+    end = datetime.fromisoformat(end) if end else datetime.now(timezone.utc)
+    return (end - datetime.fromisoformat(start)).days
+
+
+def _dependency_columns(task, by_id, children, successors):
+    depends_on = task.get("depends_on")
+    predecessors = sorted((by_id[d] for d in depends_on or [] if d in by_id), key=lambda p: p["id"])
+    kids = children.get(task["id"], [])
+    blocked_by_this = sorted(successors.get(task["id"], []))
+    if task.get("status") == "DONE":
+        execution_status = "DONE"
+    elif not depends_on:
+        execution_status = "READY"
+    elif any(p.get("status") != "DONE" for p in predecessors):
+        execution_status = "BLOCKED"
+    else:
+        execution_status = "READY"
+    return predecessors, kids, {
+        "child_count": len(kids),
+        "depends_on_names": sorted(p["name"] for p in predecessors) if depends_on is not None else None,
+        "blocking_dependencies": blocked_by_this,
+        "blocking_count": len(blocked_by_this),
+        "execution_status": execution_status,
+        "is_milestone": bool(task.get("is_milestone")),
+    }
+
+
+def tasks_with_dependencies(store):
+    """Mirror of the view in supabase-migrations/002-create-essential-views.sql."""
+    tasks, by_id, children, successors, phases, sprints = _task_context(store)
+    result = []
+    for task in tasks:
+        _, kids, computed = _dependency_columns(task, by_id, children, successors)
+        phase = phases.get(task.get("phase_id")) or {}
+        parent = by_id.get(task.get("parent_id")) or {}
+        sprint = sprints.get(task.get("sprint_id")) or {}
+        done_kids = sum(1 for k in kids if k.get("status") == "DONE")
+        result.append({
+            **task,
+            "phase_name": phase.get("name"),
+            "phase_description": phase.get("description"),
+            "phase_order": phase.get("order_index"),
+            "parent_name": parent.get("name"),
+            "parent_type": parent.get("task_type"),
+            **computed,
+            "days_in_progress": (_days_between(task.get("started_at"))
+                                 if task.get("status") == "IN_PROGRESS" else None),
+            "calculated_progress": (round(done_kids * 100 / len(kids)) if kids
+                                    else task.get("progress_percentage")),
+            "sprint_name": sprint.get("name"),
+            "sprint_start": sprint.get("start_date"),
+            "sprint_end": sprint.get("end_date"),
+            "sprint_status": sprint.get("status"),
+        })
+    return result
+
+
+def tracker_app_data(store):
+    """Mirror of the ``tracker_app_data`` view the UI reads through getAllTasks()."""
+    tasks, by_id, children, successors, phases, sprints = _task_context(store)
+    last_log = {}
+    for log in store.rows("ai_execution_logs"):
+        current = last_log.get(log.get("task_id"))
+        if current is None or (log.get("timestamp") or "") > (current.get("timestamp") or ""):
+            last_log[log.get("task_id")] = log
+    result = []
+    for task in tasks:
+        predecessors, kids, computed = _dependency_columns(task, by_id, children, successors)
+        phase = phases.get(task.get("phase_id")) or {}
+        parent = by_id.get(task.get("parent_id")) or {}
+        sprint = sprints.get(task.get("sprint_id")) or {}
+        log = last_log.get(task["id"]) or {}
+        done_kids = sum(1 for k in kids if k.get("status") == "DONE")
+        if kids:
+            calculated_progress = round(done_kids * 100 / len(kids))
+        elif task.get("status") == "DONE":
+            calculated_progress = 100
+        else:
+            calculated_progress = task.get("progress_percentage") or 0
+        result.append({
+            **task,
+            "phase_name": phase.get("name"),
+            "phase_description": phase.get("description"),
+            "phase_progress": phase.get("progress"),
+            "phase_order": phase.get("order_index"),
+            "phase_kpi": phase.get("kpi"),
+            "phase_deliverable": phase.get("deliverable"),
+            "parent_name": parent.get("name"),
+            "parent_type": parent.get("task_type"),
+            "parent_task_id": parent.get("id"),
+            "completed_child_count": done_kids,
+            **computed,
+            "depends_on_ids": [p["id"] for p in predecessors] if task.get("depends_on") is not None else [],
+            "days_in_progress": (_days_between(task.get("started_at"))
+                                 if task.get("started_at") and not task.get("completed_at") else None),
+            "days_to_complete": (_days_between(task.get("started_at"), task.get("completed_at"))
+                                 if task.get("started_at") and task.get("completed_at") else None),
+            "calculated_progress": calculated_progress,
+            "sprint_name": sprint.get("name"),
+            "sprint_start": sprint.get("start_date"),
+            "sprint_end": sprint.get("end_date"),
+            "sprint_status": sprint.get("status"),
+            "sprint_velocity": sprint.get("velocity"),
+            "last_agent": log.get("agent_name"),
+            "last_agent_status": log.get("status"),
+            "last_agent_activity": log.get("timestamp"),
+        })
+    return result
+
+
+VIEWS = {
+    "tasks_with_dependencies": tasks_with_dependencies,
+    "tracker_app_data": tracker_app_data,
+}
@@ -1,14 +1,25 @@
-import { defineConfig } from 'vite'
+import { defineConfig, loadEnv } from 'vite'
 import react from '@vitejs/plugin-react'
 
-export default defineConfig({
-  plugins: [react()],
-  server: {
-    port: 3000,
-    open: true
-  },
-  build: {
-    outDir: 'dist',
-    sourcemap: false
+export default defineConfig(({ command, mode }) => {
+  const env = loadEnv(mode, process.cwd(), '')
+
+  return {
+    plugins: [react()],
+    resolve: {
+      // Production React drops Profiler timings; VITE_PERF builds use the profiling build (src/lib/perf.js).
+      // The dev server already runs development React, which keeps them
+      alias: command === 'build' && env.VITE_PERF === 'true'
+        ? [{ find: /^react-dom\/client$/, replacement: 'react-dom/profiling' }]
+        : []
+    },
+    server: {
+      port: 3000,
+      open: true
+    },
+    build: {
+      outDir: 'dist',
+      sourcemap: false
+    }
   }
 })